@@ -1,6 +1,15 @@
 """기사(헤드라인) 전문가 에이전트."""
 
-from .agent import run
-from .schemas import ArticleExpertResponse, NotableArticleItem, NotablePeriod
+from .agent import MODEL_NAME, PROMPT_PATH, arun, run
+from .schemas import ArticleExpertResponse, NotableArticleItem, NotablePeriod, parser
 
-__all__ = ["run", "ArticleExpertResponse", "NotableArticleItem", "NotablePeriod"]
+__all__ = [
+    "run",
+    "arun",
+    "ArticleExpertResponse",
+    "NotableArticleItem",
+    "NotablePeriod",
+    "MODEL_NAME",
+    "PROMPT_PATH",
+    "parser",
+]
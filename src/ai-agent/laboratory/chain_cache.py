@@ -0,0 +1,115 @@
+"""
+에이전트 체인·OpenAI HTTP 클라이언트 재사용.
+
+run()마다 프롬프트 YAML을 다시 읽고 ChatOpenAI를 새로 만들지 않도록, 체인을 프로세스당 한 번 만들어 둡니다.
+
+- 체인 키: (프롬프트 경로, 파일 mtime, 모델, temperature, 파서, 이벤트 루프). 프롬프트 파일을 고치면 다음 호출에서 다시 구성
+- 모든 체인이 keep-alive 커넥션 풀을 가진 httpx 클라이언트를 공유 (동기 1개, 비동기는 이벤트 루프마다 1개.
+  비동기 클라이언트의 커넥션은 만든 루프에 묶이므로 다른 루프에서 쓰지 않음. 닫힌 루프의 클라이언트·체인은 버림)
+  OPENAI_HTTP_MAX_CONNECTIONS(기본 20), OPENAI_HTTP_MAX_KEEPALIVE(기본 10),
+  OPENAI_HTTP_KEEPALIVE_EXPIRY_SEC(기본 60), OPENAI_HTTP_TIMEOUT_SEC(기본 120)
+- 체인(prompt | llm | parser)은 상태가 없어 여러 스레드에서 동시에 invoke 해도 됩니다.
+"""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from langchain_core.prompts import load_prompt
+from langchain_openai import ChatOpenAI
+
+_lock = threading.Lock()
+_chains: Dict[Tuple, Any] = {}
+_http_client: Optional[httpx.Client] = None
+_async_http_clients: Dict[Optional[asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+_stats = {"builds": 0, "hits": 0}
+
+
+def _client_options() -> Dict[str, Any]:
+    return {
+        "limits": httpx.Limits(
+            max_connections=int(os.getenv("OPENAI_HTTP_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.getenv("OPENAI_HTTP_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=float(os.getenv("OPENAI_HTTP_KEEPALIVE_EXPIRY_SEC", "60")),
+        ),
+        "timeout": httpx.Timeout(float(os.getenv("OPENAI_HTTP_TIMEOUT_SEC", "120")), connect=10.0),
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """OpenAI 호출용 공유 httpx 클라이언트 (동기)"""
+    global _http_client
+    with _lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(**_client_options())
+        return _http_client
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _drop_closed_loops() -> None:
+    """닫힌 이벤트 루프의 비동기 클라이언트와 체인을 버림 (_lock 안에서 호출)"""
+    closed = [loop for loop in _async_http_clients if loop is not None and loop.is_closed()]
+    for loop in closed:
+        del _async_http_clients[loop]
+    for key in [k for k in _chains if k[-1] is not None and k[-1].is_closed()]:
+        del _chains[key]
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """OpenAI 호출용 공유 httpx 클라이언트 (비동기, 현재 이벤트 루프 기준)"""
+    loop = _running_loop()
+    with _lock:
+        _drop_closed_loops()
+        client = _async_http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = _async_http_clients[loop] = httpx.AsyncClient(**_client_options())
+        return client
+
+
+def get_chain(prompt_path: Path, model: str, parser, temperature: float = 0):
+    """프롬프트·LLM·파서 체인 (같은 키면 만들어 둔 체인 반환)"""
+    loop = _running_loop()
+    key = (str(prompt_path), Path(prompt_path).stat().st_mtime_ns, model, temperature, id(parser), loop)
+    with _lock:
+        _drop_closed_loops()
+        chain = _chains.get(key)
+        if chain is not None:
+            _stats["hits"] += 1
+            return chain
+
+    prompt = load_prompt(str(prompt_path), encoding="utf-8")
+    prompt = prompt.partial(format_instructions=parser.get_format_instructions())
+    llm = ChatOpenAI(
+        temperature=temperature,
+        model=model,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+    )
+    chain = prompt | llm | parser
+    with _lock:
+        # 같은 프롬프트의 이전 버전(mtime이 다른 키)은 버림
+        for old_key in [k for k in _chains if k[0] == key[0] and k[1] != key[1]]:
+            del _chains[old_key]
+        _chains[key] = chain
+        _stats["builds"] += 1
+    return chain
+
+
+def clear_chains() -> None:
+    """만들어 둔 체인 모두 버림 (다음 호출에서 다시 구성)"""
+    with _lock:
+        _chains.clear()
+
+
+def chain_cache_stats() -> Dict[str, int]:
+    with _lock:
+        return {"chains": len(_chains), **_stats}
@@ -1,6 +1,14 @@
 """코인 가격 전문가 에이전트."""
 
-from .agent import run
-from .schemas import CoinPriceExpertResponse, NotablePeriod
+from .agent import MODEL_NAME, PROMPT_PATH, arun, run
+from .schemas import CoinPriceExpertResponse, NotablePeriod, parser
 
-__all__ = ["run", "CoinPriceExpertResponse", "NotablePeriod"]
+__all__ = [
+    "run",
+    "arun",
+    "CoinPriceExpertResponse",
+    "NotablePeriod",
+    "MODEL_NAME",
+    "PROMPT_PATH",
+    "parser",
+]
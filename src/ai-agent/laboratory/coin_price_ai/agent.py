@@ -6,9 +6,7 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_core.prompts import load_prompt
-from langchain_openai import ChatOpenAI
-
+from ..chain_cache import get_chain
 from .data import get_csv_path, get_period_data, load_coin_price_data
 from .schemas import CoinPriceExpertResponse, parser
 
@@ -18,16 +16,28 @@ try:
 except Exception:
     pass
 
-_PROMPT_PATH = Path(__file__).parent / "prompts" / "coin_price_expert.yaml"
+PROMPT_PATH = Path(__file__).parent / "prompts" / "coin_price_expert.yaml"
 MODEL_NAME = "gpt-4.1"
 
 
 def _get_chain():
-    """프롬프트·LLM·파서로 체인 구성."""
-    prompt = load_prompt(str(_PROMPT_PATH), encoding="utf-8")
-    prompt = prompt.partial(format_instructions=parser.get_format_instructions())
-    llm = ChatOpenAI(temperature=0, model=MODEL_NAME)
-    return prompt | llm | parser
+    """프롬프트·LLM·파서 체인 (프로세스당 한 번 구성, 프롬프트 파일이 바뀌면 다시 구성)."""
+    return get_chain(PROMPT_PATH, MODEL_NAME, parser)
+
+
+def _chain_input(
+    target_date: str,
+    months_before: int = 6,
+    period_data: str | None = None,
+) -> dict:
+    """체인 입력. period_data가 없으면 CSV에서 구성(노트북용)."""
+    if period_data is None:
+        df = load_coin_price_data(get_csv_path())
+        period_data = get_period_data(df, target_date, months_before=months_before)
+    return {
+        "target_date": target_date,
+        "period_data": period_data,
+    }
 
 
 def run(
@@ -46,13 +56,13 @@ def run(
     Returns:
         CoinPriceExpertResponse
     """
-    if period_data is None:
-        df = load_coin_price_data(get_csv_path())
-        period_data = get_period_data(df, target_date, months_before=months_before)
-    chain = _get_chain()
-    return chain.invoke(
-        {
-            "target_date": target_date,
-            "period_data": period_data,
-        }
-    )
+    return _get_chain().invoke(_chain_input(target_date, months_before, period_data))
+
+
+async def arun(
+    target_date: str,
+    months_before: int = 6,
+    period_data: str | None = None,
+) -> CoinPriceExpertResponse:
+    """run()의 async 버전 (chain.ainvoke, 응답을 기다리는 동안 스레드를 점유하지 않음)."""
+    return await _get_chain().ainvoke(_chain_input(target_date, months_before, period_data))
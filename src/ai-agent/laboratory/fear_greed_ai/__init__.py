@@ -1,6 +1,14 @@
 """공포/탐욕 지수 전문가 에이전트."""
 
-from .agent import run
-from .schemas import FearGreedExpertResponse, NotablePeriod
+from .agent import MODEL_NAME, PROMPT_PATH, arun, run
+from .schemas import FearGreedExpertResponse, NotablePeriod, parser
 
-__all__ = ["run", "FearGreedExpertResponse", "NotablePeriod"]
+__all__ = [
+    "run",
+    "arun",
+    "FearGreedExpertResponse",
+    "NotablePeriod",
+    "MODEL_NAME",
+    "PROMPT_PATH",
+    "parser",
+]
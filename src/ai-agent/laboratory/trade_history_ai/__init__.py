@@ -1,6 +1,15 @@
 """매매 분석·평가 메타 에이전트."""
 
-from .agent import run
-from .schemas import TradeEvaluationExpertResponse
+from .agent import MODEL_NAME, PROMPT_PATH, abatch, arun, astream_text, run
+from .schemas import TradeEvaluationExpertResponse, parser
 
-__all__ = ["run", "TradeEvaluationExpertResponse"]
+__all__ = [
+    "run",
+    "arun",
+    "abatch",
+    "astream_text",
+    "TradeEvaluationExpertResponse",
+    "MODEL_NAME",
+    "PROMPT_PATH",
+    "parser",
+]
@@ -1,14 +1,13 @@
 """매매 분석·평가 메타 에이전트: 프롬프트, LLM, 체인 및 run()."""
 
 from pathlib import Path
+from typing import AsyncIterator, Dict, List, Union
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_core.prompts import load_prompt
-from langchain_openai import ChatOpenAI
-
+from ..chain_cache import get_chain
 from .schemas import TradeEvaluationExpertResponse, parser
 
 try:
@@ -17,16 +16,34 @@ try:
 except Exception:
     pass
 
-_PROMPT_PATH = Path(__file__).parent / "prompts" / "trade_evaluation_expert.yaml"
+PROMPT_PATH = Path(__file__).parent / "prompts" / "trade_evaluation_expert.yaml"
 MODEL_NAME = "gpt-4.1"
 
 
 def _get_chain():
-    """프롬프트·LLM·파서로 체인 구성."""
-    prompt = load_prompt(str(_PROMPT_PATH), encoding="utf-8")
-    prompt = prompt.partial(format_instructions=parser.get_format_instructions())
-    llm = ChatOpenAI(temperature=0, model=MODEL_NAME)
-    return prompt | llm | parser
+    """프롬프트·LLM·파서 체인 (프로세스당 한 번 구성, 프롬프트 파일이 바뀌면 다시 구성)."""
+    return get_chain(PROMPT_PATH, MODEL_NAME, parser)
+
+
+def _chain_input(
+    target_period: str,
+    expert_article_summary: str,
+    expert_coin_price_summary: str,
+    expert_fear_greed_summary: str,
+    trade_history_text: str,
+    diary_trading_mind: str = "",
+    diary_reason: str = "",
+) -> dict:
+    """체인 입력. 일지 항목이 비어 있으면 (미기입)/(매매 일지 없음)으로 채움."""
+    return {
+        "target_period": target_period,
+        "expert_article_summary": expert_article_summary,
+        "expert_coin_price_summary": expert_coin_price_summary,
+        "expert_fear_greed_summary": expert_fear_greed_summary,
+        "diary_trading_mind": diary_trading_mind or "(미기입)",
+        "diary_reason": diary_reason or "(매매 일지 없음)",
+        "trade_history_text": trade_history_text,
+    }
 
 
 def run(
@@ -56,15 +73,89 @@ def run(
     Returns:
         TradeEvaluationExpertResponse.
     """
-    chain = _get_chain()
-    return chain.invoke(
-        {
-            "target_period": target_period,
-            "expert_article_summary": expert_article_summary,
-            "expert_coin_price_summary": expert_coin_price_summary,
-            "expert_fear_greed_summary": expert_fear_greed_summary,
-            "diary_trading_mind": diary_trading_mind or "(미기입)",
-            "diary_reason": diary_reason or "(매매 일지 없음)",
-            "trade_history_text": trade_history_text,
-        }
+    return _get_chain().invoke(
+        _chain_input(
+            target_period,
+            expert_article_summary,
+            expert_coin_price_summary,
+            expert_fear_greed_summary,
+            trade_history_text,
+            diary_trading_mind,
+            diary_reason,
+        )
+    )
+
+
+async def arun(
+    target_period: str,
+    expert_article_summary: str,
+    expert_coin_price_summary: str,
+    expert_fear_greed_summary: str,
+    trade_history_text: str,
+    diary_trading_mind: str = "",
+    diary_reason: str = "",
+) -> TradeEvaluationExpertResponse:
+    """run()의 async 버전 (chain.ainvoke, 응답을 기다리는 동안 스레드를 점유하지 않음)."""
+    return await _get_chain().ainvoke(
+        _chain_input(
+            target_period,
+            expert_article_summary,
+            expert_coin_price_summary,
+            expert_fear_greed_summary,
+            trade_history_text,
+            diary_trading_mind,
+            diary_reason,
+        )
     )
+
+
+async def abatch(
+    inputs: List[Dict[str, str]],
+    max_concurrency: int = 5,
+) -> List[Union[TradeEvaluationExpertResponse, Exception]]:
+    """
+    여러 건을 chain.abatch로 한 번에 평가합니다 (동시에 진행하는 LLM 호출은 max_concurrency개까지).
+
+    Args:
+        inputs: 건마다 run()의 키워드 인자 dict.
+        max_concurrency: 동시에 진행할 최대 호출 수.
+
+    Returns:
+        inputs와 같은 순서의 결과. 실패한 건은 예외 객체 (나머지 건은 계속 진행).
+    """
+    return await _get_chain().abatch(
+        [_chain_input(**kwargs) for kwargs in inputs],
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+
+
+async def astream_text(
+    target_period: str,
+    expert_article_summary: str,
+    expert_coin_price_summary: str,
+    expert_fear_greed_summary: str,
+    trade_history_text: str,
+    diary_trading_mind: str = "",
+    diary_reason: str = "",
+) -> AsyncIterator[str]:
+    """
+    arun()의 스트리밍 버전: 모델 출력 텍스트를 생성되는 대로 조각 단위로 반환합니다.
+    조각을 모두 이어 붙여 parser.parse()로 넘기면 arun()과 같은 TradeEvaluationExpertResponse가 됩니다.
+    """
+    chain = _get_chain()
+    # 파서는 완성된 JSON이 필요하므로 프롬프트 | LLM 까지만 스트리밍
+    prompt_llm = chain.first | chain.middle[0]
+    async for chunk in prompt_llm.astream(
+        _chain_input(
+            target_period,
+            expert_article_summary,
+            expert_coin_price_summary,
+            expert_fear_greed_summary,
+            trade_history_text,
+            diary_trading_mind,
+            diary_reason,
+        )
+    ):
+        if chunk.content:
+            yield chunk.content
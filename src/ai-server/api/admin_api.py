@@ -0,0 +1,55 @@
+"""운영 지표 조회 API."""
+
+import logging
+
+from fastapi import APIRouter
+
+from database.database_connection import db
+from database.pool import get_pool_metrics
+from dto.http_response import SuccessResponse
+from utils.cache import get_all_cache_metrics
+from utils.http_transport import get_all_metrics
+
+router = APIRouter(prefix="/admin", tags=["운영"])
+logger = logging.getLogger(__name__)
+
+
+@router.get("/http-metrics", summary="외부 HTTP 호출 지표 조회")
+async def get_http_metrics():
+    """
+    공용 HTTP 전송 계층의 호스트별 요청 수, 평균/최대 지연, 재시도 수, 상태 코드 분포와
+    커넥션 풀 상태(생성된 커넥션 수, 유휴 커넥션 수)를 반환합니다.
+    """
+    return SuccessResponse(
+        data=get_all_metrics(),
+        message="HTTP 지표 조회가 완료되었습니다",
+    )
+
+
+@router.get("/db-pool-metrics", summary="DB 커넥션 풀 지표 조회")
+async def get_db_pool_metrics():
+    """
+    sync/async 엔진의 커넥션 풀 상태(풀 크기, 체크아웃·유휴 커넥션 수, 오버플로)와
+    커넥션을 얻기까지의 평균/최대 대기 시간, 대기 타임아웃 수를 반환합니다.
+    DB_PGBOUNCER=true 이면 NullPool이므로 풀 클래스만 표시합니다.
+    복제본이 설정돼 있으면 복제본별 지연과 라우팅된 세션 수, primary 대체 횟수도 함께 반환합니다.
+    """
+    data = get_pool_metrics()
+    if db.replica_router is not None:
+        data["replica_routing"] = db.replica_router.status()
+    return SuccessResponse(
+        data=data,
+        message="DB 커넥션 풀 지표 조회가 완료되었습니다",
+    )
+
+
+@router.get("/cache-metrics", summary="캐시 지표 조회")
+async def get_cache_metrics():
+    """
+    namespace별 L1/L2 hit, miss, loader 실행·저장·L1 제거 수, L2 오류, stampede 잠금 대기 수와
+    L1 항목 수·크기, L2 사용 가능 여부를 반환합니다.
+    """
+    return SuccessResponse(
+        data=get_all_cache_metrics(),
+        message="캐시 지표 조회가 완료되었습니다",
+    )
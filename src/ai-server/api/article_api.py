@@ -6,6 +6,7 @@ import re
 from dto.http_response import ErrorResponse, SuccessResponse
 from dto.article_dto import ArticleExpertRequest
 from dependencies import get_article_agent_service
+from utils.concurrency import run_blocking
 
 router = APIRouter(prefix="/article", tags=["기사전문가 응답 확인용"])
 logger = logging.getLogger(__name__)
@@ -37,7 +38,8 @@ async def analyze_article(
                 ).dict(),
             )
 
-        response = article_service.run_article_expert(
+        response = await run_blocking(
+            article_service.run_article_expert,
             target_date=request.target_date,
             days_before=request.days_before,
             max_headlines_per_day=request.max_headlines_per_day,
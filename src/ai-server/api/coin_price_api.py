@@ -6,6 +6,7 @@ import re
 from dto.http_response import ErrorResponse, SuccessResponse
 from dto.coin_price_dto import CoinPriceRequest
 from dependencies import get_coin_price_agent_service
+from utils.concurrency import run_blocking
 
 router = APIRouter(prefix="/coin-price", tags=["코인가격전문가 응답 확인용"])
 logger = logging.getLogger(__name__)
@@ -36,7 +37,8 @@ async def analyze_coin_price(
                 ).dict(),
             )
 
-        response = coin_price_service.run_coin_price(
+        response = await run_blocking(
+            coin_price_service.run_coin_price,
             target_date=request.target_date,
             months_before=request.months_before,
             market_code=request.market_code,
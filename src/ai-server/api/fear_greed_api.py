@@ -6,6 +6,7 @@ import re
 from dto.http_response import ErrorResponse, SuccessResponse
 from dto.fear_greed_dto import FearGreedRequest
 from dependencies import get_fear_greed_agent_service
+from utils.concurrency import run_blocking
 
 router = APIRouter(prefix="/fear-greed", tags=["공포탐욕지수 응답 확인용"])
 logger = logging.getLogger(__name__)
@@ -37,7 +38,8 @@ async def analyze_fear_greed(
                 ).dict(),
             )
 
-        response = fear_greed_service.run_fear_greed(
+        response = await run_blocking(
+            fear_greed_service.run_fear_greed,
             target_date=request.target_date,
             months_before=request.months_before,
         )
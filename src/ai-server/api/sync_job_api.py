@@ -0,0 +1,178 @@
+"""거래내역·자산 백그라운드 동기화 작업 API."""
+
+import logging
+import uuid
+from typing import Any, Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+
+from dto.http_response import ErrorResponse, SuccessResponse
+from dto.sync_job_dto import SyncJobRequest, SyncJobResponse
+from dependencies import get_sync_job_service, get_sync_orchestrator
+from model.SyncJob import JOB_TYPE_TRADING_HISTORIES, JOB_TYPE_ASSETS
+from utils.concurrency import run_blocking
+
+router = APIRouter(prefix="/sync-jobs", tags=["동기화"])
+logger = logging.getLogger(__name__)
+
+
+async def _submit(sync_job_service: Any, request: SyncJobRequest, job_type: str):
+    try:
+        uuid.UUID(request.user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                status_code=400,
+                error_code="INVALID_USER_ID",
+                message="사용자 ID 형식이 올바르지 않습니다",
+                details="user_id는 UUID 형식이어야 합니다",
+            ).dict(),
+        )
+
+    try:
+        job, created = await run_blocking(
+            sync_job_service.submit, request.user_id, job_type, request.exchange_provider
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                status_code=400,
+                error_code="VALIDATION_ERROR",
+                message=str(e),
+                details="입력값을 확인해주세요",
+            ).dict(),
+        )
+
+    if not created:
+        raise HTTPException(
+            status_code=409,
+            detail=ErrorResponse(
+                status_code=409,
+                error_code="SYNC_JOB_ALREADY_RUNNING",
+                message="이미 진행 중인 동기화 작업이 있습니다",
+                details={"job_id": str(job.id), "status": job.status},
+            ).dict(),
+        )
+
+    return JSONResponse(
+        status_code=202,
+        content=SuccessResponse(
+            status_code=202,
+            data=SyncJobResponse.from_job(job).model_dump(),
+            message="동기화 작업이 등록되었습니다",
+        ).model_dump(),
+    )
+
+
+@router.post("/trading-histories", summary="거래내역 동기화 작업 등록", status_code=202)
+async def submit_trading_histories_sync(
+    request: SyncJobRequest,
+    sync_job_service: Annotated[Any, Depends(get_sync_job_service)],
+):
+    """
+    거래소 거래내역 동기화를 백그라운드 작업으로 등록하고 작업 ID를 바로 반환합니다.
+    진행 상황은 `GET /sync-jobs/{job_id}`로 조회합니다.
+    """
+    try:
+        return await _submit(sync_job_service, request, JOB_TYPE_TRADING_HISTORIES)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("거래내역 동기화 작업 등록 중 예상치 못한 에러")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.post("/assets", summary="자산 동기화 작업 등록", status_code=202)
+async def submit_assets_sync(
+    request: SyncJobRequest,
+    sync_job_service: Annotated[Any, Depends(get_sync_job_service)],
+):
+    """거래소 잔고(자산) 동기화를 백그라운드 작업으로 등록하고 작업 ID를 바로 반환합니다."""
+    try:
+        return await _submit(sync_job_service, request, JOB_TYPE_ASSETS)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("자산 동기화 작업 등록 중 예상치 못한 에러")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.get("/scheduler/status", summary="주기 동기화 스케줄러 상태 조회")
+async def get_scheduler_status(
+    sync_orchestrator: Annotated[Any, Depends(get_sync_orchestrator)],
+):
+    """큐에 쌓인 작업 수, 진행 중 작업 수, 동기화 최대 지연(초)과 SLA를 반환합니다."""
+    return SuccessResponse(
+        data=sync_orchestrator.get_status(),
+        message="스케줄러 상태 조회가 완료되었습니다",
+    )
+
+
+@router.get("/{job_id}", summary="동기화 작업 상태 조회")
+async def get_sync_job(
+    job_id: str,
+    sync_job_service: Annotated[Any, Depends(get_sync_job_service)],
+):
+    """작업 상태와 진행 상황(조회한 구간 수, 가져온 주문 수, 저장한 행 수)을 반환합니다."""
+    try:
+        try:
+            uuid.UUID(job_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=ErrorResponse(
+                    status_code=400,
+                    error_code="INVALID_JOB_ID",
+                    message="작업 ID 형식이 올바르지 않습니다",
+                    details="job_id는 UUID 형식이어야 합니다",
+                ).dict(),
+            )
+
+        job = await run_blocking(sync_job_service.get_job, job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=404,
+                detail=ErrorResponse(
+                    status_code=404,
+                    error_code="SYNC_JOB_NOT_FOUND",
+                    message="해당 동기화 작업을 찾을 수 없습니다",
+                    details=f"job_id={job_id}",
+                ).dict(),
+            )
+
+        return SuccessResponse(
+            data=SyncJobResponse.from_job(job).model_dump(),
+            message="동기화 작업 상태 조회가 완료되었습니다",
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("동기화 작업 상태 조회 중 예상치 못한 에러")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
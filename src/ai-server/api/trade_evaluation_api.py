@@ -1,15 +1,18 @@
 """매매 1건 분석·평가 메타 에이전트 API."""
 
+import json
 import logging
 import re
-from typing import Any, Annotated
+from typing import Any, Annotated, AsyncIterator, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
-from database.database_connection import db
 from dto.http_response import ErrorResponse, SuccessResponse
-from dto.trade_evaluation_dto import TradeEvaluationRequest
+from dto.trade_evaluation_dto import TradeEvaluationBatchRequest, TradeEvaluationRequest
+from database.database_connection import db
 from dependencies import (
+    get_async_db_session,
     get_trade_evaluation_agent_service,
     get_trade_evaluation_result_repository,
 )
@@ -20,6 +23,80 @@ logger = logging.getLogger(__name__)
 _DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
+def _validate_target_date(target_date: str) -> None:
+    if not _DATE_PATTERN.match(target_date):
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                status_code=400,
+                error_code="INVALID_DATE_FORMAT",
+                message="날짜 형식이 올바르지 않습니다",
+                details="target_date는 YYYY-MM-DD 형식이어야 합니다 (예: 2022-01-14)",
+            ).dict(),
+        )
+
+
+def _trade_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail=ErrorResponse(
+            status_code=404,
+            error_code="TRADE_NOT_FOUND",
+            message="해당 매매 내역을 찾을 수 없습니다",
+            details="user_id와 trade_id에 해당하는 거래가 없거나 권한이 없습니다",
+        ).dict(),
+    )
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 1건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _evaluate_and_save(
+    trade_evaluation_service: Any,
+    trade_evaluation_result_repository: Any,
+    request: TradeEvaluationRequest,
+    session: Any,
+) -> Optional[Dict[str, Any]]:
+    """
+    평가 실행 후 결과 저장
+
+    매매 조회와 결과 저장이 요청 단위 AsyncSession 하나를 사용합니다.
+    LLM 호출은 await로 기다리므로 평가 요청이 스레드 풀 크기에 묶이지 않습니다.
+    입력이 같아 저장된 결과를 그대로 쓴 경우에는 다시 저장하지 않습니다.
+
+    Returns:
+        저장된 평가 결과. 매매 내역이 없으면 None
+    """
+    response = await trade_evaluation_service.aevaluate(
+        user_id=request.user_id,
+        trade_id=request.trade_id,
+        target_date=request.target_date,
+        coin_id=request.coin_id,
+        session=session,
+    )
+    if response is None:
+        return None
+
+    data = response.to_result_dict()
+    if response.reused:
+        return data
+
+    saved = await trade_evaluation_result_repository.save_async(
+        session,
+        user_id=request.user_id,
+        trade_id=request.trade_id,
+        target_date=request.target_date,
+        coin_id=request.coin_id,
+        result_dict=data,
+        input_fingerprints=response.input_fingerprints,
+    )
+    # 응답 전에 저장을 확정
+    await session.commit()
+    return saved.result if saved is not None else data
+
+
 @router.post("/evaluate", summary="매매 1건 분석·평가")
 async def evaluate_one_trade(
     request: TradeEvaluationRequest,
@@ -27,68 +104,211 @@ async def evaluate_one_trade(
     trade_evaluation_result_repository: Annotated[
         Any, Depends(get_trade_evaluation_result_repository)
     ],
+    session: Annotated[Any, Depends(get_async_db_session)],
 ):
     """
     지정한 매매 내역 1건(trade_id)에 대해, 선택된 날짜(target_date) 기준 시장 의견(기사·코인가격·공포탐욕)을 반영해
     메타 에이전트로 분석·평가 결과를 반환합니다. **매매 1건** + **선택된 날짜** 단일로 평가합니다.
     """
     try:
-        if not _DATE_PATTERN.match(request.target_date):
-            raise HTTPException(
+        _validate_target_date(request.target_date)
+        data_to_return = await _evaluate_and_save(
+            trade_evaluation_service,
+            trade_evaluation_result_repository,
+            request,
+            session,
+        )
+        if data_to_return is None:
+            raise _trade_not_found()
+        return SuccessResponse(
+            data=data_to_return,
+            message="매매 1건 분석·평가가 완료되었습니다",
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning("매매 평가 검증 에러: %s", e)
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
                 status_code=400,
-                detail=ErrorResponse(
-                    status_code=400,
-                    error_code="INVALID_DATE_FORMAT",
-                    message="날짜 형식이 올바르지 않습니다",
-                    details="target_date는 YYYY-MM-DD 형식이어야 합니다 (예: 2022-01-14)",
-                ).dict(),
+                error_code="VALIDATION_ERROR",
+                message=str(e),
+                details="입력값을 확인해주세요",
+            ).dict(),
+        )
+    except Exception as e:
+        logger.exception("매매 분석·평가 중 예상치 못한 에러")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.post("/evaluate/batch", summary="매매 여러 건 일괄 분석·평가")
+async def evaluate_trades_batch(
+    request: TradeEvaluationBatchRequest,
+    trade_evaluation_service: Annotated[Any, Depends(get_trade_evaluation_agent_service)],
+    trade_evaluation_result_repository: Annotated[
+        Any, Depends(get_trade_evaluation_result_repository)
+    ],
+    session: Annotated[Any, Depends(get_async_db_session)],
+):
+    """
+    매매 여러 건(최대 50건)을 한 번에 평가합니다. 건마다 /evaluate와 같은 결과를 반환합니다.
+
+    같은 날짜·코인의 매매는 전문가 의견(기사·코인가격·공포탐욕)을 한 번만 조회해 공유하고,
+    새로 계산한 결과는 한 번의 upsert로 저장합니다.
+
+    - `results`: 평가된 매매 (`trade_id`, `data`, 저장된 결과를 그대로 썼으면 `reused`=true)
+    - `not_found`: 없거나 권한이 없는 trade_id
+    - `failed`: LLM 호출 실패로 평가하지 못한 매매 (`trade_id`, `error`)
+    """
+    try:
+        for item in request.items:
+            _validate_target_date(item.target_date)
+        batch = await trade_evaluation_service.aevaluate_batch(
+            user_id=request.user_id,
+            items=[(item.trade_id, item.target_date, item.coin_id) for item in request.items],
+            session=session,
+        )
+
+        targets = {item.trade_id: item for item in request.items}
+        rows = [
+            {
+                "trade_id": trade_id,
+                "target_date": targets[trade_id].target_date,
+                "coin_id": targets[trade_id].coin_id,
+                "result_dict": result.to_result_dict(),
+                "input_fingerprints": result.input_fingerprints,
+            }
+            for trade_id, result in batch.results.items()
+            if not result.reused
+        ]
+        if rows:
+            await trade_evaluation_result_repository.bulk_upsert_async(
+                session, request.user_id, rows
             )
-        response = trade_evaluation_service.evaluate(
+            await session.commit()
+
+        return SuccessResponse(
+            data={
+                "results": [
+                    {
+                        "trade_id": item.trade_id,
+                        "data": batch.results[item.trade_id].to_result_dict(),
+                        "reused": batch.results[item.trade_id].reused,
+                    }
+                    for item in request.items
+                    if item.trade_id in batch.results
+                ],
+                "not_found": batch.not_found,
+                "failed": [
+                    {"trade_id": trade_id, "error": error}
+                    for trade_id, error in batch.failed.items()
+                ],
+            },
+            message=f"매매 {len(batch.results)}건 분석·평가가 완료되었습니다",
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning("매매 일괄 평가 검증 에러: %s", e)
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                status_code=400,
+                error_code="VALIDATION_ERROR",
+                message=str(e),
+                details="입력값을 확인해주세요",
+            ).dict(),
+        )
+    except Exception as e:
+        logger.exception("매매 일괄 분석·평가 중 예상치 못한 에러")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+async def _stream_and_save(
+    trade_evaluation_service: Any,
+    trade_evaluation_result_repository: Any,
+    request: TradeEvaluationRequest,
+    plan: Any,
+) -> AsyncIterator[str]:
+    """
+    평가 이벤트를 SSE로 전달하고, 최종 결과는 /evaluate와 같이 저장한 뒤 result 이벤트로 보냄
+
+    응답 본문은 요청 세션이 닫힌 뒤에 전송되므로 저장은 별도 AsyncSession으로 합니다.
+    스트림 도중 오류는 HTTP 상태를 바꿀 수 없으므로 error 이벤트로 보내고 종료합니다.
+    """
+    try:
+        async for event, data in trade_evaluation_service.astream(plan):
+            if event == "result" and not data["reused"]:
+                async with db.get_async_session() as session:
+                    await trade_evaluation_result_repository.save_async(
+                        session,
+                        user_id=request.user_id,
+                        trade_id=request.trade_id,
+                        target_date=request.target_date,
+                        coin_id=request.coin_id,
+                        result_dict=data["data"],
+                        input_fingerprints=plan.input_fingerprints,
+                    )
+                    await session.commit()
+            yield _sse(event, data)
+    except Exception as e:
+        logger.exception("매매 분석·평가 스트리밍 중 예상치 못한 에러")
+        yield _sse(
+            "error",
+            ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.post("/evaluate/stream", summary="매매 1건 분석·평가 (SSE 스트리밍)")
+async def stream_one_trade_evaluation(
+    request: TradeEvaluationRequest,
+    trade_evaluation_service: Annotated[Any, Depends(get_trade_evaluation_agent_service)],
+    trade_evaluation_result_repository: Annotated[
+        Any, Depends(get_trade_evaluation_result_repository)
+    ],
+):
+    """
+    /evaluate와 같은 평가를 `text/event-stream`으로 진행 상황과 함께 반환합니다.
+
+    - `expert`: 전문가 응답 (`name`: article_expert / coin_price_expert / fear_greed_expert). 끝나는 순서대로
+    - `token`: 메타 에이전트 출력 조각 (`text`)
+    - `result`: 최종 결과 (`data`는 /evaluate 응답 data와 같음, 저장 후 전송)
+    - `error`: 진행 중 오류 (ErrorResponse 형식), 이후 스트림 종료
+
+    날짜 형식 오류(400)와 매매 내역 없음(404)은 스트림을 시작하기 전에 일반 에러 응답으로 반환합니다.
+    """
+    try:
+        _validate_target_date(request.target_date)
+        plan = await trade_evaluation_service.aprepare(
             user_id=request.user_id,
             trade_id=request.trade_id,
             target_date=request.target_date,
             coin_id=request.coin_id,
         )
-        if response is None:
-            raise HTTPException(
-                status_code=404,
-                detail=ErrorResponse(
-                    status_code=404,
-                    error_code="TRADE_NOT_FOUND",
-                    message="해당 매매 내역을 찾을 수 없습니다",
-                    details="user_id와 trade_id에 해당하는 거래가 없거나 권한이 없습니다",
-                ).dict(),
-            )
-        data = {
-            "article_expert": response.article_expert.model_dump(),
-            "coin_price_expert": response.coin_price_expert.model_dump(),
-            "fear_greed_expert": response.fear_greed_expert.model_dump(),
-            "trade_evaluation_expert": response.trade_evaluation.model_dump(),
-        }
-        session = db.get_session()
-        try:
-            trade_evaluation_result_repository.save(
-                session,
-                user_id=request.user_id,
-                trade_id=request.trade_id,
-                target_date=request.target_date,
-                coin_id=request.coin_id,
-                result_dict=data,
-            )
-            session.commit()
-            saved = trade_evaluation_result_repository.find_by_trade_id(
-                session, request.trade_id
-            )
-            data_to_return = saved.result if saved else data
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
-        return SuccessResponse(
-            data=data_to_return,
-            message="매매 1건 분석·평가가 완료되었습니다",
-        )
+        if plan is None:
+            raise _trade_not_found()
     except HTTPException:
         raise
     except ValueError as e:
@@ -103,7 +323,7 @@ async def evaluate_one_trade(
             ).dict(),
         )
     except Exception as e:
-        logger.exception("매매 분석·평가 중 예상치 못한 에러")
+        logger.exception("매매 분석·평가 준비 중 예상치 못한 에러")
         raise HTTPException(
             status_code=500,
             detail=ErrorResponse(
@@ -113,3 +333,12 @@ async def evaluate_one_trade(
                 details=str(e),
             ).dict(),
         )
+
+    return StreamingResponse(
+        _stream_and_save(
+            trade_evaluation_service, trade_evaluation_result_repository, request, plan
+        ),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 이벤트를 모아 보내지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,140 @@
+"""거래내역 조회·내보내기 API."""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Annotated, Optional
+
+import pytz
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from dto.http_response import ErrorResponse, SuccessResponse
+from dependencies import get_trading_histories_service
+from service.trading_histories_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from utils.concurrency import run_blocking
+
+router = APIRouter(prefix="/trading-histories", tags=["거래내역"])
+logger = logging.getLogger(__name__)
+
+# trade_time은 업비트 체결 시각(KST)을 timezone 없이 저장
+_KST = pytz.timezone("Asia/Seoul")
+
+
+def _bad_request(error_code: str, message: str, details: str) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=ErrorResponse(
+            status_code=400,
+            error_code=error_code,
+            message=message,
+            details=details,
+        ).dict(),
+    )
+
+
+def _validate_user_id(user_id: str) -> None:
+    try:
+        uuid.UUID(user_id)
+    except ValueError:
+        raise _bad_request(
+            "INVALID_USER_ID",
+            "사용자 ID 형식이 올바르지 않습니다",
+            "user_id는 UUID 형식이어야 합니다",
+        )
+
+
+def _to_kst_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """timezone이 있는 값은 KST로 변환 후 timezone 제거 (trade_time 저장 형식과 맞춤)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(_KST).replace(tzinfo=None)
+
+
+@router.get("", summary="거래내역 목록 조회 (키셋 페이지네이션)")
+async def list_trading_histories(
+    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+    user_id: Annotated[str, Query(description="사용자 UUID")],
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_PAGE_SIZE, description="페이지 크기")
+    ] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        Optional[str], Query(description="직전 응답의 next_cursor (없으면 첫 페이지)")
+    ] = None,
+    coin_id: Annotated[Optional[int], Query(description="코인 ID")] = None,
+    exchange_code: Annotated[Optional[int], Query(description="거래소 코드")] = None,
+    start_time: Annotated[
+        Optional[datetime], Query(description="체결 시각 시작 (포함)")
+    ] = None,
+    end_time: Annotated[
+        Optional[datetime], Query(description="체결 시각 끝 (미포함)")
+    ] = None,
+):
+    """
+    거래내역을 최신순으로 한 페이지씩 반환합니다.
+    응답의 `next_cursor`를 다음 요청의 `cursor`로 넘기면 이어서 조회하며, `has_more`가 false이면 마지막 페이지입니다.
+    """
+    _validate_user_id(user_id)
+    try:
+        data = await run_blocking(
+            trading_histories_service.get_trading_histories_page,
+            user_id,
+            limit=limit,
+            cursor=cursor,
+            coin_id=coin_id,
+            exchange_code=exchange_code,
+            start_time=_to_kst_naive(start_time),
+            end_time=_to_kst_naive(end_time),
+        )
+        return SuccessResponse(
+            data=data,
+            message="거래내역 조회가 완료되었습니다",
+        )
+    except ValueError as e:
+        raise _bad_request("INVALID_CURSOR", str(e), "next_cursor 값을 그대로 넘겨주세요")
+    except Exception as e:
+        logger.exception("거래내역 목록 조회 중 예상치 못한 에러")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.get("/export", summary="거래내역 내보내기 (NDJSON 스트리밍)")
+async def export_trading_histories(
+    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+    user_id: Annotated[str, Query(description="사용자 UUID")],
+    coin_id: Annotated[Optional[int], Query(description="코인 ID")] = None,
+    exchange_code: Annotated[Optional[int], Query(description="거래소 코드")] = None,
+    start_time: Annotated[
+        Optional[datetime], Query(description="체결 시각 시작 (포함)")
+    ] = None,
+    end_time: Annotated[
+        Optional[datetime], Query(description="체결 시각 끝 (미포함)")
+    ] = None,
+):
+    """
+    조건에 맞는 거래내역 전체를 최신순 NDJSON(`application/x-ndjson`, 한 줄에 1건)으로 스트리밍합니다.
+    DB에서 배치 단위로 읽으며 바로 전송하므로 건수와 관계없이 서버 메모리 사용량이 일정합니다.
+    """
+    _validate_user_id(user_id)
+    # 동기 제너레이터는 Starlette가 스레드 풀에서 순회 (이벤트 루프를 막지 않음)
+    lines = trading_histories_service.iter_trading_histories_ndjson(
+        user_id,
+        coin_id=coin_id,
+        exchange_code=exchange_code,
+        start_time=_to_kst_naive(start_time),
+        end_time=_to_kst_naive(end_time),
+    )
+    return StreamingResponse(
+        lines,
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="trading_histories_{user_id}.ndjson"'
+        },
+    )
@@ -0,0 +1,146 @@
+"""
+일봉 캔들 수집기 오프라인 벤치마크.
+
+녹화한 /v1/candles/days 응답(HTTP_RECORD_MODE=replay)으로 data-collector의
+CoinPricesCollector를 여러 코인에 대해 실행하고 코인당 수집 시간과 초당 캔들 처리량을 측정합니다.
+기본적으로 저장 단계는 건수만 세고, --save를 주면 실제 DB에 저장합니다.
+
+    # 가상 응답 생성 후 측정
+    python benchmarks/bench_candle_collection.py --synthesize --markets 20
+
+    # 실제 응답 녹화 (공개 API)
+    HTTP_RECORD_MODE=record python benchmarks/bench_candle_collection.py --markets 5
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent))
+sys.path.insert(0, str(BENCHMARK_DIR))
+sys.path.insert(0, str(BENCHMARK_DIR.parent.parent / "data-collector"))
+
+DEFAULT_CASSETTE_DIR = BENCHMARK_DIR / "cassettes" / "candle_collection"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="일봉 캔들 수집기 오프라인 벤치마크")
+    parser.add_argument("--cassette-dir", default=str(DEFAULT_CASSETTE_DIR))
+    parser.add_argument("--synthesize", action="store_true", help="가상 응답 생성 후 재생")
+    parser.add_argument("--markets", type=int, default=10, help="수집할 코인 수")
+    parser.add_argument("--start", default="2022-01-01", help="수집 시작일 (UTC)")
+    parser.add_argument("--end", default="2025-01-01", help="수집 종료일 (UTC)")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=None, help="응답 지연 (기본: 녹화값)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 주입 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", action="store_true", help="실제 DB에 저장")
+    return parser.parse_args()
+
+
+def configure_env(args) -> None:
+    """전송 계층이 만들어지기 전에 녹화/재생 설정"""
+    os.environ.setdefault("HTTP_RECORD_MODE", "replay")
+    os.environ["HTTP_CASSETTE_DIR"] = args.cassette_dir
+    os.environ["HTTP_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["HTTP_REPLAY_429_RATE"] = str(args.rate_429)
+    os.environ["HTTP_REPLAY_SEED"] = str(args.seed)
+    os.environ["HTTP_RETRY_BACKOFF_SEC"] = "0.01"
+    if args.latency_ms is not None:
+        os.environ["HTTP_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+
+
+class CountingRepository:
+    """저장 대신 건수만 세는 저장소 (HTTP·변환 구간만 측정)"""
+
+    def __init__(self):
+        self.saved = 0
+        self._lock = threading.Lock()
+
+    def save_candle_list(self, candle_list) -> int:
+        with self._lock:
+            self.saved += len(candle_list)
+        return len(candle_list)
+
+
+def main():
+    args = parse_args()
+    configure_env(args)
+
+    import pytz
+
+    # 매퍼 설정을 위해 관계가 있는 모델을 모두 로드
+    import model.Assets  # noqa: F401
+    import model.CoinHoldingsPast  # noqa: F401
+    import model.ExchangeCredentials  # noqa: F401
+    import model.TradingHistories  # noqa: F401
+    import model.Users  # noqa: F401
+    from coin_prices_collector import CoinPricesCollector
+    from model.Coins import Coins
+    from synthetic_cassettes import synthesize_candle_cassette
+    from utils.http_transport import get_transport
+
+    start_date = pytz.UTC.localize(datetime.strptime(args.start, "%Y-%m-%d"))
+    end_date = pytz.UTC.localize(datetime.strptime(args.end, "%Y-%m-%d"))
+    markets = [f"KRW-BENCH{i:03d}" for i in range(args.markets)]
+
+    if args.synthesize:
+        cassette_path, candle_count = synthesize_candle_cassette(
+            Path(args.cassette_dir) / "upbit.jsonl",
+            markets,
+            start_date,
+            end_date,
+            seed=args.seed,
+        )
+        print(f"가상 응답 생성: {cassette_path} (캔들 {candle_count}개)")
+
+    collector = CoinPricesCollector(max_workers=args.workers)
+    if not args.save:
+        collector.repository = CountingRepository()
+
+    coins = [
+        Coins(id=i + 1, market_code=market, is_active=True)
+        for i, market in enumerate(markets)
+    ]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=collector.max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda coin: collector._fetch_and_save_candles(coin, start_date, end_date),
+                coins,
+            )
+        )
+    elapsed = time.perf_counter() - started
+
+    fetched = sum(r["total_fetched"] for r in results)
+    errors = [r for r in results if r["error"] is not None]
+    host_metrics = get_transport("upbit").get_metrics()["hosts"].get("api.upbit.com", {})
+    print(
+        f"코인 {len(coins)}개 (실패 {len(errors)}개), 캔들 {fetched}개, "
+        f"워커 {collector.max_workers}개, {elapsed:.2f}초"
+    )
+    print(
+        f"처리량: {fetched / elapsed if elapsed else 0:.1f} 캔들/초, "
+        f"코인당 {elapsed / len(coins) * 1000 if coins else 0:.1f}ms"
+    )
+    print(
+        f"HTTP 요청 {host_metrics.get('requests', 0)}회, 재시도 {host_metrics.get('retries', 0)}회, "
+        f"평균 지연 {host_metrics.get('avg_latency_ms', 0)}ms"
+    )
+    cassette = get_transport("upbit").cassette
+    if cassette is not None:
+        print(f"재생 통계: {cassette.stats}")
+    for r in errors[:5]:
+        print(f"  실패 {r['market_code']}: {r['error']}")
+
+
+if __name__ == "__main__":
+    main()
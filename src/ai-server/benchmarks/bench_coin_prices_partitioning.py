@@ -0,0 +1,230 @@
+"""
+coin_prices_day 파티션 벤치마크.
+
+같은 데이터를 일반 테이블과 연 단위 파티션 테이블(임시 스키마 두 개)에 채우고
+저장소의 기간 조회, 수집기의 최신 캔들 조회·중복 저장(ON CONFLICT DO NOTHING) 지연을 비교합니다.
+기본값은 현재 규모(마켓 약 250개, 2017-10 ~ 오늘 일봉)의 10배입니다.
+
+    python benchmarks/bench_coin_prices_partitioning.py --database-url postgresql://user:pw@localhost:5432/bitriever_test
+
+    # 현재 규모로
+    python benchmarks/bench_coin_prices_partitioning.py --scale 1
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SCHEMAS = {"plain": "bench_cpd_plain", "partitioned": "bench_cpd_partitioned"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="coin_prices_day 파티션 벤치마크")
+    parser.add_argument("--database-url", default=os.getenv("TEST_DATABASE_URL"))
+    parser.add_argument("--markets", type=int, default=250, help="현재 마켓 수")
+    parser.add_argument("--scale", type=int, default=10, help="마켓 수 배율")
+    parser.add_argument("--start", default="2017-10-01", help="일봉 시작일 (UTC)")
+    parser.add_argument("--end", default=datetime.utcnow().strftime("%Y-%m-%d"), help="일봉 종료일 (UTC)")
+    parser.add_argument("--window-days", type=int, default=180, help="기간 조회 범위")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="끝나도 스키마를 지우지 않음")
+    return parser.parse_args()
+
+
+def make_engine(url: str, schema: str):
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine(url)
+
+    @event.listens_for(engine, "connect")
+    def _set_search_path(dbapi_connection, _):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"SET search_path TO {schema}")
+        dbapi_connection.commit()
+
+    return engine
+
+
+def seed(engines, coin_count: int, start: datetime, end: datetime) -> int:
+    """파티션 스키마는 모델로, 일반 스키마는 LIKE로 만든 뒤 같은 데이터 채움"""
+    from sqlalchemy import text
+
+    from database.database_connection import db
+    from database.partitions import ensure_yearly_partitions
+    from model.CoinPricesDay import CoinPricesDay
+    from model.Coins import Coins
+
+    partitioned = SCHEMAS["partitioned"]
+    db.Base.metadata.create_all(
+        engines["partitioned"], tables=[Coins.__table__, CoinPricesDay.__table__]
+    )
+    ensure_yearly_partitions(
+        engines["partitioned"], "coin_prices_day", range(start.year, end.year + 1)
+    )
+    with engines["plain"].begin() as connection:
+        connection.execute(text(f"CREATE TABLE coins (LIKE {partitioned}.coins INCLUDING ALL)"))
+        connection.execute(
+            text(f"CREATE TABLE coin_prices_day (LIKE {partitioned}.coin_prices_day INCLUDING ALL)")
+        )
+
+    row_count = 0
+    for name, engine in engines.items():
+        started = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO coins (id, symbol, quote_currency, market_code, exchange) "
+                    "SELECT i, 'B' || i, 'KRW', 'KRW-B' || i, 'upbit' FROM generate_series(1, :n) i"
+                ),
+                {"n": coin_count},
+            )
+            row_count = connection.execute(
+                text(
+                    "INSERT INTO coin_prices_day (coin_id, market_code, candle_date_time_utc, "
+                    "candle_date_time_kst, opening_price, high_price, low_price, trade_price, "
+                    "timestamp, candle_acc_trade_price, candle_acc_trade_volume, "
+                    "prev_closing_price, change_price, change_rate) "
+                    "SELECT c, 'KRW-B' || c, d, d + interval '9 hours', 100, 110, 90, 105, 0, "
+                    "1000, 10, 100, 5, 0.05 "
+                    "FROM generate_series(1, :n) c, generate_series(:start, :end, interval '1 day') d"
+                ),
+                {"n": coin_count, "start": start, "end": end},
+            ).rowcount
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM ANALYZE coin_prices_day"))
+        print(f"{name}: {row_count}행 적재 {time.perf_counter() - started:.1f}초")
+    return row_count
+
+
+def measure(fn, repeat: int) -> str:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return f"p50 {statistics.median(timings):7.2f}ms  p95 {p95:7.2f}ms"
+
+
+def main():
+    args = parse_args()
+    if not args.database_url:
+        sys.exit("--database-url 또는 TEST_DATABASE_URL이 필요합니다")
+
+    from sqlalchemy import func, select, text
+    from sqlalchemy.dialects.postgresql import insert
+    from sqlalchemy.orm import sessionmaker
+
+    # 매퍼 설정을 위해 관계가 있는 모델을 모두 로드
+    import model.Assets  # noqa: F401
+    import model.CoinHoldingsPast  # noqa: F401
+    import model.ExchangeCredentials  # noqa: F401
+    import model.TradingHistories  # noqa: F401
+    import model.Users  # noqa: F401
+    from model.CoinPricesDay import CoinPricesDay
+    from repository.coin_price_day_repository import CoinPriceDayRepository
+
+    start = datetime.strptime(args.start, "%Y-%m-%d")
+    end = datetime.strptime(args.end, "%Y-%m-%d")
+    coin_count = args.markets * args.scale
+    rng = random.Random(args.seed)
+    repository = CoinPriceDayRepository()
+
+    setup = make_engine(args.database_url, "public")
+    with setup.begin() as connection:
+        for schema in SCHEMAS.values():
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engines = {name: make_engine(args.database_url, schema) for name, schema in SCHEMAS.items()}
+
+    try:
+        row_count = seed(engines, coin_count, start, end)
+        print(
+            f"마켓 {coin_count}개 x {(end - start).days + 1}일 = {row_count}행, "
+            f"기간 조회 {args.window_days}일, {args.repeat}회 반복\n"
+        )
+
+        span_days = (end - start).days - args.window_days
+        columns = [
+            c.key for c in CoinPricesDay.__table__.columns
+            if c.key not in ("id", "created_at", "updated_at")
+        ]
+
+        for name, engine in engines.items():
+            Session = sessionmaker(bind=engine)
+
+            def random_window():
+                window_start = start + timedelta(days=rng.randrange(span_days))
+                return rng.randint(1, coin_count), window_start, window_start + timedelta(days=args.window_days)
+
+            def by_coin_id():
+                coin_id, window_start, window_end = random_window()
+                with Session() as session:
+                    repository.find_by_coin_id_and_date_range(session, coin_id, window_start, window_end)
+
+            def by_market_code():
+                coin_id, window_start, window_end = random_window()
+                with Session() as session:
+                    repository.find_by_market_code_and_date_range(
+                        session, f"KRW-B{coin_id}", window_start, window_end
+                    )
+
+            def latest_candle():
+                with Session() as session:
+                    session.execute(
+                        select(func.max(CoinPricesDay.candle_date_time_utc)).where(
+                            CoinPricesDay.coin_id == rng.randint(1, coin_count)
+                        )
+                    ).scalar()
+
+            def duplicate_batch():
+                # 수집기가 이미 저장한 200일을 다시 저장하는 경우 (모두 중복, rollback)
+                coin_id, window_start, _ = random_window()
+                rows = [
+                    {
+                        **{key: 0 for key in columns},
+                        "coin_id": coin_id,
+                        "market_code": f"KRW-B{coin_id}",
+                        "candle_date_time_utc": window_start + timedelta(days=i),
+                        "candle_date_time_kst": window_start + timedelta(days=i, hours=9),
+                        "converted_trade_price": None,
+                    }
+                    for i in range(200)
+                ]
+                with Session() as session:
+                    session.execute(
+                        insert(CoinPricesDay)
+                        .values(rows)
+                        .on_conflict_do_nothing(index_elements=["market_code", "candle_date_time_utc"])
+                    )
+                    session.rollback()
+
+            print(f"[{name}]")
+            for label, fn in (
+                ("coin_id 기간 조회", by_coin_id),
+                ("market_code 기간 조회", by_market_code),
+                ("최신 캔들 조회", latest_candle),
+                ("중복 200건 저장", duplicate_batch),
+            ):
+                print(f"  {label:<16} {measure(fn, args.repeat)}")
+    finally:
+        for engine in engines.values():
+            engine.dispose()
+        if not args.keep:
+            with setup.begin() as connection:
+                for schema in SCHEMAS.values():
+                    connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        setup.dispose()
+
+
+if __name__ == "__main__":
+    main()
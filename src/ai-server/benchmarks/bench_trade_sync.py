@@ -0,0 +1,149 @@
+"""
+거래내역 동기화 오프라인 벤치마크.
+
+녹화한 업비트 응답(HTTP_RECORD_MODE=replay)으로 조회 → 변환 단계를 돌려
+구간(페이지)당 처리 시간과 초당 주문 처리량을 측정합니다. DB와 실제 API는 사용하지 않습니다.
+
+    # 가상 응답 생성 후 측정
+    python benchmarks/bench_trade_sync.py --synthesize
+
+    # 실제 계정 응답 녹화 (한 번만, 녹화 파일에는 인증 헤더가 남지 않음)
+    HTTP_RECORD_MODE=record python benchmarks/bench_trade_sync.py --access-key ... --secret-key ...
+
+    # 지연·429 주입하여 재생
+    python benchmarks/bench_trade_sync.py --latency-ms 50 --jitter-ms 20 --rate-429 0.05
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+DEFAULT_CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes" / "trade_sync"
+DEFAULT_MARKETS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-DOGE"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="거래내역 동기화 오프라인 벤치마크")
+    parser.add_argument("--cassette-dir", default=str(DEFAULT_CASSETTE_DIR))
+    parser.add_argument("--synthesize", action="store_true", help="가상 응답 생성 후 재생")
+    parser.add_argument("--start", default="2024-01-01", help="조회 시작일 (KST, 가상 응답은 시작일부터 1년)")
+    parser.add_argument("--max-orders", type=int, default=20, help="구간당 최대 주문 수 (가상)")
+    parser.add_argument("--latency-ms", type=float, default=None, help="응답 지연 (기본: 녹화값)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 주입 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rate-limit", type=float, default=25.0, help="access key당 초당 요청 수")
+    parser.add_argument("--access-key", default="benchmark")
+    parser.add_argument("--secret-key", default="benchmark")
+    return parser.parse_args()
+
+
+def configure_env(args) -> None:
+    """전송 계층이 만들어지기 전에 녹화/재생 설정"""
+    os.environ.setdefault("HTTP_RECORD_MODE", "replay")
+    os.environ["HTTP_CASSETTE_DIR"] = args.cassette_dir
+    os.environ["HTTP_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["HTTP_REPLAY_429_RATE"] = str(args.rate_429)
+    os.environ["HTTP_REPLAY_SEED"] = str(args.seed)
+    os.environ["HTTP_RETRY_BACKOFF_SEC"] = "0.01"
+    os.environ["UPBIT_RATE_LIMIT_PER_SEC"] = str(args.rate_limit)
+    if args.latency_ms is not None:
+        os.environ["HTTP_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+
+
+def main():
+    args = parse_args()
+    configure_env(args)
+
+    import pytz
+
+    # 매퍼 설정을 위해 관계가 있는 모델을 모두 로드
+    import model.Assets  # noqa: F401
+    import model.CoinHoldingsPast  # noqa: F401
+    import model.CoinPricesDay  # noqa: F401
+    import model.Coins  # noqa: F401
+    import model.ExchangeCredentials  # noqa: F401
+    import model.Users  # noqa: F401
+    import service.upbit_service as upbit_service_module
+    from service.trading_histories_service import TradingHistoriesService
+    from service.upbit_service import UpbitService
+    from synthetic_cassettes import synthesize_trade_cassette
+    from utils.http_cassette import MODE_REPLAY, get_record_mode
+    from utils.http_transport import get_transport
+
+    start_time = pytz.timezone("Asia/Seoul").localize(
+        datetime.strptime(args.start, "%Y-%m-%d")
+    )
+    cassette_path = Path(args.cassette_dir) / "upbit.jsonl"
+    if args.synthesize:
+        try:
+            _, order_count = synthesize_trade_cassette(
+                cassette_path,
+                start_time,
+                DEFAULT_MARKETS,
+                orders_per_window=(0, args.max_orders),
+                seed=args.seed,
+            )
+        except ValueError as e:
+            sys.exit(f"가상 응답을 만들 수 없습니다: {e}")
+        print(f"가상 응답 생성: {cassette_path} (주문 {order_count}건)")
+
+    transport = get_transport("upbit")
+    if get_record_mode() == MODE_REPLAY:
+        recorded_at = transport.cassette.meta.get("recorded_at")
+        if recorded_at is None:
+            sys.exit(f"재생할 녹화 파일이 없습니다: {cassette_path} (--synthesize 사용)")
+        # 조회 구간이 녹화 때와 같아야 응답이 매칭되므로 현재 시각을 녹화 시각으로 고정
+        frozen_now = datetime.fromisoformat(recorded_at).astimezone(
+            pytz.timezone("Asia/Seoul")
+        )
+        upbit_service_module.get_current_korea_time = lambda: frozen_now
+
+    upbit_service = UpbitService()
+    trading_histories_service = TradingHistoriesService()
+    coin_map = {market: i + 1 for i, market in enumerate(DEFAULT_MARKETS)}
+
+    windows = orders = rows = 0
+    page_times = []
+    started = time.perf_counter()
+    page_started = started
+    for page in upbit_service.iter_trading_history_pages(
+        args.access_key, args.secret_key, start_time
+    ):
+        rows += len(
+            trading_histories_service.process_trading_histories(
+                "benchmark", "UPBIT", page["orders"], coin_map=coin_map
+            )
+        )
+        windows += 1
+        orders += len(page["orders"])
+        now = time.perf_counter()
+        page_times.append(now - page_started)
+        page_started = now
+    elapsed = time.perf_counter() - started
+
+    page_times.sort()
+    host_metrics = transport.get_metrics()["hosts"].get("api.upbit.com", {})
+    print(f"구간 {windows}개, 주문 {orders}건, 변환 {rows}건, {elapsed:.2f}초")
+    print(f"처리량: {orders / elapsed if elapsed else 0:.1f} 주문/초")
+    if page_times:
+        print(
+            f"구간당 처리 시간: p50 {page_times[len(page_times) // 2] * 1000:.1f}ms, "
+            f"p95 {page_times[int(len(page_times) * 0.95) - 1] * 1000:.1f}ms"
+        )
+    print(
+        f"HTTP 요청 {host_metrics.get('requests', 0)}회, 재시도 {host_metrics.get('retries', 0)}회, "
+        f"상태 코드 {host_metrics.get('status_counts', {})}"
+    )
+    if transport.cassette is not None:
+        print(f"재생 통계: {transport.cassette.stats}")
+
+
+if __name__ == "__main__":
+    main()
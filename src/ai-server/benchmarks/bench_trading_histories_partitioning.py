@@ -0,0 +1,239 @@
+"""
+trading_histories user_id HASH 파티션 벤치마크.
+
+같은 데이터를 일반 테이블과 user_id HASH 파티션 테이블(임시 스키마 두 개)에 채우고
+저장소의 사용자별 조회·수익률 일괄 갱신 지연과 동기화 일괄 저장(bulk_insert_trading_histories) 처리량,
+사용자 거래내역 삭제 시간을 비교합니다. 파티션 스키마는 일반 테이블로 채운 뒤
+partition_trading_histories_by_user()로 전환하므로 전환 시간도 함께 출력합니다.
+
+    python benchmarks/bench_trading_histories_partitioning.py --database-url postgresql://user:pw@localhost:5432/bitriever_test
+
+    # 작은 규모로 빠르게
+    python benchmarks/bench_trading_histories_partitioning.py --users 2000 --repeat 50
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SCHEMAS = {"plain": "bench_th_plain", "hash": "bench_th_hash"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="trading_histories HASH 파티션 벤치마크")
+    parser.add_argument("--database-url", default=os.getenv("TEST_DATABASE_URL"))
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--trades-per-user", type=int, default=500)
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--sync-users", type=int, default=20, help="일괄 저장을 측정할 신규 사용자 수")
+    parser.add_argument("--sync-trades", type=int, default=5000, help="신규 사용자당 저장할 거래 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="끝나도 스키마를 지우지 않음")
+    return parser.parse_args()
+
+
+def make_engine(url: str, schema: str):
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine(url)
+
+    @event.listens_for(engine, "connect")
+    def _set_search_path(dbapi_connection, _):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"SET search_path TO {schema}")
+        dbapi_connection.commit()
+
+    return engine
+
+
+def user_id(n: int) -> uuid.UUID:
+    return uuid.UUID(bytes=bytes.fromhex(f"{n:032x}"))
+
+
+def seed(engine, users: int, trades_per_user: int, sync_users: int) -> int:
+    from sqlalchemy import text
+
+    from database.database_connection import db
+    from database.migrate import run_migrations
+
+    db.Base.metadata.create_all(engine)
+    run_migrations(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO users (id, email, nickname, signup_type, is_connect_exchange) "
+                "SELECT lpad(to_hex(i), 32, '0')::uuid, 'u' || i || '@bench', 'u' || i, 0, false "
+                "FROM generate_series(1, :n) i"
+            ),
+            {"n": users + sync_users},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO coins (id, symbol, quote_currency, market_code, exchange) "
+                "SELECT i, 'B' || i, 'KRW', 'KRW-B' || i, 'upbit' FROM generate_series(1, 50) i"
+            )
+        )
+        count = connection.execute(
+            text(
+                "INSERT INTO trading_histories (user_id, coin_id, exchange_code, trade_uuid, trade_type, "
+                "price, quantity, total_price, fee, trade_time) "
+                "SELECT lpad(to_hex(u), 32, '0')::uuid, t % 50 + 1, t % 2 + 1, u || '-' || t, t % 2, "
+                "100, 1, 100, 0, timestamp '2020-01-01' + (u * 7 + t) * interval '37 minutes' "
+                "FROM generate_series(1, :users) u, generate_series(1, :trades) t"
+            ),
+            {"users": users, "trades": trades_per_user},
+        ).rowcount
+        connection.execute(
+            text(
+                "INSERT INTO trade_evaluation_results (user_id, trade_id, target_date, coin_id, result) "
+                "SELECT user_id, id, date '2024-01-01', coin_id, '{}'::jsonb "
+                "FROM trading_histories WHERE id % 100 = 0"
+            )
+        )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE"))
+    return count
+
+
+def percentiles(timings) -> str:
+    timings = sorted(timings)
+    p95 = timings[math.ceil(len(timings) * 0.95) - 1]
+    return f"p50 {statistics.median(timings):8.2f}ms  p95 {p95:8.2f}ms"
+
+
+def measure(fn, repeat: int) -> str:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return percentiles(timings)
+
+
+def main():
+    args = parse_args()
+    if not args.database_url:
+        sys.exit("--database-url 또는 TEST_DATABASE_URL이 필요합니다")
+
+    from sqlalchemy import text
+    from sqlalchemy.orm import sessionmaker
+
+    import model.Assets  # noqa: F401
+    import model.CoinHoldingsPast  # noqa: F401
+    import model.CoinPricesDay  # noqa: F401
+    import model.Coins  # noqa: F401
+    import model.ExchangeCredentials  # noqa: F401
+    import model.TradeEvaluationResult  # noqa: F401
+    import model.Users  # noqa: F401
+    from database.database_connection import db
+    from database.partitions import partition_trading_histories_by_user
+    from database.replica import RoutingSession
+    from model.TradingHistories import TradingHistories
+    from repository.trading_histories_repository import TradingHistoriesRepository
+
+    rng = random.Random(args.seed)
+    repository = TradingHistoriesRepository()
+
+    setup = make_engine(args.database_url, "public")
+    with setup.begin() as connection:
+        for schema in SCHEMAS.values():
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engines = {name: make_engine(args.database_url, schema) for name, schema in SCHEMAS.items()}
+
+    try:
+        for name, engine in engines.items():
+            started = time.perf_counter()
+            count = seed(engine, args.users, args.trades_per_user, args.sync_users)
+            print(f"{name}: {count}행 적재 {time.perf_counter() - started:.1f}초")
+
+        started = time.perf_counter()
+        partition_trading_histories_by_user(engines["hash"], partitions=args.partitions)
+        print(f"hash: 파티션 {args.partitions}개로 전환 {time.perf_counter() - started:.1f}초\n")
+        with engines["hash"].connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM ANALYZE trading_histories"))
+
+        print(
+            f"사용자 {args.users}명 x {args.trades_per_user}건 = {count}행, {args.repeat}회 반복, "
+            f"신규 사용자 {args.sync_users}명 x {args.sync_trades}건 저장\n"
+        )
+
+        for name, engine in engines.items():
+            db.SessionLocal = sessionmaker(class_=RoutingSession, bind=engine, expire_on_commit=False)
+
+            def random_user() -> str:
+                return str(user_id(rng.randint(1, args.users)))
+
+            def by_exchange():
+                repository.find_by_user_and_exchange(random_user(), 1)
+
+            def first_page():
+                repository.find_page_by_user(random_user(), 101)
+
+            def exists():
+                repository.exists_by_user_and_exchange(random_user(), 2)
+
+            def profit_update():
+                with db.session_scope() as session:
+                    histories = repository.find_by_user_and_exchange(random_user(), 1, session=session)
+                    for history in histories:
+                        history.profit_loss_rate = Decimal("0.10")
+                    repository.bulk_update_profit_loss(histories, session=session)
+
+            print(f"[{name}]")
+            for label, fn in (
+                ("사용자·거래소 조회", by_exchange),
+                ("첫 페이지 조회", first_page),
+                ("존재 여부 조회", exists),
+                ("조회+수익률 갱신", profit_update),
+            ):
+                print(f"  {label:<14} {measure(fn, args.repeat)}")
+
+            # 동기화: 신규 사용자의 거래내역 일괄 저장 후 삭제 (재동기화 경로)
+            insert_seconds = 0.0
+            delete_timings = []
+            for n in range(args.users + 1, args.users + args.sync_users + 1):
+                sync_user = user_id(n)
+                histories = [
+                    TradingHistories(
+                        user_id=sync_user, coin_id=t % 50 + 1, exchange_code=1,
+                        trade_uuid=f"sync-{n}-{t}", trade_type=t % 2, price=Decimal("100"),
+                        quantity=Decimal("1"), total_price=Decimal("100"), fee=Decimal("0"),
+                        trade_time=datetime(2025, 1, 1) + timedelta(minutes=t),
+                    )
+                    for t in range(args.sync_trades)
+                ]
+                started = time.perf_counter()
+                repository.bulk_insert_trading_histories(histories)
+                insert_seconds += time.perf_counter() - started
+
+                started = time.perf_counter()
+                repository.delete_by_user_and_exchange(str(sync_user), 1)
+                delete_timings.append((time.perf_counter() - started) * 1000)
+
+            total = args.sync_users * args.sync_trades
+            print(f"  {'일괄 저장':<14} {total / insert_seconds:8.0f}행/초 ({insert_seconds:.1f}초)")
+            print(f"  {'사용자 삭제':<14} {percentiles(delete_timings)}")
+    finally:
+        for engine in engines.values():
+            engine.dispose()
+        if not args.keep:
+            with setup.begin() as connection:
+                for schema in SCHEMAS.values():
+                    connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        setup.dispose()
+
+
+if __name__ == "__main__":
+    main()
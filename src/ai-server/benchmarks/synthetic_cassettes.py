@@ -0,0 +1,203 @@
+"""
+벤치마크용 가상 녹화 파일(cassette) 생성.
+
+실제 계정 없이도 벤치마크를 돌릴 수 있도록 업비트 응답 형식을 흉내 낸 데이터를
+utils.http_cassette 형식으로 저장합니다. 같은 seed면 항상 같은 파일이 만들어집니다.
+"""
+
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pytz
+
+from utils.http_cassette import request_key
+from utils.time_utils import get_all_trading_time_ranges
+
+UPBIT_BASE_URL = "https://api.upbit.com"
+
+# 가상 거래내역 기간 (녹화 시각 = 조회 시작 시각 + 기간, 벤치마크는 이 시각을 현재 시각으로 고정)
+TRADE_PERIOD = timedelta(days=365)
+
+
+def _entry(method: str, path: str, params, body, latency_ms: float) -> dict:
+    return {
+        "key": request_key(method, f"{UPBIT_BASE_URL}{path}", params),
+        "status": 200,
+        "headers": {"content-type": "application/json; charset=utf-8"},
+        "body": json.dumps(body, ensure_ascii=False),
+        "encoding": "utf-8",
+        "latency_ms": latency_ms,
+    }
+
+
+def _write(path: Path, meta: dict, entries: List[dict]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"meta": meta}, ensure_ascii=False) + "\n")
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return path
+
+
+def synthesize_trade_cassette(
+    path: Path,
+    start_time: datetime,
+    markets: List[str],
+    orders_per_window: Tuple[int, int] = (0, 20),
+    latency_ms: float = 30.0,
+    seed: int = 0,
+    recorded_at: Optional[datetime] = None,
+) -> Tuple[Path, int]:
+    """
+    거래내역 동기화 응답 (/v1/orders/closed, /v1/order) 생성
+
+    Args:
+        recorded_at: 녹화 시각 (조회 끝). 없으면 start_time + TRADE_PERIOD
+
+    Returns:
+        (파일 경로, 생성한 주문 수)
+
+    Raises:
+        ValueError: 조회 구간이 하나도 없을 때 (recorded_at이 start_time 이전)
+    """
+    if recorded_at is None:
+        recorded_at = start_time + TRADE_PERIOD
+    time_ranges = get_all_trading_time_ranges(start_time, recorded_at)
+    if not time_ranges:
+        raise ValueError(
+            f"조회 구간이 없습니다: start={start_time.isoformat()}, recorded_at={recorded_at.isoformat()}"
+        )
+
+    rng = random.Random(seed)
+    entries = []
+    order_count = 0
+
+    for range_start, range_end in time_ranges:
+        window_start = datetime.fromisoformat(range_start)
+        orders = []
+        for _ in range(rng.randint(*orders_per_window)):
+            created_at = window_start + timedelta(seconds=rng.randint(0, 6 * 86400))
+            volume = round(rng.uniform(0.01, 5), 8)
+            price = round(rng.uniform(1_000, 100_000), 2)
+            orders.append(
+                {
+                    "uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "side": rng.choice(["bid", "ask"]),
+                    "market": rng.choice(markets),
+                    "paid_fee": str(round(volume * price * 0.0005, 8)),
+                    "created_at": created_at.isoformat(),
+                    "executed_volume": str(volume),
+                    "trades": [
+                        {"volume": str(volume), "funds": str(round(volume * price, 8))}
+                    ],
+                }
+            )
+
+        closed_params = {
+            "states[]": ["done", "cancel"],
+            "start_time": range_start,
+            "end_time": range_end,
+            "limit": 1000,
+        }
+        entries.append(
+            _entry(
+                "GET",
+                "/v1/orders/closed",
+                closed_params,
+                [
+                    {"uuid": o["uuid"], "executed_volume": o["executed_volume"]}
+                    for o in orders
+                ],
+                latency_ms,
+            )
+        )
+        for order in orders:
+            entries.append(
+                _entry("GET", "/v1/order", {"uuid": order["uuid"]}, order, latency_ms)
+            )
+        order_count += len(orders)
+
+    meta = {"recorded_at": recorded_at.isoformat(), "synthetic": True}
+    return _write(path, meta, entries), order_count
+
+
+def candle_to_param(current_to: datetime) -> str:
+    """CoinPricesCollector가 보내는 to 파라미터 형식 (UTC)"""
+    return current_to.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+def synthesize_candle_cassette(
+    path: Path,
+    markets: List[str],
+    start_date: datetime,
+    end_date: datetime,
+    latency_ms: float = 30.0,
+    seed: int = 0,
+) -> Tuple[Path, int]:
+    """
+    일봉 캔들 응답 (/v1/candles/days) 생성
+
+    코인마다 상장일을 달리 두고, 수집기와 같은 방식(가장 오래된 캔들 - 1일)으로 to를 옮겨가며
+    200개 단위 페이지를 만듭니다.
+
+    Returns:
+        (파일 경로, 생성한 캔들 수)
+    """
+    rng = random.Random(seed)
+    entries = []
+    candle_count = 0
+
+    for market in markets:
+        listed_at = start_date + timedelta(days=rng.randint(0, 365))
+        price = rng.uniform(100, 100_000)
+        current_to = end_date
+
+        while current_to > start_date:
+            day = current_to.replace(hour=0, minute=0, second=0, microsecond=0)
+            if day == current_to:
+                day -= timedelta(days=1)
+
+            candles = []
+            while len(candles) < 200 and day >= listed_at:
+                change = price * rng.uniform(-0.05, 0.05)
+                candles.append(
+                    {
+                        "market": market,
+                        "candle_date_time_utc": day.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "candle_date_time_kst": (day + timedelta(hours=9)).strftime(
+                            "%Y-%m-%dT%H:%M:%S"
+                        ),
+                        "opening_price": price,
+                        "high_price": price + abs(change),
+                        "low_price": price - abs(change),
+                        "trade_price": price + change,
+                        "timestamp": int(day.timestamp() * 1000),
+                        "candle_acc_trade_price": rng.uniform(1e6, 1e10),
+                        "candle_acc_trade_volume": rng.uniform(1, 1e5),
+                        "prev_closing_price": price,
+                        "change_price": change,
+                        "change_rate": change / price,
+                    }
+                )
+                price = max(1.0, price + change)
+                day -= timedelta(days=1)
+
+            params = {"market": market, "count": 200, "to": candle_to_param(current_to)}
+            entries.append(_entry("GET", "/v1/candles/days", params, candles, latency_ms))
+            candle_count += len(candles)
+
+            if len(candles) < 200:
+                break
+            oldest = pytz.UTC.localize(
+                datetime.fromisoformat(candles[-1]["candle_date_time_utc"])
+            )
+            if oldest <= start_date:
+                break
+            current_to = oldest - timedelta(days=1)
+
+    meta = {"recorded_at": end_date.isoformat(), "synthetic": True}
+    return _write(path, meta, entries), candle_count
@@ -1,9 +1,13 @@
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from database.pool import engine_options, register_pool, unregister_pool
+from database.replica import ReplicaRouter, RoutingSession, replica_urls_from_env
+
 load_dotenv()
 
 
@@ -22,20 +26,124 @@ class DatabaseConnection:
 
         self.database_url = f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+        # 풀 설정은 환경변수로 (database.pool 참고)
         self.engine = create_engine(
-            self.database_url, echo=False, pool_size=5, max_overflow=10
+            self.database_url, echo=False, **engine_options("sync")
         )
+        register_pool("sync", self.engine)
+
+        # 읽기 전용 복제본 (DB_REPLICA_URLS, database.replica 참고)
+        replica_engines = {}
+        for index, url in enumerate(replica_urls_from_env()):
+            name = f"replica-{index}"
+            replica_engines[name] = create_engine(url, echo=False, **engine_options(name))
+            register_pool(name, replica_engines[name])
+        self.replica_router = ReplicaRouter(replica_engines) if replica_engines else None
 
         self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
+            class_=RoutingSession,
+            router=self.replica_router,
+            autocommit=False,
+            autoflush=False,
+            bind=self.engine,
         )
 
         self.Base = declarative_base()
 
+        # asyncpg 엔진은 처음 사용할 때 생성 (동기 경로만 쓰는 스크립트는 asyncpg 불필요)
+        self.async_database_url = f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+        self._async_engine = None
+        self._async_session_local = None
+
     def get_session(self):
         """return db session"""
         return self.SessionLocal()
 
+    @contextmanager
+    def session_scope(self, session=None, read_only: bool = False):
+        """
+        작업 단위(unit of work) 세션
+
+        session을 넘기면 그 작업 단위에 참여만 하고 commit/rollback/close는 세션을 연 쪽에 맡깁니다.
+        없으면 새 세션을 열어 블록이 끝날 때 commit(예외 시 rollback) 후 close 합니다.
+        commit 후에도 반환한 객체 속성을 읽을 수 있도록 expire_on_commit=False로 엽니다.
+        read_only=True로 새로 여는 세션은 복제본이 있으면 복제본에서 조회합니다.
+        넘겨받은 세션은 read_only와 관계없이 그 세션의 연결(primary)을 그대로 씁니다.
+
+            with db.session_scope(session) as s:
+                repository.save(..., session=s)
+        """
+        if session is not None:
+            yield session
+            return
+
+        session = self.SessionLocal(expire_on_commit=False, read_only=read_only)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def release_connection(self, session) -> None:
+        """
+        LLM 호출처럼 오래 기다리기 전에 읽기 트랜잭션을 끝내 커넥션을 풀에 돌려줌
+
+        세션은 그대로 쓸 수 있고 다음 쿼리 때 커넥션을 다시 얻습니다.
+        아직 flush하지 않은 변경이 있으면 세션을 연 쪽의 트랜잭션이므로 건드리지 않습니다.
+        commit으로 끝내므로 expire_on_commit=True 세션이면 조회한 객체는 다음 접근 때 다시 읽습니다.
+        """
+        if session.new or session.dirty or session.deleted:
+            return
+        if session.in_transaction():
+            session.commit()
+
+    async def release_async_connection(self, session) -> None:
+        """release_connection의 AsyncSession 버전"""
+        if session.new or session.dirty or session.deleted:
+            return
+        if session.in_transaction():
+            await session.commit()
+
+    @property
+    def async_engine(self):
+        """asyncpg 기반 AsyncEngine (지연 생성)"""
+        if self._async_engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            self._async_engine = create_async_engine(
+                self.async_database_url,
+                echo=False,
+                **engine_options("async", is_async=True),
+            )
+            register_pool("async", self._async_engine)
+        return self._async_engine
+
+    @property
+    def AsyncSessionLocal(self):
+        """AsyncSession 팩토리. commit 후에도 조회한 객체 속성을 다시 읽지 않도록 expire_on_commit=False"""
+        if self._async_session_local is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            self._async_session_local = async_sessionmaker(
+                bind=self.async_engine, autoflush=False, expire_on_commit=False
+            )
+        return self._async_session_local
+
+    def get_async_session(self):
+        """return async db session (async with db.get_async_session() as session: ...)"""
+        return self.AsyncSessionLocal()
+
+    async def dispose_async_engine(self):
+        """애플리케이션 종료 시 async 커넥션 풀 정리"""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+            unregister_pool("async")
+            self._async_engine = None
+            self._async_session_local = None
+
     def create_tables(self):
         """create all tables"""
         # 모델들을 명시적으로 import하여 순서 보장
@@ -47,6 +155,10 @@ class DatabaseConnection:
         import model.CoinHoldingsPast
         import model.CoinPricesDay
         import model.TradeEvaluationResult
+        import model.SyncJob
+        import model.UserSyncStatus
+        import model.CacheVersion
+        import model.ExpertResponse
 
         self.Base.metadata.create_all(bind=self.engine)
 
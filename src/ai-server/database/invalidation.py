@@ -0,0 +1,233 @@
+"""
+프로세스 간 캐시 무효화 (Postgres LISTEN/NOTIFY).
+
+uvicorn 워커·수집기마다 따로 가진 프로세스 내 캐시를, 데이터를 바꾼 쪽이 알려서 바로 비웁니다.
+
+- 쓰는 쪽: 데이터를 바꾼 트랜잭션에서 publish_invalidation(name, key, session=s)
+  NOTIFY는 커밋될 때 전달되고 rollback 되면 전달되지 않음
+- 받는 쪽: subscribe(name, callback)으로 등록해 두면 리스너 스레드가 callback(key)를 호출
+  key가 None이면 그 캐시 전체를 비움
+- 리스너는 워커마다 하나 (main.py lifespan에서 start_listener/stop_listener).
+  연결이 끊기면 다시 연결하고, 그 사이 놓친 알림이 있을 수 있으므로 등록된 캐시를 모두 비움
+
+NOTIFY는 PgBouncer transaction pooling을 거치면 LISTEN 세션이 유지되지 않으므로,
+DB_PGBOUNCER=true 이면 DB_LISTEN_URL(Postgres 직접 연결)이 있을 때만 리스너를 시작합니다.
+리스너가 없어도 캐시는 각자의 TTL·버전 확인으로 갱신됩니다.
+"""
+
+import json
+import logging
+import os
+import select
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+# NOTIFY payload 최대 8000바이트. 키가 많아 넘으면 캐시 전체 무효화로 보냄
+_MAX_PAYLOAD_BYTES = 7900
+
+_subscribers: Dict[str, List[Callable[[Optional[str]], None]]] = defaultdict(list)
+_subscribers_lock = threading.Lock()
+
+_listener: Optional["InvalidationListener"] = None
+_listener_lock = threading.Lock()
+
+
+def subscribe(name: str, callback: Callable[[Optional[str]], None]) -> None:
+    """name 캐시 무효화 알림을 받을 callback(key) 등록"""
+    with _subscribers_lock:
+        if callback not in _subscribers[name]:
+            _subscribers[name].append(callback)
+
+
+def unsubscribe(name: str, callback: Callable[[Optional[str]], None]) -> None:
+    with _subscribers_lock:
+        if callback in _subscribers.get(name, []):
+            _subscribers[name].remove(callback)
+
+
+def dispatch(name: str, key: Optional[str] = None) -> None:
+    """등록된 callback 호출 (callback 예외는 기록만 하고 나머지는 계속 호출)"""
+    with _subscribers_lock:
+        callbacks = list(_subscribers.get(name, []))
+    for callback in callbacks:
+        try:
+            callback(key)
+        except Exception as e:
+            logger.error(f"캐시 무효화 처리 중 에러 발생: name={name}, key={key}, error={e}")
+
+
+def dispatch_all() -> None:
+    """등록된 모든 캐시 전체 무효화"""
+    with _subscribers_lock:
+        names = list(_subscribers)
+    for name in names:
+        dispatch(name, None)
+
+
+def encode_payload(name: str, keys: Union[str, Iterable[str], None] = None) -> List[str]:
+    """
+    알림 payload 목록
+
+    keys가 여러 개면 하나의 payload에 담고, 크기 제한을 넘으면 키 없는(전체) payload 하나로 보냅니다.
+    """
+    if keys is None or isinstance(keys, str):
+        return [json.dumps({"name": name, "key": keys}, ensure_ascii=False)]
+
+    keys = sorted({str(key) for key in keys})
+    if not keys:
+        return []
+    payload = json.dumps({"name": name, "keys": keys}, ensure_ascii=False)
+    if len(payload.encode("utf-8")) > _MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"name": name, "key": None})
+    return [payload]
+
+
+def decode_payload(payload: str) -> List[tuple]:
+    """payload → [(name, key)] (형식이 다르면 빈 목록)"""
+    try:
+        message = json.loads(payload)
+        name = message["name"]
+    except (ValueError, KeyError, TypeError):
+        logger.warning(f"캐시 무효화 알림 형식이 아님: {payload!r}")
+        return []
+    if "keys" in message:
+        return [(name, key) for key in message["keys"]]
+    return [(name, message.get("key"))]
+
+
+def publish_invalidation(
+    name: str, keys: Union[str, Iterable[str], None] = None, session=None
+) -> None:
+    """
+    name 캐시 무효화 알림 (keys 없으면 전체)
+
+    session을 넘기면 그 트랜잭션이 커밋될 때 전달됩니다.
+    알림 실패는 캐시가 TTL까지 오래된 값을 쓰는 것뿐이므로 데이터 저장을 실패시키지 않습니다.
+    """
+    from database.database_connection import db  # lazy import
+
+    payloads = encode_payload(name, keys)
+    if not payloads:
+        return
+    try:
+        with db.session_scope(session) as s:
+            # 실패해도 호출한 트랜잭션이 abort 되지 않도록 savepoint 안에서 실행
+            with s.begin_nested():
+                for payload in payloads:
+                    s.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": CHANNEL, "payload": payload},
+                    )
+    except Exception as e:
+        logger.warning(f"캐시 무효화 알림 실패: name={name}, error={e}")
+
+
+class InvalidationListener(threading.Thread):
+    """CHANNEL을 LISTEN 하면서 받은 알림을 dispatch 하는 데몬 스레드"""
+
+    def __init__(
+        self,
+        connect: Callable[[], object],
+        poll_interval_sec: float = 1.0,
+        reconnect_delay_sec: float = 5.0,
+    ):
+        super().__init__(name="cache-invalidation-listener", daemon=True)
+        self._connect = connect
+        self.poll_interval_sec = poll_interval_sec
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self._stop_event = threading.Event()
+        self._connection = None
+        self.received = 0
+        self.reconnects = 0
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop_event.set()
+        self.join(timeout if timeout is not None else self.poll_interval_sec * 2)
+
+    def run(self) -> None:
+        connected_before = False
+        while not self._stop_event.is_set():
+            try:
+                self._connection = self._connect()
+                self._connection.autocommit = True
+                with self._connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                if connected_before:
+                    # 끊긴 동안의 알림은 받을 수 없으므로 전부 비움
+                    self.reconnects += 1
+                    logger.info("캐시 무효화 리스너 재연결, 등록된 캐시 전체 무효화")
+                    dispatch_all()
+                connected_before = True
+                self._listen()
+            except Exception as e:
+                logger.warning(f"캐시 무효화 리스너 연결 끊김: {e}")
+                self._stop_event.wait(self.reconnect_delay_sec)
+            finally:
+                self._close()
+
+    def _listen(self) -> None:
+        connection = self._connection
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select([connection], [], [], self.poll_interval_sec)
+            if not readable:
+                continue
+            connection.poll()
+            while connection.notifies:
+                notify = connection.notifies.pop(0)
+                self.received += 1
+                for name, key in decode_payload(notify.payload):
+                    dispatch(name, key)
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+
+def _listen_connection():
+    """LISTEN 전용 DBAPI(psycopg2) 연결 (풀에서 분리해 풀 크기를 차지하지 않음)"""
+    listen_url = os.getenv("DB_LISTEN_URL")
+    if listen_url:
+        import psycopg2
+
+        return psycopg2.connect(listen_url)
+
+    from database.database_connection import db  # lazy import
+
+    connection = db.engine.raw_connection()
+    connection.detach()
+    return connection.dbapi_connection
+
+
+def start_listener() -> Optional[InvalidationListener]:
+    """워커의 무효화 리스너 시작 (이미 실행 중이면 그대로 반환)"""
+    global _listener
+    from database.pool import pgbouncer_mode
+
+    with _listener_lock:
+        if _listener is not None and _listener.is_alive():
+            return _listener
+        if pgbouncer_mode() and not os.getenv("DB_LISTEN_URL"):
+            logger.warning("DB_PGBOUNCER 모드에서 DB_LISTEN_URL이 없어 캐시 무효화 리스너를 시작하지 않음")
+            return None
+        _listener = InvalidationListener(_listen_connection)
+        _listener.start()
+        logger.info(f"캐시 무효화 리스너 시작 (channel={CHANNEL})")
+        return _listener
+
+
+def stop_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
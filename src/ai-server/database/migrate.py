@@ -0,0 +1,127 @@
+"""
+버전 관리되는 SQL 마이그레이션 실행기.
+
+- database/migrations/versions/NNNN_설명.sql 파일을 버전 순서대로 한 번씩 적용
+- 적용 이력은 schema_migrations 테이블에 (version, name, checksum, applied_at)으로 기록
+- 마이그레이션 하나가 트랜잭션 하나. 실패하면 그 마이그레이션만 rollback 되고 중단
+- 여러 인스턴스가 동시에 시작해도 advisory lock으로 한 곳에서만 실행
+- 이미 적용한 파일의 내용이 바뀌면 경고만 남김 (적용된 마이그레이션은 수정하지 말고 새 버전 추가)
+
+앱 시작 시 create_tables() 다음에 실행되며, 직접 실행하려면:
+    python -m database.migrate
+"""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations" / "versions"
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d{4})_(\w+)\.sql$")
+# schema_migrations 실행 잠금 키 (pg_advisory_lock)
+MIGRATION_LOCK_ID = 7_302_026
+
+_CREATE_HISTORY_TABLE = text(
+    """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version VARCHAR(10) PRIMARY KEY,
+        name VARCHAR(200) NOT NULL,
+        checksum VARCHAR(64) NOT NULL,
+        applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+    """
+)
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Tuple[str, str, str]]:
+    """(version, name, sql) 목록을 버전 순으로 반환"""
+    migrations = []
+    for path in sorted(directory.glob("*.sql")):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            logger.warning(f"마이그레이션 파일명 형식이 아니어서 건너뜀: {path.name}")
+            continue
+        migrations.append((match.group(1), match.group(2), path.read_text(encoding="utf-8")))
+
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"마이그레이션 버전이 중복되었습니다: {versions}")
+    return migrations
+
+
+def _checksum(sql: str) -> str:
+    return hashlib.sha256(sql.encode("utf-8")).hexdigest()
+
+
+def run_migrations(engine, directory: Path = MIGRATIONS_DIR) -> List[str]:
+    """
+    아직 적용하지 않은 마이그레이션 적용
+
+    Returns:
+        이번에 적용한 버전 목록
+    """
+    migrations = load_migrations(directory)
+    applied_now = []
+
+    with engine.connect() as lock_connection:
+        lock_connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        lock_connection.commit()
+        try:
+            with engine.begin() as connection:
+                connection.execute(_CREATE_HISTORY_TABLE)
+                applied = {
+                    row.version: row.checksum
+                    for row in connection.execute(
+                        text("SELECT version, checksum FROM schema_migrations")
+                    )
+                }
+
+            for version, name, sql in migrations:
+                checksum = _checksum(sql)
+                if version in applied:
+                    if applied[version] != checksum:
+                        logger.warning(
+                            f"적용된 마이그레이션 파일이 변경됨: {version}_{name} (새 버전으로 추가해주세요)"
+                        )
+                    continue
+
+                logger.info(f"마이그레이션 적용 중: {version}_{name}")
+                with engine.begin() as connection:
+                    # 파라미터 바인딩 없이 파일 전체를 그대로 실행 (DO 블록, 여러 문장, format()의 % 포함)
+                    cursor = connection.connection.cursor()
+                    try:
+                        cursor.execute(sql)
+                    finally:
+                        cursor.close()
+                    connection.execute(
+                        text(
+                            "INSERT INTO schema_migrations (version, name, checksum) "
+                            "VALUES (:version, :name, :checksum)"
+                        ),
+                        {"version": version, "name": name, "checksum": checksum},
+                    )
+                applied_now.append(version)
+        finally:
+            lock_connection.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID}
+            )
+            lock_connection.commit()
+
+    if applied_now:
+        logger.info(f"마이그레이션 적용 완료: {applied_now}")
+    return applied_now
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    from database.database_connection import db
+
+    db.create_tables()
+    applied = run_migrations(db.engine)
+    print(f"적용한 마이그레이션: {applied or '없음'}")
@@ -0,0 +1,106 @@
+-- 자주 쓰는 조회 조건에 맞춘 인덱스와 일괄 upsert용 유니크 키
+-- articles, diaries, fear_greed_indices는 app-server/수집기가 만드는 테이블이라 있을 때만 적용
+
+-- trading_histories: 사용자·거래소별 조회(trade_time 정렬), 사용자 기간 조회
+CREATE INDEX IF NOT EXISTS idx_trading_histories_user_exchange_time
+ON trading_histories (user_id, exchange_code, trade_time);
+
+CREATE INDEX IF NOT EXISTS idx_trading_histories_user_time
+ON trading_histories (user_id, trade_time);
+
+-- coin_prices_day: coin_id 기간 조회
+CREATE INDEX IF NOT EXISTS idx_coin_prices_day_coin_id_date_utc
+ON coin_prices_day (coin_id, candle_date_time_utc);
+
+-- coin_prices_day: (market_code, candle_date_time_utc) 유니크 키
+-- market_code 기간 조회와 일봉 upsert(ON CONFLICT)에 사용. 중복 캔들은 최근 갱신분만 남김
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        WHERE i.indrelid = 'coin_prices_day'::regclass
+          AND i.indisunique
+          AND strpos(pg_get_indexdef(i.indexrelid), '(market_code, candle_date_time_utc)') > 0
+    ) THEN
+        DELETE FROM coin_prices_day
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT id,
+                       row_number() OVER (
+                           PARTITION BY market_code, candle_date_time_utc
+                           ORDER BY updated_at DESC NULLS LAST, id DESC
+                       ) AS rn
+                FROM coin_prices_day
+            ) ranked
+            WHERE rn > 1
+        );
+
+        ALTER TABLE coin_prices_day
+        ADD CONSTRAINT uq_coin_prices_day_market_date UNIQUE (market_code, candle_date_time_utc);
+    END IF;
+END $$;
+
+-- coin_holdings_past: 사용자·거래소별 조회 (유니크 키는 (user_id, coin_id, exchange_code) 순서라 쓰지 못함)
+CREATE INDEX IF NOT EXISTS idx_coin_holdings_past_user_exchange
+ON coin_holdings_past (user_id, exchange_code);
+
+-- assets: 사용자·거래소별 조회는 uk_assets_user_exchange_symbol(user_id, exchange_code, ...) 앞부분으로 처리
+
+-- trade_evaluation_results: trade_id 최신순 조회
+CREATE INDEX IF NOT EXISTS idx_trade_evaluation_results_trade_created
+ON trade_evaluation_results (trade_id, created_at DESC);
+
+-- trade_evaluation_results: (user_id, trade_id) 유니크 키 (save는 이 키로 upsert)
+-- 이미 쌓인 중복은 최신 결과만 남김
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'trade_evaluation_results'::regclass
+          AND conname = 'uq_trade_evaluation_results_user_trade'
+    ) THEN
+        DELETE FROM trade_evaluation_results
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT id,
+                       row_number() OVER (
+                           PARTITION BY user_id, trade_id
+                           ORDER BY created_at DESC NULLS LAST, id DESC
+                       ) AS rn
+                FROM trade_evaluation_results
+            ) ranked
+            WHERE rn > 1
+        );
+
+        ALTER TABLE trade_evaluation_results
+        ADD CONSTRAINT uq_trade_evaluation_results_user_trade UNIQUE (user_id, trade_id);
+    END IF;
+END $$;
+
+-- articles: 기간 조회(최신순), 언론사 지정 시 publisher_type 동등 조건 + 기간
+DO $$
+BEGIN
+    IF to_regclass('articles') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_articles_published_at
+        ON articles (published_at);
+
+        CREATE INDEX IF NOT EXISTS idx_articles_publisher_type_published_at
+        ON articles (publisher_type, published_at);
+    END IF;
+END $$;
+
+-- diaries: trading_history_id 조회 (app-server 스키마에 유니크 키가 없을 때만)
+DO $$
+BEGIN
+    IF to_regclass('diaries') IS NOT NULL AND NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        WHERE i.indrelid = to_regclass('diaries')
+          AND strpos(pg_get_indexdef(i.indexrelid), '(trading_history_id)') > 0
+    ) THEN
+        CREATE INDEX idx_diaries_trading_history_id ON diaries (trading_history_id);
+    END IF;
+END $$;
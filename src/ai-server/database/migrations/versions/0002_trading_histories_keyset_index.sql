@@ -0,0 +1,6 @@
+-- 거래내역 키셋 페이지네이션 ((trade_time, id) < 커서, 최신순)용 인덱스
+-- (user_id, trade_time) 인덱스를 id까지 포함하는 인덱스로 대체
+CREATE INDEX IF NOT EXISTS idx_trading_histories_user_time_id
+ON trading_histories (user_id, trade_time, id);
+
+DROP INDEX IF EXISTS idx_trading_histories_user_time;
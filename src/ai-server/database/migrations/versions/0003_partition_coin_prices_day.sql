@@ -0,0 +1,62 @@
+-- coin_prices_day를 candle_date_time_utc 연 단위 RANGE 파티션 테이블로 전환
+-- 파티션명: coin_prices_day_y{연도}, 범위 [연도-01-01, 다음 연도-01-01)
+-- 새 DB는 create_all이 이미 파티션 테이블로 만들므로 파티션만 생성
+-- 이후 연도 파티션은 수집기가 저장 전에 만듦 (database/partitions.py)
+
+DO $$
+DECLARE
+    seq_name text;
+    first_year int := 2017;
+    last_year int := extract(year FROM now())::int + 1;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'coin_prices_day'::regclass
+    ) THEN
+        seq_name := pg_get_serial_sequence('coin_prices_day', 'id');
+
+        -- 기존 테이블은 옮긴 뒤 삭제. 인덱스 이름이 겹치지 않도록 먼저 제약조건·인덱스 제거
+        ALTER TABLE coin_prices_day RENAME TO coin_prices_day_unpartitioned;
+        ALTER TABLE coin_prices_day_unpartitioned DROP CONSTRAINT IF EXISTS coin_prices_day_pkey;
+        ALTER TABLE coin_prices_day_unpartitioned DROP CONSTRAINT IF EXISTS uq_coin_prices_day_market_date;
+        DROP INDEX IF EXISTS idx_coin_prices_day_coin_id_date_utc;
+
+        CREATE TABLE coin_prices_day (
+            LIKE coin_prices_day_unpartitioned INCLUDING DEFAULTS
+        ) PARTITION BY RANGE (candle_date_time_utc);
+
+        ALTER TABLE coin_prices_day ADD CONSTRAINT coin_prices_day_pkey
+            PRIMARY KEY (id, candle_date_time_utc);
+        ALTER TABLE coin_prices_day ADD CONSTRAINT uq_coin_prices_day_market_date
+            UNIQUE (market_code, candle_date_time_utc);
+        ALTER TABLE coin_prices_day ADD CONSTRAINT coin_prices_day_coin_id_fkey
+            FOREIGN KEY (coin_id) REFERENCES coins (id) ON DELETE CASCADE;
+        CREATE INDEX idx_coin_prices_day_coin_id_date_utc
+            ON coin_prices_day (coin_id, candle_date_time_utc);
+
+        -- id 시퀀스는 새 테이블 소유로 (기존 테이블을 지워도 남도록)
+        IF seq_name IS NOT NULL THEN
+            EXECUTE format('ALTER SEQUENCE %s OWNED BY coin_prices_day.id', seq_name);
+        END IF;
+
+        SELECT least(first_year, coalesce(min(extract(year FROM candle_date_time_utc))::int, first_year)),
+               greatest(last_year, coalesce(max(extract(year FROM candle_date_time_utc))::int, last_year))
+        INTO first_year, last_year
+        FROM coin_prices_day_unpartitioned;
+    END IF;
+
+    FOR y IN first_year..last_year LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF coin_prices_day FOR VALUES FROM (%L) TO (%L)',
+            'coin_prices_day_y' || y,
+            make_date(y, 1, 1),
+            make_date(y + 1, 1, 1)
+        );
+    END LOOP;
+
+    IF to_regclass('coin_prices_day_unpartitioned') IS NOT NULL THEN
+        INSERT INTO coin_prices_day SELECT * FROM coin_prices_day_unpartitioned;
+        DROP TABLE coin_prices_day_unpartitioned;
+    END IF;
+END $$;
+
+ANALYZE coin_prices_day;
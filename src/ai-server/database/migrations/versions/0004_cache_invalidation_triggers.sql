@@ -0,0 +1,37 @@
+-- 다른 서비스(app-server/수집기)가 쓰는 참조 테이블이 바뀌면 캐시 무효화 알림 (database/invalidation.py)
+-- 문장 단위 트리거라 일괄 저장이어도 문장당 알림 한 번, 커밋될 때 전달
+-- fear_greed_indices, articles는 다른 서비스가 만드는 테이블이라 있을 때만 적용
+
+CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify(
+        'cache_invalidation',
+        json_build_object('name', TG_ARGV[0], 'key', NULL)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    target record;
+BEGIN
+    FOR target IN
+        SELECT * FROM (VALUES
+            ('fear_greed_indices', 'fear_greed_index'),
+            ('articles', 'articles')
+        ) AS t (table_name, cache_name)
+    LOOP
+        IF to_regclass(target.table_name) IS NOT NULL THEN
+            EXECUTE format(
+                'DROP TRIGGER IF EXISTS %I ON %I',
+                target.table_name || '_cache_invalidation', target.table_name
+            );
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+                'FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation(%L)',
+                target.table_name || '_cache_invalidation', target.table_name, target.cache_name
+            );
+        END IF;
+    END LOOP;
+END $$;
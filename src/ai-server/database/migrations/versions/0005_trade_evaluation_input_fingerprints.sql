@@ -0,0 +1,4 @@
+-- trade_evaluation_results: 결과를 만든 입력 지문 (같은 입력 재요청 시 LLM 없이 저장된 결과 반환)
+-- 기존 행은 NULL이라 다음 요청에서 한 번 다시 계산
+ALTER TABLE trade_evaluation_results
+ADD COLUMN IF NOT EXISTS input_fingerprints JSONB;
@@ -0,0 +1,284 @@
+"""
+테이블 파티션 관리.
+
+연 단위 RANGE 파티션 (coin_prices_day)
+    candle_date_time_utc 기준 연 단위 파티션(coin_prices_day_y2024 …)으로 나뉩니다.
+    파티션이 없는 연도의 행은 INSERT가 실패하므로, 저장하는 쪽(수집기)이 저장 전에
+    ensure_yearly_partitions()로 필요한 연도의 파티션을 만듭니다.
+
+    - 이미 확인한 파티션은 프로세스 안에서 기억해 DDL/카탈로그 조회를 반복하지 않음
+    - 파티션 생성은 부모 테이블 잠금을 잡으므로 별도 트랜잭션에서, advisory lock으로 직렬화
+    - 파티션 테이블이 아니면(마이그레이션 전 DB) 아무것도 하지 않음
+
+user_id HASH 파티션 (trading_histories, 선택)
+    사용자가 많아져 trading_histories vacuum/인덱스 관리가 무거워지면
+    partition_trading_histories_by_user()로 기존 테이블을 user_id 해시 파티션으로 전환합니다.
+    자동 마이그레이션이 아니라 운영자가 점검 시간에 직접 실행합니다.
+
+        python -m database.partitions trading-histories --partitions 16
+
+    - 인덱스·유니크 키는 모델 정의대로 각 파티션에 로컬 인덱스로 생성, 기본 키는 (id, user_id)
+    - id만으로는 유일성을 보장할 수 없어서, trading_histories.id를 참조하는 외래 키는
+      참조하는 테이블에 user_id가 있으면 (user_id, 칼럼) → (user_id, id) 복합 외래 키로 바꿈.
+      user_id가 없는 테이블의 외래 키는 drop_unsupported_foreign_keys=True일 때만 삭제하고 진행
+    - 전체가 트랜잭션 하나 (실패하면 그대로 rollback), 변환 중에는 테이블 전체가 잠김
+"""
+
+import argparse
+import logging
+import threading
+from typing import Iterable, List
+
+from sqlalchemy import ForeignKeyConstraint, UniqueConstraint, text
+from sqlalchemy.schema import AddConstraint, CreateIndex
+
+logger = logging.getLogger(__name__)
+
+_known_partitions = set()
+_unpartitioned_tables = set()
+_lock = threading.Lock()
+
+
+TRADING_HISTORIES_HASH_PARTITIONS = 16
+
+# pg_constraint.confdeltype → ON DELETE 동작 (SET NULL/SET DEFAULT는 복합 키로 옮기면 user_id까지 바뀌어 제외)
+_ON_DELETE_ACTIONS = {"a": "NO ACTION", "r": "RESTRICT", "c": "CASCADE"}
+
+
+def yearly_partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+
+def hash_partition_name(table: str, remainder: int) -> str:
+    return f"{table}_p{remainder:02d}"
+
+
+def _is_partitioned(connection, table: str) -> bool:
+    return bool(
+        connection.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table))"
+            ),
+            {"table": table},
+        ).scalar()
+    )
+
+
+def ensure_yearly_partitions(engine, table: str, years: Iterable[int]) -> List[str]:
+    """
+    years에 해당하는 연 단위 파티션이 없으면 생성
+
+    Args:
+        engine: 동기 Engine (파티션 생성은 호출자의 트랜잭션과 분리해 바로 커밋)
+        table: 파티션 부모 테이블명
+        years: 저장할 행들의 연도
+
+    Returns:
+        이번에 새로 만든 파티션 테이블명 목록
+    """
+    with _lock:
+        if table in _unpartitioned_tables:
+            return []
+        missing = sorted(
+            year for year in set(years)
+            if yearly_partition_name(table, year) not in _known_partitions
+        )
+    if not missing:
+        return []
+
+    created = []
+    with engine.begin() as connection:
+        if not _is_partitioned(connection, table):
+            logger.warning(f"{table}이 파티션 테이블이 아니어서 파티션 생성을 건너뜀 (마이그레이션 필요)")
+            with _lock:
+                _unpartitioned_tables.add(table)
+            return []
+
+        # 여러 수집 워커가 같은 연도 파티션을 동시에 만들지 않도록 트랜잭션 단위 잠금
+        connection.execute(text("SELECT pg_advisory_xact_lock(hashtext(:table))"), {"table": table})
+        for year in missing:
+            name = yearly_partition_name(table, year)
+            exists = connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+            if exists is None:
+                connection.execute(
+                    text(
+                        f"CREATE TABLE {name} PARTITION OF {table} "
+                        f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+                    )
+                )
+                created.append(name)
+
+    with _lock:
+        _known_partitions.update(yearly_partition_name(table, year) for year in missing)
+    if created:
+        logger.info(f"파티션 생성: {created}")
+    return created
+
+
+def _referencing_foreign_keys(connection, table: str) -> list:
+    """table을 참조하는 단일 칼럼 외래 키 (이름, 참조하는 테이블, 칼럼, ON DELETE, user_id 칼럼 여부)"""
+    return connection.execute(
+        text(
+            """
+            SELECT c.conname AS name,
+                   c.conrelid::regclass::text AS table_name,
+                   a.attname AS column_name,
+                   c.confdeltype AS on_delete,
+                   EXISTS (
+                       SELECT 1 FROM pg_attribute u
+                       WHERE u.attrelid = c.conrelid AND u.attname = 'user_id' AND NOT u.attisdropped
+                   ) AS has_user_id
+            FROM pg_constraint c
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]
+            WHERE c.contype = 'f'
+              AND c.confrelid = to_regclass(:table)
+              AND array_length(c.conkey, 1) = 1
+            """
+        ),
+        {"table": table},
+    ).all()
+
+
+def partition_trading_histories_by_user(
+    engine,
+    partitions: int = TRADING_HISTORIES_HASH_PARTITIONS,
+    drop_unsupported_foreign_keys: bool = False,
+) -> bool:
+    """
+    trading_histories를 user_id HASH 파티션 테이블로 전환
+
+    Args:
+        engine: 동기 Engine
+        partitions: 파티션 수 (trading_histories_p00 … 로 생성, 나중에 바꾸려면 다시 옮겨야 함)
+        drop_unsupported_foreign_keys: user_id가 없는 테이블의 외래 키를 삭제하고 진행할지
+
+    Returns:
+        전환했으면 True, 이미 파티션 테이블이면 False
+
+    Raises:
+        ValueError: 복합 키로 옮길 수 없는 외래 키가 있는데 drop_unsupported_foreign_keys가 False
+    """
+    from model.TradingHistories import TradingHistories
+
+    table = TradingHistories.__table__
+    name = table.name
+    dialect = engine.dialect
+
+    with engine.begin() as connection:
+        if _is_partitioned(connection, name):
+            logger.info(f"{name}은 이미 파티션 테이블입니다")
+            return False
+
+        connection.execute(text(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE"))
+
+        foreign_keys = _referencing_foreign_keys(connection, name)
+        unsupported = [
+            fk for fk in foreign_keys
+            if not fk.has_user_id or fk.on_delete not in _ON_DELETE_ACTIONS
+        ]
+        if unsupported and not drop_unsupported_foreign_keys:
+            raise ValueError(
+                "복합 외래 키 (user_id, 칼럼)로 옮길 수 없는 외래 키가 있습니다: "
+                + ", ".join(f"{fk.table_name}.{fk.name}" for fk in unsupported)
+            )
+        for fk in foreign_keys:
+            connection.execute(text(f"ALTER TABLE {fk.table_name} DROP CONSTRAINT {fk.name}"))
+
+        sequence = connection.execute(
+            text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": name}
+        ).scalar()
+        old_indexes = set(
+            connection.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = :table AND schemaname = current_schema()"),
+                {"table": name},
+            ).scalars()
+        )
+
+        # 기존 테이블은 옮긴 뒤 삭제 (키·인덱스 이름은 삭제 후 새 테이블에서 다시 사용)
+        old = f"{name}_unpartitioned"
+        connection.execute(text(f"ALTER TABLE {name} RENAME TO {old}"))
+
+        # 칼럼·기본값·NOT NULL·CHECK는 기존 테이블 그대로, 키와 인덱스는 모델 정의대로
+        connection.execute(
+            text(
+                f"CREATE TABLE {name} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                f"PARTITION BY HASH (user_id)"
+            )
+        )
+        for remainder in range(partitions):
+            connection.execute(
+                text(
+                    f"CREATE TABLE {hash_partition_name(name, remainder)} PARTITION OF {name} "
+                    f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+                )
+            )
+        if sequence:
+            connection.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {name}.id"))
+
+        # 행을 먼저 옮기고 키·인덱스는 나중에 (행마다 인덱스를 갱신하지 않도록)
+        moved = connection.execute(text(f"INSERT INTO {name} SELECT * FROM {old}")).rowcount
+        connection.execute(text(f"DROP TABLE {old}"))
+
+        connection.execute(text(f"ALTER TABLE {name} ADD CONSTRAINT {name}_pkey PRIMARY KEY (id, user_id)"))
+        for constraint in table.constraints:
+            if isinstance(constraint, (UniqueConstraint, ForeignKeyConstraint)):
+                connection.exec_driver_sql(str(AddConstraint(constraint).compile(dialect=dialect)))
+        for index in table.indexes:
+            connection.exec_driver_sql(str(CreateIndex(index).compile(dialect=dialect)))
+
+        dropped = old_indexes - {f"{name}_pkey"} - {
+            c.name for c in table.constraints if isinstance(c, UniqueConstraint)
+        } - {index.name for index in table.indexes}
+        if dropped:
+            logger.warning(f"모델에 없는 인덱스는 다시 만들지 않음: {sorted(dropped)}")
+
+        for fk in foreign_keys:
+            if fk in unsupported:
+                logger.warning(f"외래 키 삭제: {fk.table_name}.{fk.name} ({fk.column_name} → {name}.id)")
+                continue
+            connection.execute(
+                text(
+                    f"ALTER TABLE {fk.table_name} ADD CONSTRAINT {fk.name} "
+                    f"FOREIGN KEY (user_id, {fk.column_name}) REFERENCES {name} (user_id, id) "
+                    f"ON DELETE {_ON_DELETE_ACTIONS[fk.on_delete]}"
+                )
+            )
+
+    with engine.connect() as connection:
+        connection.execute(text(f"ANALYZE {name}"))
+        connection.commit()
+
+    logger.info(f"{name}을 user_id HASH 파티션 {partitions}개로 전환 ({moved}행)")
+    return True
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="테이블 파티션 전환")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    trading = subparsers.add_parser("trading-histories", help="trading_histories를 user_id HASH 파티션으로 전환")
+    trading.add_argument("--partitions", type=int, default=TRADING_HISTORIES_HASH_PARTITIONS)
+    trading.add_argument(
+        "--drop-unsupported-foreign-keys",
+        action="store_true",
+        help="user_id가 없는 테이블의 trading_histories.id 외래 키를 삭제하고 진행",
+    )
+    args = parser.parse_args()
+
+    import model.Assets  # noqa: F401
+    import model.CoinHoldingsPast  # noqa: F401
+    import model.CoinPricesDay  # noqa: F401
+    import model.Coins  # noqa: F401
+    import model.ExchangeCredentials  # noqa: F401
+    import model.TradingHistories  # noqa: F401
+    import model.Users  # noqa: F401
+    from database.database_connection import db
+
+    converted = partition_trading_histories_by_user(
+        db.engine,
+        partitions=args.partitions,
+        drop_unsupported_foreign_keys=args.drop_unsupported_foreign_keys,
+    )
+    print("전환 완료" if converted else "이미 파티션 테이블입니다")
@@ -0,0 +1,165 @@
+"""
+DB 커넥션 풀 설정과 지표.
+
+- 풀 크기·오버플로·대기 타임아웃·recycle·pre_ping을 환경변수로 설정
+- DB_PGBOUNCER=true 이면 NullPool (커넥션 풀링은 PgBouncer에 맡김) + asyncpg prepared statement 캐시 비활성화
+- 풀별 체크아웃 수, 오버플로, 커넥션 대기 시간·타임아웃 지표 (/api/admin/db-pool-metrics)
+
+환경변수 (기본값):
+    DB_POOL_SIZE=5, DB_MAX_OVERFLOW=10, DB_POOL_TIMEOUT=30, DB_POOL_RECYCLE=1800,
+    DB_POOL_PRE_PING=true, DB_PGBOUNCER=false
+"""
+
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Dict
+from uuid import uuid4
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() == "true"
+
+
+def pgbouncer_mode() -> bool:
+    """PgBouncer(transaction pooling) 뒤에서 실행 중인지 여부"""
+    return _env_bool("DB_PGBOUNCER", False)
+
+
+class PoolMetrics:
+    """풀 1개의 커넥션 대기 지표"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_sec = 0.0
+        self.max_wait_sec = 0.0
+
+    def record(self, wait_sec: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_sec += wait_sec
+            self.max_wait_sec = max(self.max_wait_sec, wait_sec)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (
+                    round(self.total_wait_sec / waits * 1000, 2) if waits else 0.0
+                ),
+                "max_wait_ms": round(self.max_wait_sec * 1000, 2),
+            }
+
+
+_metrics: Dict[str, PoolMetrics] = {}
+_pools: Dict[str, Any] = {}
+
+# QueuePool._do_get은 오버플로 경합 시 자신을 재귀 호출하므로 바깥 호출만 측정.
+# AsyncAdaptedQueuePool은 여러 코루틴이 이벤트 루프 스레드 하나를 같이 쓰므로 스레드가 아닌 컨텍스트별로 표시
+_timing: contextvars.ContextVar[bool] = contextvars.ContextVar("pool_checkout_timing", default=False)
+
+
+def _timed_pool_class(base, metrics: PoolMetrics):
+    """커넥션을 얻기까지 걸린 시간을 metrics에 기록하는 풀 클래스"""
+
+    class TimedPool(base):
+        def _do_get(self):
+            if _timing.get():
+                return super()._do_get()
+
+            token = _timing.set(True)
+            started = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except exc.TimeoutError:
+                metrics.record(time.perf_counter() - started, timed_out=True)
+                raise
+            finally:
+                _timing.reset(token)
+            metrics.record(time.perf_counter() - started)
+            return conn
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def engine_options(name: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    create_engine / create_async_engine에 넘길 풀 옵션
+
+    Args:
+        name: 지표에 표시할 풀 이름 ("sync", "async")
+        is_async: asyncpg 엔진 여부
+    """
+    if pgbouncer_mode():
+        options: Dict[str, Any] = {"poolclass": NullPool}
+        if is_async:
+            # transaction pooling에서는 서버 커넥션이 트랜잭션마다 바뀌므로
+            # 이름이 겹치지 않게 하고 prepared statement를 캐시하지 않음
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return options
+
+    metrics = _metrics.setdefault(name, PoolMetrics())
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return {
+        "poolclass": _timed_pool_class(base, metrics),
+        "pool_size": _env_int("DB_POOL_SIZE", 5),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+    }
+
+
+def register_pool(name: str, engine) -> None:
+    """지표 조회 대상 엔진 등록 (AsyncEngine은 sync_engine의 풀을 사용)"""
+    _pools[name] = getattr(engine, "sync_engine", engine).pool
+
+
+def unregister_pool(name: str) -> None:
+    _pools.pop(name, None)
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """등록된 풀별 현재 상태와 누적 대기 지표"""
+    result: Dict[str, Any] = {"pgbouncer": pgbouncer_mode(), "pools": {}}
+    for name, pool in _pools.items():
+        if not isinstance(pool, QueuePool):
+            result["pools"][name] = {"pool_class": type(pool).__name__}
+            continue
+
+        data = {
+            "pool_class": type(pool).__name__,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # 음수이면 아직 pool_size만큼 커넥션을 만들지 않은 상태
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout_sec": pool.timeout(),
+            "recycle_sec": pool._recycle,
+            "pre_ping": pool._pre_ping,
+        }
+        if name in _metrics:
+            data.update(_metrics[name].to_dict())
+        result["pools"][name] = data
+    return result
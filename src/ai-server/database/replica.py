@@ -0,0 +1,146 @@
+"""
+읽기 전용 복제본(read replica) 라우팅.
+
+- DB_REPLICA_URLS (쉼표 구분 SQLAlchemy URL)에 있는 복제본으로 읽기 전용 세션을 보냄
+- 복제 지연이 DB_REPLICA_MAX_LAG_SEC(기본 5초)를 넘거나 확인에 실패한 복제본은 건너뛰고,
+  쓸 수 있는 복제본이 없으면 primary 사용
+- 지연은 DB_REPLICA_LAG_CHECK_SEC(기본 5초)마다 다시 확인
+
+읽기 전용 세션은 db.session_scope(read_only=True)로만 열고, 쓰기와 방금 쓴 내용을 다시 읽는 경로는
+기존처럼 primary 세션을 사용합니다.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 수신한 WAL을 모두 재생했으면 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간.
+# 복제본이 아니면(pg_is_in_recovery() = false) 지연 없음
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def postgres_replica_lag(engine) -> float:
+    """복제본의 재생 지연(초)"""
+    with engine.connect() as connection:
+        return float(connection.execute(REPLICA_LAG_SQL).scalar() or 0)
+
+
+def replica_urls_from_env() -> List[str]:
+    return [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+
+
+class ReplicaRouter:
+    """지연을 확인해 읽기 전용 세션에 쓸 복제본을 고름 (없으면 None = primary)"""
+
+    def __init__(
+        self,
+        engines: Dict[str, Any],
+        max_lag_sec: Optional[float] = None,
+        check_interval_sec: Optional[float] = None,
+        lag_fn: Callable[[Any], float] = postgres_replica_lag,
+    ):
+        self.engines = engines
+        self.max_lag_sec = (
+            max_lag_sec
+            if max_lag_sec is not None
+            else float(os.getenv("DB_REPLICA_MAX_LAG_SEC", "5"))
+        )
+        self.check_interval_sec = (
+            check_interval_sec
+            if check_interval_sec is not None
+            else float(os.getenv("DB_REPLICA_LAG_CHECK_SEC", "5"))
+        )
+        self._lag_fn = lag_fn
+        self._lock = threading.Lock()
+        self._round_robin = itertools.cycle(list(engines))
+        # name -> (확인 시각, 지연 초 또는 None(확인 실패))
+        self._lag: Dict[str, tuple] = {}
+        self.routed = {name: 0 for name in engines}
+        self.fallbacks = 0
+
+    def _current_lag(self, name: str) -> Optional[float]:
+        checked_at, lag = self._lag.get(name, (None, None))
+        now = time.monotonic()
+        if checked_at is not None and now - checked_at < self.check_interval_sec:
+            return lag
+
+        try:
+            lag = self._lag_fn(self.engines[name])
+        except Exception as e:
+            logger.warning(f"복제본 지연 확인 실패: replica={name}, error={e}")
+            lag = None
+        self._lag[name] = (now, lag)
+        return lag
+
+    def choose(self) -> Optional[str]:
+        """지연 허용 범위 안의 복제본 이름 (라운드 로빈). 없으면 None"""
+        with self._lock:
+            for _ in range(len(self.engines)):
+                name = next(self._round_robin)
+                lag = self._current_lag(name)
+                if lag is not None and lag <= self.max_lag_sec:
+                    self.routed[name] += 1
+                    return name
+            if self.engines:
+                self.fallbacks += 1
+            return None
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_lag_sec": self.max_lag_sec,
+                "primary_fallbacks": self.fallbacks,
+                "replicas": {
+                    name: {
+                        "lag_sec": self._lag.get(name, (None, None))[1],
+                        "routed_sessions": self.routed[name],
+                    }
+                    for name in self.engines
+                },
+            }
+
+
+class RoutingSession(Session):
+    """
+    read_only 세션이면 복제본, 아니면 primary(bind)로 쿼리를 보내는 세션
+
+    복제본은 세션마다 처음 쿼리할 때 한 번 골라 끝까지 같은 복제본을 씁니다(같은 스냅샷 유지).
+    flush(쓰기)는 read_only 세션이라도 primary로 보냅니다.
+    """
+
+    def __init__(self, *args, router: Optional[ReplicaRouter] = None, read_only: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self.read_only = read_only
+        self._replica_name: Optional[str] = None
+        self._replica_chosen = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.read_only and self.router is not None and not self._flushing:
+            if not self._replica_chosen:
+                self._replica_name = self.router.choose()
+                self._replica_chosen = True
+            if self._replica_name is not None:
+                return self.router.engines[self._replica_name]
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    @property
+    def replica_name(self) -> Optional[str]:
+        """이 세션이 사용 중인 복제본 이름 (primary면 None)"""
+        return self._replica_name
@@ -7,6 +7,7 @@ from repository.user_repository import UserRepository
 _upbit_service_instance = None
 _coin_service_instance = None
 _coin_repository_instance = None
+_coin_catalog_instance = None
 _user_service_instance = None
 _user_repository_instance = None
 _trading_histories_service_instance = None
@@ -16,6 +17,7 @@ _trading_profit_service_instance = None
 _fear_greed_agent_service_instance = None
 _coin_price_agent_service_instance = None
 _article_agent_service_instance = None
+_expert_response_store_instance = None
 _fear_greed_index_repository_instance = None
 _coin_price_day_repository_instance = None
 _article_repository_instance = None
@@ -23,6 +25,8 @@ _trading_histories_repository_instance = None
 _trade_evaluation_agent_service_instance = None
 _diary_repository_instance = None
 _trade_evaluation_result_repository_instance = None
+_sync_job_service_instance = None
+_sync_orchestrator_instance = None
 
 
 # 의존성 주입 함수들
@@ -67,6 +71,19 @@ def get_coin_repository() -> CoinRepository:
     return _coin_repository_instance
 
 
+def get_coin_catalog() -> Any:
+    global _coin_catalog_instance
+    if _coin_catalog_instance is None:
+        from database.invalidation import subscribe
+        from model.CacheVersion import CACHE_COINS
+        from service.coin_catalog import CoinCatalog
+
+        _coin_catalog_instance = CoinCatalog(get_coin_repository())
+        # 다른 프로세스가 코인 목록을 바꾸면 버전 확인을 기다리지 않고 바로 비움
+        subscribe(CACHE_COINS, lambda key: _coin_catalog_instance.invalidate())
+    return _coin_catalog_instance
+
+
 def get_trading_histories_service() -> Any:
     global _trading_histories_service_instance
     if _trading_histories_service_instance is None:
@@ -130,13 +147,24 @@ def get_article_repository() -> Any:
     return _article_repository_instance
 
 
+def get_expert_response_store() -> Any:
+    """전문가 에이전트 응답 저장소 (사용자와 무관한 전문가 의견 재사용)"""
+    global _expert_response_store_instance
+    if _expert_response_store_instance is None:
+        from service.expert_response_store import ExpertResponseStore
+
+        _expert_response_store_instance = ExpertResponseStore()
+    return _expert_response_store_instance
+
+
 def get_fear_greed_agent_service() -> Any:
     global _fear_greed_agent_service_instance
     if _fear_greed_agent_service_instance is None:
         from service.fear_greed_agent_service import FearGreedAgentService
 
         _fear_greed_agent_service_instance = FearGreedAgentService(
-            get_fear_greed_index_repository()
+            get_fear_greed_index_repository(),
+            expert_response_store=get_expert_response_store(),
         )
     return _fear_greed_agent_service_instance
 
@@ -147,7 +175,8 @@ def get_coin_price_agent_service() -> Any:
         from service.coin_price_agent_service import CoinPriceAgentService
 
         _coin_price_agent_service_instance = CoinPriceAgentService(
-            get_coin_price_day_repository()
+            get_coin_price_day_repository(),
+            expert_response_store=get_expert_response_store(),
         )
     return _coin_price_agent_service_instance
 
@@ -157,7 +186,10 @@ def get_article_agent_service() -> Any:
     if _article_agent_service_instance is None:
         from service.article_agent_service import ArticleAgentService
 
-        _article_agent_service_instance = ArticleAgentService(get_article_repository())
+        _article_agent_service_instance = ArticleAgentService(
+            get_article_repository(),
+            expert_response_store=get_expert_response_store(),
+        )
     return _article_agent_service_instance
 
 
@@ -190,6 +222,7 @@ def get_trade_evaluation_agent_service() -> Any:
             get_fear_greed_agent_service(),
             get_trading_histories_repository(),
             get_diary_repository(),
+            get_trade_evaluation_result_repository(),
         )
     return _trade_evaluation_agent_service_instance
 
@@ -203,3 +236,42 @@ def get_trade_evaluation_result_repository() -> Any:
 
         _trade_evaluation_result_repository_instance = TradeEvaluationResultRepository()
     return _trade_evaluation_result_repository_instance
+
+
+def get_sync_job_service() -> Any:
+    global _sync_job_service_instance
+    if _sync_job_service_instance is None:
+        from service.sync_job_service import SyncJobService
+
+        _sync_job_service_instance = SyncJobService()
+    return _sync_job_service_instance
+
+
+def get_sync_orchestrator() -> Any:
+    global _sync_orchestrator_instance
+    if _sync_orchestrator_instance is None:
+        from service.sync_orchestrator import SyncOrchestrator
+
+        _sync_orchestrator_instance = SyncOrchestrator()
+    return _sync_orchestrator_instance
+
+
+def get_db_session():
+    """
+    요청 단위 작업 세션 (라우트에서 Depends로 사용)
+
+    요청 하나가 세션·트랜잭션 하나를 쓰고, 정상 종료 시 commit, 예외 시 rollback 후 close 합니다.
+    서비스·저장소에 session=으로 넘겨 같은 트랜잭션에 참여시킵니다.
+    """
+    from database.database_connection import db  # lazy import
+
+    with db.session_scope() as session:
+        yield session
+
+
+async def get_async_db_session():
+    """요청 단위 AsyncSession (라우트에서 Depends로 사용, 응답 후 자동 close)"""
+    from database.database_connection import db  # lazy import
+
+    async with db.get_async_session() as session:
+        yield session
@@ -0,0 +1,81 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Dict, Any
+from dto.exchange_credentials_dto import ExchangeProvider
+
+
+class SyncJobRequest(BaseModel):
+    """동기화 작업 등록 요청 DTO"""
+
+    user_id: str = Field(..., description="사용자 UUID")
+    exchange_provider: ExchangeProvider = Field(
+        ExchangeProvider.UPBIT, description="거래소 제공자 (기본: 업비트)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "user_id": "bd70f700-5399-46e5-837d-2fc978b3c3b7",
+                "exchange_provider": 1,
+            }
+        }
+    )
+
+
+class SyncJobResponse(BaseModel):
+    """동기화 작업 상태 응답 DTO - SyncJob 모델 기반"""
+
+    job_id: str = Field(..., description="작업 ID")
+    user_id: str = Field(..., description="사용자 UUID")
+    job_type: str = Field(..., description="작업 종류 (trading_histories, assets)")
+    exchange_code: int = Field(..., description="거래소 코드")
+    status: str = Field(..., description="상태 (pending, running, succeeded, failed)")
+    progress: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="진행 상황 (windows_scanned, window_count, orders_fetched, rows_saved 등)",
+    )
+    result: Optional[Dict[str, Any]] = Field(None, description="완료 시 결과 요약")
+    error: Optional[str] = Field(None, description="실패 시 에러 메시지")
+    created_at: Optional[str] = Field(None, description="등록 시간")
+    started_at: Optional[str] = Field(None, description="시작 시간")
+    finished_at: Optional[str] = Field(None, description="종료 시간")
+
+    @classmethod
+    def from_job(cls, job):
+        """SyncJob 모델에서 SyncJobResponse 생성"""
+        return cls(
+            job_id=str(job.id),
+            user_id=str(job.user_id),
+            job_type=job.job_type,
+            exchange_code=job.exchange_code,
+            status=job.status,
+            progress=job.progress or {},
+            result=job.result,
+            error=job.error,
+            created_at=job.created_at.isoformat() if job.created_at else None,
+            started_at=job.started_at.isoformat() if job.started_at else None,
+            finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "job_id": "0b7e6f1c-3c59-4a57-9d0f-6f1f4f3b2a10",
+                "user_id": "bd70f700-5399-46e5-837d-2fc978b3c3b7",
+                "job_type": "trading_histories",
+                "exchange_code": 1,
+                "status": "running",
+                "progress": {
+                    "windows_scanned": 120,
+                    "window_count": 430,
+                    "orders_fetched": 812,
+                    "rows_saved": 790,
+                    "profit_updated": 790,
+                },
+                "result": None,
+                "error": None,
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "started_at": "2025-01-01T00:00:01+00:00",
+                "finished_at": None,
+            }
+        }
+    )
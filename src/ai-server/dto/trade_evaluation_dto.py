@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, ConfigDict
+from typing import List
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 
 class TradeEvaluationRequest(BaseModel):
@@ -19,3 +21,44 @@ class TradeEvaluationRequest(BaseModel):
             }
         }
     )
+
+
+# 일괄 평가 요청 1회에 담을 수 있는 최대 매매 건수
+MAX_BATCH_TRADES = 50
+
+
+class TradeEvaluationBatchItem(BaseModel):
+    """일괄 평가 대상 매매 1건"""
+
+    trade_id: int = Field(..., description="분석할 매매 내역 ID (trading_histories.id)")
+    target_date: str = Field(..., description="선택된 날짜 (YYYY-MM-DD)")
+    coin_id: int = Field(..., description="코인가격 전문가용 코인 ID (coins.id)")
+
+
+class TradeEvaluationBatchRequest(BaseModel):
+    """매매 여러 건 일괄 분석·평가 요청 DTO. 같은 (target_date, coin_id)의 전문가 의견은 한 번만 조회해 공유합니다."""
+
+    user_id: str = Field(..., description="매매 내역 소유 사용자 ID (UUID)")
+    items: List[TradeEvaluationBatchItem] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_TRADES, description="평가할 매매 목록"
+    )
+
+    @field_validator("items")
+    @classmethod
+    def validate_unique_trade_ids(cls, items):
+        trade_ids = [item.trade_id for item in items]
+        if len(trade_ids) != len(set(trade_ids)):
+            raise ValueError("같은 trade_id가 중복되었습니다")
+        return items
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "user_id": "550e8400-e29b-41d4-a716-446655440000",
+                "items": [
+                    {"trade_id": 123, "target_date": "2022-01-14", "coin_id": 1},
+                    {"trade_id": 124, "target_date": "2022-01-14", "coin_id": 1},
+                ],
+            }
+        }
+    )
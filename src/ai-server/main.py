@@ -5,7 +5,11 @@ import os
 import importlib
 from utils.router_utils import register_routers
 from database.database_connection import db
+from database.migrate import run_migrations
+from database.invalidation import start_listener, stop_listener
 from utils.app_initializer import initialize_app
+from dependencies import get_expert_response_store, get_sync_job_service, get_sync_orchestrator
+from utils.concurrency import shutdown_blocking_executor
 import logging
 from contextlib import asynccontextmanager
 
@@ -31,6 +35,26 @@ async def lifespan(app: FastAPI):
             # 테이블 생성
             db.create_tables()
             logger.info("✅ 데이터베이스 테이블 생성 완료")
+
+            # 버전 관리 마이그레이션 (인덱스·제약조건 등)
+            run_migrations(db.engine)
+            logger.info("✅ 스키마 마이그레이션 적용 완료")
+
+            # 다른 워커·수집기의 캐시 무효화 알림 수신 (워커마다 하나)
+            start_listener()
+
+            # 재시작 전 미완료 동기화 작업 재실행
+            get_sync_job_service().recover_jobs()
+
+            # 보관 기간이 지난 전문가 응답 정리 (실패해도 시작은 계속)
+            try:
+                get_expert_response_store().prune()
+            except Exception as e:
+                logger.warning(f"전문가 응답 정리 실패: {e}")
+
+            # 연결된 전체 사용자 주기 동기화 (선택)
+            if os.getenv("SYNC_ORCHESTRATOR_ENABLED", "false").lower() == "true":
+                await get_sync_orchestrator().start()
         else:
             logger.error("❌ 데이터베이스 연결 실패")
             raise Exception("데이터베이스 연결에 실패했습니다")
@@ -45,6 +69,11 @@ async def lifespan(app: FastAPI):
 
     # 종료 시
     logger.info("🛑 애플리케이션 종료 중...")
+    await get_sync_orchestrator().stop()
+    stop_listener()
+    get_sync_job_service().shutdown()
+    shutdown_blocking_executor()
+    await db.dispose_async_engine()
 
 
 app = FastAPI(
@@ -0,0 +1,23 @@
+"""캐시 대상 데이터의 버전. 쓰는 쪽이 값을 올리면 각 프로세스의 캐시가 다음 확인 때 다시 로드."""
+
+from sqlalchemy import Column, String, BigInteger, TIMESTAMP, func
+from database.database_connection import db
+
+# 캐시 이름 (cache_versions.name, 캐시 무효화 알림의 name)
+CACHE_COINS = "coins"
+CACHE_COIN_PRICES_DAY = "coin_prices_day"  # key: coin_id
+CACHE_FEAR_GREED_INDEX = "fear_greed_index"
+CACHE_ARTICLES = "articles"
+CACHE_TRADING_HISTORIES = "trading_histories"  # key: user_id
+CACHE_ASSETS = "assets"  # key: user_id
+
+
+class CacheVersion(db.Base):
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP(timezone=True), default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<CacheVersion(name={self.name}, version={self.version})>"
@@ -7,6 +7,7 @@ from sqlalchemy import (
     TIMESTAMP,
     func,
     ForeignKey,
+    Index,
     UniqueConstraint,
     CheckConstraint,
 )
@@ -42,6 +43,7 @@ class CoinHoldingsPast(db.Base):
         CheckConstraint("exchange_code IN (1, 2, 3, 4)", name="chk_exchange_code_valid"),
         CheckConstraint("remaining_quantity >= 0", name="chk_remaining_quantity_non_negative"),
         CheckConstraint("avg_buy_price >= 0", name="chk_avg_buy_price_non_negative"),
+        Index("idx_coin_holdings_past_user_exchange", "user_id", "exchange_code"),
     )
 
     def __repr__(self):
@@ -6,6 +6,8 @@ from sqlalchemy import (
     TIMESTAMP,
     BigInteger,
     ForeignKey,
+    Index,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.orm import relationship
@@ -15,12 +17,13 @@ from database.database_connection import db
 class CoinPricesDay(db.Base):
     __tablename__ = "coin_prices_day"
 
+    # 파티션 키(candle_date_time_utc)를 기본 키에 포함 (파티션 테이블의 PK/UNIQUE 조건)
     id = Column(Integer, primary_key=True, autoincrement=True)
     coin_id = Column(
         Integer, ForeignKey("coins.id", ondelete="CASCADE"), nullable=False
     )
     market_code = Column(String(20), nullable=False)
-    candle_date_time_utc = Column(TIMESTAMP, nullable=False)
+    candle_date_time_utc = Column(TIMESTAMP, primary_key=True, nullable=False)
     candle_date_time_kst = Column(TIMESTAMP, nullable=False)
     opening_price = Column(Numeric(20, 8), nullable=False)
     high_price = Column(Numeric(20, 8), nullable=False)
@@ -39,6 +42,16 @@ class CoinPricesDay(db.Base):
     # 관계 설정
     coin = relationship("Coins", back_populates="coin_prices_day")
 
+    # 제약조건 (기존 DB는 migrations/versions/0001에서 추가)
+    # candle_date_time_utc 연 단위 RANGE 파티션 (기존 DB는 0003에서 전환, 파티션은 database/partitions.py로 생성)
+    __table_args__ = (
+        UniqueConstraint(
+            "market_code", "candle_date_time_utc", name="uq_coin_prices_day_market_date"
+        ),
+        Index("idx_coin_prices_day_coin_id_date_utc", "coin_id", "candle_date_time_utc"),
+        {"postgresql_partition_by": "RANGE (candle_date_time_utc)"},
+    )
+
     def __repr__(self):
         return f"<CoinPricesDay(id={self.id}, coin_id={self.coin_id}, market_code={self.market_code}, date={self.candle_date_time_utc})>"
 
@@ -0,0 +1,26 @@
+"""전문가 에이전트(기사·코인 가격·공포탐욕) 응답 저장소. 사용자와 무관해 같은 입력이면 재사용."""
+
+from sqlalchemy import Column, String, Integer, Date, TIMESTAMP, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
+from database.database_connection import db
+
+
+class ExpertResponse(db.Base):
+    __tablename__ = "expert_responses"
+
+    # (agent, prompt_version, model, target_date, params, coin_id, input_hash)의 sha256
+    cache_key = Column(String(64), primary_key=True)
+    agent = Column(String(30), nullable=False)
+    prompt_version = Column(String(16), nullable=False)
+    model = Column(String(50), nullable=False)
+    target_date = Column(Date, nullable=False)
+    coin_id = Column(Integer)
+    params = Column(JSONB, nullable=False)
+    input_hash = Column(String(64), nullable=False)  # 에이전트에 넘긴 기간 데이터의 sha256
+    response = Column(JSONB, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), default=func.now())
+
+    __table_args__ = (Index("idx_expert_responses_created_at", "created_at"),)
+
+    def __repr__(self):
+        return f"<ExpertResponse(agent={self.agent}, target_date={self.target_date}, cache_key={self.cache_key[:12]})>"
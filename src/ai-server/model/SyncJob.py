@@ -0,0 +1,65 @@
+"""거래소 동기화 백그라운드 작업. 진행 상황을 JSONB로 저장해 재시작 후에도 상태를 유지."""
+
+import uuid
+
+from sqlalchemy import (
+    Column,
+    String,
+    SmallInteger,
+    Text,
+    TIMESTAMP,
+    ForeignKey,
+    Index,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from database.database_connection import db
+
+# 작업 종류
+JOB_TYPE_TRADING_HISTORIES = "trading_histories"
+JOB_TYPE_ASSETS = "assets"
+
+# 작업 상태
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+ACTIVE_STATUSES = (STATUS_PENDING, STATUS_RUNNING)
+
+
+class SyncJob(db.Base):
+    __tablename__ = "sync_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    job_type = Column(String(30), nullable=False)  # trading_histories, assets
+    exchange_code = Column(SmallInteger, nullable=False)
+    status = Column(String(20), nullable=False, default=STATUS_PENDING)
+    progress = Column(JSONB, nullable=False, default=dict)
+    result = Column(JSONB)
+    error = Column(Text)
+
+    created_at = Column(TIMESTAMP(timezone=True), default=func.now())
+    started_at = Column(TIMESTAMP(timezone=True))
+    finished_at = Column(TIMESTAMP(timezone=True))
+    updated_at = Column(TIMESTAMP(timezone=True), default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 사용자·작업 종류·거래소별로 진행 중인 작업은 하나만 허용
+        Index(
+            "uq_sync_jobs_active",
+            "user_id",
+            "job_type",
+            "exchange_code",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+        Index("idx_sync_jobs_status", "status"),
+    )
+
+    def __repr__(self):
+        return f"<SyncJob(id={self.id}, job_type={self.job_type}, status={self.status})>"
@@ -1,6 +1,15 @@
 """매매 분석 결과. API 응답 data 전체를 JSONB로 저장."""
 
-from sqlalchemy import Column, Integer, Date, TIMESTAMP, func, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    Date,
+    TIMESTAMP,
+    func,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from database.database_connection import db
 
@@ -21,6 +30,19 @@ class TradeEvaluationResult(db.Base):
     coin_id = Column(Integer, nullable=False)
     created_at = Column(TIMESTAMP(timezone=True), default=func.now())
     result = Column(JSONB, nullable=False)
+    # 결과를 만든 입력의 지문 {"experts": {agent: 전문가 응답 키}, "meta": 메타 에이전트 입력 해시}
+    # 같은 입력으로 다시 요청하면 LLM 없이 result를 반환 (없으면 다시 계산)
+    input_fingerprints = Column(JSONB)
+
+    # 제약조건 (기존 DB는 migrations/versions/0001에서 중복 정리 후 추가)
+    __table_args__ = (
+        UniqueConstraint("user_id", "trade_id", name="uq_trade_evaluation_results_user_trade"),
+        Index(
+            "idx_trade_evaluation_results_trade_created",
+            "trade_id",
+            created_at.desc(),
+        ),
+    )
 
     def __repr__(self):
         return f"<TradeEvaluationResult(id={self.id}, trade_id={self.trade_id})>"
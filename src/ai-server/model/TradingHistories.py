@@ -7,6 +7,7 @@ from sqlalchemy import (
     TIMESTAMP,
     func,
     ForeignKey,
+    Index,
     UniqueConstraint,
     CheckConstraint,
 )
@@ -59,7 +60,19 @@ class TradingHistories(db.Base):
         ),
         CheckConstraint("exchange_code IN (1, 2, 3, 4)", name="chk_exchange_code"),
         CheckConstraint("trade_type IN (0, 1)", name="chk_trade_type"),
+        # 조회 인덱스 (기존 DB는 migrations/versions/0001에서 추가)
+        Index(
+            "idx_trading_histories_user_exchange_time",
+            "user_id",
+            "exchange_code",
+            "trade_time",
+        ),
+        Index("idx_trading_histories_user_time_id", "user_id", "trade_time", "id"),
     )
 
+    # ORM 식별자는 (id, user_id). UPDATE/DELETE WHERE에 user_id가 들어가
+    # user_id 해시 파티션 레이아웃(database/partitions.py)에서도 파티션 하나만 찾음
+    __mapper_args__ = {"primary_key": [id, user_id]}
+
     def __repr__(self):
         return f"<TradingHistory(id={self.id}, user_id={self.user_id}, trade_uuid={self.trade_uuid})>"
@@ -0,0 +1,26 @@
+"""사용자·거래소별 마지막 동기화 시각. 스케줄러가 다음 동기화 대상을 고를 때 사용."""
+
+from sqlalchemy import Column, SmallInteger, Text, TIMESTAMP, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from database.database_connection import db
+
+
+class UserSyncStatus(db.Base):
+    __tablename__ = "user_sync_status"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    exchange_code = Column(SmallInteger, primary_key=True)
+
+    trading_synced_at = Column(TIMESTAMP(timezone=True))  # 거래내역 마지막 동기화
+    assets_synced_at = Column(TIMESTAMP(timezone=True))  # 자산 마지막 동기화
+    last_error = Column(Text)
+    updated_at = Column(TIMESTAMP(timezone=True), default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("idx_user_sync_status_trading_synced_at", "trading_synced_at"),
+    )
+
+    def __repr__(self):
+        return f"<UserSyncStatus(user_id={self.user_id}, exchange_code={self.exchange_code})>"
@@ -2,9 +2,28 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Row, select
+
 from database.database_connection import db
 from model.Article import Article
 
+# 에이전트 입력에 쓰는 칼럼만 조회 (summary TEXT 등은 읽지 않음)
+_HEADLINE_COLUMNS = (Article.headline, Article.published_at, Article.original_url)
+
+
+def _headlines(start_dt: datetime, end_dt: datetime, publisher_type: Optional[int]):
+    stmt = (
+        select(*_HEADLINE_COLUMNS)
+        .where(
+            Article.published_at >= start_dt,
+            Article.published_at <= end_dt,
+        )
+        .order_by(Article.published_at.desc())
+    )
+    if publisher_type is not None:
+        stmt = stmt.where(Article.publisher_type == publisher_type)
+    return stmt
+
 
 class ArticleRepository:
     def __init__(self):
@@ -16,16 +35,17 @@ class ArticleRepository:
         start_dt: datetime,
         end_dt: datetime,
         publisher_type: Optional[int] = None,
-    ) -> List[Article]:
-        """published_at 구간 조회, published_at 내림차순(최신순). headline, published_at, original_url 사용."""
-        q = (
-            session.query(Article)
-            .filter(
-                Article.published_at >= start_dt,
-                Article.published_at <= end_dt,
-            )
-            .order_by(Article.published_at.desc())
-        )
-        if publisher_type is not None:
-            q = q.filter(Article.publisher_type == publisher_type)
-        return q.all()
+    ) -> List[Row]:
+        """published_at 구간 조회, published_at 내림차순(최신순). (headline, published_at, original_url) 행만 반환."""
+        return session.execute(_headlines(start_dt, end_dt, publisher_type)).all()
+
+    async def find_by_published_at_between_async(
+        self,
+        session,
+        start_dt: datetime,
+        end_dt: datetime,
+        publisher_type: Optional[int] = None,
+    ) -> List[Row]:
+        """find_by_published_at_between의 AsyncSession 버전."""
+        result = await session.execute(_headlines(start_dt, end_dt, publisher_type))
+        return list(result.all())
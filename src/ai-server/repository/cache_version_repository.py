@@ -0,0 +1,48 @@
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from database.database_connection import db
+from model.CacheVersion import CacheVersion
+
+
+class CacheVersionRepository:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def get_version(self, name: str, session=None) -> int:
+        """캐시 버전 조회 (한 번도 올린 적 없으면 0)"""
+        try:
+            with db.session_scope(session) as s:
+                version = s.execute(
+                    select(CacheVersion.version).where(CacheVersion.name == name)
+                ).scalar()
+                return version or 0
+        except Exception as e:
+            self.logger.error(f"캐시 버전 조회 중 에러 발생: name={name}, {e}")
+            raise e
+
+    def bump(self, name: str, session=None) -> int:
+        """
+        캐시 버전을 1 올림 (없으면 1로 생성)
+
+        데이터를 바꾼 트랜잭션과 같은 session으로 호출하면 커밋될 때 함께 반영됩니다.
+
+        Returns:
+            올린 뒤의 버전
+        """
+        try:
+            with db.session_scope(session) as s:
+                stmt = insert(CacheVersion).values(name=name, version=1)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[CacheVersion.name],
+                    set_={
+                        "version": CacheVersion.version + 1,
+                        "updated_at": func.now(),
+                    },
+                ).returning(CacheVersion.version)
+                return s.execute(stmt).scalar()
+        except Exception as e:
+            self.logger.error(f"캐시 버전 갱신 중 에러 발생: name={name}, {e}")
+            raise e
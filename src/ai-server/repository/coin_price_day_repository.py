@@ -2,9 +2,35 @@ import logging
 from datetime import datetime
 from typing import List
 
+from sqlalchemy import Float, Row, cast, select
+
 from database.database_connection import db
 from model.CoinPricesDay import CoinPricesDay
 
+# 에이전트 입력(일봉 요약)에 필요한 칼럼만 조회. 가격은 표시용이라 SQL에서 float8로 변환해
+# Decimal 생성 없이 float로 받음
+_DAILY_CANDLE_COLUMNS = (
+    CoinPricesDay.candle_date_time_utc,
+    cast(CoinPricesDay.opening_price, Float).label("opening_price"),
+    cast(CoinPricesDay.high_price, Float).label("high_price"),
+    cast(CoinPricesDay.low_price, Float).label("low_price"),
+    cast(CoinPricesDay.trade_price, Float).label("trade_price"),
+    cast(CoinPricesDay.change_rate, Float).label("change_rate"),
+)
+
+
+def _daily_candles(condition, start_dt: datetime, end_dt: datetime):
+    # candle_date_time_utc 범위 조건으로 해당 연도 파티션만 조회 (partition pruning)
+    return (
+        select(*_DAILY_CANDLE_COLUMNS)
+        .where(
+            condition,
+            CoinPricesDay.candle_date_time_utc >= start_dt,
+            CoinPricesDay.candle_date_time_utc < end_dt,
+        )
+        .order_by(CoinPricesDay.candle_date_time_utc.asc())
+    )
+
 
 class CoinPriceDayRepository:
     def __init__(self):
@@ -16,18 +42,27 @@ class CoinPriceDayRepository:
         market_code: str,
         start_dt: datetime,
         end_dt: datetime,
-    ) -> List[CoinPricesDay]:
-        """market_code와 candle_date_time_utc 구간으로 조회, 날짜 오름차순."""
-        return (
-            session.query(CoinPricesDay)
-            .filter(
-                CoinPricesDay.market_code == market_code,
-                CoinPricesDay.candle_date_time_utc >= start_dt,
-                CoinPricesDay.candle_date_time_utc < end_dt,
-            )
-            .order_by(CoinPricesDay.candle_date_time_utc.asc())
-            .all()
+    ) -> List[Row]:
+        """
+        market_code와 candle_date_time_utc 구간으로 조회, 날짜 오름차순.
+        (candle_date_time_utc, opening/high/low/trade_price, change_rate) 행만 반환 (가격은 float).
+        """
+        return session.execute(
+            _daily_candles(CoinPricesDay.market_code == market_code, start_dt, end_dt)
+        ).all()
+
+    async def find_by_market_code_and_date_range_async(
+        self,
+        session,
+        market_code: str,
+        start_dt: datetime,
+        end_dt: datetime,
+    ) -> List[Row]:
+        """find_by_market_code_and_date_range의 AsyncSession 버전."""
+        result = await session.execute(
+            _daily_candles(CoinPricesDay.market_code == market_code, start_dt, end_dt)
         )
+        return list(result.all())
 
     def find_by_coin_id_and_date_range(
         self,
@@ -35,15 +70,24 @@ class CoinPriceDayRepository:
         coin_id: int,
         start_dt: datetime,
         end_dt: datetime,
-    ) -> List[CoinPricesDay]:
-        """coin_id와 candle_date_time_utc 구간으로 조회, 날짜 오름차순."""
-        return (
-            session.query(CoinPricesDay)
-            .filter(
-                CoinPricesDay.coin_id == coin_id,
-                CoinPricesDay.candle_date_time_utc >= start_dt,
-                CoinPricesDay.candle_date_time_utc < end_dt,
-            )
-            .order_by(CoinPricesDay.candle_date_time_utc.asc())
-            .all()
+    ) -> List[Row]:
+        """
+        coin_id와 candle_date_time_utc 구간으로 조회, 날짜 오름차순.
+        (candle_date_time_utc, opening/high/low/trade_price, change_rate) 행만 반환 (가격은 float).
+        """
+        return session.execute(
+            _daily_candles(CoinPricesDay.coin_id == coin_id, start_dt, end_dt)
+        ).all()
+
+    async def find_by_coin_id_and_date_range_async(
+        self,
+        session,
+        coin_id: int,
+        start_dt: datetime,
+        end_dt: datetime,
+    ) -> List[Row]:
+        """find_by_coin_id_and_date_range의 AsyncSession 버전."""
+        result = await session.execute(
+            _daily_candles(CoinPricesDay.coin_id == coin_id, start_dt, end_dt)
         )
+        return list(result.all())
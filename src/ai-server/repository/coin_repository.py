@@ -1,16 +1,24 @@
 import logging
 from typing import List, Dict, Any
+from sqlalchemy import Row, select
 from database.database_connection import db
+from database.invalidation import publish_invalidation
+from model.CacheVersion import CACHE_COINS
 from model.Coins import Coins
+from repository.cache_version_repository import CacheVersionRepository
 
 
 class CoinRepository:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.cache_version_repository = CacheVersionRepository()
 
     def save_coin_list(self, coin_list: List[Coins]):
         """
         코인 목록을 저장 (신규 종목만 추가, 기존 종목은 업데이트하지 않음)
+
+        새 종목이 있으면 같은 트랜잭션에서 코인 캐시 버전을 올리고 무효화 알림을 보내
+        각 프로세스의 CoinCatalog가 다시 로드합니다.
         
         Args:
             coin_list: 저장할 코인 목록
@@ -39,7 +47,11 @@ class CoinRepository:
                     # 새로운 코인만 추가
                     session.add(coin)
                     new_count += 1
-            
+
+            if new_count:
+                self.cache_version_repository.bump(CACHE_COINS, session=session)
+                publish_invalidation(CACHE_COINS, session=session)
+
             session.commit()
 
             self.logger.info(
@@ -57,15 +69,25 @@ class CoinRepository:
             if session:
                 session.close()
 
-    def get_all_coins(self):
-        session = None
+    def get_all_coins(self, session=None):
         try:
-            session = db.get_session()
-            coins = session.query(Coins).all()
-            return coins
+            with db.session_scope(session) as s:
+                return s.query(Coins).all()
         except Exception as e:
             self.logger.error(f"코인 목록 조회 중 에러 발생: {e}")
             raise e
-        finally:
-            if session:
-                session.close()
+
+    def get_coin_refs(self, session=None) -> List[Row]:
+        """
+        코인 매핑용 (id, symbol, quote_currency, market_code) 행 목록
+
+        market_code/symbol → id 매핑에만 쓰는 경로용. ORM 객체를 만들지 않아 identity map에 올라가지 않습니다.
+        """
+        try:
+            with db.session_scope(session) as s:
+                return s.execute(
+                    select(Coins.id, Coins.symbol, Coins.quote_currency, Coins.market_code)
+                ).all()
+        except Exception as e:
+            self.logger.error(f"코인 매핑 목록 조회 중 에러 발생: {e}")
+            raise e
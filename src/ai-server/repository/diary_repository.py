@@ -1,5 +1,7 @@
 import logging
-from typing import Optional
+from typing import List, Optional
+
+from sqlalchemy import select
 
 from database.database_connection import db
 from model.Diary import Diary
@@ -16,3 +18,23 @@ class DiaryRepository:
             .filter(Diary.trading_history_id == trading_history_id)
             .first()
         )
+
+    async def find_by_trading_history_id_async(
+        self, session, trading_history_id: int
+    ) -> Optional[Diary]:
+        """find_by_trading_history_id의 AsyncSession 버전."""
+        result = await session.execute(
+            select(Diary).where(Diary.trading_history_id == trading_history_id).limit(1)
+        )
+        return result.scalars().first()
+
+    async def find_all_by_trading_history_ids_async(
+        self, session, trading_history_ids: List[int]
+    ) -> List[Diary]:
+        """trading_history_id 목록으로 매매 일지 일괄 조회 (AsyncSession)."""
+        if not trading_history_ids:
+            return []
+        result = await session.execute(
+            select(Diary).where(Diary.trading_history_id.in_(trading_history_ids))
+        )
+        return list(result.scalars().all())
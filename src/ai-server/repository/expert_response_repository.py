@@ -0,0 +1,76 @@
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from database.database_connection import db
+from model.ExpertResponse import ExpertResponse
+
+
+class ExpertResponseRepository:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def find_response(self, cache_key: str, session=None) -> Optional[Dict[str, Any]]:
+        """
+        저장된 응답(JSON) 조회. 없으면 None
+
+        LLM을 다시 부를지 정하는 중복 확인이라 복제본이 아닌 primary에서 조회합니다
+        (복제 지연으로 방금 저장한 응답을 못 보면 같은 입력으로 LLM을 또 호출).
+        """
+        try:
+            with db.session_scope(session) as s:
+                return s.execute(
+                    select(ExpertResponse.response).where(ExpertResponse.cache_key == cache_key)
+                ).scalar()
+        except Exception as e:
+            self.logger.error(f"전문가 응답 조회 중 에러 발생: {e}")
+            raise e
+
+    def save(
+        self,
+        cache_key: str,
+        agent: str,
+        prompt_version: str,
+        model: str,
+        target_date: date,
+        coin_id: Optional[int],
+        params: Dict[str, Any],
+        input_hash: str,
+        response: Dict[str, Any],
+        session=None,
+    ) -> None:
+        """응답 저장 (같은 키가 이미 있으면 그대로 둠)"""
+        try:
+            with db.session_scope(session) as s:
+                s.execute(
+                    insert(ExpertResponse)
+                    .values(
+                        cache_key=cache_key,
+                        agent=agent,
+                        prompt_version=prompt_version,
+                        model=model,
+                        target_date=target_date,
+                        coin_id=coin_id,
+                        params=params,
+                        input_hash=input_hash,
+                        response=response,
+                    )
+                    .on_conflict_do_nothing(index_elements=[ExpertResponse.cache_key])
+                )
+        except Exception as e:
+            self.logger.error(f"전문가 응답 저장 중 에러 발생: {e}")
+            raise e
+
+    def delete_created_before(self, cutoff: datetime, session=None) -> int:
+        """cutoff 이전에 저장한 응답 삭제 (입력 데이터가 바뀌어 더 이상 쓰이지 않는 키 정리)"""
+        try:
+            with db.session_scope(session) as s:
+                return s.execute(
+                    delete(ExpertResponse).where(ExpertResponse.created_at < cutoff)
+                ).rowcount
+        except Exception as e:
+            self.logger.error(f"전문가 응답 정리 중 에러 발생: {e}")
+            raise e
@@ -2,6 +2,8 @@ import logging
 from datetime import date
 from typing import List, Tuple
 
+from sqlalchemy import select
+
 from database.database_connection import db
 from model.FearGreedIndex import FearGreedIndex
 
@@ -23,3 +25,17 @@ class FearGreedIndexRepository:
             .order_by(FearGreedIndex.date.asc())
         )
         return [(row.date, row.value) for row in q.all()]
+
+    async def find_by_date_range_async(
+        self, session, start_date: date, end_date: date
+    ) -> List[Tuple[date, int]]:
+        """find_by_date_range의 AsyncSession 버전."""
+        result = await session.execute(
+            select(FearGreedIndex.date, FearGreedIndex.value)
+            .where(
+                FearGreedIndex.date >= start_date,
+                FearGreedIndex.date <= end_date,
+            )
+            .order_by(FearGreedIndex.date.asc())
+        )
+        return [(row.date, row.value) for row in result.all()]
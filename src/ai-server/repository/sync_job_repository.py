@@ -0,0 +1,204 @@
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
+
+from database.database_connection import db
+from model.SyncJob import (
+    SyncJob,
+    ACTIVE_STATUSES,
+    STATUS_PENDING,
+    STATUS_RUNNING,
+    STATUS_SUCCEEDED,
+    STATUS_FAILED,
+)
+
+
+def _to_uuid(value):
+    return uuid.UUID(value) if isinstance(value, str) else value
+
+
+class SyncJobRepository:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def create_job(
+        self, user_id: str, job_type: str, exchange_code: int
+    ) -> Optional[SyncJob]:
+        """
+        대기(pending) 상태의 작업 생성
+
+        Returns:
+            생성된 작업. 같은 사용자·종류·거래소의 진행 중 작업이 이미 있으면 None
+        """
+        try:
+            session = db.get_session()
+            job = SyncJob(
+                user_id=_to_uuid(user_id),
+                job_type=job_type,
+                exchange_code=exchange_code,
+                status=STATUS_PENDING,
+                progress={},
+            )
+            session.add(job)
+            session.commit()
+            session.refresh(job)
+            return job
+        except IntegrityError:
+            # uq_sync_jobs_active 위반: 동시에 들어온 중복 요청
+            session.rollback()
+            return None
+        except Exception as e:
+            self.logger.error(f"동기화 작업 생성 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def find_by_id(self, job_id: str) -> Optional[SyncJob]:
+        """작업 ID로 조회"""
+        try:
+            session = db.get_session()
+            return session.query(SyncJob).filter(SyncJob.id == _to_uuid(job_id)).first()
+        except Exception as e:
+            self.logger.error(f"동기화 작업 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_active(
+        self, user_id: str, job_type: str, exchange_code: int
+    ) -> Optional[SyncJob]:
+        """사용자·작업 종류·거래소별 진행 중(pending/running) 작업 조회"""
+        try:
+            session = db.get_session()
+            return (
+                session.query(SyncJob)
+                .filter(
+                    SyncJob.user_id == _to_uuid(user_id),
+                    SyncJob.job_type == job_type,
+                    SyncJob.exchange_code == exchange_code,
+                    SyncJob.status.in_(ACTIVE_STATUSES),
+                )
+                .first()
+            )
+        except Exception as e:
+            self.logger.error(f"진행 중 동기화 작업 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_pending(self) -> List[SyncJob]:
+        """대기 중인 작업 목록 (생성 순)"""
+        try:
+            session = db.get_session()
+            return (
+                session.query(SyncJob)
+                .filter(SyncJob.status == STATUS_PENDING)
+                .order_by(SyncJob.created_at.asc())
+                .all()
+            )
+        except Exception as e:
+            self.logger.error(f"대기 중 동기화 작업 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def reset_stale_running(self, stale_after: timedelta) -> int:
+        """
+        진행 상황 갱신이 stale_after 이상 멈춘 running 작업을 pending으로 되돌림
+
+        프로세스 재시작 등으로 중단된 작업을 다시 실행하기 위해 사용합니다.
+        """
+        try:
+            session = db.get_session()
+            threshold = datetime.now(timezone.utc) - stale_after
+            result = session.execute(
+                update(SyncJob)
+                .where(
+                    SyncJob.status == STATUS_RUNNING,
+                    SyncJob.updated_at < threshold,
+                )
+                .values(status=STATUS_PENDING, updated_at=func.now())
+            )
+            session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.logger.error(f"중단된 동기화 작업 복구 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def claim(self, job_id: str) -> Optional[SyncJob]:
+        """
+        pending 작업을 running으로 전환 (조건부 UPDATE)
+
+        여러 워커가 같은 작업을 잡더라도 한 곳만 성공합니다.
+
+        Returns:
+            선점에 성공한 작업. 이미 다른 곳에서 실행 중이거나 끝났으면 None
+        """
+        try:
+            session = db.get_session()
+            claimed_id = session.execute(
+                update(SyncJob)
+                .where(SyncJob.id == _to_uuid(job_id), SyncJob.status == STATUS_PENDING)
+                .values(
+                    status=STATUS_RUNNING,
+                    started_at=func.now(),
+                    updated_at=func.now(),
+                )
+                .returning(SyncJob.id)
+            ).scalar()
+            session.commit()
+            if claimed_id is None:
+                return None
+            return session.query(SyncJob).filter(SyncJob.id == claimed_id).first()
+        except Exception as e:
+            self.logger.error(f"동기화 작업 선점 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """진행 상황 갱신"""
+        self._update(job_id, progress=progress, updated_at=func.now())
+
+    def mark_succeeded(self, job_id: str, result: Dict[str, Any]) -> None:
+        """성공 처리"""
+        self._update(
+            job_id,
+            status=STATUS_SUCCEEDED,
+            result=result,
+            finished_at=func.now(),
+            updated_at=func.now(),
+        )
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        """실패 처리"""
+        self._update(
+            job_id,
+            status=STATUS_FAILED,
+            error=error,
+            finished_at=func.now(),
+            updated_at=func.now(),
+        )
+
+    def _update(self, job_id: str, **values) -> None:
+        try:
+            session = db.get_session()
+            session.execute(
+                update(SyncJob).where(SyncJob.id == _to_uuid(job_id)).values(**values)
+            )
+            session.commit()
+        except Exception as e:
+            self.logger.error(f"동기화 작업 갱신 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
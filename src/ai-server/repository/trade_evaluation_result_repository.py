@@ -1,11 +1,23 @@
 import logging
 import uuid
+from datetime import date
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
 from database.database_connection import db
 from model.TradeEvaluationResult import TradeEvaluationResult
 
 
+def _to_uuid(user_id):
+    return uuid.UUID(user_id) if isinstance(user_id, str) else user_id
+
+
+def _to_date(target_date):
+    return date.fromisoformat(target_date) if isinstance(target_date, str) else target_date
+
+
 class TradeEvaluationResultRepository:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -18,21 +30,19 @@ class TradeEvaluationResultRepository:
         target_date: str,
         coin_id: int,
         result_dict: Dict[str, Any],
+        input_fingerprints: Optional[Dict[str, Any]] = None,
     ) -> TradeEvaluationResult:
         """(user_id, trade_id) 기준 upsert: 있으면 갱신, 없으면 INSERT."""
-        from datetime import date
-
-        user_uuid = uuid.UUID(user_id) if isinstance(user_id, str) else user_id
-        target_dt = (
-            date.fromisoformat(target_date)
-            if isinstance(target_date, str)
-            else target_date
-        )
+        user_uuid = _to_uuid(user_id)
+        target_dt = _to_date(target_date)
         row = self.find_by_user_id_and_trade_id(session, user_id, trade_id)
         if row:
             row.target_date = target_dt
             row.coin_id = coin_id
             row.result = result_dict
+            row.input_fingerprints = input_fingerprints
+            # 최신순 조회(trade_id, created_at DESC)에서 다시 평가한 결과가 최신으로 보이도록
+            row.created_at = func.now()
             session.flush()
             session.refresh(row)
             return row
@@ -42,6 +52,7 @@ class TradeEvaluationResultRepository:
             target_date=target_dt,
             coin_id=coin_id,
             result=result_dict,
+            input_fingerprints=input_fingerprints,
         )
         session.add(row)
         session.flush()
@@ -52,7 +63,7 @@ class TradeEvaluationResultRepository:
         self, session: Any, user_id: str, trade_id: int
     ) -> Optional[TradeEvaluationResult]:
         """(user_id, trade_id)로 1건 조회. 없으면 None."""
-        user_uuid = uuid.UUID(user_id) if isinstance(user_id, str) else user_id
+        user_uuid = _to_uuid(user_id)
         return (
             session.query(TradeEvaluationResult)
             .filter(
@@ -83,3 +94,132 @@ class TradeEvaluationResultRepository:
             .order_by(TradeEvaluationResult.created_at.desc())
             .all()
         )
+
+    async def save_async(
+        self,
+        session: Any,
+        user_id: str,
+        trade_id: int,
+        target_date: str,
+        coin_id: int,
+        result_dict: Dict[str, Any],
+        input_fingerprints: Optional[Dict[str, Any]] = None,
+    ) -> TradeEvaluationResult:
+        """save의 AsyncSession 버전. commit은 호출한 쪽에서."""
+        row = await self.find_by_user_id_and_trade_id_async(session, user_id, trade_id)
+        if row:
+            row.target_date = _to_date(target_date)
+            row.coin_id = coin_id
+            row.result = result_dict
+            row.input_fingerprints = input_fingerprints
+            # 최신순 조회(trade_id, created_at DESC)에서 다시 평가한 결과가 최신으로 보이도록
+            row.created_at = func.now()
+            await session.flush()
+            await session.refresh(row)
+            return row
+        row = TradeEvaluationResult(
+            user_id=_to_uuid(user_id),
+            trade_id=trade_id,
+            target_date=_to_date(target_date),
+            coin_id=coin_id,
+            result=result_dict,
+            input_fingerprints=input_fingerprints,
+        )
+        session.add(row)
+        await session.flush()
+        await session.refresh(row)
+        return row
+
+    async def find_by_user_id_and_trade_id_async(
+        self, session: Any, user_id: str, trade_id: int
+    ) -> Optional[TradeEvaluationResult]:
+        """find_by_user_id_and_trade_id의 AsyncSession 버전."""
+        result = await session.execute(
+            select(TradeEvaluationResult)
+            .where(
+                TradeEvaluationResult.user_id == _to_uuid(user_id),
+                TradeEvaluationResult.trade_id == trade_id,
+            )
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    async def find_all_by_user_id_and_trade_ids_async(
+        self, session: Any, user_id: str, trade_ids: List[int]
+    ) -> List[TradeEvaluationResult]:
+        """(user_id, trade_id 목록)으로 일괄 조회 (AsyncSession)."""
+        if not trade_ids:
+            return []
+        result = await session.execute(
+            select(TradeEvaluationResult).where(
+                TradeEvaluationResult.user_id == _to_uuid(user_id),
+                TradeEvaluationResult.trade_id.in_(trade_ids),
+            )
+        )
+        return list(result.scalars().all())
+
+    async def bulk_upsert_async(
+        self, session: Any, user_id: str, rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        여러 건을 INSERT ... ON CONFLICT (user_id, trade_id) DO UPDATE 한 번으로 저장. commit은 호출한 쪽에서.
+
+        Args:
+            rows: 건마다 trade_id, target_date, coin_id, result_dict, input_fingerprints(선택)
+
+        Returns:
+            저장(추가·갱신)된 행 수
+        """
+        if not rows:
+            return 0
+        values = [
+            {
+                "user_id": _to_uuid(user_id),
+                "trade_id": row["trade_id"],
+                "target_date": _to_date(row["target_date"]),
+                "coin_id": row["coin_id"],
+                "result": row["result_dict"],
+                "input_fingerprints": row.get("input_fingerprints"),
+                "created_at": func.now(),
+            }
+            for row in rows
+        ]
+        stmt = insert(TradeEvaluationResult).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_trade_evaluation_results_user_trade",
+            set_={
+                "target_date": stmt.excluded.target_date,
+                "coin_id": stmt.excluded.coin_id,
+                "result": stmt.excluded.result,
+                "input_fingerprints": stmt.excluded.input_fingerprints,
+                # 최신순 조회(trade_id, created_at DESC)에서 다시 평가한 결과가 최신으로 보이도록
+                "created_at": func.now(),
+            },
+        ).returning(TradeEvaluationResult.id)
+        result = await session.execute(stmt)
+        saved = len(result.all())
+        self.logger.info(f"매매 평가 결과 일괄 저장: user_id={user_id}, {saved}건")
+        return saved
+
+    async def find_by_trade_id_async(
+        self, session: Any, trade_id: int
+    ) -> Optional[TradeEvaluationResult]:
+        """find_by_trade_id의 AsyncSession 버전."""
+        result = await session.execute(
+            select(TradeEvaluationResult)
+            .where(TradeEvaluationResult.trade_id == trade_id)
+            .order_by(TradeEvaluationResult.created_at.desc())
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    async def find_all_by_trade_id_async(
+        self, session: Any, trade_id: int
+    ) -> List[TradeEvaluationResult]:
+        """find_all_by_trade_id의 AsyncSession 버전."""
+        result = await session.execute(
+            select(TradeEvaluationResult)
+            .where(TradeEvaluationResult.trade_id == trade_id)
+            .order_by(TradeEvaluationResult.created_at.desc())
+        )
+        return list(result.scalars().all())
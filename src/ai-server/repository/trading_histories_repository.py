@@ -1,8 +1,33 @@
 import logging
-from typing import List, Optional
+import uuid
+from datetime import datetime
+from collections import defaultdict
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import Integer, Numeric, cast, column, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm.attributes import set_committed_value
 from database.database_connection import db
 from model.TradingHistories import TradingHistories
 
+# 한 번의 INSERT 문에 담을 최대 행 수 (바인딩 파라미터 한도 여유)
+BULK_INSERT_CHUNK_SIZE = 500
+
+# 스트리밍 조회 시 서버 측 커서에서 한 번에 가져올 행 수
+STREAM_BATCH_SIZE = 1000
+
+_INSERT_COLUMNS = (
+    "user_id",
+    "coin_id",
+    "exchange_code",
+    "trade_uuid",
+    "trade_type",
+    "price",
+    "quantity",
+    "total_price",
+    "fee",
+    "trade_time",
+)
+
 
 class TradingHistoriesRepository:
     def __init__(self):
@@ -51,44 +76,227 @@ class TradingHistoriesRepository:
         finally:
             session.close()
 
-    def find_by_user_and_exchange(
-        self, user_id: str, exchange_code: int
+    def bulk_insert_trading_histories(
+        self, trading_histories: List[TradingHistories], session=None
     ) -> List[TradingHistories]:
-        """사용자와 거래소별 거래내역 조회"""
+        """
+        거래내역 목록 일괄 저장 (INSERT ... ON CONFLICT DO NOTHING)
+
+        (user_id, exchange_code, trade_uuid)가 이미 있는 건은 건너뜁니다.
+        행마다 중복 조회하지 않고 청크 단위 INSERT 한 번으로 저장합니다.
+        session을 넘기면 그 작업 단위에 참여하고 commit은 세션을 연 쪽에서 합니다.
+
+        Returns:
+            새로 저장된 거래내역 목록 (id가 채워진 상태, 입력 순서 유지)
+        """
+        if not trading_histories:
+            return []
+
         try:
-            session = db.get_session()
-            histories = (
-                session.query(TradingHistories)
-                .filter(
+            with db.session_scope(session) as s:
+                inserted_ids = {}
+                for start in range(0, len(trading_histories), BULK_INSERT_CHUNK_SIZE):
+                    chunk = trading_histories[start : start + BULK_INSERT_CHUNK_SIZE]
+                    rows = []
+                    for history in chunk:
+                        row = {column: getattr(history, column) for column in _INSERT_COLUMNS}
+                        if isinstance(row["user_id"], str):
+                            row["user_id"] = uuid.UUID(row["user_id"])
+                        rows.append(row)
+
+                    stmt = (
+                        insert(TradingHistories)
+                        .values(rows)
+                        .on_conflict_do_nothing(constraint="uq_user_exchange_trade_uuid")
+                        .returning(TradingHistories.id, TradingHistories.trade_uuid)
+                    )
+                    for row_id, trade_uuid in s.execute(stmt):
+                        inserted_ids[str(trade_uuid)] = row_id
+
+            saved_histories = []
+            for history in trading_histories:
+                row_id = inserted_ids.get(str(history.trade_uuid))
+                if row_id is None:
+                    continue
+                history.id = row_id
+                saved_histories.append(history)
+
+            self.logger.info(
+                f"거래내역 일괄 저장 완료: {len(saved_histories)}개 (중복 제외 {len(trading_histories) - len(saved_histories)}개)"
+            )
+            return saved_histories
+
+        except Exception as e:
+            self.logger.error(f"거래내역 일괄 저장 중 에러 발생: {e}")
+            raise e
+
+    def exists_by_user_and_exchange(
+        self, user_id: str, exchange_code: int, session=None
+    ) -> bool:
+        """사용자와 거래소별 거래내역 존재 여부"""
+        try:
+            with db.session_scope(session) as s:
+                exists = (
+                    s.query(TradingHistories.id)
+                    .filter(
+                        TradingHistories.user_id == user_id,
+                        TradingHistories.exchange_code == exchange_code,
+                    )
+                    .first()
+                )
+            return exists is not None
+        except Exception as e:
+            self.logger.error(f"거래내역 존재 여부 조회 중 에러 발생: {e}")
+            raise e
+
+    def exists_trade_at_or_after(
+        self,
+        user_id: str,
+        exchange_code: int,
+        trade_time,
+        exclude_ids: Optional[List[int]] = None,
+        session=None,
+    ) -> bool:
+        """사용자와 거래소별로 trade_time 이후(같은 시각 포함) 거래내역 존재 여부 (exclude_ids 제외)"""
+        try:
+            with db.session_scope(session) as s:
+                query = s.query(TradingHistories.id).filter(
                     TradingHistories.user_id == user_id,
                     TradingHistories.exchange_code == exchange_code,
+                    TradingHistories.trade_time >= trade_time,
+                )
+                if exclude_ids:
+                    query = query.filter(TradingHistories.id.notin_(exclude_ids))
+                exists = query.first()
+            return exists is not None
+        except Exception as e:
+            self.logger.error(f"거래내역 존재 여부 조회 중 에러 발생: {e}")
+            raise e
+
+    def find_by_user_and_exchange(
+        self, user_id: str, exchange_code: int, session=None
+    ) -> List[TradingHistories]:
+        """사용자와 거래소별 거래내역 조회"""
+        try:
+            with db.session_scope(session) as s:
+                return (
+                    s.query(TradingHistories)
+                    .filter(
+                        TradingHistories.user_id == user_id,
+                        TradingHistories.exchange_code == exchange_code,
+                    )
+                    .order_by(TradingHistories.trade_time.desc())
+                    .all()
                 )
-                .order_by(TradingHistories.trade_time.desc())
-                .all()
-            )
-            return histories
         except Exception as e:
             self.logger.error(f"거래내역 조회 중 에러 발생: {e}")
             raise e
-        finally:
-            session.close()
 
     def find_by_user_id(self, user_id: str) -> List[TradingHistories]:
-        """사용자 ID로 모든 거래내역 조회"""
+        """사용자 ID로 모든 거래내역 조회 (읽기 전용, 복제본이 있으면 복제본에서 조회)"""
         try:
-            session = db.get_session()
-            histories = (
-                session.query(TradingHistories)
-                .filter(TradingHistories.user_id == user_id)
-                .order_by(TradingHistories.trade_time.desc())
-                .all()
-            )
-            return histories
+            with db.session_scope(read_only=True) as session:
+                return (
+                    session.query(TradingHistories)
+                    .filter(TradingHistories.user_id == user_id)
+                    .order_by(TradingHistories.trade_time.desc())
+                    .all()
+                )
         except Exception as e:
             self.logger.error(f"사용자 거래내역 조회 중 에러 발생: {e}")
             raise e
-        finally:
-            session.close()
+
+    def _user_filters(
+        self,
+        user_id: str,
+        coin_id: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> list:
+        conditions = [TradingHistories.user_id == user_id]
+        if coin_id is not None:
+            conditions.append(TradingHistories.coin_id == coin_id)
+        if exchange_code is not None:
+            conditions.append(TradingHistories.exchange_code == exchange_code)
+        if start_time is not None:
+            conditions.append(TradingHistories.trade_time >= start_time)
+        if end_time is not None:
+            conditions.append(TradingHistories.trade_time < end_time)
+        return conditions
+
+    def find_page_by_user(
+        self,
+        user_id: str,
+        limit: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        coin_id: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        session=None,
+    ) -> List[TradingHistories]:
+        """
+        사용자 거래내역 한 페이지 조회 (최신순, (trade_time, id) 키셋 페이지네이션)
+
+        OFFSET 없이 cursor(직전 페이지 마지막 행의 (trade_time, id)) 다음부터 조회하므로
+        몇 번째 페이지든 같은 인덱스 범위 스캔으로 끝납니다.
+
+        Args:
+            limit: 조회할 최대 행 수 (다음 페이지 여부는 호출부에서 limit + 1로 판단)
+            cursor: 직전 페이지 마지막 행의 (trade_time, id). 없으면 첫 페이지
+        """
+        try:
+            conditions = self._user_filters(
+                user_id, coin_id, exchange_code, start_time, end_time
+            )
+            if cursor is not None:
+                conditions.append(
+                    tuple_(TradingHistories.trade_time, TradingHistories.id) < tuple_(*cursor)
+                )
+
+            with db.session_scope(session, read_only=True) as s:
+                return (
+                    s.execute(
+                        select(TradingHistories)
+                        .where(*conditions)
+                        .order_by(TradingHistories.trade_time.desc(), TradingHistories.id.desc())
+                        .limit(limit)
+                    )
+                    .scalars()
+                    .all()
+                )
+        except Exception as e:
+            self.logger.error(f"거래내역 페이지 조회 중 에러 발생: {e}")
+            raise e
+
+    def iter_by_user(
+        self,
+        user_id: str,
+        coin_id: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[TradingHistories]:
+        """
+        사용자 거래내역 전체를 최신순으로 스트리밍 조회 (내보내기용)
+
+        서버 측 커서로 batch_size 행씩 가져오므로 전체 건수와 관계없이 메모리 사용량이 일정합니다.
+        제너레이터를 끝까지 소비하거나 close 할 때까지 읽기 전용 세션을 유지합니다.
+        """
+        conditions = self._user_filters(
+            user_id, coin_id, exchange_code, start_time, end_time
+        )
+        with db.session_scope(read_only=True) as s:
+            result = s.execute(
+                select(TradingHistories)
+                .where(*conditions)
+                .order_by(TradingHistories.trade_time.desc(), TradingHistories.id.desc())
+                .execution_options(yield_per=batch_size)
+            )
+            # identity map은 약한 참조라 소비한 행은 배치마다 해제됨
+            yield from result.scalars()
 
     def find_by_user_id_and_trade_time_between(
         self,
@@ -122,6 +330,34 @@ class TradingHistoriesRepository:
             .first()
         )
 
+    async def find_by_user_id_and_id_async(
+        self, session, user_id: str, trade_id: int
+    ) -> Optional[TradingHistories]:
+        """find_by_user_id_and_id의 AsyncSession 버전."""
+        result = await session.execute(
+            select(TradingHistories)
+            .where(
+                TradingHistories.user_id == user_id,
+                TradingHistories.id == trade_id,
+            )
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    async def find_all_by_user_id_and_ids_async(
+        self, session, user_id: str, trade_ids: List[int]
+    ) -> List[TradingHistories]:
+        """사용자 ID와 거래 내역 ID 목록으로 거래 일괄 조회 (AsyncSession). 없는 ID는 결과에서 빠짐."""
+        if not trade_ids:
+            return []
+        result = await session.execute(
+            select(TradingHistories).where(
+                TradingHistories.user_id == user_id,
+                TradingHistories.id.in_(trade_ids),
+            )
+        )
+        return list(result.scalars().all())
+
     def delete_by_user_and_exchange(self, user_id: str, exchange_code: int) -> bool:
         """사용자와 거래소별 거래내역 삭제"""
         try:
@@ -146,47 +382,106 @@ class TradingHistoriesRepository:
             session.close()
 
     def update_profit_loss(
-        self, trading_histories: List[TradingHistories]
+        self, trading_histories: List[TradingHistories], session=None
     ) -> List[TradingHistories]:
         """
         거래내역의 수익률 및 평균 구매 단가 업데이트
-        
+
         Args:
             trading_histories: 업데이트할 거래내역 목록
-        
+            session: 참여할 작업 단위 세션. 그 세션에서 조회한 거래내역이면 추가 조회 없이 반영
+
         Returns:
             업데이트된 거래내역 목록
         """
         try:
-            session = db.get_session()
+            with db.session_scope(session) as s:
+                updated_histories = []
 
-            updated_histories = []
-
-            for history in trading_histories:
-                # 기존 거래내역 확인
-                existing = (
-                    session.query(TradingHistories)
-                    .filter(TradingHistories.id == history.id)
-                    .first()
-                )
-
-                if existing:
-                    # 수익률 및 평균 구매 단가 업데이트
-                    existing.profit_loss_rate = history.profit_loss_rate
-                    existing.avg_buy_price = history.avg_buy_price
-                    updated_histories.append(existing)
+                for history in trading_histories:
+                    # 같은 세션의 객체는 그대로, 아니면 (id, user_id)로 조회 (identity map 우선)
+                    existing = (
+                        history
+                        if history in s
+                        else s.get(TradingHistories, (history.id, history.user_id))
+                    )
 
-            session.commit()
+                    if existing:
+                        # 수익률 및 평균 구매 단가 업데이트
+                        existing.profit_loss_rate = history.profit_loss_rate
+                        existing.avg_buy_price = history.avg_buy_price
+                        updated_histories.append(existing)
 
-            for history in updated_histories:
-                session.refresh(history)
+                s.flush()
 
             self.logger.info(f"거래내역 수익률 업데이트 완료: {len(updated_histories)}개")
             return updated_histories
 
         except Exception as e:
             self.logger.error(f"거래내역 수익률 업데이트 중 에러 발생: {e}")
-            session.rollback()
             raise e
-        finally:
-            session.close()
+
+    def bulk_update_profit_loss(
+        self, trading_histories: List[TradingHistories], session=None
+    ) -> int:
+        """
+        거래내역의 수익률 및 평균 구매 단가를 (id, user_id) 기준으로 일괄 업데이트
+
+        update_profit_loss와 달리 행마다 조회하지 않고, 사용자별로 청크마다
+        UPDATE ... FROM (VALUES ...) 한 문장으로 처리합니다. user_id를 상수 조건으로 넣어
+        user_id 해시 파티션 레이아웃에서도 계획 시점에 파티션 하나로 좁혀집니다.
+        같은 세션에서 조회해 값을 바꾼 객체는 flush 때 행마다 다시 UPDATE 하지 않도록 반영된 값으로 표시합니다.
+
+        Returns:
+            업데이트 요청한 거래내역 수
+        """
+        if not trading_histories:
+            return 0
+
+        by_user = defaultdict(list)
+        for history in trading_histories:
+            by_user[history.user_id].append(
+                (history.id, history.profit_loss_rate, history.avg_buy_price)
+            )
+
+        try:
+            with db.session_scope(session) as s, s.no_autoflush:
+                for user_id, rows in by_user.items():
+                    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                        new_values = values(
+                            column("id", Integer),
+                            column("profit_loss_rate", Numeric),
+                            column("avg_buy_price", Numeric),
+                            name="new_values",
+                        ).data(rows[start : start + BULK_INSERT_CHUNK_SIZE])
+                        s.execute(
+                            update(TradingHistories)
+                            .where(
+                                TradingHistories.user_id == user_id,
+                                TradingHistories.id == new_values.c.id,
+                            )
+                            # 한 칼럼이 모두 NULL이면 VALUES 칼럼이 text로 추론되므로 형 변환
+                            .values(
+                                profit_loss_rate=cast(
+                                    new_values.c.profit_loss_rate,
+                                    TradingHistories.profit_loss_rate.type,
+                                ),
+                                avg_buy_price=cast(
+                                    new_values.c.avg_buy_price,
+                                    TradingHistories.avg_buy_price.type,
+                                ),
+                            )
+                            .execution_options(synchronize_session=False)
+                        )
+
+                for history in trading_histories:
+                    if history in s:
+                        set_committed_value(history, "profit_loss_rate", history.profit_loss_rate)
+                        set_committed_value(history, "avg_buy_price", history.avg_buy_price)
+
+            self.logger.info(f"거래내역 수익률 일괄 업데이트 완료: {len(trading_histories)}개")
+            return len(trading_histories)
+
+        except Exception as e:
+            self.logger.error(f"거래내역 수익률 일괄 업데이트 중 에러 발생: {e}")
+            raise e
@@ -0,0 +1,159 @@
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.dialects.postgresql import insert
+
+from database.database_connection import db
+from database.invalidation import publish_invalidation
+from model.CacheVersion import CACHE_ASSETS, CACHE_TRADING_HISTORIES
+from model.ExchangeCredentials import ExchangeCredentials, ExchangeProvider
+from model.Users import Users
+from model.UserSyncStatus import UserSyncStatus
+from model.SyncJob import JOB_TYPE_TRADING_HISTORIES
+
+
+class UserSyncStatusRepository:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def find_due(self, threshold: datetime, limit: int) -> List[Dict[str, Any]]:
+        """
+        거래소가 연결된 활성 사용자 중 동기화 시각이 threshold 이전(또는 없음)인 대상 조회
+
+        가장 오래 동기화되지 않은 사용자부터 반환합니다.
+        직전 동기화가 실패한 사용자는 threshold가 지난 뒤에 다시 대상이 됩니다.
+        자산 동기화는 업비트만 지원하므로 assets_synced_at은 업비트 계정에서만 고려합니다.
+
+        Returns:
+            [{"user_id", "exchange_code", "trading_synced_at", "assets_synced_at"}]
+        """
+        try:
+            session = db.get_session()
+            is_upbit = ExchangeCredentials.exchange_provider == ExchangeProvider.UPBIT.value
+            # 업비트가 아니면 NULL → least()에서 무시되어 거래내역 동기화 시각만으로 정렬
+            oldest = func.least(
+                func.coalesce(UserSyncStatus.trading_synced_at, datetime.min),
+                case(
+                    (is_upbit, func.coalesce(UserSyncStatus.assets_synced_at, datetime.min))
+                ),
+            )
+            rows = (
+                session.query(
+                    Users.id,
+                    ExchangeCredentials.exchange_provider,
+                    UserSyncStatus.trading_synced_at,
+                    UserSyncStatus.assets_synced_at,
+                )
+                .join(ExchangeCredentials, ExchangeCredentials.user_id == Users.id)
+                .outerjoin(
+                    UserSyncStatus,
+                    and_(
+                        UserSyncStatus.user_id == Users.id,
+                        UserSyncStatus.exchange_code
+                        == ExchangeCredentials.exchange_provider,
+                    ),
+                )
+                .filter(
+                    Users.is_connect_exchange.is_(True),
+                    Users.is_active.isnot(False),
+                    or_(
+                        UserSyncStatus.trading_synced_at.is_(None),
+                        UserSyncStatus.trading_synced_at < threshold,
+                        and_(
+                            is_upbit,
+                            or_(
+                                UserSyncStatus.assets_synced_at.is_(None),
+                                UserSyncStatus.assets_synced_at < threshold,
+                            ),
+                        ),
+                    ),
+                    or_(
+                        UserSyncStatus.last_error.is_(None),
+                        UserSyncStatus.updated_at < threshold,
+                    ),
+                )
+                .order_by(oldest.asc())
+                .limit(limit)
+                .all()
+            )
+            return [
+                {
+                    "user_id": str(user_id),
+                    "exchange_code": exchange_code,
+                    "trading_synced_at": trading_synced_at,
+                    "assets_synced_at": assets_synced_at,
+                }
+                for user_id, exchange_code, trading_synced_at, assets_synced_at in rows
+            ]
+        except Exception as e:
+            self.logger.error(f"동기화 대상 사용자 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_by_user_and_exchange(
+        self, user_id: str, exchange_code: int
+    ) -> Optional[UserSyncStatus]:
+        """사용자·거래소별 동기화 상태 조회"""
+        try:
+            session = db.get_session()
+            user_uuid = uuid.UUID(user_id) if isinstance(user_id, str) else user_id
+            return (
+                session.query(UserSyncStatus)
+                .filter(
+                    UserSyncStatus.user_id == user_uuid,
+                    UserSyncStatus.exchange_code == exchange_code,
+                )
+                .first()
+            )
+        except Exception as e:
+            self.logger.error(f"동기화 상태 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def mark_synced(
+        self, user_id: str, exchange_code: int, job_type: str, synced_at: datetime
+    ) -> None:
+        """동기화 완료 시각 기록 (없으면 생성), 그 사용자의 거래내역/자산 캐시 무효화 알림"""
+        if job_type == JOB_TYPE_TRADING_HISTORIES:
+            column, cache_name = "trading_synced_at", CACHE_TRADING_HISTORIES
+        else:
+            column, cache_name = "assets_synced_at", CACHE_ASSETS
+        self._upsert(
+            user_id,
+            exchange_code,
+            invalidate=cache_name,
+            **{column: synced_at, "last_error": None},
+        )
+
+    def mark_error(self, user_id: str, exchange_code: int, error: str) -> None:
+        """마지막 동기화 에러 기록"""
+        self._upsert(user_id, exchange_code, last_error=error)
+
+    def _upsert(
+        self, user_id: str, exchange_code: int, invalidate: Optional[str] = None, **values
+    ) -> None:
+        try:
+            session = db.get_session()
+            user_uuid = uuid.UUID(user_id) if isinstance(user_id, str) else user_id
+            stmt = insert(UserSyncStatus).values(
+                user_id=user_uuid, exchange_code=exchange_code, **values
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UserSyncStatus.user_id, UserSyncStatus.exchange_code],
+                set_={**values, "updated_at": func.now()},
+            )
+            session.execute(stmt)
+            if invalidate:
+                publish_invalidation(invalidate, str(user_uuid), session=session)
+            session.commit()
+        except Exception as e:
+            self.logger.error(f"동기화 상태 저장 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
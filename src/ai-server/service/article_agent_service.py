@@ -14,8 +14,12 @@ _ai_agent_dir = _src_dir / "ai-agent"
 if _ai_agent_dir.exists() and str(_ai_agent_dir) not in sys.path:
     sys.path.insert(0, str(_ai_agent_dir))
 
+from laboratory.article_ai import arun as arun_article_agent
 from laboratory.article_ai import run as run_article_agent
-from laboratory.article_ai import ArticleExpertResponse
+from laboratory.article_ai import ArticleExpertResponse, MODEL_NAME, PROMPT_PATH, parser
+
+from service.expert_response_store import ExpertRequest, ExpertResponseStore, prompt_version
+from service.prompt_context import build_article_context, prompt_tokens, token_budget
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +27,17 @@ logger = logging.getLogger(__name__)
 class ArticleAgentService:
     """기사(헤드라인) 전문가 에이전트 서비스."""
 
-    def __init__(self, article_repository):
+    AGENT_NAME = "article"
+
+    def __init__(self, article_repository, expert_response_store=None):
         self._article_repository = article_repository
+        self._expert_response_store = expert_response_store
+
+    @property
+    def expert_response_store(self) -> ExpertResponseStore:
+        if self._expert_response_store is None:
+            self._expert_response_store = ExpertResponseStore()
+        return self._expert_response_store
 
     def run_article_expert(
         self,
@@ -36,39 +49,109 @@ class ArticleAgentService:
         """
         평가 일자에 대해 기사 헤드라인 기반 시장 분위기·이슈 의견을 반환합니다.
         DB에서 headline, published_at, original_url 조회 후 period_data에 URL 포함해 에이전트에 전달.
+        같은 입력(기간 데이터·프롬프트·모델)의 응답이 저장돼 있으면 LLM을 호출하지 않고 재사용합니다.
         """
-        target = datetime.strptime(target_date, "%Y-%m-%d")
-        end_dt = target.replace(hour=23, minute=59, second=59, microsecond=999999)
-        start_dt = (target - timedelta(days=days_before)).replace(
-            hour=0, minute=0, second=0, microsecond=0
+        return self.run_request(
+            self.build_request(target_date, days_before, max_headlines_per_day, publisher_type)
+        )
+
+    def run_request(self, request: ExpertRequest) -> ArticleExpertResponse:
+        """build_request로 만든 입력으로 에이전트 실행 (저장된 응답이 있으면 재사용)"""
+        return self.expert_response_store.get_or_run(
+            request,
+            lambda: run_article_agent(
+                target_date=request.target_date,
+                days_before=request.params["days_before"],
+                max_headlines_per_day=request.params["max_headlines_per_day"],
+                period_data=request.input_data,
+            ),
+            ArticleExpertResponse,
         )
 
-        session = None
-        try:
-            session = db.get_session()
+    async def arun_request(self, request: ExpertRequest) -> ArticleExpertResponse:
+        """run_request의 async 버전 (chain.ainvoke)"""
+        return await self.expert_response_store.aget_or_run(
+            request,
+            lambda: arun_article_agent(
+                target_date=request.target_date,
+                days_before=request.params["days_before"],
+                max_headlines_per_day=request.params["max_headlines_per_day"],
+                period_data=request.input_data,
+            ),
+            ArticleExpertResponse,
+        )
+
+    def build_request(
+        self,
+        target_date: str,
+        days_before: int = 7,
+        max_headlines_per_day: int = 30,
+        publisher_type: Optional[int] = None,
+    ) -> ExpertRequest:
+        """DB에서 기간 기사를 조회해 에이전트 입력(응답 저장 키 포함) 구성"""
+        start_dt, end_dt = self._datetime_range(target_date, days_before)
+        # 읽기 전용 조회는 복제본에서. LLM 응답을 기다리는 동안 커넥션을 잡고 있지 않도록 조회가 끝나면 세션 반납
+        with db.session_scope(read_only=True) as session:
             articles = self._article_repository.find_by_published_at_between(
                 session, start_dt, end_dt, publisher_type=publisher_type
             )
-            by_date = defaultdict(list)
-            for a in articles:
-                d = a.published_at.date() if a.published_at else None
-                if d is not None:
-                    by_date[d].append((a.headline or "", a.original_url or ""))
-
-            lines = []
-            for d in sorted(by_date.keys()):
-                day_str = d.strftime("%Y-%m-%d")
-                items = by_date[d][:max_headlines_per_day]
-                parts = [f"{h.strip()} [{u}]" for h, u in items if h or u]
-                lines.append(day_str + ": " + " | ".join(parts))
-            period_data = "\n".join(lines)
-
-            return run_article_agent(
-                target_date=target_date,
-                days_before=days_before,
-                max_headlines_per_day=max_headlines_per_day,
-                period_data=period_data,
+        return self._to_request(target_date, days_before, max_headlines_per_day, publisher_type, articles)
+
+    async def abuild_request(
+        self,
+        target_date: str,
+        days_before: int = 7,
+        max_headlines_per_day: int = 30,
+        publisher_type: Optional[int] = None,
+    ) -> ExpertRequest:
+        """build_request의 async 버전 (AsyncSession으로 조회)"""
+        start_dt, end_dt = self._datetime_range(target_date, days_before)
+        async with db.get_async_session() as session:
+            articles = await self._article_repository.find_by_published_at_between_async(
+                session, start_dt, end_dt, publisher_type=publisher_type
             )
-        finally:
-            if session:
-                session.close()
+        return self._to_request(target_date, days_before, max_headlines_per_day, publisher_type, articles)
+
+    @staticmethod
+    def _datetime_range(target_date: str, days_before: int):
+        target = datetime.strptime(target_date, "%Y-%m-%d")
+        end_dt = target.replace(hour=23, minute=59, second=59, microsecond=999999)
+        start_dt = (target - timedelta(days=days_before)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return start_dt, end_dt
+
+    def _to_request(
+        self,
+        target_date: str,
+        days_before: int,
+        max_headlines_per_day: int,
+        publisher_type: Optional[int],
+        articles,
+    ) -> ExpertRequest:
+        by_date = defaultdict(list)
+        for a in articles:
+            d = a.published_at.date() if a.published_at else None
+            if d is not None:
+                by_date[d].append((a.headline or "", a.original_url or ""))
+
+        context = build_article_context(
+            {d: items[:max_headlines_per_day] for d, items in by_date.items()},
+            token_budget(self.AGENT_NAME),
+            MODEL_NAME,
+        )
+
+        return ExpertRequest(
+            agent=self.AGENT_NAME,
+            prompt_version=prompt_version(PROMPT_PATH, parser),
+            model=MODEL_NAME,
+            target_date=target_date,
+            input_data=context.text,
+            params={
+                "days_before": days_before,
+                "max_headlines_per_day": max_headlines_per_day,
+                "publisher_type": publisher_type,
+            },
+            aliases=context.aliases,
+            context_tokens=context.tokens + prompt_tokens(PROMPT_PATH, parser, MODEL_NAME),
+        )
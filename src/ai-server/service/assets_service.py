@@ -1,14 +1,15 @@
 import logging
-from typing import List, Dict, Any, Set, Tuple
+from typing import Dict, Any, Set, Tuple
 from model.Assets import Assets
 from dto.exchange_credentials_dto import ExchangeProvider
+from database.database_connection import db
 
 
 class AssetsService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._assets_repository = None
-        self._coin_repository = None
+        self._coin_catalog = None
         self._upbit_service = None
         self._exchange_credentials_service = None
 
@@ -21,12 +22,12 @@ class AssetsService:
         return self._assets_repository
 
     @property
-    def coin_repository(self):
-        if self._coin_repository is None:
-            from dependencies import get_coin_repository
+    def coin_catalog(self):
+        if self._coin_catalog is None:
+            from dependencies import get_coin_catalog
 
-            self._coin_repository = get_coin_repository()
-        return self._coin_repository
+            self._coin_catalog = get_coin_catalog()
+        return self._coin_catalog
 
     @property
     def upbit_service(self):
@@ -45,21 +46,11 @@ class AssetsService:
         return self._exchange_credentials_service
 
     def _get_coin_id(self, symbol: str, trade_by_symbol: str) -> int | None:
-        """symbol과 trade_by_symbol로 coin_id 조회"""
+        """symbol과 trade_by_symbol로 coin_id 조회 (market_code BTC/KRW 우선, 없으면 symbol·quote_currency)"""
         try:
-            coins = self.coin_repository.get_all_coins()
-
-            # market_code 형식: BTC/KRW
-            market_code = f"{symbol}/{trade_by_symbol}"
-
-            for coin in coins:
-                if coin.market_code == market_code:
-                    return coin.id
-
-            # market_code로 찾지 못하면 symbol과 quote_currency로 찾기
-            for coin in coins:
-                if coin.symbol == symbol and coin.quote_currency == trade_by_symbol:
-                    return coin.id
+            coin_id = self.coin_catalog.find_coin_id(symbol, trade_by_symbol)
+            if coin_id is not None:
+                return coin_id
 
             self.logger.warning(
                 f"coin_id를 찾을 수 없습니다: symbol={symbol}, trade_by_symbol={trade_by_symbol}"
@@ -70,9 +61,7 @@ class AssetsService:
             self.logger.error(f"coin_id 조회 중 에러 발생: {e}")
             return None
 
-    def _convert_upbit_account_to_asset(
-        self, account: Dict[str, Any]
-    ) -> Assets:
+    def _convert_upbit_account_to_asset(self, account: Dict[str, Any]) -> Assets:
         """Upbit 계정 잔고 응답을 Assets 모델로 변환"""
         try:
             currency = account.get("currency", "")
@@ -101,8 +90,12 @@ class AssetsService:
             self.logger.error(f"Upbit 계정 잔고 변환 중 에러 발생: {e}")
             raise e
 
-    def sync_upbit_assets(self, user_id: str) -> Dict[str, Any]:
-        """Upbit 잔고를 가져와서 assets 테이블에 동기화"""
+    def sync_upbit_assets(self, user_id: str, session=None) -> Dict[str, Any]:
+        """
+        Upbit 잔고를 가져와서 assets 테이블에 동기화
+
+        잔고 API 호출이 끝난 뒤 코인 조회·저장·삭제를 한 트랜잭션(session)으로 처리합니다.
+        """
         try:
             # 1. 자격증명 조회
             credentials = self.exchange_credentials_service.get_credentials(
@@ -120,57 +113,58 @@ class AssetsService:
                 credentials.access_key, credentials.secret_key
             )
 
-            if not accounts:
-                self.logger.warning(f"Upbit 계정 잔고가 비어있습니다: user_id={user_id}")
-                # 잔고가 없으면 모든 자산 삭제
-                deleted_count = self.assets_repository.delete_assets_not_in_list(
-                    user_id, ExchangeProvider.UPBIT.value, set()
-                )
-                return {
-                    "saved_count": 0,
-                    "deleted_count": deleted_count,
-                    "assets": [],
-                }
+            with db.session_scope(session) as s:
+                if not accounts:
+                    self.logger.warning(f"Upbit 계정 잔고가 비어있습니다: user_id={user_id}")
+                    # 잔고가 없으면 모든 자산 삭제
+                    deleted_count = self.assets_repository.delete_assets_not_in_list(
+                        user_id, ExchangeProvider.UPBIT.value, set(), session=s
+                    )
+                    return {
+                        "saved_count": 0,
+                        "deleted_count": deleted_count,
+                        "assets": [],
+                    }
 
-            # 3. Upbit 응답을 Assets 모델로 변환
-            assets = []
-            symbol_trade_by_pairs: Set[Tuple[str, str]] = set()
+                # 3. Upbit 응답을 Assets 모델로 변환 (coin_id는 코인 목록 캐시에서 조회)
+                assets = []
+                symbol_trade_by_pairs: Set[Tuple[str, str]] = set()
 
-            for account in accounts:
-                # 잔고가 0이고 locked도 0인 경우는 제외하지 않음 (보유 이력 유지)
-                asset = self._convert_upbit_account_to_asset(account)
-                assets.append(asset)
-                symbol_trade_by_pairs.add((asset.symbol, asset.trade_by_symbol))
+                for account in accounts:
+                    # 잔고가 0이고 locked도 0인 경우는 제외하지 않음 (보유 이력 유지)
+                    asset = self._convert_upbit_account_to_asset(account)
+                    assets.append(asset)
+                    symbol_trade_by_pairs.add((asset.symbol, asset.trade_by_symbol))
 
-            # 4. 자산 저장/업데이트
-            saved_assets = self.assets_repository.save_or_update_assets(
-                user_id, ExchangeProvider.UPBIT.value, assets
-            )
+                # 4. 자산 저장/업데이트
+                saved_assets = self.assets_repository.save_or_update_assets(
+                    user_id, ExchangeProvider.UPBIT.value, assets, session=s
+                )
 
-            # 5. 잔고에 없는 자산 삭제
-            deleted_count = self.assets_repository.delete_assets_not_in_list(
-                user_id, ExchangeProvider.UPBIT.value, symbol_trade_by_pairs
-            )
+                # 5. 잔고에 없는 자산 삭제
+                deleted_count = self.assets_repository.delete_assets_not_in_list(
+                    user_id, ExchangeProvider.UPBIT.value, symbol_trade_by_pairs, session=s
+                )
 
-            self.logger.info(
-                f"Upbit 자산 동기화 완료: user_id={user_id}, saved={len(saved_assets)}, deleted={deleted_count}"
-            )
+                self.logger.info(
+                    f"Upbit 자산 동기화 완료: user_id={user_id}, saved={len(saved_assets)}, deleted={deleted_count}"
+                )
 
-            return {
-                "saved_count": len(saved_assets),
-                "deleted_count": deleted_count,
-                "assets": [
-                    {
-                        "id": asset.id,
-                        "symbol": asset.symbol,
-                        "trade_by_symbol": asset.trade_by_symbol,
-                        "quantity": float(asset.quantity),
-                        "locked_quantity": float(asset.locked_quantity),
-                        "avg_buy_price": float(asset.avg_buy_price),
-                    }
-                    for asset in saved_assets
-                ],
-            }
+                return {
+                    "saved_count": len(saved_assets),
+                    "deleted_count": deleted_count,
+                    "assets": [
+                        {
+                            "id": asset.id,
+                            "symbol": asset.symbol,
+                            "trade_by_symbol": asset.trade_by_symbol,
+                            "quantity": float(asset.quantity),
+                            "locked_quantity": float(asset.locked_quantity),
+                            "avg_buy_price": float(asset.avg_buy_price),
+                        }
+                        for asset in saved_assets
+                    ],
+                }
 
         except Exception as e:
             self.logger.error(f"Upbit 자산 동기화 중 에러 발생: {e}")
@@ -0,0 +1,160 @@
+"""
+코인 목록 프로세스 내 캐시.
+
+coins 테이블은 코인 목록 최신화(sync_coin_list.py) 때만 바뀌는데, 잔고·거래내역 동기화와
+수익률 계산은 계정/거래마다 코인 목록을 다시 조회하고 목록을 훑어 coin_id를 찾았습니다.
+CoinCatalog는 목록을 한 번 읽어 id, market_code, (symbol, quote_currency) 키의 dict로 들고 있다가
+다음 경우에만 다시 읽습니다.
+
+- 마지막 로드 후 COIN_CATALOG_TTL_SEC(기본 1시간)가 지남
+- cache_versions의 coins 버전이 바뀜 (save_coin_list가 새 종목을 저장하면 올림).
+  버전은 COIN_CATALOG_VERSION_CHECK_SEC(기본 10초)마다 한 번만 확인
+
+스냅샷은 통째로 교체하므로 조회 중에 다른 스레드가 다시 로드해도 반쯤 바뀐 상태를 보지 않습니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from model.CacheVersion import CACHE_COINS
+
+
+class _CoinIndex:
+    """한 시점의 코인 목록과 키별 색인 (만든 뒤 바꾸지 않음)"""
+
+    def __init__(self, coins, version: Optional[int]):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.by_id = MappingProxyType({coin.id: coin for coin in coins})
+        self.by_market_code = MappingProxyType({str(coin.market_code): coin for coin in coins})
+        self.by_symbol = MappingProxyType(
+            {(coin.symbol, coin.quote_currency): coin for coin in coins}
+        )
+        self.id_by_market_code = MappingProxyType(
+            {market_code: coin.id for market_code, coin in self.by_market_code.items()}
+        )
+
+
+class CoinCatalog:
+    def __init__(
+        self,
+        coin_repository=None,
+        cache_version_repository=None,
+        ttl_sec: Optional[float] = None,
+        version_check_sec: Optional[float] = None,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self._coin_repository = coin_repository
+        self._cache_version_repository = cache_version_repository
+        self.ttl_sec = (
+            ttl_sec if ttl_sec is not None else float(os.getenv("COIN_CATALOG_TTL_SEC", "3600"))
+        )
+        self.version_check_sec = (
+            version_check_sec
+            if version_check_sec is not None
+            else float(os.getenv("COIN_CATALOG_VERSION_CHECK_SEC", "10"))
+        )
+        self._index: Optional[_CoinIndex] = None
+        self._version_checked_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @property
+    def coin_repository(self):
+        if self._coin_repository is None:
+            from dependencies import get_coin_repository
+
+            self._coin_repository = get_coin_repository()
+        return self._coin_repository
+
+    @property
+    def cache_version_repository(self):
+        if self._cache_version_repository is None:
+            from repository.cache_version_repository import CacheVersionRepository
+
+            self._cache_version_repository = CacheVersionRepository()
+        return self._cache_version_repository
+
+    def _read_version(self) -> Optional[int]:
+        """버전 조회 (실패하면 None, 이때는 TTL로만 갱신)"""
+        try:
+            return self.cache_version_repository.get_version(CACHE_COINS)
+        except Exception as e:
+            self.logger.warning(f"코인 캐시 버전 확인 실패: {e}")
+            return None
+
+    def _load(self) -> _CoinIndex:
+        # 버전을 먼저 읽어야 그 사이에 바뀐 목록이 다음 확인 때 다시 로드됨
+        version = self._read_version()
+        coins = self.coin_repository.get_coin_refs()
+        index = _CoinIndex(coins, version)
+        self.loads += 1
+        self.logger.info(f"코인 목록 캐시 로드: {len(index.by_id)}개, version={version}")
+        return index
+
+    def _is_stale(self, index: _CoinIndex, now: float) -> bool:
+        if now - index.loaded_at >= self.ttl_sec:
+            return True
+        if now - self._version_checked_at < self.version_check_sec:
+            return False
+        self._version_checked_at = now
+        version = self._read_version()
+        return version is not None and version != index.version
+
+    def _snapshot(self) -> _CoinIndex:
+        index = self._index
+        now = time.monotonic()
+        if index is not None and (
+            now - index.loaded_at < self.ttl_sec
+            and now - self._version_checked_at < self.version_check_sec
+        ):
+            return index
+
+        with self._lock:
+            index = self._index
+            if index is None or self._is_stale(index, now):
+                try:
+                    index = self._load()
+                except Exception as e:
+                    if index is None:
+                        raise
+                    # 다시 읽지 못하면 이전 목록을 계속 사용하고 다음 확인 때 재시도
+                    self.logger.error(f"코인 목록 캐시 갱신 실패, 이전 목록 사용: {e}")
+                    return index
+                self._index = index
+                self._version_checked_at = now
+            return index
+
+    def invalidate(self) -> None:
+        """다음 조회 때 다시 로드"""
+        with self._lock:
+            self._index = None
+
+    def get_by_id(self, coin_id: int) -> Optional[Any]:
+        return self._snapshot().by_id.get(coin_id)
+
+    def get_by_market_code(self, market_code: str) -> Optional[Any]:
+        return self._snapshot().by_market_code.get(market_code)
+
+    def get_by_symbol(self, symbol: str, quote_currency: str) -> Optional[Any]:
+        return self._snapshot().by_symbol.get((symbol, quote_currency))
+
+    def find_coin_id(self, symbol: str, quote_currency: str) -> Optional[int]:
+        """market_code(SYMBOL/QUOTE)로 찾고, 없으면 (symbol, quote_currency)로 찾은 coin_id"""
+        index = self._snapshot()
+        coin = index.by_market_code.get(f"{symbol}/{quote_currency}") or index.by_symbol.get(
+            (symbol, quote_currency)
+        )
+        return coin.id if coin is not None else None
+
+    def symbol_of(self, coin_id: int, default: str = "UNKNOWN") -> str:
+        coin = self.get_by_id(coin_id)
+        return coin.symbol if coin is not None else default
+
+    def market_code_map(self) -> Mapping[str, int]:
+        """market_code -> coin_id (읽기 전용)"""
+        return self._snapshot().id_by_market_code
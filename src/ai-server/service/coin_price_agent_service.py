@@ -3,7 +3,6 @@
 import logging
 import sys
 from datetime import datetime, timedelta
-from decimal import Decimal
 from pathlib import Path
 
 from database.database_connection import db
@@ -13,8 +12,12 @@ _ai_agent_dir = _src_dir / "ai-agent"
 if _ai_agent_dir.exists() and str(_ai_agent_dir) not in sys.path:
     sys.path.insert(0, str(_ai_agent_dir))
 
+from laboratory.coin_price_ai import arun as arun_coin_price_agent
 from laboratory.coin_price_ai import run as run_coin_price_agent
-from laboratory.coin_price_ai import CoinPriceExpertResponse
+from laboratory.coin_price_ai import CoinPriceExpertResponse, MODEL_NAME, PROMPT_PATH, parser
+
+from service.expert_response_store import ExpertRequest, ExpertResponseStore, prompt_version
+from service.prompt_context import Candle, build_coin_price_context, prompt_tokens, token_budget
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +27,23 @@ DEFAULT_MARKET_CODE = "KRW-BTC"
 class CoinPriceAgentService:
     """코인 가격 전문가 에이전트 서비스."""
 
-    def __init__(self, coin_price_day_repository, default_market_code: str = DEFAULT_MARKET_CODE):
+    AGENT_NAME = "coin_price"
+
+    def __init__(
+        self,
+        coin_price_day_repository,
+        default_market_code: str = DEFAULT_MARKET_CODE,
+        expert_response_store=None,
+    ):
         self._coin_price_day_repository = coin_price_day_repository
         self._default_market_code = default_market_code
+        self._expert_response_store = expert_response_store
+
+    @property
+    def expert_response_store(self) -> ExpertResponseStore:
+        if self._expert_response_store is None:
+            self._expert_response_store = ExpertResponseStore()
+        return self._expert_response_store
 
     def run_coin_price(
         self,
@@ -38,18 +55,45 @@ class CoinPriceAgentService:
         """
         평가 일자에 대해 코인 가격 전문가 의견을 반환합니다. DB에서 기간 데이터 조회 후 에이전트에 전달.
         coin_id가 있으면 coin_id로 조회, 없으면 market_code(기본 KRW-BTC)로 조회.
+        같은 입력(기간 데이터·프롬프트·모델)의 응답이 저장돼 있으면 LLM을 호출하지 않고 재사용합니다.
         """
-        target = datetime.strptime(target_date, "%Y-%m-%d")
-        start_dt = (target - timedelta(days=months_before * 30)).replace(
-            hour=0, minute=0, second=0, microsecond=0
+        return self.run_request(self.build_request(target_date, months_before, coin_id, market_code))
+
+    def run_request(self, request: ExpertRequest) -> CoinPriceExpertResponse:
+        """build_request로 만든 입력으로 에이전트 실행 (저장된 응답이 있으면 재사용)"""
+        return self.expert_response_store.get_or_run(
+            request,
+            lambda: run_coin_price_agent(
+                target_date=request.target_date,
+                months_before=request.params["months_before"],
+                period_data=request.input_data,
+            ),
+            CoinPriceExpertResponse,
         )
-        end_dt = (target + timedelta(days=1)).replace(
-            hour=0, minute=0, second=0, microsecond=0
+
+    async def arun_request(self, request: ExpertRequest) -> CoinPriceExpertResponse:
+        """run_request의 async 버전 (chain.ainvoke)"""
+        return await self.expert_response_store.aget_or_run(
+            request,
+            lambda: arun_coin_price_agent(
+                target_date=request.target_date,
+                months_before=request.params["months_before"],
+                period_data=request.input_data,
+            ),
+            CoinPriceExpertResponse,
         )
 
-        session = None
-        try:
-            session = db.get_session()
+    def build_request(
+        self,
+        target_date: str,
+        months_before: int = 6,
+        coin_id: int | None = None,
+        market_code: str | None = None,
+    ) -> ExpertRequest:
+        """DB에서 기간 캔들을 조회해 에이전트 입력(응답 저장 키 포함) 구성"""
+        start_dt, end_dt = self._datetime_range(target_date, months_before)
+        # 읽기 전용 조회는 복제본에서. LLM 응답을 기다리는 동안 커넥션을 잡고 있지 않도록 조회가 끝나면 세션 반납
+        with db.session_scope(read_only=True) as session:
             if coin_id is not None:
                 rows = self._coin_price_day_repository.find_by_coin_id_and_date_range(
                     session, coin_id, start_dt, end_dt
@@ -59,25 +103,75 @@ class CoinPriceAgentService:
                 rows = self._coin_price_day_repository.find_by_market_code_and_date_range(
                     session, market_code, start_dt, end_dt
                 )
-            lines = []
-            for row in rows:
-                d = row.candle_date_time_utc
-                if hasattr(d, "date"):
-                    d = d.date()
-                day_str = d.strftime("%Y-%m-%d") if hasattr(d, "strftime") else str(d)
-                o = float(row.opening_price) if isinstance(row.opening_price, Decimal) else row.opening_price
-                h = float(row.high_price) if isinstance(row.high_price, Decimal) else row.high_price
-                l = float(row.low_price) if isinstance(row.low_price, Decimal) else row.low_price
-                c = float(row.trade_price) if isinstance(row.trade_price, Decimal) else row.trade_price
-                rate = float(row.change_rate) if isinstance(row.change_rate, Decimal) else row.change_rate
-                pct_str = f"{rate:+.2%}" if rate is not None else "N/A"
-                lines.append(f"{day_str}: {o:.0f} | {h:.0f} | {l:.0f} | {c:.0f}, {pct_str}")
-            period_data = "\n".join(lines)
-            return run_coin_price_agent(
-                target_date=target_date,
-                months_before=months_before,
-                period_data=period_data,
+        return self._to_request(target_date, months_before, coin_id, market_code, rows)
+
+    async def abuild_request(
+        self,
+        target_date: str,
+        months_before: int = 6,
+        coin_id: int | None = None,
+        market_code: str | None = None,
+    ) -> ExpertRequest:
+        """build_request의 async 버전 (AsyncSession으로 조회)"""
+        start_dt, end_dt = self._datetime_range(target_date, months_before)
+        async with db.get_async_session() as session:
+            if coin_id is not None:
+                rows = await self._coin_price_day_repository.find_by_coin_id_and_date_range_async(
+                    session, coin_id, start_dt, end_dt
+                )
+            else:
+                market_code = market_code or self._default_market_code
+                rows = await self._coin_price_day_repository.find_by_market_code_and_date_range_async(
+                    session, market_code, start_dt, end_dt
+                )
+        return self._to_request(target_date, months_before, coin_id, market_code, rows)
+
+    @staticmethod
+    def _datetime_range(target_date: str, months_before: int):
+        target = datetime.strptime(target_date, "%Y-%m-%d")
+        start_dt = (target - timedelta(days=months_before * 30)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        end_dt = (target + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return start_dt, end_dt
+
+    def _to_request(
+        self,
+        target_date: str,
+        months_before: int,
+        coin_id: int | None,
+        market_code: str | None,
+        rows,
+    ) -> ExpertRequest:
+        candles = []
+        for row in rows:
+            d = row.candle_date_time_utc
+            if hasattr(d, "date"):
+                d = d.date()
+            # 가격은 저장소에서 float로 조회됨
+            candles.append(
+                Candle(
+                    day=d,
+                    open=row.opening_price,
+                    high=row.high_price,
+                    low=row.low_price,
+                    close=row.trade_price,
+                    change_rate=row.change_rate,
+                )
             )
-        finally:
-            if session:
-                session.close()
+        context = build_coin_price_context(candles, token_budget(self.AGENT_NAME), MODEL_NAME)
+        return ExpertRequest(
+            agent=self.AGENT_NAME,
+            prompt_version=prompt_version(PROMPT_PATH, parser),
+            model=MODEL_NAME,
+            target_date=target_date,
+            input_data=context.text,
+            params={
+                "months_before": months_before,
+                "market_code": None if coin_id is not None else market_code,
+            },
+            coin_id=coin_id,
+            context_tokens=context.tokens + prompt_tokens(PROMPT_PATH, parser, MODEL_NAME),
+        )
@@ -0,0 +1,232 @@
+"""
+전문가 에이전트 응답 재사용.
+
+기사·공포탐욕 전문가는 target_date와 파라미터, 코인 가격 전문가는 여기에 coin_id만 더해 결정되고
+사용자와는 무관합니다. 같은 날짜의 매매를 여러 사용자가 평가해도 전문가 LLM 호출은 입력이 같으면 한 번이면 됩니다.
+
+키는 (agent, 프롬프트 버전, 모델, target_date, params, coin_id, 입력 데이터 해시)의 sha256입니다.
+
+- 입력 데이터는 에이전트에 넘기는 기간 데이터 문자열 그대로이므로, DB 행(캔들·지수·기사)이 바뀌면
+  키가 달라져 자동으로 다시 계산
+- 프롬프트 버전은 프롬프트 파일 내용과 출력 형식 지시문(응답 스키마)의 해시라 프롬프트를 고치면 새 키
+- 조회 순서: 2단 캐시(L1/Redis) → expert_responses 테이블 → LLM 호출 후 둘 다 저장.
+  같은 키 동시 요청은 캐시의 stampede 방지로 LLM을 한 번만 호출
+- aget_or_run은 async 버전. 조회·저장(DB·Redis)만 스레드 풀에서 하고 LLM 응답은 await로 기다림.
+  같은 워커 안의 동시 요청은 태스크 하나를 공유 (워커 간 잠금은 동기 경로만 사용)
+- 입력이 토큰 예산을 넘으면 service.prompt_context로 줄여서 넘기고, LLM을 호출할 때마다 입출력 토큰 수를 기록
+- 오래된 키는 EXPERT_RESPONSE_RETENTION_DAYS(기본 30일)가 지나면 prune()으로 삭제
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from service.prompt_context import count_tokens, restore_aliases
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R", bound=BaseModel)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _prompt_version(prompt_path: str, mtime_ns: int, format_instructions: str) -> str:
+    content = Path(prompt_path).read_text(encoding="utf-8")
+    return _sha256(content + "\n" + format_instructions)[:16]
+
+
+def prompt_version(prompt_path: Path, parser) -> str:
+    """프롬프트 파일 내용 + 출력 형식 지시문 해시 (파일이 바뀌면 다시 계산)"""
+    return _prompt_version(
+        str(prompt_path), Path(prompt_path).stat().st_mtime_ns, parser.get_format_instructions()
+    )
+
+
+@dataclass
+class ExpertRequest:
+    """전문가 에이전트 호출 1건의 입력 (키 계산용)"""
+
+    agent: str
+    prompt_version: str
+    model: str
+    target_date: str
+    input_data: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    coin_id: Optional[int] = None
+    # 입력에서 id로 줄인 값 → 원래 값 (LLM 응답에서 되돌린 뒤 저장)
+    aliases: Dict[str, str] = field(default_factory=dict)
+    # 프롬프트 전체 토큰 수 (로그용, 키에는 포함하지 않음)
+    context_tokens: Optional[int] = None
+
+    @property
+    def input_hash(self) -> str:
+        if not self.aliases:
+            return _sha256(self.input_data)
+        return _sha256(
+            self.input_data + "\n" + json.dumps(self.aliases, sort_keys=True, ensure_ascii=False)
+        )
+
+    @property
+    def key(self) -> str:
+        return _sha256(
+            json.dumps(
+                [
+                    self.agent,
+                    self.prompt_version,
+                    self.model,
+                    self.target_date,
+                    self.params,
+                    self.coin_id,
+                    self.input_hash,
+                ],
+                sort_keys=True,
+                ensure_ascii=False,
+                default=str,
+            )
+        )
+
+
+class ExpertResponseStore:
+    def __init__(self, repository=None, cache=None):
+        self.logger = logging.getLogger(__name__)
+        self._repository = repository
+        self._cache = cache
+        self.retention_days = int(os.getenv("EXPERT_RESPONSE_RETENTION_DAYS", "30"))
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def repository(self):
+        if self._repository is None:
+            from repository.expert_response_repository import ExpertResponseRepository
+
+            self._repository = ExpertResponseRepository()
+        return self._repository
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from utils.cache import get_cache
+
+            self._cache = get_cache(
+                "expert_responses",
+                ttl_sec=float(os.getenv("EXPERT_RESPONSE_CACHE_TTL_SEC", "86400")),
+            )
+        return self._cache
+
+    def get_or_run(
+        self,
+        request: ExpertRequest,
+        run: Callable[[], R],
+        response_model: Type[R],
+    ) -> R:
+        """
+        request와 같은 입력의 응답이 있으면 반환, 없으면 run()(LLM 호출) 결과를 저장 후 반환
+
+        응답 저장(DB)이 실패해도 run() 결과는 그대로 반환합니다.
+        """
+        key = request.key
+
+        def load() -> Dict[str, Any]:
+            stored = self.repository.find_response(key)
+            if stored is not None:
+                self.logger.info(f"저장된 전문가 응답 사용: agent={request.agent}, target_date={request.target_date}")
+                return stored
+
+            response = self._completed(request, run().model_dump(mode="json"))
+            self._save(request, response)
+            return response
+
+        return response_model.model_validate(self.cache.get_or_load(key, load))
+
+    async def aget_or_run(
+        self,
+        request: ExpertRequest,
+        arun: Callable[[], Awaitable[R]],
+        response_model: Type[R],
+    ) -> R:
+        """get_or_run의 async 버전 (arun은 chain.ainvoke를 호출하는 코루틴 함수)"""
+        from utils.concurrency import run_blocking
+
+        key = request.key
+        loop = asyncio.get_running_loop()
+
+        async def load() -> Dict[str, Any]:
+            stored = await run_blocking(self._lookup, key)
+            if stored is not None:
+                return stored
+            response = self._completed(request, (await arun()).model_dump(mode="json"))
+            # 캐시 쓰기도 Redis 네트워크 I/O가 있으므로 DB 저장과 같이 이벤트 루프 밖에서
+            await run_blocking(self._save_and_cache, request, response)
+            return response
+
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(load())
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None
+            )
+        # 기다리던 요청 하나가 취소돼도 같은 키를 기다리는 다른 요청의 계산은 계속
+        return response_model.model_validate(await asyncio.shield(task))
+
+    def _completed(self, request: ExpertRequest, response: Dict[str, Any]) -> Dict[str, Any]:
+        """LLM 응답의 id를 원래 값으로 되돌리고 입출력 토큰 수 기록"""
+        response = restore_aliases(response, request.aliases)
+        self.logger.info(
+            f"전문가 LLM 호출: agent={request.agent}, target_date={request.target_date}, "
+            f"tokens_in={request.context_tokens}, "
+            f"tokens_out={count_tokens(json.dumps(response, ensure_ascii=False), request.model)}"
+        )
+        return response
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 → DB 순서로 저장된 응답 조회 (DB에서 찾으면 캐시에도 저장)"""
+        stored = self.cache.get(key)
+        if stored is not None:
+            return stored
+        stored = self.repository.find_response(key)
+        if stored is not None:
+            self.cache.set(key, stored)
+        return stored
+
+    def _save(self, request: ExpertRequest, response: Dict[str, Any]) -> None:
+        """응답 DB 저장. 실패해도 응답은 그대로 쓸 수 있으므로 기록만 함"""
+        try:
+            self.repository.save(
+                cache_key=request.key,
+                agent=request.agent,
+                prompt_version=request.prompt_version,
+                model=request.model,
+                target_date=date.fromisoformat(request.target_date),
+                coin_id=request.coin_id,
+                params=request.params,
+                input_hash=request.input_hash,
+                response=response,
+            )
+        except Exception as e:
+            self.logger.warning(f"전문가 응답 저장 실패 (응답은 그대로 반환): agent={request.agent}, error={e}")
+
+    def _save_and_cache(self, request: ExpertRequest, response: Dict[str, Any]) -> None:
+        """응답 DB 저장 후 캐시에도 저장"""
+        self._save(request, response)
+        self.cache.set(request.key, response)
+
+    def prune(self) -> int:
+        """보관 기간이 지난 응답 삭제"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        deleted = self.repository.delete_created_before(cutoff)
+        if deleted:
+            self.logger.info(f"오래된 전문가 응답 {deleted}건 삭제 (기준 {cutoff:%Y-%m-%d})")
+        return deleted
@@ -13,8 +13,12 @@ _ai_agent_dir = _src_dir / "ai-agent"
 if _ai_agent_dir.exists() and str(_ai_agent_dir) not in sys.path:
     sys.path.insert(0, str(_ai_agent_dir))
 
+from laboratory.fear_greed_ai import arun as arun_fear_greed_agent
 from laboratory.fear_greed_ai import run as run_fear_greed_agent
-from laboratory.fear_greed_ai import FearGreedExpertResponse
+from laboratory.fear_greed_ai import FearGreedExpertResponse, MODEL_NAME, PROMPT_PATH, parser
+
+from service.expert_response_store import ExpertRequest, ExpertResponseStore, prompt_version
+from service.prompt_context import build_fear_greed_context, prompt_tokens, token_budget
 
 logger = logging.getLogger(__name__)
 
@@ -22,33 +26,83 @@ logger = logging.getLogger(__name__)
 class FearGreedAgentService:
     """공포/탐욕 지수 전문가 에이전트 서비스."""
 
-    def __init__(self, fear_greed_index_repository):
+    AGENT_NAME = "fear_greed"
+
+    def __init__(self, fear_greed_index_repository, expert_response_store=None):
         self._fear_greed_index_repository = fear_greed_index_repository
+        self._expert_response_store = expert_response_store
+
+    @property
+    def expert_response_store(self) -> ExpertResponseStore:
+        if self._expert_response_store is None:
+            self._expert_response_store = ExpertResponseStore()
+        return self._expert_response_store
 
     def run_fear_greed(
         self, target_date: str, months_before: int = 6
     ) -> FearGreedExpertResponse:
         """
         평가 일자에 대해 공포/탐욕 전문가 의견을 반환합니다. DB에서 기간 데이터 조회 후 에이전트에 전달.
+        같은 입력(기간 데이터·프롬프트·모델)의 응답이 저장돼 있으면 LLM을 호출하지 않고 재사용합니다.
         """
-        target = date.fromisoformat(target_date)
-        start_date = target - timedelta(days=months_before * 30)
-        end_date = target
+        return self.run_request(self.build_request(target_date, months_before))
+
+    def run_request(self, request: ExpertRequest) -> FearGreedExpertResponse:
+        """build_request로 만든 입력으로 에이전트 실행 (저장된 응답이 있으면 재사용)"""
+        return self.expert_response_store.get_or_run(
+            request,
+            lambda: run_fear_greed_agent(
+                target_date=request.target_date,
+                months_before=request.params["months_before"],
+                period_data=request.input_data,
+            ),
+            FearGreedExpertResponse,
+        )
+
+    async def arun_request(self, request: ExpertRequest) -> FearGreedExpertResponse:
+        """run_request의 async 버전 (chain.ainvoke)"""
+        return await self.expert_response_store.aget_or_run(
+            request,
+            lambda: arun_fear_greed_agent(
+                target_date=request.target_date,
+                months_before=request.params["months_before"],
+                period_data=request.input_data,
+            ),
+            FearGreedExpertResponse,
+        )
 
-        session = None
-        try:
-            session = db.get_session()
+    def build_request(self, target_date: str, months_before: int = 6) -> ExpertRequest:
+        """DB에서 기간 데이터를 조회해 에이전트 입력(응답 저장 키 포함) 구성"""
+        start_date, end_date = self._date_range(target_date, months_before)
+        # 읽기 전용 조회는 복제본에서. LLM 응답을 기다리는 동안 커넥션을 잡고 있지 않도록 조회가 끝나면 세션 반납
+        with db.session_scope(read_only=True) as session:
             rows = self._fear_greed_index_repository.find_by_date_range(
                 session, start_date, end_date
             )
-            period_data = "\n".join(
-                f"{d.isoformat()}: {v}" for d, v in rows
-            )
-            return run_fear_greed_agent(
-                target_date=target_date,
-                months_before=months_before,
-                period_data=period_data,
+        return self._to_request(target_date, months_before, rows)
+
+    async def abuild_request(self, target_date: str, months_before: int = 6) -> ExpertRequest:
+        """build_request의 async 버전 (AsyncSession으로 조회)"""
+        start_date, end_date = self._date_range(target_date, months_before)
+        async with db.get_async_session() as session:
+            rows = await self._fear_greed_index_repository.find_by_date_range_async(
+                session, start_date, end_date
             )
-        finally:
-            if session:
-                session.close()
+        return self._to_request(target_date, months_before, rows)
+
+    @staticmethod
+    def _date_range(target_date: str, months_before: int):
+        target = date.fromisoformat(target_date)
+        return target - timedelta(days=months_before * 30), target
+
+    def _to_request(self, target_date: str, months_before: int, rows) -> ExpertRequest:
+        context = build_fear_greed_context(list(rows), token_budget(self.AGENT_NAME), MODEL_NAME)
+        return ExpertRequest(
+            agent=self.AGENT_NAME,
+            prompt_version=prompt_version(PROMPT_PATH, parser),
+            model=MODEL_NAME,
+            target_date=target_date,
+            input_data=context.text,
+            params={"months_before": months_before},
+            context_tokens=context.tokens + prompt_tokens(PROMPT_PATH, parser, MODEL_NAME),
+        )
@@ -0,0 +1,285 @@
+"""
+전문가 에이전트 입력(기간 데이터) 토큰 예산.
+
+전문가에게 넘기는 기간 데이터를 tiktoken으로 세고, 에이전트별 예산을 넘으면 정보를 덜 잃는 순서로 줄입니다.
+예산 안이면 기존 형식 그대로라 저장된 전문가 응답 키도 바뀌지 않습니다.
+
+- 코인 가격: 최근 N일은 일봉 그대로, 그 이전은 주간 OHLC 한 줄로 합침 (N을 줄여가며 예산에 맞춤)
+- 공포/탐욕: 같은 값이 이어지는 날은 한 줄로(run-length). 그래도 넘으면 최근 N일 외에는 구간(공포·탐욕 단계)별로 합침
+- 기사: URL을 [a1] 같은 id로 바꿈(응답의 original_url은 restore_aliases로 원래 URL로 되돌림).
+  그래도 넘으면 날짜별 헤드라인 수를 줄임
+- 예산(기간 데이터 토큰): EXPERT_TOKEN_BUDGET_COIN_PRICE(기본 2500), EXPERT_TOKEN_BUDGET_FEAR_GREED(기본 1000),
+  EXPERT_TOKEN_BUDGET_ARTICLE(기본 6000)
+- 인코딩 파일을 받을 수 없는 환경(외부망 차단, TIKTOKEN_CACHE_DIR 없음)에서는 UTF-8 바이트 수 / 4로 추정
+"""
+
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BUDGETS = {"coin_price": 2500, "fear_greed": 1000, "article": 6000}
+
+# 일봉으로 남길 최근 일수 (앞에서부터 시도)
+_RECENT_CANDLE_DAYS = (60, 30, 14, 7)
+# 정확한 지수로 남길 최근 일수
+_RECENT_INDEX_DAYS = (30, 14, 7)
+
+# 공포/탐욕 지수 단계 (상한 포함)
+_FEAR_GREED_BANDS = ((24, "극단적 공포"), (44, "공포"), (55, "중립"), (75, "탐욕"), (100, "극단적 탐욕"))
+
+ARTICLE_ID_NOTE = "(기사 URL은 [a1] 형식의 id로 표시합니다. original_url에는 해당 id를 그대로 출력하세요)"
+
+
+def token_budget(agent: str) -> int:
+    """에이전트별 기간 데이터 토큰 예산"""
+    return int(os.getenv(f"EXPERT_TOKEN_BUDGET_{agent.upper()}", str(_DEFAULT_BUDGETS[agent])))
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩을 불러오지 못해 토큰 수를 추정합니다: model={model}, error={e}")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """model 기준 토큰 수"""
+    encoding = _encoding(model)
+    if encoding is None:
+        return (len(text.encode("utf-8")) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=32)
+def _prompt_tokens(prompt_path: str, mtime_ns: int, format_instructions: str, model: str) -> int:
+    content = Path(prompt_path).read_text(encoding="utf-8")
+    return count_tokens(content + "\n" + format_instructions, model)
+
+
+def prompt_tokens(prompt_path: Path, parser, model: str) -> int:
+    """프롬프트 파일 + 출력 형식 지시문 토큰 수 (기간 데이터 제외)"""
+    return _prompt_tokens(
+        str(prompt_path), Path(prompt_path).stat().st_mtime_ns, parser.get_format_instructions(), model
+    )
+
+
+@dataclass
+class PromptContext:
+    """예산에 맞춘 기간 데이터"""
+
+    text: str
+    tokens: int
+    # 적용한 압축 (daily, weekly+daily30, run_length, banded+daily14, url_ids+headlines10 등)
+    strategy: str
+    # 입력에서 줄인 값 → 원래 값 (응답에서 되돌림)
+    aliases: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Candle:
+    day: date
+    open: float
+    high: float
+    low: float
+    close: float
+    change_rate: Optional[float]
+
+
+def _pct(rate: Optional[float]) -> str:
+    return f"{rate:+.2%}" if rate is not None else "N/A"
+
+
+def _daily_line(c: Candle) -> str:
+    return f"{c.day.isoformat()}: {c.open:.0f} | {c.high:.0f} | {c.low:.0f} | {c.close:.0f}, {_pct(c.change_rate)}"
+
+
+def _weekly_lines(candles: Sequence[Candle]) -> List[str]:
+    """주(월~일) 단위 OHLC. 등락률은 직전 주 종가(첫 주는 시가) 대비"""
+    weeks: Dict[Tuple[int, int], List[Candle]] = defaultdict(list)
+    for c in candles:
+        weeks[tuple(c.day.isocalendar())[:2]].append(c)
+
+    lines = []
+    prev_close = None
+    for week in sorted(weeks):
+        days = weeks[week]
+        base = prev_close if prev_close else days[0].open
+        rate = days[-1].close / base - 1 if base else None
+        lines.append(
+            f"{days[0].day.isoformat()}~{days[-1].day.isoformat()}: {days[0].open:.0f} | "
+            f"{max(c.high for c in days):.0f} | {min(c.low for c in days):.0f} | {days[-1].close:.0f}, {_pct(rate)}"
+        )
+        prev_close = days[-1].close
+    return lines
+
+
+def _fit(
+    agent: str,
+    candidates: List[Tuple[str, List[str]]],
+    budget: int,
+    model: str,
+    drop_oldest: Callable[[List[str]], List[str]] = lambda lines: lines[1:],
+) -> PromptContext:
+    """
+    candidates(전략 이름, 줄 목록)를 순서대로 세어 처음으로 예산 안에 드는 것을 반환.
+    모두 넘으면 마지막 후보에서 오래된 줄부터 버림.
+    """
+    original_tokens = None
+    strategy, lines, tokens = "", [], 0
+    for strategy, lines in candidates:
+        tokens = count_tokens("\n".join(lines), model)
+        if original_tokens is None:
+            original_tokens = tokens
+        if tokens <= budget:
+            break
+    else:
+        while tokens > budget and len(lines) > 1:
+            lines = drop_oldest(lines)
+            tokens = count_tokens("\n".join(lines), model)
+        strategy += "+truncated"
+
+    if tokens != original_tokens:
+        logger.info(
+            f"전문가 입력 압축: agent={agent}, {original_tokens} → {tokens} 토큰 "
+            f"(예산 {budget}, {strategy})"
+        )
+    return PromptContext(text="\n".join(lines), tokens=tokens, strategy=strategy)
+
+
+def build_coin_price_context(candles: Sequence[Candle], budget: int, model: str) -> PromptContext:
+    """일봉 목록 → 기간 데이터 (예산을 넘으면 오래된 구간을 주간 OHLC로)"""
+    candles = sorted(candles, key=lambda c: c.day)
+    candidates = [("daily", [_daily_line(c) for c in candles])]
+    for recent_days in _RECENT_CANDLE_DAYS:
+        if recent_days < len(candles):
+            older, recent = candles[:-recent_days], candles[-recent_days:]
+            candidates.append(
+                (f"weekly+daily{recent_days}", _weekly_lines(older) + [_daily_line(c) for c in recent])
+            )
+    return _fit("coin_price", candidates, budget, model)
+
+
+def _runs(points: Sequence[Tuple[date, int]], label: Callable[[int], Any]) -> List[List[Tuple[date, int]]]:
+    """label이 같은 연속 구간으로 묶음"""
+    runs: List[List[Tuple[date, int]]] = []
+    for point in points:
+        if runs and label(runs[-1][-1][1]) == label(point[1]):
+            runs[-1].append(point)
+        else:
+            runs.append([point])
+    return runs
+
+
+def _run_length_lines(points: Sequence[Tuple[date, int]]) -> List[str]:
+    lines = []
+    for run in _runs(points, lambda v: v):
+        start, end = run[0][0], run[-1][0]
+        day = start.isoformat() if start == end else f"{start.isoformat()}~{end.isoformat()}"
+        lines.append(f"{day}: {run[0][1]}")
+    return lines
+
+
+def _band(value: int) -> str:
+    for upper, name in _FEAR_GREED_BANDS:
+        if value <= upper:
+            return name
+    return _FEAR_GREED_BANDS[-1][1]
+
+
+def _banded_lines(points: Sequence[Tuple[date, int]]) -> List[str]:
+    lines = []
+    for run in _runs(points, _band):
+        values = [v for _, v in run]
+        lines.append(
+            f"{run[0][0].isoformat()}~{run[-1][0].isoformat()}: {_band(values[0])} "
+            f"({min(values)}~{max(values)})"
+        )
+    return lines
+
+
+def build_fear_greed_context(points: Sequence[Tuple[date, int]], budget: int, model: str) -> PromptContext:
+    """(날짜, 지수) 목록 → 기간 데이터 (예산을 넘으면 run-length, 이어서 오래된 구간은 단계별로)"""
+    points = sorted(points)
+    candidates = [
+        ("daily", [f"{d.isoformat()}: {v}" for d, v in points]),
+        ("run_length", _run_length_lines(points)),
+    ]
+    for recent_days in _RECENT_INDEX_DAYS:
+        if recent_days < len(points):
+            older, recent = points[:-recent_days], points[-recent_days:]
+            candidates.append(
+                (f"banded+daily{recent_days}", _banded_lines(older) + _run_length_lines(recent))
+            )
+    return _fit("fear_greed", candidates, budget, model)
+
+
+def build_article_context(
+    by_date: Dict[date, List[Tuple[str, str]]],
+    budget: int,
+    model: str,
+) -> PromptContext:
+    """
+    날짜별 (헤드라인, URL) → 기간 데이터. 예산을 넘으면 URL을 [a1] 형식의 id로 바꾸고,
+    그래도 넘으면 날짜별 헤드라인 수를 줄임 (이미 max_headlines_per_day로 자른 목록을 받음)
+    """
+    days = sorted(by_date)
+    ids: Dict[str, str] = {}
+    for d in days:
+        for _, url in by_date[d]:
+            if url and url not in ids:
+                ids[url] = f"a{len(ids) + 1}"
+
+    def lines_for(per_day: int, use_ids: bool = True) -> List[str]:
+        lines = [ARTICLE_ID_NOTE] if use_ids else []
+        for d in days:
+            parts = [
+                f"{h.strip()} [{ids.get(u, '') if use_ids else u}]"
+                for h, u in by_date[d][:per_day]
+                if h or u
+            ]
+            lines.append(d.strftime("%Y-%m-%d") + ": " + " | ".join(parts))
+        return lines
+
+    max_per_day = max((len(items) for items in by_date.values()), default=0)
+    candidates = [
+        ("full", lines_for(max_per_day, use_ids=False)),
+        ("url_ids", lines_for(max_per_day)),
+    ]
+    per_day = max_per_day
+    while per_day > 1:
+        per_day = max(1, per_day * 2 // 3)
+        candidates.append((f"url_ids+headlines{per_day}", lines_for(per_day)))
+
+    # 안내 문구는 남기고 가장 오래된 날짜부터 버림
+    context = _fit("article", candidates, budget, model, drop_oldest=lambda lines: lines[:1] + lines[2:])
+    if context.strategy.startswith("url_ids"):
+        body = context.text[len(ARTICLE_ID_NOTE) :]
+        context.aliases = {alias: url for url, alias in ids.items() if f"[{alias}]" in body}
+    return context
+
+
+def restore_aliases(value: Any, aliases: Dict[str, str]) -> Any:
+    """응답(JSON) 안에서 id와 정확히 같은 문자열 값을 원래 값으로 바꿈 ("a1", "[a1]" 모두)"""
+    if not aliases:
+        return value
+    if isinstance(value, dict):
+        return {k: restore_aliases(v, aliases) for k, v in value.items()}
+    if isinstance(value, list):
+        return [restore_aliases(v, aliases) for v in value]
+    if isinstance(value, str):
+        return aliases.get(value.strip().strip("[]").strip(), value)
+    return value
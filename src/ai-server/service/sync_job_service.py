@@ -0,0 +1,229 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from dto.exchange_credentials_dto import ExchangeProvider
+from model.SyncJob import (
+    SyncJob,
+    JOB_TYPE_TRADING_HISTORIES,
+    JOB_TYPE_ASSETS,
+)
+
+# 증분 동기화 시 마지막 동기화 시각보다 앞당겨 조회하는 여유 구간 (중복은 저장 시 제외됨)
+INCREMENTAL_SYNC_OVERLAP = timedelta(days=1)
+
+
+class SyncJobService:
+    """
+    거래내역·자산 동기화 백그라운드 작업 관리
+
+    요청은 작업 ID만 받고 바로 반환되며, 실제 동기화는 크기가 제한된 워커 풀에서 실행됩니다.
+    작업 상태는 sync_jobs 테이블에 저장되어 재시작 후에도 조회·재실행할 수 있습니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers or int(os.getenv("SYNC_JOB_WORKERS", "2"))
+        self.stale_after = timedelta(
+            minutes=int(os.getenv("SYNC_JOB_STALE_MINUTES", "10"))
+        )
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._sync_job_repository = None
+        self._trading_histories_service = None
+        self._assets_service = None
+        self._user_service = None
+        self._user_repository = None
+        self._user_sync_status_repository = None
+
+    @property
+    def sync_job_repository(self):
+        if self._sync_job_repository is None:
+            from repository.sync_job_repository import SyncJobRepository
+
+            self._sync_job_repository = SyncJobRepository()
+        return self._sync_job_repository
+
+    @property
+    def trading_histories_service(self):
+        if self._trading_histories_service is None:
+            from dependencies import get_trading_histories_service
+
+            self._trading_histories_service = get_trading_histories_service()
+        return self._trading_histories_service
+
+    @property
+    def assets_service(self):
+        if self._assets_service is None:
+            from dependencies import get_assets_service
+
+            self._assets_service = get_assets_service()
+        return self._assets_service
+
+    @property
+    def user_service(self):
+        if self._user_service is None:
+            from dependencies import get_user_service
+
+            self._user_service = get_user_service()
+        return self._user_service
+
+    @property
+    def user_repository(self):
+        if self._user_repository is None:
+            from dependencies import get_user_repository
+
+            self._user_repository = get_user_repository()
+        return self._user_repository
+
+    @property
+    def user_sync_status_repository(self):
+        if self._user_sync_status_repository is None:
+            from repository.user_sync_status_repository import (
+                UserSyncStatusRepository,
+            )
+
+            self._user_sync_status_repository = UserSyncStatusRepository()
+        return self._user_sync_status_repository
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="sync-job"
+                )
+            return self._executor
+
+    def submit(
+        self, user_id: str, job_type: str, exchange_provider: ExchangeProvider
+    ) -> Tuple[SyncJob, bool]:
+        """
+        동기화 작업 등록
+
+        Returns:
+            (작업, 새로 생성 여부). 같은 작업이 이미 진행 중이면 기존 작업과 False
+        """
+        if job_type not in (JOB_TYPE_TRADING_HISTORIES, JOB_TYPE_ASSETS):
+            raise ValueError(f"지원하지 않는 동기화 작업입니다: {job_type}")
+        if job_type == JOB_TYPE_ASSETS and exchange_provider != ExchangeProvider.UPBIT:
+            raise ValueError("자산 동기화는 현재 업비트만 지원합니다")
+
+        exchange_code = exchange_provider.value
+        active = self.sync_job_repository.find_active(user_id, job_type, exchange_code)
+        if active is not None:
+            return active, False
+
+        job = self.sync_job_repository.create_job(user_id, job_type, exchange_code)
+        if job is None:
+            # 동시에 들어온 요청이 먼저 생성한 경우
+            return (
+                self.sync_job_repository.find_active(user_id, job_type, exchange_code),
+                False,
+            )
+
+        self.executor.submit(self._run, str(job.id))
+        self.logger.info(
+            f"동기화 작업 등록: job_id={job.id}, user_id={user_id}, job_type={job_type}"
+        )
+        return job, True
+
+    def get_job(self, job_id: str) -> Optional[SyncJob]:
+        """작업 상태 조회"""
+        return self.sync_job_repository.find_by_id(job_id)
+
+    def recover_jobs(self) -> int:
+        """
+        재시작 시 미완료 작업 재실행
+
+        진행 상황 갱신이 오래 멈춘 running 작업은 pending으로 되돌리고,
+        pending 작업은 모두 다시 워커 풀에 넣습니다. 실행 직전 선점(claim)하므로
+        여러 프로세스가 동시에 복구해도 같은 작업이 두 번 실행되지 않습니다.
+        """
+        reset_count = self.sync_job_repository.reset_stale_running(self.stale_after)
+        pending_jobs = self.sync_job_repository.find_pending()
+        for job in pending_jobs:
+            self.executor.submit(self._run, str(job.id))
+
+        if pending_jobs:
+            self.logger.info(
+                f"미완료 동기화 작업 재등록: {len(pending_jobs)}개 (중단 작업 복구 {reset_count}개)"
+            )
+        return len(pending_jobs)
+
+    def run_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 1건을 현재 스레드에서 실행 (선점 → 동기화 → 결과 저장)
+
+        Returns:
+            작업 결과. 선점에 실패했거나 작업이 실패하면 None
+        """
+        job = self.sync_job_repository.claim(job_id)
+        if job is None:
+            return None
+
+        started_at = datetime.now(timezone.utc)
+        try:
+            if job.job_type == JOB_TYPE_TRADING_HISTORIES:
+                result = self._sync_trading_histories(job)
+            else:
+                result = self._sync_assets(job)
+
+            self.sync_job_repository.mark_succeeded(job_id, result)
+            self.user_sync_status_repository.mark_synced(
+                str(job.user_id), job.exchange_code, job.job_type, started_at
+            )
+            self.logger.info(f"동기화 작업 완료: job_id={job_id}, result={result}")
+            return result
+
+        except Exception as e:
+            self.logger.error(f"동기화 작업 실패: job_id={job_id}, error={e}")
+            self.sync_job_repository.mark_failed(job_id, str(e))
+            return None
+
+    def shutdown(self) -> None:
+        """워커 풀 종료 (진행 중 작업은 다음 기동 시 복구)"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _run(self, job_id: str) -> None:
+        try:
+            self.run_job(job_id)
+        except Exception as e:
+            # 상태 저장 자체가 실패한 경우. 작업은 stale 복구 대상으로 남음
+            self.logger.error(f"동기화 작업 실행 중 에러 발생: job_id={job_id}, error={e}")
+
+    def _sync_trading_histories(self, job: SyncJob) -> Dict[str, Any]:
+        user_id = str(job.user_id)
+        provider = ExchangeProvider(job.exchange_code)
+
+        # 이전 동기화 시각이 있으면 그 이후만 조회 (증분)
+        start_time = None
+        user = self.user_repository.find_by_id(user_id)
+        if user is not None and user.last_trading_history_update_at is not None:
+            start_time = user.last_trading_history_update_at - INCREMENTAL_SYNC_OVERLAP
+
+        progress = self.trading_histories_service.sync_trading_histories(
+            user_id,
+            provider.name,
+            start_time=start_time,
+            on_progress=lambda p: self.sync_job_repository.update_progress(
+                str(job.id), p
+            ),
+        )
+        self.user_service.update_user_trading_history_updated_at(user_id)
+        return progress
+
+    def _sync_assets(self, job: SyncJob) -> Dict[str, Any]:
+        result = self.assets_service.sync_upbit_assets(str(job.user_id))
+        summary = {
+            "saved_count": result["saved_count"],
+            "deleted_count": result["deleted_count"],
+        }
+        self.sync_job_repository.update_progress(str(job.id), summary)
+        return summary
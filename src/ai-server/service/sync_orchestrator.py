@@ -0,0 +1,320 @@
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from dto.exchange_credentials_dto import ExchangeProvider
+from model.SyncJob import JOB_TYPE_TRADING_HISTORIES, JOB_TYPE_ASSETS
+from service.sync_job_service import INCREMENTAL_SYNC_OVERLAP
+
+
+@dataclass
+class SyncTask:
+    """오케스트레이터가 한 단계씩 진행시키는 사용자별 동기화 작업"""
+
+    job_id: str
+    user_id: str
+    exchange_code: int
+    job_type: str
+    started_at: datetime
+    steps: Iterator[Dict[str, Any]]
+    progress: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        return (self.user_id, self.job_type, self.exchange_code)
+
+
+class SyncOrchestrator:
+    """
+    거래소가 연결된 모든 사용자의 거래내역·자산 증분 동기화 스케줄러
+
+    - 주기적으로 동기화 시각이 오래된 사용자를 골라 sync_jobs에 작업을 만들고 선점합니다.
+    - asyncio 워커들이 공용 큐에서 작업을 꺼내 한 단계(거래내역 1페이지 또는 자산 동기화)만
+      스레드에서 실행한 뒤 큐 뒤로 돌려보냅니다. 거래가 많은 계정도 다른 사용자를 막지 않고
+      페이지 단위로 번갈아 진행됩니다 (round-robin).
+    - 요청 속도는 UpbitHttpClient의 access key별 토큰 버킷으로 계정마다 따로 제한됩니다.
+    - 완료 시각은 user_sync_status에 기록하고, 목표 주기(SLA)를 넘긴 사용자가 있으면 경고를 남깁니다.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.worker_count = int(os.getenv("SYNC_ORCHESTRATOR_WORKERS", "4"))
+        self.schedule_interval_sec = float(os.getenv("SYNC_SCHEDULE_INTERVAL_SEC", "60"))
+        self.target_interval = timedelta(
+            minutes=float(os.getenv("SYNC_TARGET_INTERVAL_MIN", "30"))
+        )
+        self.freshness_sla = timedelta(
+            minutes=float(os.getenv("SYNC_FRESHNESS_SLA_MIN", "60"))
+        )
+        self.schedule_batch_size = int(os.getenv("SYNC_SCHEDULE_BATCH", "100"))
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active_keys: Set[Tuple[str, str, int]] = set()
+        self._last_max_lag_sec: Optional[float] = None
+        self._completed_count = 0
+        self._failed_count = 0
+
+        self._sync_job_repository = None
+        self._user_sync_status_repository = None
+        self._trading_histories_service = None
+        self._assets_service = None
+        self._user_service = None
+
+    @property
+    def sync_job_repository(self):
+        if self._sync_job_repository is None:
+            from repository.sync_job_repository import SyncJobRepository
+
+            self._sync_job_repository = SyncJobRepository()
+        return self._sync_job_repository
+
+    @property
+    def user_sync_status_repository(self):
+        if self._user_sync_status_repository is None:
+            from repository.user_sync_status_repository import (
+                UserSyncStatusRepository,
+            )
+
+            self._user_sync_status_repository = UserSyncStatusRepository()
+        return self._user_sync_status_repository
+
+    @property
+    def trading_histories_service(self):
+        if self._trading_histories_service is None:
+            from dependencies import get_trading_histories_service
+
+            self._trading_histories_service = get_trading_histories_service()
+        return self._trading_histories_service
+
+    @property
+    def assets_service(self):
+        if self._assets_service is None:
+            from dependencies import get_assets_service
+
+            self._assets_service = get_assets_service()
+        return self._assets_service
+
+    @property
+    def user_service(self):
+        if self._user_service is None:
+            from dependencies import get_user_service
+
+            self._user_service = get_user_service()
+        return self._user_service
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """스케줄 루프와 워커 시작"""
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._schedule_loop())]
+        self._tasks.extend(
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        )
+        self.logger.info(f"동기화 오케스트레이터 시작: workers={self.worker_count}")
+
+    async def stop(self) -> None:
+        """스케줄 루프와 워커 종료 (진행 중 작업은 sync_jobs 복구 대상으로 남음)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._active_keys.clear()
+        self.logger.info("동기화 오케스트레이터 종료")
+
+    def get_status(self) -> Dict[str, Any]:
+        """스케줄러 상태 (큐 길이, 진행 중 작업 수, 최대 지연)"""
+        return {
+            "running": self.is_running,
+            "workers": self.worker_count,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "active": len(self._active_keys),
+            "completed": self._completed_count,
+            "failed": self._failed_count,
+            "max_lag_sec": self._last_max_lag_sec,
+            "freshness_sla_sec": self.freshness_sla.total_seconds(),
+        }
+
+    async def schedule_due(self) -> int:
+        """
+        동기화가 필요한 사용자 작업을 큐에 추가
+
+        Returns:
+            새로 추가한 작업 수
+        """
+        now = datetime.now(timezone.utc)
+        threshold = now - self.target_interval
+        due_users = await asyncio.to_thread(
+            self.user_sync_status_repository.find_due,
+            threshold,
+            self.schedule_batch_size,
+        )
+        self._check_freshness(due_users, now)
+
+        scheduled = 0
+        for due in due_users:
+            for job_type, synced_at in self._job_synced_times(due):
+                if synced_at is not None and synced_at >= threshold:
+                    continue
+                if (due["user_id"], job_type, due["exchange_code"]) in self._active_keys:
+                    continue
+
+                task = await asyncio.to_thread(
+                    self._open_task,
+                    due["user_id"],
+                    due["exchange_code"],
+                    job_type,
+                    synced_at,
+                )
+                if task is None:
+                    continue
+
+                self._active_keys.add(task.key)
+                self._queue.put_nowait(task)
+                scheduled += 1
+
+        if scheduled:
+            self.logger.info(f"동기화 작업 스케줄: {scheduled}개")
+        return scheduled
+
+    @staticmethod
+    def _job_synced_times(due: Dict[str, Any]) -> List[Tuple[str, Optional[datetime]]]:
+        """사용자에게 실행할 수 있는 작업 종류별 마지막 동기화 시각 (자산 동기화는 업비트만)"""
+        jobs = [(JOB_TYPE_TRADING_HISTORIES, due["trading_synced_at"])]
+        if due["exchange_code"] == ExchangeProvider.UPBIT.value:
+            jobs.append((JOB_TYPE_ASSETS, due["assets_synced_at"]))
+        return jobs
+
+    def _check_freshness(self, due_users: List[Dict[str, Any]], now: datetime) -> None:
+        synced_times = [
+            synced_at
+            for due in due_users
+            for _, synced_at in self._job_synced_times(due)
+            if synced_at is not None
+        ]
+        never_synced = sum(
+            1
+            for due in due_users
+            if any(synced_at is None for _, synced_at in self._job_synced_times(due))
+        )
+        self._last_max_lag_sec = (
+            (now - min(synced_times)).total_seconds() if synced_times else None
+        )
+
+        if (
+            self._last_max_lag_sec is not None
+            and self._last_max_lag_sec > self.freshness_sla.total_seconds()
+        ):
+            self.logger.warning(
+                f"동기화 SLA 초과: 최대 지연 {self._last_max_lag_sec / 60:.1f}분 "
+                f"(SLA {self.freshness_sla.total_seconds() / 60:.0f}분), "
+                f"대기 {len(due_users)}명, 최초 동기화 대기 {never_synced}명"
+            )
+
+    def _open_task(
+        self,
+        user_id: str,
+        exchange_code: int,
+        job_type: str,
+        synced_at: Optional[datetime],
+    ) -> Optional[SyncTask]:
+        """sync_jobs에 작업을 만들고 선점한 뒤 단계 이터레이터 생성. 이미 진행 중이면 None"""
+        job = self.sync_job_repository.create_job(user_id, job_type, exchange_code)
+        if job is None:
+            return None
+        job = self.sync_job_repository.claim(str(job.id))
+        if job is None:
+            return None
+
+        if job_type == JOB_TYPE_TRADING_HISTORIES:
+            start_time = None
+            if synced_at is not None:
+                start_time = synced_at - INCREMENTAL_SYNC_OVERLAP
+            steps = self.trading_histories_service.iter_sync_trading_histories(
+                user_id, ExchangeProvider(exchange_code).name, start_time
+            )
+        else:
+            steps = self._iter_assets_sync(user_id)
+
+        return SyncTask(
+            job_id=str(job.id),
+            user_id=user_id,
+            exchange_code=exchange_code,
+            job_type=job_type,
+            started_at=datetime.now(timezone.utc),
+            steps=steps,
+        )
+
+    def _iter_assets_sync(self, user_id: str) -> Iterator[Dict[str, Any]]:
+        result = self.assets_service.sync_upbit_assets(user_id)
+        yield {
+            "saved_count": result["saved_count"],
+            "deleted_count": result["deleted_count"],
+        }
+
+    async def _schedule_loop(self) -> None:
+        while True:
+            try:
+                await self.schedule_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"동기화 스케줄 중 에러 발생: {e}")
+            await asyncio.sleep(self.schedule_interval_sec)
+
+    async def _worker(self) -> None:
+        while True:
+            task = await self._queue.get()
+            try:
+                done = await asyncio.to_thread(self.step, task)
+                if done:
+                    self._active_keys.discard(task.key)
+                else:
+                    # 한 단계만 진행하고 큐 뒤로 보내 다른 사용자와 번갈아 실행
+                    self._queue.put_nowait(task)
+            finally:
+                self._queue.task_done()
+
+    def step(self, task: SyncTask) -> bool:
+        """
+        작업을 한 단계 진행
+
+        Returns:
+            작업이 끝났으면(성공·실패 모두) True
+        """
+        try:
+            task.progress = next(task.steps)
+            self.sync_job_repository.update_progress(task.job_id, task.progress)
+            return False
+
+        except StopIteration:
+            self.sync_job_repository.mark_succeeded(task.job_id, task.progress)
+            self.user_sync_status_repository.mark_synced(
+                task.user_id, task.exchange_code, task.job_type, task.started_at
+            )
+            if task.job_type == JOB_TYPE_TRADING_HISTORIES:
+                self.user_service.update_user_trading_history_updated_at(task.user_id)
+            self._completed_count += 1
+            return True
+
+        except Exception as e:
+            self.logger.error(
+                f"스케줄 동기화 실패: user_id={task.user_id}, job_type={task.job_type}, error={e}"
+            )
+            self._failed_count += 1
+            try:
+                self.sync_job_repository.mark_failed(task.job_id, str(e))
+                self.user_sync_status_repository.mark_error(
+                    task.user_id, task.exchange_code, str(e)
+                )
+            except Exception as record_error:
+                self.logger.error(f"동기화 실패 기록 중 에러 발생: {record_error}")
+            return True
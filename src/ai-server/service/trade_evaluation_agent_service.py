@@ -1,13 +1,16 @@
 """매매 1건 분석·평가 메타 에이전트 서비스. 세 전문가 호출 + 해당 건만 포맷 후 trade_evaluation run()."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, wait
-from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from database.database_connection import db
 
@@ -31,13 +34,27 @@ if _ai_agent_dir.exists() and str(_ai_agent_dir) not in sys.path:
 from laboratory.article_ai import ArticleExpertResponse
 from laboratory.coin_price_ai import CoinPriceExpertResponse
 from laboratory.fear_greed_ai import FearGreedExpertResponse
-from laboratory.trade_history_ai import run as run_trade_evaluation_agent
+from laboratory.trade_history_ai import abatch as abatch_trade_evaluation_agent
+from laboratory.trade_history_ai import arun as arun_trade_evaluation_agent
+from laboratory.trade_history_ai import astream_text as astream_trade_evaluation_text
 from laboratory.trade_history_ai import TradeEvaluationExpertResponse
+from laboratory.trade_history_ai import MODEL_NAME as META_MODEL_NAME
+from laboratory.trade_history_ai import PROMPT_PATH as META_PROMPT_PATH
+from laboratory.trade_history_ai import parser as meta_parser
 
-from utils.openai_retry import with_openai_retry
+from service.expert_response_store import prompt_version
+from service.prompt_context import count_tokens, prompt_tokens
+from utils.openai_retry import (
+    astream_with_openai_retry,
+    is_retryable,
+    with_openai_retry_async,
+)
 
 logger = logging.getLogger(__name__)
 
+# 일괄 평가에서 동시에 진행할 LLM 호출 수 (전문가·메타 에이전트 각각)
+BATCH_MAX_CONCURRENCY = int(os.getenv("TRADE_EVALUATION_BATCH_CONCURRENCY", "5"))
+
 
 @dataclass
 class TradeEvaluationFullResult:
@@ -47,6 +64,28 @@ class TradeEvaluationFullResult:
     coin_price_expert: CoinPriceExpertResponse
     fear_greed_expert: FearGreedExpertResponse
     trade_evaluation: TradeEvaluationExpertResponse
+    # 결과를 만든 입력 지문 (trade_evaluation_results.input_fingerprints로 저장)
+    input_fingerprints: Optional[Dict[str, Any]] = None
+    # 저장된 결과를 그대로 반환했으면 True (다시 저장할 필요 없음)
+    reused: bool = False
+
+    def to_result_dict(self) -> Dict[str, Any]:
+        """trade_evaluation_results.result / API 응답 data 형식"""
+        return {
+            "article_expert": self.article_expert.model_dump(),
+            "coin_price_expert": self.coin_price_expert.model_dump(),
+            "fear_greed_expert": self.fear_greed_expert.model_dump(),
+            "trade_evaluation_expert": self.trade_evaluation.model_dump(),
+        }
+
+
+@dataclass
+class TradeEvaluationBatchResult:
+    """일괄 평가 결과: 매매 ID별 결과, 없는 매매 ID, 실패한 매매 ID와 사유"""
+
+    results: Dict[int, TradeEvaluationFullResult] = field(default_factory=dict)
+    not_found: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
 
 
 def _expert_response_to_summary(verdict: str, market_flow_analysis: str, short_long_term_perspective: str) -> str:
@@ -100,9 +139,45 @@ def _format_trades_from_histories(histories: List) -> str:
     return "\n".join(lines) if lines else "(매매 내역 없음)"
 
 
+def _meta_fingerprint(target_period: str, expert_keys: Dict[str, str], meta_inputs: Dict[str, str]) -> str:
+    """메타 에이전트 입력 지문: 전문가 응답 키 + 매매·일지 텍스트 + 메타 프롬프트 버전·모델"""
+    payload = json.dumps(
+        {
+            "target_period": target_period,
+            "experts": expert_keys,
+            "inputs": meta_inputs,
+            "prompt_version": prompt_version(META_PROMPT_PATH, meta_parser),
+            "model": META_MODEL_NAME,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _log_meta_call(meta_kwargs: Dict[str, str], response: Any) -> None:
+    """메타 에이전트 입출력 토큰 수 기록 (response는 응답 모델 또는 스트리밍으로 받은 원문)"""
+    if not isinstance(response, str):
+        response = json.dumps(response.model_dump(mode="json"), ensure_ascii=False)
+    tokens_in = prompt_tokens(META_PROMPT_PATH, meta_parser, META_MODEL_NAME) + count_tokens(
+        "\n".join(meta_kwargs.values()), META_MODEL_NAME
+    )
+    logger.info(
+        f"메타 에이전트 LLM 호출: agent=trade_evaluation, target_date={meta_kwargs['target_period']}, "
+        f"tokens_in={tokens_in}, tokens_out={count_tokens(response, META_MODEL_NAME)}"
+    )
+
+
 class TradeEvaluationAgentService:
     """매매 1건 분석·평가 메타 에이전트 서비스. 지정한 매매 1건에 대해 세 전문가 의견을 반영해 평가합니다."""
 
+    # (전문가 이름, 저장된 result의 키, 응답 모델)
+    _EXPERTS = (
+        ("article", "article_expert", ArticleExpertResponse),
+        ("coin_price", "coin_price_expert", CoinPriceExpertResponse),
+        ("fear_greed", "fear_greed_expert", FearGreedExpertResponse),
+    )
+
     def __init__(
         self,
         article_agent_service,
@@ -110,19 +185,32 @@ class TradeEvaluationAgentService:
         fear_greed_agent_service,
         trading_histories_repository,
         diary_repository,
+        trade_evaluation_result_repository=None,
     ):
         self._article = article_agent_service
         self._coin_price = coin_price_agent_service
         self._fear_greed = fear_greed_agent_service
         self._trading_repo = trading_histories_repository
         self._diary_repo = diary_repository
+        self._result_repo = trade_evaluation_result_repository
 
-    def evaluate(
+    @property
+    def result_repo(self):
+        if self._result_repo is None:
+            from repository.trade_evaluation_result_repository import (
+                TradeEvaluationResultRepository,
+            )
+
+            self._result_repo = TradeEvaluationResultRepository()
+        return self._result_repo
+
+    async def aevaluate(
         self,
         user_id: str,
         trade_id: int,
         target_date: str,
         coin_id: int,
+        session=None,
     ) -> Optional[TradeEvaluationFullResult]:
         """
         매매 내역 1건(trade_id)에 대해, 선택된 날짜(target_date) 기준 시장 의견(기사·코인가격·공포탐욕)을 조회한 뒤
@@ -130,76 +218,402 @@ class TradeEvaluationAgentService:
 
         - trade_id에 해당하는 건이 user_id 소유가 아니면 None 반환(호출부에서 404 처리).
         - target_date는 요청에서 받은 선택된 날짜(단일)로, 전문가 호출 및 평가 기간 표시에 사용.
+        - session(AsyncSession)을 넘기면 요청 단위 세션으로 조회합니다(없으면 조회용 세션을 열고 닫음).
+          조회 후 LLM 호출 전에 커넥션을 반납하고, 이후 저장 시 세션이 커넥션을 다시 얻습니다.
+        - 저장된 결과가 있고 입력(전문가 응답 키, 매매 내역, 일지, 메타 프롬프트 버전)이 같으면
+          LLM 없이 그대로 반환합니다(reused=True). 일지만 바뀌었으면 저장된 전문가 응답을 쓰고 메타 에이전트만 다시 실행합니다.
+
+        전문가 호출은 asyncio.gather + chain.ainvoke, 429 백오프는 asyncio.sleep이라
+        LLM 응답을 기다리는 동안 스레드를 점유하지 않습니다.
         """
-        session = None
-        try:
-            session = db.get_session()
-            trade = self._trading_repo.find_by_user_id_and_id(session, user_id, trade_id)
-            diary = self._diary_repo.find_by_trading_history_id(session, trade_id) if trade else None
-        finally:
-            if session:
-                session.close()
+        plan = await self.aprepare(user_id, trade_id, target_date, coin_id, session=session)
+        if plan is None:
+            return None
+        if plan.reused_result is not None:
+            return plan.reused_result
+
+        pending_responses = await asyncio.gather(
+            *(self._arun_expert(plan, name) for name in plan.pending)
+        )
+        responses = {**plan.reusable, **dict(zip(plan.pending, pending_responses))}
+
+        meta_kwargs = plan.meta_kwargs(responses)
+        arun_meta = with_openai_retry_async(arun_trade_evaluation_agent)
+        trade_eval_resp = await arun_meta(**meta_kwargs)
+        _log_meta_call(meta_kwargs, trade_eval_resp)
+        return plan.result(responses, trade_eval_resp)
+
+    async def aprepare(
+        self,
+        user_id: str,
+        trade_id: int,
+        target_date: str,
+        coin_id: int,
+        session=None,
+    ) -> Optional["_EvaluationPlan"]:
+        """
+        매매·일지·저장된 결과 조회와 전문가 입력 구성 (LLM 호출 없음)
+
+        매매 내역이 없으면 None. 스트리밍 라우트는 이 단계에서 404를 판단한 뒤 astream으로 진행합니다.
+        """
+        async with _async_session_scope(session) as s:
+            trade = await self._trading_repo.find_by_user_id_and_id_async(s, user_id, trade_id)
+            diary = None
+            stored = None
+            if trade is not None:
+                diary = await self._diary_repo.find_by_trading_history_id_async(s, trade_id)
+                stored = await self.result_repo.find_by_user_id_and_trade_id_async(
+                    s, user_id, trade_id
+                )
+            stored = _StoredEvaluation.of(stored)
+            # 전문가·메타 에이전트(LLM) 응답을 기다리는 동안 커넥션을 풀에 돌려둠
+            await db.release_async_connection(s)
 
         if trade is None:
             return None
 
-        target_period = target_date
-        trade_history_text = _format_trades_from_histories([trade])
+        article_req, coin_price_req, fear_greed_req = await asyncio.gather(
+            self._article.abuild_request(target_date),
+            self._coin_price.abuild_request(target_date, coin_id=coin_id),
+            self._fear_greed.abuild_request(target_date),
+        )
+        requests = {
+            "article": article_req,
+            "coin_price": coin_price_req,
+            "fear_greed": fear_greed_req,
+        }
+        return self._plan(user_id, trade_id, target_date, trade, diary, stored, requests)
+
+    async def astream(self, plan: "_EvaluationPlan") -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        aprepare 결과로 평가를 진행하며 (이벤트, 데이터)를 순서대로 반환
+
+        - ("expert", {"name", "data", "reused"}): 전문가 응답. 재사용분은 바로, 나머지는 끝나는 순서대로
+        - ("token", {"text"}): 메타 에이전트 출력 조각
+        - ("result", {"data", "reused"}): 최종 결과(API data 형식). 저장은 호출한 쪽에서
+        소비하는 쪽이 중간에 멈추면(클라이언트 연결 종료) 아직 끝나지 않은 전문가 호출은 취소합니다.
+        """
+        result_keys = {name: result_key for name, result_key, _ in self._EXPERTS}
+        if plan.reused_result is not None:
+            data = plan.reused_result.to_result_dict()
+            for name in plan.reusable:
+                yield "expert", {"name": result_keys[name], "data": data[result_keys[name]], "reused": True}
+            yield "result", {"data": data, "reused": True}
+            return
+
+        responses = dict(plan.reusable)
+        for name, response in plan.reusable.items():
+            yield "expert", {"name": result_keys[name], "data": response.model_dump(), "reused": True}
+
+        async def run_named(name: str):
+            return name, await self._arun_expert(plan, name)
+
+        tasks = [asyncio.ensure_future(run_named(name)) for name in plan.pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, response = await next_done
+                responses[name] = response
+                yield "expert", {"name": result_keys[name], "data": response.model_dump(), "reused": False}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        chunks: List[str] = []
+        meta_kwargs = plan.meta_kwargs(responses)
+        async for text in astream_with_openai_retry(astream_trade_evaluation_text, **meta_kwargs):
+            chunks.append(text)
+            yield "token", {"text": text}
+
+        _log_meta_call(meta_kwargs, "".join(chunks))
+        trade_eval_resp = meta_parser.parse("".join(chunks))
+        result = plan.result(responses, trade_eval_resp)
+        yield "result", {"data": result.to_result_dict(), "reused": False}
+
+    async def aevaluate_batch(
+        self,
+        user_id: str,
+        items: List[Tuple[int, str, int]],
+        session=None,
+        max_concurrency: Optional[int] = None,
+    ) -> TradeEvaluationBatchResult:
+        """
+        매매 여러 건을 한 번에 평가합니다. items는 (trade_id, target_date, coin_id) 목록.
+
+        - 매매·일지·저장된 결과는 건별이 아니라 IN 조회 한 번씩으로 가져옵니다.
+        - 전문가 입력은 (target_date, coin_id) 그룹마다 한 번 구성하고, 같은 입력(전문가 응답 키)의
+          전문가는 여러 매매가 공유해 한 번만 호출합니다.
+        - 메타 에이전트는 chain.abatch로 동시에 max_concurrency건까지 호출합니다.
+        - 한 건의 실패(전문가·메타 에이전트)는 해당 건만 failed로 돌려주고 나머지는 계속 진행합니다.
+        저장은 호출한 쪽에서 (TradeEvaluationResultRepository.bulk_upsert_async).
+        """
+        max_concurrency = max_concurrency or BATCH_MAX_CONCURRENCY
+        batch = TradeEvaluationBatchResult()
+        trade_ids = [trade_id for trade_id, _, _ in items]
+
+        async with _async_session_scope(session) as s:
+            trades = {
+                trade.id: trade
+                for trade in await self._trading_repo.find_all_by_user_id_and_ids_async(
+                    s, user_id, trade_ids
+                )
+            }
+            found_ids = list(trades)
+            diaries = {
+                diary.trading_history_id: diary
+                for diary in await self._diary_repo.find_all_by_trading_history_ids_async(
+                    s, found_ids
+                )
+            }
+            stored_rows = {
+                row.trade_id: _StoredEvaluation.of(row)
+                for row in await self.result_repo.find_all_by_user_id_and_trade_ids_async(
+                    s, user_id, found_ids
+                )
+            }
+            await db.release_async_connection(s)
+
+        batch.not_found = [trade_id for trade_id in trade_ids if trade_id not in trades]
+        items = [item for item in items if item[0] in trades]
+
+        group_requests = await self._abuild_group_requests(
+            {(target_date, coin_id) for _, target_date, coin_id in items}
+        )
+        plans = {
+            trade_id: self._plan(
+                user_id,
+                trade_id,
+                target_date,
+                trades[trade_id],
+                diaries.get(trade_id),
+                stored_rows.get(trade_id, _StoredEvaluation()),
+                group_requests[(target_date, coin_id)],
+            )
+            for trade_id, target_date, coin_id in items
+        }
+        for trade_id, plan in plans.items():
+            if plan.reused_result is not None:
+                batch.results[trade_id] = plan.reused_result
+
+        # 입력이 같은 전문가 호출은 한 번만 (전문가 응답 키 기준)
+        distinct = {
+            plan.requests[name].key: (name, plan.requests[name])
+            for plan in plans.values()
+            if plan.reused_result is None
+            for name in plan.pending
+        }
+        semaphore = asyncio.Semaphore(max_concurrency)
 
+        async def run_distinct(name: str, request):
+            async with semaphore:
+                return await self._arun_request(name, request)
+
+        outcomes = await asyncio.gather(
+            *(run_distinct(name, request) for name, request in distinct.values()),
+            return_exceptions=True,
+        )
+        expert_responses = dict(zip(distinct, outcomes))
+        per_trade_calls = sum(
+            len(plan.pending) for plan in plans.values() if plan.reused_result is None
+        )
+        logger.info(
+            f"일괄 평가 전문가 호출: user_id={user_id}, 매매 {len(plans)}건, "
+            f"호출 {len(distinct)}회 (건별 호출 시 {per_trade_calls}회)"
+        )
+
+        # 메타 에이전트 입력 구성 (전문가가 실패한 건은 제외)
+        meta_jobs: List[Tuple[int, Dict[str, Any]]] = []
+        for trade_id, plan in plans.items():
+            if plan.reused_result is not None:
+                continue
+            responses = dict(plan.reusable)
+            for name in plan.pending:
+                responses[name] = expert_responses[plan.requests[name].key]
+            errors = [r for r in responses.values() if isinstance(r, Exception)]
+            if errors:
+                batch.failed[trade_id] = f"전문가 호출 실패: {errors[0]}"
+                continue
+            meta_jobs.append((trade_id, responses))
+
+        meta_inputs = [plans[trade_id].meta_kwargs(responses) for trade_id, responses in meta_jobs]
+        meta_results = []
+        if meta_jobs:
+            meta_results = await abatch_trade_evaluation_agent(meta_inputs, max_concurrency=max_concurrency)
+
+        # 429/타임아웃으로 실패한 건만 개별 재시도
+        arun_meta = with_openai_retry_async(arun_trade_evaluation_agent)
+        for (trade_id, responses), meta_kwargs, meta in zip(meta_jobs, meta_inputs, meta_results):
+            if isinstance(meta, Exception) and is_retryable(meta):
+                try:
+                    meta = await arun_meta(**meta_kwargs)
+                except Exception as e:
+                    meta = e
+            if isinstance(meta, Exception):
+                logger.warning(f"일괄 평가 메타 에이전트 실패: trade_id={trade_id}, {meta}")
+                batch.failed[trade_id] = f"메타 에이전트 호출 실패: {meta}"
+                continue
+            _log_meta_call(meta_kwargs, meta)
+            batch.results[trade_id] = plans[trade_id].result(responses, meta)
+        return batch
+
+    async def _abuild_group_requests(
+        self, groups
+    ) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """(target_date, coin_id) 그룹별 전문가 입력. 기사·공포탐욕은 날짜마다 한 번만 구성"""
+        dates = sorted({target_date for target_date, _ in groups})
+        groups = sorted(groups)
+        built = await asyncio.gather(
+            *(self._article.abuild_request(target_date) for target_date in dates),
+            *(self._fear_greed.abuild_request(target_date) for target_date in dates),
+            *(
+                self._coin_price.abuild_request(target_date, coin_id=coin_id)
+                for target_date, coin_id in groups
+            ),
+        )
+        articles = dict(zip(dates, built[: len(dates)]))
+        fear_greeds = dict(zip(dates, built[len(dates) : 2 * len(dates)]))
+        coin_prices = dict(zip(groups, built[2 * len(dates) :]))
+        return {
+            (target_date, coin_id): {
+                "article": articles[target_date],
+                "coin_price": coin_prices[(target_date, coin_id)],
+                "fear_greed": fear_greeds[target_date],
+            }
+            for target_date, coin_id in groups
+        }
+
+    def _arun_expert(self, plan: "_EvaluationPlan", name: str):
+        """전문가 1명 async 호출 (429 시 재시도 적용)"""
+        return self._arun_request(name, plan.requests[name])
+
+    def _arun_request(self, name: str, request):
+        runner = {
+            "article": self._article.arun_request,
+            "coin_price": self._coin_price.arun_request,
+            "fear_greed": self._fear_greed.arun_request,
+        }[name]
+        return with_openai_retry_async(runner)(request)
+
+    def _plan(
+        self,
+        user_id: str,
+        trade_id: int,
+        target_date: str,
+        trade,
+        diary,
+        stored: "_StoredEvaluation",
+        requests: Dict[str, Any],
+    ) -> "_EvaluationPlan":
+        """입력 지문을 계산하고 저장된 결과 중 재사용할 부분(전체 또는 전문가별)을 결정"""
         diary_trading_mind_text = "(미기입)"
         diary_reason_text = "(매매 일지 없음)"
         if diary is not None:
             diary_trading_mind_text = _trading_mind_code_to_korean(diary.trading_mind)
             diary_reason_text = _extract_text_from_diary_content(diary.content) or "(작성 내용 없음)"
+        meta_inputs = {
+            "trade_history_text": _format_trades_from_histories([trade]),
+            "diary_trading_mind": diary_trading_mind_text,
+            "diary_reason": diary_reason_text,
+        }
 
-        # 세 전문가 에이전트 병렬 호출 (429 시 재시도 적용)
-        run_article = with_openai_retry(self._article.run_article_expert)
-        run_coin_price = with_openai_retry(self._coin_price.run_coin_price)
-        run_fear_greed = with_openai_retry(self._fear_greed.run_fear_greed)
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            f_article = executor.submit(run_article, target_date=target_date)
-            f_coin_price = executor.submit(
-                run_coin_price,
-                target_date=target_date,
-                coin_id=coin_id,
-            )
-            f_fear_greed = executor.submit(run_fear_greed, target_date=target_date)
-            wait([f_article, f_coin_price, f_fear_greed])
-            article_resp = f_article.result()
-            coin_price_resp = f_coin_price.result()
-            fear_greed_resp = f_fear_greed.result()
-
-        expert_article_summary = _expert_response_to_summary(
-            article_resp.verdict,
-            article_resp.market_flow_analysis,
-            article_resp.short_long_term_perspective,
-        )
-        expert_coin_price_summary = _expert_response_to_summary(
-            coin_price_resp.verdict,
-            coin_price_resp.market_flow_analysis,
-            coin_price_resp.short_long_term_perspective,
-        )
-        expert_fear_greed_summary = _expert_response_to_summary(
-            fear_greed_resp.verdict,
-            fear_greed_resp.market_flow_analysis,
-            fear_greed_resp.short_long_term_perspective,
-        )
+        expert_keys = {name: request.key for name, request in requests.items()}
+        input_fingerprints = {
+            "experts": expert_keys,
+            "meta": _meta_fingerprint(target_date, expert_keys, meta_inputs),
+        }
 
-        # 메타 에이전트 호출 (3개 결과 종합, 429 시 재시도 적용)
-        run_meta = with_openai_retry(run_trade_evaluation_agent)
-        trade_eval_resp = run_meta(
-            target_period=target_period,
-            expert_article_summary=expert_article_summary,
-            expert_coin_price_summary=expert_coin_price_summary,
-            expert_fear_greed_summary=expert_fear_greed_summary,
-            trade_history_text=trade_history_text,
-            diary_trading_mind=diary_trading_mind_text,
-            diary_reason=diary_reason_text,
+        stored_experts = stored.fingerprints.get("experts") or {}
+        reusable = {
+            name: response_model.model_validate(stored.result[result_key])
+            for name, result_key, response_model in self._EXPERTS
+            if stored.result is not None
+            and stored_experts.get(name) == expert_keys[name]
+            and result_key in stored.result
+        }
+        plan = _EvaluationPlan(
+            target_period=target_date,
+            meta_inputs=meta_inputs,
+            input_fingerprints=input_fingerprints,
+            reusable=reusable,
+            pending=[name for name in requests if name not in reusable],
+            requests=requests,
         )
+        if (
+            not plan.pending
+            and stored.fingerprints.get("meta") == input_fingerprints["meta"]
+            and "trade_evaluation_expert" in stored.result
+        ):
+            logger.info(f"저장된 매매 평가 재사용: user_id={user_id}, trade_id={trade_id}")
+            plan.reused_result = plan.result(
+                reusable,
+                TradeEvaluationExpertResponse.model_validate(stored.result["trade_evaluation_expert"]),
+                reused=True,
+            )
+        elif reusable:
+            logger.info(
+                f"저장된 전문가 응답 재사용: trade_id={trade_id}, experts={sorted(reusable)}"
+            )
+        return plan
+
+
+@dataclass
+class _StoredEvaluation:
+    """저장된 평가 결과에서 재사용 판단에 쓰는 값 (세션을 닫은 뒤에도 사용)"""
 
+    result: Optional[Dict[str, Any]] = None
+    fingerprints: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, row) -> "_StoredEvaluation":
+        if row is None:
+            return cls()
+        return cls(result=row.result, fingerprints=row.input_fingerprints or {})
+
+
+@dataclass
+class _EvaluationPlan:
+    """매매 1건 평가에서 다시 실행할 전문가와 메타 에이전트 입력"""
+
+    target_period: str
+    meta_inputs: Dict[str, str]
+    input_fingerprints: Dict[str, Any]
+    reusable: Dict[str, Any]
+    pending: List[str]
+    requests: Dict[str, Any] = field(default_factory=dict)
+    reused_result: Optional[TradeEvaluationFullResult] = None
+
+    def meta_kwargs(self, responses: Dict[str, Any]) -> Dict[str, str]:
+        """메타 에이전트 run()/arun() 인자"""
+        summaries = {
+            f"expert_{name}_summary": _expert_response_to_summary(
+                responses[name].verdict,
+                responses[name].market_flow_analysis,
+                responses[name].short_long_term_perspective,
+            )
+            for name in ("article", "coin_price", "fear_greed")
+        }
+        return {"target_period": self.target_period, **summaries, **self.meta_inputs}
+
+    def result(
+        self,
+        responses: Dict[str, Any],
+        trade_evaluation: TradeEvaluationExpertResponse,
+        reused: bool = False,
+    ) -> TradeEvaluationFullResult:
         return TradeEvaluationFullResult(
-            article_expert=article_resp,
-            coin_price_expert=coin_price_resp,
-            fear_greed_expert=fear_greed_resp,
-            trade_evaluation=trade_eval_resp,
+            article_expert=responses["article"],
+            coin_price_expert=responses["coin_price"],
+            fear_greed_expert=responses["fear_greed"],
+            trade_evaluation=trade_evaluation,
+            input_fingerprints=self.input_fingerprints,
+            reused=reused,
         )
+
+
+@asynccontextmanager
+async def _async_session_scope(session=None):
+    """넘겨받은 AsyncSession이 있으면 그대로, 없으면 조회용 세션을 열고 닫음"""
+    if session is not None:
+        yield session
+        return
+    async with db.get_async_session() as s:
+        yield s
@@ -1,22 +1,74 @@
 from dotenv import load_dotenv
+import base64
+import json
 import logging
 from datetime import datetime
 import pytz
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Mapping, Optional
 from fastapi import HTTPException
 from model.TradingHistories import TradingHistories
+from database.database_connection import db
 
 load_dotenv()
 
+# 거래내역 목록 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def _to_float(value) -> float:
+    """Numeric(Decimal) 칼럼 값을 float로 변환 (None은 0.0)"""
+    if value is None:
+        return 0.0
+    return float(value)
+
+
+def format_trading_history(history: TradingHistories) -> Dict[str, Any]:
+    """거래내역 1건을 응답용 dict로 변환"""
+    return {
+        "id": history.id,
+        "coin_id": history.coin_id,
+        "exchange_code": history.exchange_code,
+        "trade_uuid": str(history.trade_uuid),
+        "trade_type": history.trade_type,
+        "price": _to_float(history.price),
+        "quantity": _to_float(history.quantity),
+        "total_price": _to_float(history.total_price),
+        "fee": _to_float(history.fee),
+        "trade_time": (
+            history.trade_time.isoformat() if history.trade_time is not None else None
+        ),
+        "created_at": (
+            history.created_at.isoformat() if history.created_at is not None else None
+        ),
+    }
+
+
+def encode_cursor(history: TradingHistories) -> str:
+    """페이지 마지막 거래내역의 (trade_time, id)를 불투명한 커서 문자열로 변환"""
+    raw = json.dumps({"t": history.trade_time.isoformat(), "id": history.id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """커서 문자열을 (trade_time, id)로 변환. 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), int(data["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("잘못된 페이지 커서입니다") from e
+
 
 class TradingHistoriesService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._trading_repository = None
-        self._coin_repository = None
+        self._coin_catalog = None
         self._exchange_credentials_service = None
         self._upbit_service = None
+        self._trading_profit_service = None
 
     @property
     def trading_repository(self):
@@ -29,12 +81,12 @@ class TradingHistoriesService:
         return self._trading_repository
 
     @property
-    def coin_repository(self):
-        if self._coin_repository is None:
-            from dependencies import get_coin_repository
+    def coin_catalog(self):
+        if self._coin_catalog is None:
+            from dependencies import get_coin_catalog
 
-            self._coin_repository = get_coin_repository()
-        return self._coin_repository
+            self._coin_catalog = get_coin_catalog()
+        return self._coin_catalog
 
     @property
     def exchange_credentials_service(self):
@@ -52,6 +104,14 @@ class TradingHistoriesService:
             self._upbit_service = get_upbit_service()
         return self._upbit_service
 
+    @property
+    def trading_profit_service(self):
+        if self._trading_profit_service is None:
+            from dependencies import get_trading_profit_service
+
+            self._trading_profit_service = get_trading_profit_service()
+        return self._trading_profit_service
+
     def get_trading_histories(
         self,
         user_id: str,
@@ -87,15 +147,14 @@ class TradingHistoriesService:
         user_id: str,
         exchange_provider: str,
         trading_histies: List[Dict[str, Any]],
+        coin_map: Optional[Mapping[str, int]] = None,
     ):
         try:
-            from dependencies import get_coin_repository
             from dto.exchange_credentials_dto import ExchangeProvider
 
-            coin_repository = get_coin_repository()
-            coins = coin_repository.get_all_coins()
-
-            coin_map = {str(coin.market_code): coin.id for coin in coins}
+            # 페이지 단위로 반복 호출하는 경우 coin_map을 넘겨 동기화 중 같은 코인 목록을 사용
+            if coin_map is None:
+                coin_map = self.coin_catalog.market_code_map()
 
             # exchange_provider를 숫자로 변환
             exchange_code = ExchangeProvider[exchange_provider.upper()].value
@@ -145,6 +204,115 @@ class TradingHistoriesService:
         except Exception as e:
             raise e
 
+    def iter_sync_trading_histories(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        start_time: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        거래내역 스트리밍 동기화 (조회 → 변환 → 일괄 저장 → 증분 수익률)
+
+        조회 구간(페이지)마다 바로 변환·저장하고 수익률을 이어서 계산하므로
+        메모리 사용량이 페이지 크기로 제한되고, 중간에 실패해도 이미 처리한 페이지는 남습니다.
+        같은 구간을 다시 동기화해도 trade_uuid 기준으로 중복 저장되지 않습니다.
+
+        Yields:
+            페이지 처리 후 누적 진행 상황
+            {"windows_scanned", "window_count", "orders_fetched", "rows_saved", "profit_updated"}
+        """
+        from dto.exchange_credentials_dto import ExchangeProvider
+
+        provider = ExchangeProvider[exchange_provider.upper()]
+        credentials = self.exchange_credentials_service.get_credentials(
+            user_id, provider
+        )
+        if credentials is None:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        exchange_code = provider.value
+        coin_map = self.coin_catalog.market_code_map()
+
+        # 평단 없이 거래내역만 있는 경우 증분 계산이 불가하므로 마지막에 전체 재계산
+        incremental = self.trading_profit_service.can_apply_incrementally(
+            user_id, exchange_code
+        )
+
+        progress = {
+            "windows_scanned": 0,
+            "window_count": 0,
+            "orders_fetched": 0,
+            "rows_saved": 0,
+            "profit_updated": 0,
+        }
+
+        pages = self.upbit_service.iter_trading_history_pages(
+            credentials.access_key, credentials.secret_key, start_time
+        )
+        for page in pages:
+            orders = page["orders"]
+            trading_histories = self.process_trading_histories(
+                user_id, exchange_provider, orders, coin_map
+            )
+            # 페이지 저장과 수익률·평단 반영을 한 트랜잭션으로 처리 (중간 실패 시 페이지 단위로 롤백)
+            with db.session_scope() as session:
+                saved_histories = self.trading_repository.bulk_insert_trading_histories(
+                    trading_histories, session=session
+                )
+
+                if incremental and saved_histories:
+                    profit_result = (
+                        self.trading_profit_service.apply_incremental_profit_loss(
+                            user_id, exchange_code, saved_histories, session=session
+                        )
+                    )
+                    progress["profit_updated"] += profit_result["updated_count"]
+
+            progress["windows_scanned"] = page["window_index"] + 1
+            progress["window_count"] = page["window_count"]
+            progress["orders_fetched"] += len(orders)
+            progress["rows_saved"] += len(saved_histories)
+            yield dict(progress)
+
+        if not incremental and progress["rows_saved"] > 0:
+            profit_result = self.trading_profit_service.calculate_and_update_profit_loss(
+                user_id, exchange_code
+            )
+            progress["profit_updated"] = profit_result["updated_count"]
+            yield dict(progress)
+
+    def sync_trading_histories(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        start_time: Optional[datetime] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        거래내역 스트리밍 동기화를 끝까지 실행하고 최종 진행 상황 반환
+
+        Args:
+            on_progress: 페이지마다 누적 진행 상황을 받는 콜백
+        """
+        progress = {
+            "windows_scanned": 0,
+            "window_count": 0,
+            "orders_fetched": 0,
+            "rows_saved": 0,
+            "profit_updated": 0,
+        }
+        for progress in self.iter_sync_trading_histories(
+            user_id, exchange_provider, start_time
+        ):
+            if on_progress is not None:
+                on_progress(progress)
+
+        self.logger.info(
+            f"거래내역 동기화 완료: user_id={user_id}, exchange={exchange_provider}, "
+            f"orders={progress['orders_fetched']}, saved={progress['rows_saved']}"
+        )
+        return progress
+
     def save_trading_histories(
         self, trading_histories: List[TradingHistories]
     ) -> List[TradingHistories]:
@@ -175,44 +343,14 @@ class TradingHistoriesService:
             raise e
 
     def get_all_trading_histories_by_user_formatted(self, user_id: str) -> dict:
-        """사용자의 모든 거래내역을 포맷된 형태로 조회"""
+        """사용자의 모든 거래내역을 포맷된 형태로 조회 (건수가 많으면 get_trading_histories_page 사용)"""
         try:
             histories = self.trading_repository.find_by_user_id(user_id)
 
             formatted_histories = []
             for history in histories:
                 try:
-                    # Decimal을 안전하게 float로 변환
-                    def safe_float(value):
-                        if value is None:
-                            return 0.0
-                        try:
-                            return float(str(value))
-                        except (ValueError, TypeError):
-                            return 0.0
-
-                    formatted_history = {
-                        "id": history.id,
-                        "coin_id": history.coin_id,
-                        "exchange_code": history.exchange_code,
-                        "trade_uuid": str(history.trade_uuid),
-                        "trade_type": history.trade_type,
-                        "price": safe_float(history.price),
-                        "quantity": safe_float(history.quantity),
-                        "total_price": safe_float(history.total_price),
-                        "fee": safe_float(history.fee),
-                        "trade_time": (
-                            history.trade_time.isoformat()
-                            if history.trade_time is not None
-                            else None
-                        ),
-                        "created_at": (
-                            history.created_at.isoformat()
-                            if history.created_at is not None
-                            else None
-                        ),
-                    }
-                    formatted_histories.append(formatted_history)
+                    formatted_histories.append(format_trading_history(history))
                 except Exception as e:
                     self.logger.warning(
                         f"거래내역 포맷 중 오류 발생 (ID: {history.id}): {e}"
@@ -228,3 +366,76 @@ class TradingHistoriesService:
             }
         except Exception as e:
             raise e
+
+    def get_trading_histories_page(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        coin_id: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        사용자 거래내역 한 페이지 조회 (최신순, 키셋 페이지네이션)
+
+        Args:
+            limit: 페이지 크기 (1 ~ MAX_PAGE_SIZE)
+            cursor: 직전 응답의 next_cursor. 없으면 첫 페이지
+            coin_id / exchange_code / start_time / end_time: 선택 필터 (trade_time은 [start_time, end_time))
+
+        Returns:
+            {"trading_histories": [...], "next_cursor": str | None, "has_more": bool}
+
+        Raises:
+            ValueError: 커서 형식이 잘못되었거나 limit이 범위를 벗어남
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit은 1 ~ {MAX_PAGE_SIZE} 사이여야 합니다")
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+
+        # 한 건 더 조회해서 다음 페이지 여부 판단 (COUNT 쿼리 없음)
+        rows = self.trading_repository.find_page_by_user(
+            user_id,
+            limit + 1,
+            cursor=decoded_cursor,
+            coin_id=coin_id,
+            exchange_code=exchange_code,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        return {
+            "trading_histories": [format_trading_history(history) for history in rows],
+            "next_cursor": encode_cursor(rows[-1]) if has_more else None,
+            "has_more": has_more,
+        }
+
+    def iter_trading_histories_ndjson(
+        self,
+        user_id: str,
+        coin_id: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Iterator[str]:
+        """
+        사용자 거래내역 전체를 NDJSON(한 줄에 거래내역 1건) 문자열로 스트리밍 (내보내기용)
+
+        DB 서버 측 커서에서 배치 단위로 읽어 바로 내보내므로 전체를 메모리에 올리지 않습니다.
+        """
+        count = 0
+        for history in self.trading_repository.iter_by_user(
+            user_id,
+            coin_id=coin_id,
+            exchange_code=exchange_code,
+            start_time=start_time,
+            end_time=end_time,
+        ):
+            count += 1
+            yield json.dumps(format_trading_history(history), ensure_ascii=False) + "\n"
+
+        self.logger.info(f"사용자 {user_id}의 거래내역 내보내기 완료: {count}개")
@@ -31,17 +31,7 @@ class TradingProfitCalculator:
 
             # 보유량 추적 딕셔너리: {coin_id: [avg_buy_price, quantity]}
             holdings: Dict[int, List[Decimal]] = {}
-
-            for history in sorted_histories:
-                coin_id = history.coin_id
-                trade_type = history.trade_type
-                price = Decimal(str(history.price))
-                quantity = Decimal(str(history.quantity))
-
-                if trade_type == 0:  # 매수
-                    self._process_buy(holdings, coin_id, price, quantity, history)
-                elif trade_type == 1:  # 매도
-                    self._process_sell(holdings, coin_id, price, quantity, history)
+            self.apply_trades(holdings, sorted_histories)
 
             self.logger.info(
                 f"수익률 계산 완료: 총 {len(sorted_histories)}개 거래 내역 처리"
@@ -52,6 +42,34 @@ class TradingProfitCalculator:
             self.logger.error(f"수익률 계산 중 에러 발생: {e}")
             raise e
 
+    def apply_trades(
+        self,
+        holdings: Dict[int, List[Decimal]],
+        trading_histories: List[TradingHistories],
+    ) -> List[TradingHistories]:
+        """
+        보유량 위에 거래 내역을 주어진 순서대로 반영합니다.
+
+        Args:
+            holdings: {coin_id: [avg_buy_price, quantity]} (제자리에서 갱신)
+            trading_histories: trade_time 순으로 정렬된 거래 내역 리스트 (과거부터 현재 순)
+
+        Returns:
+            profit_loss_rate와 avg_buy_price가 계산된 거래 내역 리스트
+        """
+        for history in trading_histories:
+            coin_id = history.coin_id
+            trade_type = history.trade_type
+            price = Decimal(str(history.price))
+            quantity = Decimal(str(history.quantity))
+
+            if trade_type == 0:  # 매수
+                self._process_buy(holdings, coin_id, price, quantity, history)
+            elif trade_type == 1:  # 매도
+                self._process_sell(holdings, coin_id, price, quantity, history)
+
+        return trading_histories
+
     def _process_buy(
         self,
         holdings: Dict[int, List[Decimal]],
@@ -7,8 +7,8 @@ from model.CoinHoldingsPast import CoinHoldingsPast
 from service.trading_profit_calculator import TradingProfitCalculator
 from repository.trading_histories_repository import TradingHistoriesRepository
 from repository.coin_holdings_past_repository import CoinHoldingsPastRepository
-from repository.coin_repository import CoinRepository
 from dto.exchange_credentials_dto import ExchangeProvider
+from database.database_connection import db
 
 
 class TradingProfitService:
@@ -19,7 +19,7 @@ class TradingProfitService:
         self._trading_profit_calculator = None
         self._trading_histories_repository = None
         self._coin_holdings_past_repository = None
-        self._coin_repository = None
+        self._coin_catalog = None
 
     @property
     def trading_profit_calculator(self):
@@ -40,13 +40,15 @@ class TradingProfitService:
         return self._coin_holdings_past_repository
 
     @property
-    def coin_repository(self):
-        if self._coin_repository is None:
-            self._coin_repository = CoinRepository()
-        return self._coin_repository
+    def coin_catalog(self):
+        if self._coin_catalog is None:
+            from dependencies import get_coin_catalog
+
+            self._coin_catalog = get_coin_catalog()
+        return self._coin_catalog
 
     def calculate_and_update_profit_loss(
-        self, user_id: str, exchange_code: int, is_initial: bool = False
+        self, user_id: str, exchange_code: int, is_initial: bool = False, session=None
     ) -> Dict[str, Any]:
         """
         거래 내역 수익률 계산 및 업데이트, 보유 종목 평단 저장
@@ -54,7 +56,8 @@ class TradingProfitService:
         Args:
             user_id: 사용자 UUID
             exchange_code: 거래소 코드
-            is_initial: 최초 fetch 여부 (True: 최초, False: 이후 업데이트)
+            is_initial: 최초 fetch 여부 (True: 기존 평단을 무시하고 전체 재계산, False: 평단 유무로 판단)
+            session: 참여할 작업 단위 세션 (없으면 조회부터 저장까지 새 트랜잭션 하나로 처리)
         
         Returns:
             {
@@ -64,93 +67,221 @@ class TradingProfitService:
             }
         """
         try:
-            # 1. 사용자의 거래 내역 조회 (trade_time 순으로 정렬)
-            trading_histories = (
-                self.trading_histories_repository.find_by_user_and_exchange(
-                    user_id, exchange_code
+            with db.session_scope(session) as s:
+                # 1. 사용자의 거래 내역 조회 (trade_time 순으로 정렬)
+                trading_histories = (
+                    self.trading_histories_repository.find_by_user_and_exchange(
+                        user_id, exchange_code, session=s
+                    )
                 )
-            )
 
-            if not trading_histories:
-                self.logger.warning(
-                    f"거래 내역이 없습니다: user_id={user_id}, exchange_code={exchange_code}"
+                if not trading_histories:
+                    self.logger.warning(
+                        f"거래 내역이 없습니다: user_id={user_id}, exchange_code={exchange_code}"
+                    )
+                    return {
+                        "updated_count": 0,
+                        "holdings_count": 0,
+                        "deleted_holdings_count": 0,
+                    }
+
+                # 2. 기존 보유 종목 평단 조회
+                holdings_dict = self.coin_holdings_past_repository.get_holdings_dict(
+                    user_id, exchange_code, session=s
                 )
-                return {
-                    "updated_count": 0,
-                    "holdings_count": 0,
-                    "deleted_holdings_count": 0,
-                }
 
-            # 2. 기존 보유 종목 평단 조회
-            holdings_dict = self.coin_holdings_past_repository.get_holdings_dict(
-                user_id, exchange_code
-            )
+                # 3. is_initial 재확인: coin_holdings_past에 데이터가 없으면 최초로 판단
+                # coin_holdings_past 테이블에 실제 데이터가 있는지 확인하는 것이 더 정확함
+                # is_initial=True로 호출하면 기존 평단을 무시하고 전체 거래 내역으로 다시 계산
+                if is_initial:
+                    self.logger.info(
+                        f"기존 평단을 무시하고 전체 재계산: user_id={user_id}, exchange_code={exchange_code}"
+                    )
+                elif not holdings_dict:
+                    is_initial = True
+                    self.logger.info(
+                        f"coin_holdings_past에 데이터가 없어 최초 계산으로 판단: user_id={user_id}, exchange_code={exchange_code}"
+                    )
+                else:
+                    is_initial = False
+                    self.logger.info(
+                        f"coin_holdings_past에 데이터가 있어 이후 업데이트로 판단: user_id={user_id}, exchange_code={exchange_code}, holdings_count={len(holdings_dict)}"
+                    )
 
-            # 3. is_initial 재확인: coin_holdings_past에 데이터가 없으면 최초로 판단
-            # coin_holdings_past 테이블에 실제 데이터가 있는지 확인하는 것이 더 정확함
-            if not holdings_dict:
-                is_initial = True
-                self.logger.info(
-                    f"coin_holdings_past에 데이터가 없어 최초 계산으로 판단: user_id={user_id}, exchange_code={exchange_code}"
+                # 4. 수익률 계산
+                # 최초가 아닌 경우, 기존 보유 종목 평단을 사용하여 계산
+                if not is_initial and holdings_dict:
+                    updated_histories = self._calculate_with_existing_holdings(
+                        trading_histories, holdings_dict
+                    )
+                else:
+                    # 최초인 경우, 전체 거래 내역을 순회하며 계산
+                    updated_histories = (
+                        self.trading_profit_calculator.calculate_profit_loss(
+                            trading_histories
+                        )
+                    )
+
+                # 5. 거래 내역 업데이트
+                updated_count = len(updated_histories)
+                self.trading_histories_repository.update_profit_loss(
+                    updated_histories, session=s
                 )
-            else:
-                is_initial = False
-                self.logger.info(
-                    f"coin_holdings_past에 데이터가 있어 이후 업데이트로 판단: user_id={user_id}, exchange_code={exchange_code}, holdings_count={len(holdings_dict)}"
+
+                # 6. 보유 종목 평단 계산 및 저장
+                final_holdings = self._calculate_final_holdings(
+                    updated_histories, session=s
                 )
+                holdings_count = len(final_holdings)
 
-            # 4. 수익률 계산
-            # 최초가 아닌 경우, 기존 보유 종목 평단을 사용하여 계산
-            if not is_initial and holdings_dict:
-                updated_histories = self._calculate_with_existing_holdings(
-                    trading_histories, holdings_dict
+                # 7. 보유 종목 평단 저장/업데이트
+                self.coin_holdings_past_repository.save_or_update_holdings(
+                    user_id, exchange_code, final_holdings, session=s
                 )
-            else:
-                # 최초인 경우, 전체 거래 내역을 순회하며 계산
-                updated_histories = (
-                    self.trading_profit_calculator.calculate_profit_loss(
-                        trading_histories
+
+                # 8. 보유 수량이 0인 종목 삭제
+                coin_ids_with_holdings = {
+                    coin_id
+                    for coin_id, data in final_holdings.items()
+                    if data["remaining_quantity"] > 0
+                }
+                deleted_count = (
+                    self.coin_holdings_past_repository.delete_holdings_not_in_list(
+                        user_id, exchange_code, coin_ids_with_holdings, session=s
                     )
                 )
 
-            # 5. 거래 내역 업데이트
-            updated_count = len(updated_histories)
-            self.trading_histories_repository.update_profit_loss(updated_histories)
+                self.logger.info(
+                    f"수익률 계산 및 업데이트 완료: user_id={user_id}, exchange_code={exchange_code}, "
+                    f"updated={updated_count}, holdings={holdings_count}, deleted={deleted_count}"
+                )
 
-            # 6. 보유 종목 평단 계산 및 저장
-            final_holdings = self._calculate_final_holdings(updated_histories)
-            holdings_count = len(final_holdings)
+                return {
+                    "updated_count": updated_count,
+                    "holdings_count": holdings_count,
+                    "deleted_holdings_count": deleted_count,
+                }
 
-            # 7. 보유 종목 평단 저장/업데이트
-            self.coin_holdings_past_repository.save_or_update_holdings(
-                user_id, exchange_code, final_holdings
-            )
+        except Exception as e:
+            self.logger.error(f"수익률 계산 및 업데이트 중 에러 발생: {e}")
+            raise e
+
+    def can_apply_incrementally(
+        self, user_id: str, exchange_code: int, session=None
+    ) -> bool:
+        """
+        새 거래내역만으로 수익률을 이어서 계산할 수 있는지 여부
 
-            # 8. 보유 수량이 0인 종목 삭제
-            coin_ids_with_holdings = {
-                coin_id
-                for coin_id, data in final_holdings.items()
-                if data["remaining_quantity"] > 0
+        보유 종목 평단이 저장되어 있거나, 아직 거래내역이 하나도 없으면 가능합니다.
+        거래내역은 있는데 평단이 없으면 전체 재계산이 필요합니다.
+        """
+        if self.coin_holdings_past_repository.get_holdings_dict(
+            user_id, exchange_code, session=session
+        ):
+            return True
+        return not self.trading_histories_repository.exists_by_user_and_exchange(
+            user_id, exchange_code, session=session
+        )
+
+    def apply_incremental_profit_loss(
+        self,
+        user_id: str,
+        exchange_code: int,
+        new_histories: List[TradingHistories],
+        session=None,
+    ) -> Dict[str, Any]:
+        """
+        새로 저장된 거래내역에만 수익률을 계산하고 보유 종목 평단을 이어서 갱신
+
+        스트리밍 동기화에서 페이지(과거 → 최신 순)마다 호출합니다.
+        new_histories는 id가 채워진 상태여야 합니다.
+        session을 넘기면 거래내역 저장과 같은 트랜잭션에서 반영됩니다.
+        새 거래내역 중 가장 이른 것이 이미 반영된 거래내역보다 늦지 않으면
+        시간 순서가 어긋나므로 전체 거래내역으로 다시 계산합니다.
+
+        Returns:
+            {
+                "updated_count": int,
+                "holdings_count": int,
+                "deleted_holdings_count": int
             }
-            deleted_count = (
-                self.coin_holdings_past_repository.delete_holdings_not_in_list(
-                    user_id, exchange_code, coin_ids_with_holdings
+        """
+        try:
+            if not new_histories:
+                return {
+                    "updated_count": 0,
+                    "holdings_count": 0,
+                    "deleted_holdings_count": 0,
+                }
+
+            with db.session_scope(session) as s:
+                # 이미 반영된 거래보다 과거(같은 시각 포함)의 거래가 새로 들어오면 이어서 계산할 수 없음
+                earliest_trade_time = min(history.trade_time for history in new_histories)
+                if self.trading_histories_repository.exists_trade_at_or_after(
+                    user_id,
+                    exchange_code,
+                    earliest_trade_time,
+                    exclude_ids=[history.id for history in new_histories],
+                    session=s,
+                ):
+                    self.logger.info(
+                        f"이미 반영된 거래보다 과거의 거래가 저장되어 전체 재계산: user_id={user_id}, exchange_code={exchange_code}"
+                    )
+                    return self.calculate_and_update_profit_loss(
+                        user_id, exchange_code, is_initial=True, session=s
+                    )
+
+                holdings_dict = self.coin_holdings_past_repository.get_holdings_dict(
+                    user_id, exchange_code, session=s
                 )
-            )
 
-            self.logger.info(
-                f"수익률 계산 및 업데이트 완료: user_id={user_id}, exchange_code={exchange_code}, "
-                f"updated={updated_count}, holdings={holdings_count}, deleted={deleted_count}"
-            )
+                # 기존 평단에서 시작해 새 거래내역만 과거 → 최신 순으로 반영
+                holdings: Dict[int, List[Decimal]] = {
+                    coin_id: [
+                        Decimal(str(data["avg_buy_price"])),
+                        Decimal(str(data["remaining_quantity"])),
+                    ]
+                    for coin_id, data in holdings_dict.items()
+                }
+                updated_histories = self.trading_profit_calculator.apply_trades(
+                    holdings, sorted(new_histories, key=lambda x: x.trade_time)
+                )
 
-            return {
-                "updated_count": updated_count,
-                "holdings_count": holdings_count,
-                "deleted_holdings_count": deleted_count,
-            }
+                updated_count = self.trading_histories_repository.bulk_update_profit_loss(
+                    updated_histories, session=s
+                )
+
+                coin_symbols = {
+                    coin_id: data["symbol"] for coin_id, data in holdings_dict.items()
+                }
+
+                final_holdings = {
+                    coin_id: {
+                        "symbol": coin_symbols.get(coin_id) or self.coin_catalog.symbol_of(coin_id),
+                        "avg_buy_price": avg_buy_price,
+                        "remaining_quantity": remaining_quantity,
+                    }
+                    for coin_id, (avg_buy_price, remaining_quantity) in holdings.items()
+                    if remaining_quantity > 0
+                }
+
+                self.coin_holdings_past_repository.save_or_update_holdings(
+                    user_id, exchange_code, final_holdings, session=s
+                )
+                deleted_count = (
+                    self.coin_holdings_past_repository.delete_holdings_not_in_list(
+                        user_id, exchange_code, set(final_holdings.keys()), session=s
+                    )
+                )
+
+                return {
+                    "updated_count": updated_count,
+                    "holdings_count": len(final_holdings),
+                    "deleted_holdings_count": deleted_count,
+                }
 
         except Exception as e:
-            self.logger.error(f"수익률 계산 및 업데이트 중 에러 발생: {e}")
+            self.logger.error(f"증분 수익률 계산 중 에러 발생: {e}")
             raise e
 
     def _calculate_with_existing_holdings(
@@ -183,29 +314,16 @@ class TradingProfitService:
                 ]
 
             # 새로운 거래 내역만 순회하며 계산
-            for history in sorted_histories:
-                coin_id = history.coin_id
-                trade_type = history.trade_type
-                price = Decimal(str(history.price))
-                quantity = Decimal(str(history.quantity))
-
-                if trade_type == 0:  # 매수
-                    self.trading_profit_calculator._process_buy(
-                        holdings, coin_id, price, quantity, history
-                    )
-                elif trade_type == 1:  # 매도
-                    self.trading_profit_calculator._process_sell(
-                        holdings, coin_id, price, quantity, history
-                    )
-
-            return sorted_histories
+            return self.trading_profit_calculator.apply_trades(
+                holdings, sorted_histories
+            )
 
         except Exception as e:
             self.logger.error(f"기존 보유 종목 평단을 사용한 수익률 계산 중 에러 발생: {e}")
             raise e
 
     def _calculate_final_holdings(
-        self, trading_histories: List[TradingHistories]
+        self, trading_histories: List[TradingHistories], session=None
     ) -> Dict[int, Dict]:
         """
         최종 보유 종목 평단 계산
@@ -226,30 +344,16 @@ class TradingProfitService:
             holdings: Dict[int, List[Decimal]] = {}
             # 코인 심볼 추적: {coin_id: symbol}
             coin_symbols: Dict[int, str] = {}
-            
-            # 모든 코인 정보 조회
-            coins = self.coin_repository.get_all_coins()
-            coin_map = {coin.id: coin.symbol for coin in coins}
 
             for history in sorted_histories:
-                coin_id = history.coin_id
-                trade_type = history.trade_type
-                price = Decimal(str(history.price))
-                quantity = Decimal(str(history.quantity))
-
                 # 코인 심볼 저장 (첫 거래에서)
-                if coin_id not in coin_symbols:
-                    coin_symbols[coin_id] = coin_map.get(coin_id, "UNKNOWN")
-
-                if trade_type == 0:  # 매수
-                    self.trading_profit_calculator._process_buy(
-                        holdings, coin_id, price, quantity, history
-                    )
-                elif trade_type == 1:  # 매도
-                    self.trading_profit_calculator._process_sell(
-                        holdings, coin_id, price, quantity, history
+                if history.coin_id not in coin_symbols:
+                    coin_symbols[history.coin_id] = self.coin_catalog.symbol_of(
+                        history.coin_id
                     )
 
+            self.trading_profit_calculator.apply_trades(holdings, sorted_histories)
+
             # 최종 보유 종목 딕셔너리 생성
             final_holdings = {}
             for coin_id, (avg_buy_price, remaining_quantity) in holdings.items():
@@ -4,9 +4,9 @@ import logging
 from utils.time_utils import get_all_trading_time_ranges, get_current_korea_time
 from datetime import datetime
 import pytz
-import time
 from utils.http_client import Http_client
-from typing import List, Dict, Any, Optional
+from utils.rate_limiter import get_upbit_static_rate_limiter
+from typing import List, Dict, Any, Iterator, Optional
 
 load_dotenv()
 
@@ -16,50 +16,68 @@ class UpbitService:
         self.upbit_http_client = UpbitHttpClient()
         self.logger = logging.getLogger(__name__)
 
+    def _resolve_first_time(self, start_time: Optional[datetime]) -> datetime:
+        """조회 시작 시각 결정 (None이면 업비트 서비스 시작 시점, 타임존이 없으면 한국 시간)"""
+        if start_time is None:
+            return datetime(2017, 11, 1, tzinfo=pytz.timezone("Asia/Seoul"))
+        if start_time.tzinfo is None:
+            return pytz.timezone("Asia/Seoul").localize(start_time)
+        return start_time
+
+    def _fetch_closed_order_uuids(
+        self, access_key: str, secret_key: str, range_start: str, range_end: str
+    ) -> List[str]:
+        """한 조회 구간의 체결(일부 체결 포함)된 주문 uuid 목록"""
+        params = {
+            "states[]": ["done", "cancel"],
+            "start_time": range_start,
+            "end_time": range_end,
+            "limit": 1000,
+        }
+
+        response = self.upbit_http_client.get(
+            "/v1/orders/closed", access_key, secret_key, params, True
+        )
+
+        if response is None:
+            return []
+
+        uuids = []
+        for r in response:
+            if isinstance(r, dict) and r.get("executed_volume") == "0":
+                continue
+
+            if isinstance(r, dict) and r.get("uuid"):
+                uuids.append(r.get("uuid"))
+        return uuids
+
+    def _fetch_order_detail(
+        self, access_key: str, secret_key: str, uuid: str
+    ) -> Optional[Dict[str, Any]]:
+        """주문 1건 상세 (체결 목록 trades 포함)"""
+        params = {"uuid": uuid}
+        return self.upbit_http_client.get(
+            "/v1/order", access_key, secret_key, params, True
+        )
+
     def fetch_all_trading_uuids(
         self, access_key: str, secret_key: str, start_time: Optional[datetime] = None
     ):
         try:
-            # start_time이 None이면 기본값 사용
-            if start_time is None:
-                first_time = datetime(2017, 11, 1, tzinfo=pytz.timezone("Asia/Seoul"))
-            else:
-                # start_time이 타임존 정보가 없으면 한국 시간으로 설정
-                if start_time.tzinfo is None:
-                    first_time = pytz.timezone("Asia/Seoul").localize(start_time)
-                else:
-                    first_time = start_time
-
+            first_time = self._resolve_first_time(start_time)
             current_time = get_current_korea_time()
             time_ranges = get_all_trading_time_ranges(first_time, current_time)
 
             all_uuids = []
 
-            for i, (range_start, range_end) in enumerate(time_ranges):
-                params = {
-                    "states[]": ["done", "cancel"],
-                    "start_time": range_start,
-                    "end_time": range_end,
-                    "limit": 1000,
-                }
-
-                response = self.upbit_http_client.get(
-                    "/v1/orders/closed", access_key, secret_key, params, True
+            # 요청 속도는 UpbitHttpClient의 access key별 토큰 버킷이 제한
+            for range_start, range_end in time_ranges:
+                all_uuids.extend(
+                    self._fetch_closed_order_uuids(
+                        access_key, secret_key, range_start, range_end
+                    )
                 )
 
-                if response is None:
-                    continue
-
-                for r in response:
-                    if isinstance(r, dict) and r.get("executed_volume") == "0":
-                        continue
-
-                    if isinstance(r, dict) and r.get("uuid"):
-                        all_uuids.append(r.get("uuid"))
-
-                if (i + 1) % 25 == 0:
-                    time.sleep(1)
-
             return all_uuids
         except Exception as e:
             raise e
@@ -68,15 +86,9 @@ class UpbitService:
         try:
             trading_histories = []
 
-            time.sleep(1)
-            for i, uuid in enumerate(uuids):
-                if (i + 1) % 25 == 0:
-                    time.sleep(1)
-
-                params = {"uuid": uuid}
-                response = self.upbit_http_client.get(
-                    "/v1/order", access_key, secret_key, params, True
-                )
+            # 요청 속도는 UpbitHttpClient의 access key별 토큰 버킷이 제한
+            for uuid in uuids:
+                response = self._fetch_order_detail(access_key, secret_key, uuid)
 
                 if response is None:
                     continue
@@ -88,6 +100,45 @@ class UpbitService:
         except Exception as e:
             raise e
 
+    def iter_trading_history_pages(
+        self, access_key: str, secret_key: str, start_time: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        거래내역을 조회 구간(최대 7일) 단위 페이지로 순차 반환 (과거 → 최신)
+
+        전체 내역을 메모리에 모으지 않고, 구간마다 주문 상세를 조회해 바로 넘겨줍니다.
+        주문이 없는 구간도 진행 상황 집계를 위해 빈 orders로 반환합니다.
+
+        Returns:
+            {"window_index", "window_count", "range_start", "range_end", "orders"} 페이지 이터레이터
+        """
+        first_time = self._resolve_first_time(start_time)
+        current_time = get_current_korea_time()
+        time_ranges = get_all_trading_time_ranges(first_time, current_time)
+
+        # 요청 속도는 UpbitHttpClient의 access key별 토큰 버킷이 제한
+        for i, (range_start, range_end) in enumerate(time_ranges):
+            uuids = self._fetch_closed_order_uuids(
+                access_key, secret_key, range_start, range_end
+            )
+
+            orders = []
+            for uuid in uuids:
+                response = self._fetch_order_detail(access_key, secret_key, uuid)
+
+                if response is None:
+                    continue
+
+                orders.append(response)
+
+            yield {
+                "window_index": i,
+                "window_count": len(time_ranges),
+                "range_start": range_start,
+                "range_end": range_end,
+                "orders": orders,
+            }
+
     def fetch_all_coin_list(self) -> Any:
         try:
             base_url = "https://crix-static.upbit.com/crix_master"
@@ -123,9 +174,9 @@ class UpbitService:
     def download_image(self, coin_list: List[Dict[Any, Any]], url: str, save_path: str):
         try:
             client = Http_client(url)
-            for i, r in enumerate(coin_list):
-                if i % 5 == 0:
-                    time.sleep(1)
+            for r in coin_list:
+                # 정적 파일 서버는 Exchange API와 별도의 토큰 버킷으로 속도 제한
+                get_upbit_static_rate_limiter().acquire()
 
                 symbol = r.get("baseCurrencyCode")
                 url = f"https://static.upbit.com/logos/{symbol}.png"
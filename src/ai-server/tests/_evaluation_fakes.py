@@ -0,0 +1,88 @@
+"""매매 평가 테스트 공용 가짜 전문가·메타 에이전트 응답과 TradeEvaluationAgentService 생성."""
+
+import asyncio
+from typing import Dict, Union
+from unittest.mock import AsyncMock, Mock
+
+from service.expert_response_store import ExpertRequest
+from service.trade_evaluation_agent_service import (
+    ArticleExpertResponse,
+    CoinPriceExpertResponse,
+    FearGreedExpertResponse,
+    TradeEvaluationAgentService,
+    TradeEvaluationExpertResponse,
+)
+
+
+class RateLimitError(Exception):
+    """openai.RateLimitError와 같은 이름 (재시도 대상 판별용)"""
+
+
+def expert_response(model):
+    return model(
+        verdict="보통",
+        market_flow_analysis="흐름",
+        short_long_term_perspective="관점",
+        notable_periods=[],
+    )
+
+
+def meta_response(text: str) -> TradeEvaluationExpertResponse:
+    return TradeEvaluationExpertResponse.model_validate(
+        {name: text for name in TradeEvaluationExpertResponse.model_fields}
+    )
+
+
+def agent_service(name: str, model, delay_sec: float = 0.0, period_data: str = "data"):
+    """
+    가짜 전문가 에이전트 서비스
+
+    요청의 input_data는 service.period_data를 읽으므로 테스트 중에 바꿔 시장 데이터 변경을 흉내낼 수 있습니다.
+    """
+    service = Mock()
+
+    async def abuild_request(target_date, **kwargs):
+        return ExpertRequest(
+            agent=name,
+            prompt_version="v1",
+            model="gpt-4.1",
+            target_date=target_date,
+            input_data=service.period_data,
+            coin_id=kwargs.get("coin_id"),
+        )
+
+    async def arun_request(request):
+        if delay_sec:
+            await asyncio.sleep(delay_sec)
+        return expert_response(model)
+
+    service.period_data = period_data
+    service.abuild_request = AsyncMock(side_effect=abuild_request)
+    service.arun_request = AsyncMock(side_effect=arun_request)
+    return service
+
+
+def evaluation_service(
+    trading_repo,
+    diary_repo,
+    result_repo,
+    delay_sec: Union[float, Dict[str, float]] = 0.0,
+) -> TradeEvaluationAgentService:
+    """
+    가짜 전문가 세 명으로 TradeEvaluationAgentService 생성
+
+    Args:
+        delay_sec: 전문가 응답 지연(초). {"article": 0.1, ...}처럼 전문가별로 줄 수도 있음
+    """
+
+    def delay(name: str) -> float:
+        return delay_sec.get(name, 0.0) if isinstance(delay_sec, dict) else delay_sec
+
+    return TradeEvaluationAgentService(
+        agent_service("article", ArticleExpertResponse, delay("article")),
+        agent_service("coin_price", CoinPriceExpertResponse, delay("coin_price")),
+        agent_service("fear_greed", FearGreedExpertResponse, delay("fear_greed")),
+        trading_repo,
+        diary_repo,
+        result_repo,
+    )
@@ -0,0 +1,147 @@
+import asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.dialects import postgresql
+
+import model.Assets  # noqa: F401
+import model.CoinHoldingsPast  # noqa: F401
+import model.CoinPricesDay  # noqa: F401
+import model.Coins  # noqa: F401
+import model.ExchangeCredentials  # noqa: F401
+import model.TradingHistories  # noqa: F401
+import model.Users  # noqa: F401
+from repository.article_repository import ArticleRepository
+from repository.coin_price_day_repository import CoinPriceDayRepository
+from repository.fear_greed_index_repository import FearGreedIndexRepository
+from repository.trade_evaluation_result_repository import (
+    TradeEvaluationResultRepository,
+)
+
+
+def _session(result):
+    session = Mock()
+    session.execute = AsyncMock(return_value=result)
+    session.flush = AsyncMock()
+    session.refresh = AsyncMock()
+    return session
+
+
+def _sql(session) -> str:
+    stmt = session.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestAsyncRepositories:
+    """AsyncSession용 저장소 메서드 테스트"""
+
+    def test_article_filters_by_publisher_and_orders_latest_first(self):
+        """기사 조회는 기간·언론사 조건과 최신순 정렬을 사용"""
+        # Given
+        result = Mock()
+        result.all.return_value = ["article"]
+        session = _session(result)
+
+        # When
+        articles = asyncio.run(
+            ArticleRepository().find_by_published_at_between_async(
+                session, datetime(2024, 1, 1), datetime(2024, 1, 8), publisher_type=1
+            )
+        )
+
+        # Then
+        assert articles == ["article"]
+        sql = _sql(session)
+        assert "articles.publisher_type" in sql
+        assert "ORDER BY articles.published_at DESC" in sql
+        assert "articles.summary" not in sql
+
+    def test_fear_greed_returns_date_value_tuples(self):
+        """공포/탐욕 지수는 (date, value) 목록으로 반환"""
+        # Given
+        row = Mock(date=date(2024, 1, 1), value=55)
+        result = Mock()
+        result.all.return_value = [row]
+        session = _session(result)
+
+        # When
+        rows = asyncio.run(
+            FearGreedIndexRepository().find_by_date_range_async(
+                session, date(2024, 1, 1), date(2024, 1, 31)
+            )
+        )
+
+        # Then
+        assert rows == [(date(2024, 1, 1), 55)]
+
+    def test_coin_price_day_selects_only_candle_columns_as_float(self):
+        """일봉 조회는 필요한 칼럼만 float8로 변환해 조회"""
+        # Given
+        result = Mock()
+        result.all.return_value = []
+        session = _session(result)
+
+        # When
+        asyncio.run(
+            CoinPriceDayRepository().find_by_coin_id_and_date_range_async(
+                session, 1, datetime(2024, 1, 1), datetime(2024, 2, 1)
+            )
+        )
+
+        # Then
+        sql = _sql(session)
+        assert "CAST(coin_prices_day.trade_price AS FLOAT)" in sql
+        assert "candle_acc_trade_volume" not in sql
+        assert "ORDER BY coin_prices_day.candle_date_time_utc ASC" in sql
+
+    def test_save_async_updates_existing_row(self):
+        """이미 평가 결과가 있으면 INSERT 없이 갱신"""
+        # Given
+        existing = Mock()
+        result = Mock()
+        result.scalars.return_value.first.return_value = existing
+        session = _session(result)
+
+        # When
+        row = asyncio.run(
+            TradeEvaluationResultRepository().save_async(
+                session,
+                user_id="a24c7d05-119e-4a8e-99f4-160e29434d0a",
+                trade_id=1,
+                target_date="2024-01-03",
+                coin_id=2,
+                result_dict={"score": 1},
+            )
+        )
+
+        # Then
+        assert row is existing
+        assert existing.target_date == date(2024, 1, 3)
+        assert existing.result == {"score": 1}
+        assert str(existing.created_at.compile(dialect=postgresql.dialect())) == "now()"
+        session.add.assert_not_called()
+        session.flush.assert_awaited_once()
+
+    def test_save_bumps_created_at_on_update(self):
+        """save(동기)도 다시 평가한 결과는 created_at을 현재 시각으로 갱신"""
+        # Given
+        existing = Mock()
+        session = Mock()
+        session.query.return_value.filter.return_value.first.return_value = existing
+
+        # When
+        row = TradeEvaluationResultRepository().save(
+            session,
+            user_id="a24c7d05-119e-4a8e-99f4-160e29434d0a",
+            trade_id=1,
+            target_date="2024-01-03",
+            coin_id=2,
+            result_dict={"score": 1},
+        )
+
+        # Then
+        assert row is existing
+        assert existing.result == {"score": 1}
+        assert str(existing.created_at.compile(dialect=postgresql.dialect())) == "now()"
+        session.add.assert_not_called()
+        session.flush.assert_called_once()
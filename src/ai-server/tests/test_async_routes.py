@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+
+from dependencies import get_fear_greed_agent_service
+from main import app
+
+BLOCKING_SEC = 0.5
+
+
+class _SlowFearGreedService:
+    """LLM 호출처럼 스레드를 BLOCKING_SEC 동안 붙잡는 서비스"""
+
+    def __init__(self):
+        self.threads = set()
+
+    def run_fear_greed(self, target_date, months_before):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(BLOCKING_SEC)
+        response = Mock()
+        response.model_dump.return_value = {"target_date": target_date}
+        return response
+
+
+class TestAsyncRoutes:
+    """async 라우트가 블로킹 작업 중에도 이벤트 루프를 막지 않는지 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 느린 서비스로 의존성 교체"""
+        self.service = _SlowFearGreedService()
+        app.dependency_overrides[get_fear_greed_agent_service] = lambda: self.service
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+
+    def test_concurrent_requests_run_in_parallel(self):
+        """블로킹 분석 요청 4건이 동시에 처리되고, 그동안 헬스 체크가 바로 응답"""
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                started = time.perf_counter()
+                analyses = [
+                    asyncio.create_task(
+                        client.post(
+                            "/api/fear-greed/analyze",
+                            json={"target_date": "2024-01-0" + str(i + 1)},
+                        )
+                    )
+                    for i in range(4)
+                ]
+                await asyncio.sleep(0.05)
+
+                health_started = time.perf_counter()
+                health = await client.get("/health")
+                health_elapsed = time.perf_counter() - health_started
+
+                responses = await asyncio.gather(*analyses)
+                return responses, health, health_elapsed, time.perf_counter() - started
+
+        # When
+        responses, health, health_elapsed, elapsed = asyncio.run(run())
+
+        # Then
+        assert [r.status_code for r in responses] == [200] * 4
+        assert health.status_code == 200
+        assert health_elapsed < BLOCKING_SEC / 2
+        # 순차 처리라면 4 * BLOCKING_SEC
+        assert elapsed < BLOCKING_SEC * 2
+        assert len(self.service.threads) == 4
+        assert all(name.startswith("blocking") for name in self.service.threads)
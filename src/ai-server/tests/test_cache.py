@@ -0,0 +1,209 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from database import invalidation
+from utils.cache import InMemoryBackend, LocalLRU, TieredCache, MISSING
+
+
+def _cache(l2=None, **options) -> TieredCache:
+    options.setdefault("l1_max_entries", 100)
+    options.setdefault("l1_max_bytes", 1024 * 1024)
+    return TieredCache("test", l2=l2, key_prefix="t", **options)
+
+
+class TestLocalLRU:
+    """LocalLRU 테스트"""
+
+    def test_evicts_least_recently_used_by_size(self):
+        """크기 합을 넘으면 오래 안 쓴 항목부터 제거"""
+        # Given
+        lru = LocalLRU(max_entries=10, max_bytes=100)
+        lru.set("a", "A", 40, 60)
+        lru.set("b", "B", 40, 60)
+        lru.get("a")
+
+        # When
+        evicted = lru.set("c", "C", 40, 60)
+
+        # Then
+        assert evicted == 1
+        assert lru.get("b") is MISSING
+        assert lru.get("a") == "A" and lru.get("c") == "C"
+        assert lru.size_bytes == 80
+
+    def test_evicts_by_entry_count_and_skips_oversized(self):
+        """항목 수 제한, max_bytes보다 큰 항목은 저장하지 않음"""
+        # Given
+        lru = LocalLRU(max_entries=2, max_bytes=100)
+
+        # When
+        for key in ("a", "b", "c"):
+            lru.set(key, key, 1, 60)
+        lru.set("huge", "x", 101, 60)
+
+        # Then
+        assert len(lru) == 2
+        assert lru.get("a") is MISSING
+        assert lru.get("huge") is MISSING
+
+    def test_expired_entry_removed(self):
+        """TTL이 지난 항목은 미스"""
+        # Given
+        lru = LocalLRU(max_entries=10, max_bytes=100)
+        with patch("utils.cache.time.monotonic", return_value=100.0):
+            lru.set("a", "A", 10, 5)
+
+        # When / Then
+        with patch("utils.cache.time.monotonic", return_value=104.0):
+            assert lru.get("a") == "A"
+        with patch("utils.cache.time.monotonic", return_value=105.0):
+            assert lru.get("a") is MISSING
+        assert lru.size_bytes == 0
+
+
+class TestTieredCache:
+    """TieredCache 테스트"""
+
+    def test_workers_share_values_through_l2(self):
+        """다른 워커(캐시 인스턴스)가 저장한 값을 L2에서 읽고 L1에 올림"""
+        # Given
+        l2 = InMemoryBackend()
+        worker_a, worker_b = _cache(l2), _cache(l2)
+        worker_a.set(("expert", "2024-01-01"), {"score": 1})
+
+        # When
+        first = worker_b.get(("expert", "2024-01-01"))
+        second = worker_b.get(("expert", "2024-01-01"))
+
+        # Then
+        assert first == second == {"score": 1}
+        stats = worker_b.stats()
+        assert (stats["l2_hits"], stats["l1_hits"], stats["misses"]) == (1, 1, 0)
+        assert l2.get("t:test:expert:2024-01-01") is not None
+
+    def test_get_or_load_caches_none(self):
+        """loader 결과가 None이어도 저장해 다시 실행하지 않음"""
+        # Given
+        cache = _cache()
+        loader = Mock(return_value=None)
+
+        # When
+        results = [cache.get_or_load("k", loader) for _ in range(3)]
+
+        # Then
+        assert results == [None, None, None]
+        loader.assert_called_once()
+
+    def test_concurrent_misses_run_loader_once(self):
+        """같은 키를 동시에 요청해도 loader는 한 번만 실행"""
+        # Given
+        cache = _cache(InMemoryBackend())
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+            for _ in range(8)
+        ]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+        assert cache.stats()["lock_waits"] == 7
+
+    def test_waits_for_other_process_holding_l2_lock(self):
+        """다른 프로세스가 계산 중이면 L2에 저장될 때까지 기다렸다가 그 값을 사용"""
+        # Given
+        l2 = InMemoryBackend()
+        other, cache = _cache(l2), _cache(l2, lock_wait_sec=5)
+        assert l2.acquire_lock("t:test:k:lock", "other", 10)
+        threading.Timer(0.1, lambda: other.set("k", "from-other")).start()
+        loader = Mock(return_value="mine")
+
+        # When
+        value = cache.get_or_load("k", loader)
+
+        # Then
+        assert value == "from-other"
+        loader.assert_not_called()
+
+    def test_loader_failure_not_cached(self):
+        """loader 예외는 그대로 발생하고 저장하지 않음, 잠금도 해제"""
+        # Given
+        l2 = InMemoryBackend()
+        cache = _cache(l2)
+
+        # When
+        with pytest.raises(ValueError):
+            cache.get_or_load("k", Mock(side_effect=ValueError("llm down")))
+
+        # Then
+        assert cache.get_or_load("k", lambda: "ok") == "ok"
+        assert l2.get("t:test:k:lock") is None
+
+    def test_l2_errors_fall_back_to_l1(self):
+        """L2 오류는 미스로 처리하고 잠시 L2를 건너뜀"""
+        # Given
+        l2 = Mock()
+        l2.get.side_effect = ConnectionError("redis down")
+        l2.set.side_effect = ConnectionError("redis down")
+        cache = _cache(l2)
+
+        # When
+        value = cache.get_or_load("k", lambda: "value")
+        again = cache.get("k")
+
+        # Then
+        assert value == again == "value"
+        stats = cache.stats()
+        assert stats["l2_errors"] == 1
+        assert stats["l2_available"] is False
+        assert l2.get.call_count == 1
+
+    def test_clear_only_own_namespace(self):
+        """clear()는 자기 namespace의 L1/L2만 삭제"""
+        # Given
+        l2 = InMemoryBackend()
+        cache = _cache(l2)
+        other = TieredCache("other", l2=l2, key_prefix="t")
+        cache.set("k", 1)
+        other.set("k", 2)
+
+        # When
+        cache.clear()
+
+        # Then
+        assert cache.get("k") is None
+        assert other.get("k") == 2
+
+    def test_invalidation_notification_evicts(self, monkeypatch):
+        """무효화 알림을 받으면 해당 키(key 없으면 전체)를 비움"""
+        # Given
+        monkeypatch.setattr(invalidation, "_subscribers", invalidation.defaultdict(list))
+        cache = _cache(InMemoryBackend(), invalidation_name="fear_greed_index")
+        cache.set("2024-01-01", "a")
+        cache.set("2024-01-02", "b")
+
+        # When
+        invalidation.dispatch("fear_greed_index", "2024-01-01")
+
+        # Then
+        assert cache.get("2024-01-01") is None
+        assert cache.get("2024-01-02") == "b"
+
+        invalidation.dispatch("fear_greed_index", None)
+        assert cache.get("2024-01-02") is None
@@ -0,0 +1,207 @@
+"""
+캐시 무효화 버스 테스트.
+
+LISTEN/NOTIFY 검사는 TEST_DATABASE_URL(Postgres)이 있을 때만 실행합니다.
+"""
+
+import json
+import os
+import queue
+import uuid
+from datetime import date
+
+import psycopg2
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+import model.Article  # noqa: F401
+import model.Assets  # noqa: F401
+import model.CoinHoldingsPast  # noqa: F401
+import model.CoinPricesDay  # noqa: F401
+import model.Coins  # noqa: F401
+import model.Diary  # noqa: F401
+import model.ExchangeCredentials  # noqa: F401
+import model.FearGreedIndex  # noqa: F401
+import model.TradeEvaluationResult  # noqa: F401
+import model.TradingHistories  # noqa: F401
+import model.Users  # noqa: F401
+from database import invalidation
+from database.database_connection import db
+from database.invalidation import (
+    InvalidationListener,
+    decode_payload,
+    dispatch,
+    encode_payload,
+    publish_invalidation,
+    subscribe,
+    unsubscribe,
+)
+from database.migrate import run_migrations
+from database.replica import RoutingSession
+from model.CacheVersion import CACHE_COINS, CACHE_FEAR_GREED_INDEX
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+requires_db = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 없으면 LISTEN/NOTIFY 검사를 건너뜀"
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_subscribers(monkeypatch):
+    """테스트마다 빈 구독 목록 사용"""
+    monkeypatch.setattr(invalidation, "_subscribers", invalidation.defaultdict(list))
+
+
+class TestInvalidationPayload:
+    """무효화 알림 payload·dispatch 테스트"""
+
+    def test_round_trip(self):
+        """키 하나, 여러 키, 전체 무효화 payload"""
+        # When / Then
+        assert decode_payload(encode_payload("coins")[0]) == [("coins", None)]
+        assert decode_payload(encode_payload("assets", "u1")[0]) == [("assets", "u1")]
+        assert decode_payload(encode_payload("coin_prices_day", {2, 1})[0]) == [
+            ("coin_prices_day", "1"),
+            ("coin_prices_day", "2"),
+        ]
+        assert encode_payload("coin_prices_day", []) == []
+
+    def test_too_many_keys_becomes_full_invalidation(self):
+        """payload 크기 제한을 넘으면 전체 무효화로 보냄"""
+        # When
+        payloads = encode_payload("coin_prices_day", range(5000))
+
+        # Then
+        assert [json.loads(p) for p in payloads] == [{"name": "coin_prices_day", "key": None}]
+
+    def test_malformed_payload_ignored(self):
+        """형식이 다른 알림은 무시"""
+        assert decode_payload("not json") == []
+        assert decode_payload('{"key": "x"}') == []
+
+    def test_failing_callback_does_not_block_others(self):
+        """callback 하나가 실패해도 나머지는 호출"""
+        # Given
+        received = []
+
+        def broken(key):
+            raise RuntimeError("boom")
+
+        subscribe("coins", broken)
+        subscribe("coins", received.append)
+        subscribe("coins", received.append)  # 같은 callback은 한 번만 등록
+
+        # When
+        dispatch("coins", "k")
+        unsubscribe("coins", received.append)
+        dispatch("coins", "k2")
+
+        # Then
+        assert received == ["k"]
+
+
+@requires_db
+class TestInvalidationListener:
+    """LISTEN/NOTIFY 무효화 테스트"""
+
+    @pytest.fixture
+    def schema_engine(self, monkeypatch):
+        """임시 스키마에 테이블 생성 → 마이그레이션, 저장소 세션도 이 스키마 사용"""
+        schema = f"invalidation_{uuid.uuid4().hex[:8]}"
+        engine = create_engine(TEST_DATABASE_URL)
+
+        @event.listens_for(engine, "connect")
+        def _set_search_path(dbapi_connection, _):
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"SET search_path TO {schema}")
+            dbapi_connection.commit()
+
+        with engine.begin() as connection:
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+        monkeypatch.setattr(db, "SessionLocal", sessionmaker(class_=RoutingSession, bind=engine))
+        try:
+            db.Base.metadata.create_all(engine)
+            run_migrations(engine)
+            yield engine
+        finally:
+            engine.dispose()
+            with create_engine(TEST_DATABASE_URL).begin() as connection:
+                connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+    @pytest.fixture
+    def received(self):
+        """리스너를 띄우고 받은 (name, key)를 큐로 전달"""
+        messages = queue.Queue()
+        for name in (CACHE_COINS, CACHE_FEAR_GREED_INDEX):
+            subscribe(name, lambda key, name=name: messages.put((name, key)))
+        listener = InvalidationListener(
+            lambda: psycopg2.connect(TEST_DATABASE_URL), poll_interval_sec=0.05
+        )
+        listener.start()
+        # LISTEN이 등록될 때까지 자기 자신에게 보낸 알림으로 확인
+        while True:
+            publish_invalidation(CACHE_COINS, "ready")
+            try:
+                if messages.get(timeout=0.2) == (CACHE_COINS, "ready"):
+                    break
+            except queue.Empty:
+                continue
+        yield messages
+        listener.stop()
+
+    def test_delivered_on_commit_only(self, schema_engine, received):
+        """커밋된 트랜잭션의 알림만 전달"""
+        # When
+        with pytest.raises(RuntimeError):
+            with db.session_scope() as session:
+                publish_invalidation(CACHE_COINS, "rolled-back", session=session)
+                raise RuntimeError("rollback")
+        with db.session_scope() as session:
+            publish_invalidation(CACHE_COINS, "committed", session=session)
+
+        # Then
+        assert received.get(timeout=5) == (CACHE_COINS, "committed")
+        assert received.empty()
+
+    def test_external_writer_notifies_through_trigger(self, schema_engine, received):
+        """다른 서비스가 공포·탐욕 지수를 저장하면 트리거가 알림 (여러 행도 문장당 한 번)"""
+        # When
+        with schema_engine.begin() as connection:
+            connection.execute(
+                text("INSERT INTO fear_greed_indices (date, value) VALUES (:d1, 10), (:d2, 20)"),
+                {"d1": date(2024, 1, 1), "d2": date(2024, 1, 2)},
+            )
+
+        # Then
+        assert received.get(timeout=5) == (CACHE_FEAR_GREED_INDEX, None)
+        with pytest.raises(queue.Empty):
+            received.get(timeout=0.3)
+
+    def test_reconnect_invalidates_everything(self, schema_engine):
+        """연결이 끊겼다가 다시 붙으면 놓친 알림 대신 전체 무효화"""
+        # Given
+        messages = queue.Queue()
+        subscribe(CACHE_COINS, messages.put)
+        connections = []
+
+        def connect():
+            connection = psycopg2.connect(TEST_DATABASE_URL)
+            connections.append(connection)
+            return connection
+
+        listener = InvalidationListener(connect, poll_interval_sec=0.05, reconnect_delay_sec=0.05)
+        listener.start()
+        try:
+            # When: 서버 쪽에서 리스너 연결을 끊음
+            while not connections:
+                pass
+            pid = connections[0].get_backend_pid()
+            with schema_engine.begin() as connection:
+                connection.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+
+            # Then
+            assert messages.get(timeout=5) is None
+            assert listener.reconnects == 1
+        finally:
+            listener.stop()
@@ -0,0 +1,91 @@
+import asyncio
+import os
+
+import pytest
+from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import BaseModel
+
+import service.fear_greed_agent_service  # noqa: F401  (ai-agent 경로 추가)
+from laboratory.chain_cache import chain_cache_stats, clear_chains, get_chain
+
+
+class _Answer(BaseModel):
+    verdict: str
+
+
+_parser = PydanticOutputParser(pydantic_object=_Answer)
+
+
+@pytest.fixture
+def prompt_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY", "sk-test"))
+    clear_chains()
+    path = tmp_path / "expert.yaml"
+    path.write_text(
+        '_type: "prompt"\ntemplate: "{target_date}\\n{format_instructions}"\n'
+        "input_variables: [target_date]\n",
+        encoding="utf-8",
+    )
+    yield path
+    clear_chains()
+
+
+class TestChainCache:
+    """에이전트 체인 재사용 테스트"""
+
+    def test_same_chain_reused(self, prompt_file):
+        """같은 프롬프트·모델이면 체인을 다시 만들지 않음"""
+        # Given
+        before = chain_cache_stats()["builds"]
+
+        # When
+        first = get_chain(prompt_file, "gpt-4.1", _parser)
+        second = get_chain(prompt_file, "gpt-4.1", _parser)
+
+        # Then
+        assert first is second
+        assert chain_cache_stats()["builds"] == before + 1
+
+    def test_rebuilt_when_prompt_or_model_changes(self, prompt_file):
+        """프롬프트 파일이 바뀌거나 모델이 다르면 새 체인, 이전 버전은 버림"""
+        # Given
+        first = get_chain(prompt_file, "gpt-4.1", _parser)
+
+        # When
+        other_model = get_chain(prompt_file, "gpt-4.1-mini", _parser)
+        prompt_file.write_text(prompt_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        os.utime(prompt_file, ns=(0, os.stat(prompt_file).st_mtime_ns + 1_000_000))
+        edited = get_chain(prompt_file, "gpt-4.1", _parser)
+
+        # Then
+        assert other_model is not first
+        assert edited is not first
+        assert chain_cache_stats()["chains"] == 1
+
+    def test_chains_share_http_client(self, prompt_file):
+        """모든 체인이 같은 커넥션 풀(httpx 클라이언트)을 사용"""
+        # When
+        a = get_chain(prompt_file, "gpt-4.1", _parser)
+        b = get_chain(prompt_file, "gpt-4.1-mini", _parser)
+
+        # Then
+        llm_a, llm_b = a.steps[1], b.steps[1]
+        assert llm_a.http_client is llm_b.http_client
+        assert llm_a.http_async_client is llm_b.http_async_client
+
+    def test_async_client_per_event_loop(self, prompt_file):
+        """비동기 클라이언트는 이벤트 루프마다 따로, 닫힌 루프의 체인은 버림"""
+
+        # Given
+        async def build():
+            return get_chain(prompt_file, "gpt-4.1", _parser)
+
+        # When
+        first = asyncio.run(build())
+        second = asyncio.run(build())
+
+        # Then
+        assert first is not second
+        assert first.steps[1].http_async_client is not second.steps[1].http_async_client
+        assert first.steps[1].http_client is second.steps[1].http_client
+        assert chain_cache_stats()["chains"] == 1
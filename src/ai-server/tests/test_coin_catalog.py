@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from service.assets_service import AssetsService
+from service.coin_catalog import CoinCatalog
+
+
+def _coin(coin_id: int, symbol: str, quote_currency: str = "KRW", market_code: str = None):
+    return SimpleNamespace(
+        id=coin_id,
+        symbol=symbol,
+        quote_currency=quote_currency,
+        market_code=market_code or f"{symbol}/{quote_currency}",
+    )
+
+
+class TestCoinCatalog:
+    """CoinCatalog 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.coin_repository = Mock()
+        self.coin_repository.get_coin_refs.return_value = [
+            _coin(1, "BTC"),
+            _coin(2, "ETH"),
+            _coin(3, "XRP", market_code="KRW-XRP"),
+        ]
+        self.cache_version_repository = Mock()
+        self.cache_version_repository.get_version.return_value = 1
+        self.now = 1000.0
+        self.catalog = CoinCatalog(
+            self.coin_repository,
+            self.cache_version_repository,
+            ttl_sec=3600,
+            version_check_sec=10,
+        )
+
+    def _lookup(self):
+        with patch("service.coin_catalog.time.monotonic", return_value=self.now):
+            return self.catalog.find_coin_id("BTC", "KRW")
+
+    def test_lookup_by_each_key(self):
+        """id, market_code, (symbol, quote_currency)로 조회"""
+        # When / Then
+        assert self.catalog.get_by_id(2).symbol == "ETH"
+        assert self.catalog.get_by_market_code("KRW-XRP").id == 3
+        assert self.catalog.get_by_symbol("BTC", "KRW").id == 1
+        assert self.catalog.find_coin_id("BTC", "KRW") == 1
+        # market_code 형식이 달라도 symbol·quote_currency로 찾음
+        assert self.catalog.find_coin_id("XRP", "KRW") == 3
+        assert self.catalog.find_coin_id("DOGE", "KRW") is None
+        assert self.catalog.symbol_of(99) == "UNKNOWN"
+        assert self.catalog.market_code_map() == {"BTC/KRW": 1, "ETH/KRW": 2, "KRW-XRP": 3}
+
+    def test_loads_once_within_intervals(self):
+        """TTL·버전 확인 주기 안에서는 DB를 다시 조회하지 않음"""
+        # Given
+        self._lookup()
+
+        # When
+        for _ in range(100):
+            self.now += 0.05
+            self._lookup()
+
+        # Then
+        self.coin_repository.get_coin_refs.assert_called_once()
+        assert self.cache_version_repository.get_version.call_count == 1
+
+    def test_reloads_when_version_bumped(self):
+        """버전이 바뀌면 확인 주기가 지난 뒤 다시 로드"""
+        # Given
+        self._lookup()
+        self.coin_repository.get_coin_refs.return_value = [_coin(10, "BTC")]
+        self.cache_version_repository.get_version.return_value = 2
+
+        # When
+        self.now += 5
+        before_check = self._lookup()
+        self.now += 10
+        after_check = self._lookup()
+
+        # Then
+        assert before_check == 1
+        assert after_check == 10
+        assert self.catalog.loads == 2
+
+    def test_same_version_only_checks(self):
+        """버전이 같으면 확인만 하고 목록은 다시 읽지 않음"""
+        # Given
+        self._lookup()
+
+        # When
+        self.now += 60
+        self._lookup()
+
+        # Then
+        assert self.cache_version_repository.get_version.call_count == 2
+        self.coin_repository.get_coin_refs.assert_called_once()
+
+    def test_reloads_after_ttl_without_version(self):
+        """버전을 읽지 못해도 TTL이 지나면 다시 로드"""
+        # Given
+        self.cache_version_repository.get_version.side_effect = Exception("no table")
+        self._lookup()
+
+        # When
+        self.now += 3600
+        self._lookup()
+
+        # Then
+        assert self.coin_repository.get_coin_refs.call_count == 2
+
+    def test_keeps_previous_snapshot_when_reload_fails(self):
+        """다시 로드가 실패하면 이전 목록으로 계속 조회, 첫 로드 실패는 예외"""
+        # Given
+        self._lookup()
+        self.coin_repository.get_coin_refs.side_effect = Exception("db down")
+
+        # When
+        self.now += 3600
+        coin_id = self._lookup()
+
+        # Then
+        assert coin_id == 1
+        with pytest.raises(Exception, match="db down"):
+            CoinCatalog(self.coin_repository, self.cache_version_repository).get_by_id(1)
+
+
+class TestAssetsServiceCoinLookup:
+    """AssetsService coin_id 조회 테스트"""
+
+    def test_accounts_resolved_without_repository_calls(self):
+        """계정 잔고를 변환할 때 코인 목록은 카탈로그에서 한 번만 로드"""
+        # Given
+        coin_repository = Mock()
+        coin_repository.get_coin_refs.return_value = [_coin(1, "BTC"), _coin(2, "ETH")]
+        service = AssetsService()
+        service._coin_catalog = CoinCatalog(coin_repository, Mock(), ttl_sec=3600, version_check_sec=3600)
+        accounts = [
+            {"currency": "BTC", "unit_currency": "KRW", "balance": "1"},
+            {"currency": "ETH", "unit_currency": "KRW", "balance": "2"},
+            {"currency": "NEW", "unit_currency": "KRW", "balance": "3"},
+        ]
+
+        # When
+        assets = [service._convert_upbit_account_to_asset(account) for account in accounts]
+
+        # Then
+        assert [asset.coin_id for asset in assets] == [1, 2, None]
+        coin_repository.get_coin_refs.assert_called_once()
@@ -0,0 +1,137 @@
+import contextvars
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool, QueuePool
+
+from database import pool
+from database.database_connection import db
+
+
+class TestEngineOptions:
+    """환경변수 기반 풀 옵션 테스트"""
+
+    def test_pool_settings_from_env(self, monkeypatch):
+        """풀 크기·오버플로·recycle·pre_ping을 환경변수로 설정"""
+        # Given
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DB_POOL_RECYCLE", "300")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+        # When
+        options = pool.engine_options("test-env")
+
+        # Then
+        assert issubclass(options["poolclass"], QueuePool)
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 0
+        assert options["pool_recycle"] == 300
+        assert options["pool_pre_ping"] is False
+
+    def test_pgbouncer_mode_disables_pooling_and_statement_cache(self, monkeypatch):
+        """PgBouncer 모드는 NullPool, asyncpg는 prepared statement 캐시 비활성화"""
+        # Given
+        monkeypatch.setenv("DB_PGBOUNCER", "true")
+
+        # When
+        sync_options = pool.engine_options("test-sync")
+        async_options = pool.engine_options("test-async", is_async=True)
+
+        # Then
+        assert sync_options == {"poolclass": NullPool}
+        assert async_options["poolclass"] is NullPool
+        connect_args = async_options["connect_args"]
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+
+class TestPoolMetrics:
+    """커넥션 대기 지표 테스트"""
+
+    def test_wait_and_timeout_recorded(self, monkeypatch):
+        """커넥션 체크아웃과 대기 타임아웃이 지표에 기록됨"""
+        # Given: 커넥션 1개, 오버플로 없음
+        monkeypatch.setenv("DB_POOL_SIZE", "1")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        options = pool.engine_options("test-timed")
+        timed_pool = options["poolclass"](
+            creator=Mock,
+            pool_size=options["pool_size"],
+            max_overflow=options["max_overflow"],
+            timeout=0.05,
+        )
+        pool._pools["test-timed"] = timed_pool
+
+        # When
+        conn = timed_pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            timed_pool.connect()
+
+        # Then
+        data = pool.get_pool_metrics()["pools"]["test-timed"]
+        assert data["checked_out"] == 1
+        assert data["checkouts"] == 1
+        assert data["timeouts"] == 1
+        assert data["max_wait_ms"] >= 50
+
+        conn.close()
+        pool.unregister_pool("test-timed")
+
+    def test_async_checkouts_timed_per_context(self, monkeypatch):
+        """같은 스레드에서 다른 코루틴이 체크아웃 대기 중이어도 각 체크아웃을 기록"""
+        # Given: 다른 코루틴이 이벤트 루프 스레드에서 체크아웃을 측정하는 중
+        options = pool.engine_options("test-timed-async", is_async=True)
+        timed_pool = options["poolclass"](creator=Mock, pool_size=2, max_overflow=0)
+        pool._pools["test-timed-async"] = timed_pool
+        token = pool._timing.set(True)
+
+        # When: 다른 코루틴(컨텍스트)에서 체크아웃
+        try:
+            conn = contextvars.Context().run(timed_pool.connect)
+        finally:
+            pool._timing.reset(token)
+
+        # Then
+        data = pool.get_pool_metrics()["pools"]["test-timed-async"]
+        assert data["checkouts"] == 1
+
+        conn.close()
+        pool.unregister_pool("test-timed-async")
+
+
+class TestReleaseConnection:
+    """LLM 대기 전 커넥션 반납 테스트"""
+
+    def _session(self, pending=False):
+        session = Mock()
+        session.new = {"row"} if pending else set()
+        session.dirty = set()
+        session.deleted = set()
+        session.in_transaction.return_value = True
+        return session
+
+    def test_read_only_transaction_committed(self):
+        """읽기만 한 트랜잭션은 끝내서 커넥션을 돌려줌"""
+        # Given
+        session = self._session()
+
+        # When
+        db.release_connection(session)
+
+        # Then
+        session.commit.assert_called_once()
+
+    def test_pending_changes_left_to_caller(self):
+        """flush하지 않은 변경이 있으면 commit하지 않음"""
+        # Given
+        session = self._session(pending=True)
+
+        # When
+        db.release_connection(session)
+
+        # Then
+        session.commit.assert_not_called()
@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+
+from pydantic import BaseModel
+
+from repository.expert_response_repository import ExpertResponseRepository
+from service.expert_response_store import ExpertRequest, ExpertResponseStore
+from utils.cache import InMemoryBackend, TieredCache
+
+
+class _Response(BaseModel):
+    verdict: str
+    original_url: str = ""
+
+
+def _request(input_data: str = "2024-01-01: 10", **overrides) -> ExpertRequest:
+    values = dict(
+        agent="fear_greed",
+        prompt_version="v1",
+        model="gpt-4.1",
+        target_date="2024-01-02",
+        input_data=input_data,
+        params={"months_before": 6},
+    )
+    values.update(overrides)
+    return ExpertRequest(**values)
+
+
+def _store(repository=None, l2=None) -> ExpertResponseStore:
+    if repository is None:
+        repository = Mock()
+        repository.find_response.return_value = None
+    cache = TieredCache("expert_responses", l2=l2, key_prefix="t", l1_max_entries=100)
+    return ExpertResponseStore(repository=repository, cache=cache)
+
+
+class TestExpertRequest:
+    """ExpertRequest 키 테스트"""
+
+    def test_key_changes_with_inputs(self):
+        """기간 데이터·프롬프트·모델·파라미터가 바뀌면 키가 바뀜"""
+        # Given
+        base = _request()
+
+        # When / Then
+        assert base.key == _request().key
+        assert base.key != _request("2024-01-01: 11").key
+        assert base.key != _request(prompt_version="v2").key
+        assert base.key != _request(model="gpt-4.1-mini").key
+        assert base.key != _request(params={"months_before": 3}).key
+        assert base.key != _request(coin_id=1).key
+
+
+class TestExpertResponseRepository:
+    """ExpertResponseRepository 테스트"""
+
+    def test_dedup_lookup_reads_primary(self):
+        """중복 확인 조회는 복제본이 아닌 primary 세션으로"""
+        # Given
+        calls = []
+
+        @contextmanager
+        def session_scope(session=None, read_only=False):
+            calls.append(read_only)
+            yield Mock()
+
+        # When
+        with patch("repository.expert_response_repository.db.session_scope", session_scope):
+            ExpertResponseRepository().find_response("key")
+
+        # Then
+        assert calls == [False]
+
+
+class TestExpertResponseStore:
+    """ExpertResponseStore 테스트"""
+
+    def test_second_call_skips_llm(self):
+        """같은 입력이면 두 번째 호출은 LLM을 실행하지 않음"""
+        # Given
+        store = _store()
+        run = Mock(return_value=_Response(verdict="중립"))
+
+        # When
+        first = store.get_or_run(_request(), run, _Response)
+        second = store.get_or_run(_request(), run, _Response)
+
+        # Then
+        assert first == second == _Response(verdict="중립")
+        run.assert_called_once()
+        store.repository.save.assert_called_once()
+        saved = store.repository.save.call_args.kwargs
+        assert saved["response"] == {"verdict": "중립", "original_url": ""}
+        assert saved["cache_key"] == _request().key
+
+    def test_uses_stored_response_from_db(self):
+        """다른 워커가 저장한 응답(DB)이 있으면 LLM 없이 반환"""
+        # Given
+        repository = Mock()
+        repository.find_response.return_value = {"verdict": "탐욕"}
+        store = _store(repository)
+        run = Mock()
+
+        # When
+        result = store.get_or_run(_request(), run, _Response)
+
+        # Then
+        assert result == _Response(verdict="탐욕")
+        run.assert_not_called()
+        repository.save.assert_not_called()
+
+    def test_changed_rows_run_again(self):
+        """DB 행이 바뀌어 기간 데이터가 달라지면 다시 계산"""
+        # Given
+        store = _store()
+        run = Mock(side_effect=[_Response(verdict="공포"), _Response(verdict="탐욕")])
+
+        # When
+        before = store.get_or_run(_request("2024-01-01: 10"), run, _Response)
+        after = store.get_or_run(_request("2024-01-01: 80"), run, _Response)
+
+        # Then
+        assert (before.verdict, after.verdict) == ("공포", "탐욕")
+        assert run.call_count == 2
+
+    def test_save_failure_still_returns_response(self):
+        """DB 저장이 실패해도 LLM 응답은 반환"""
+        # Given
+        store = _store()
+        store.repository.save.side_effect = RuntimeError("db down")
+
+        # When
+        result = store.get_or_run(_request(), lambda: _Response(verdict="중립"), _Response)
+
+        # Then
+        assert result.verdict == "중립"
+
+    def test_aliases_restored_before_save(self):
+        """입력에서 id로 줄인 URL은 응답에서 원래 값으로 되돌려 저장·반환"""
+        # Given
+        store = _store()
+        request = _request(aliases={"a1": "https://news.example.com/1"})
+        run = Mock(return_value=_Response(verdict="중립", original_url="a1"))
+
+        # When
+        result = store.get_or_run(request, run, _Response)
+
+        # Then
+        assert result.original_url == "https://news.example.com/1"
+        saved = store.repository.save.call_args.kwargs
+        assert saved["response"]["original_url"] == "https://news.example.com/1"
+        assert request.key != _request().key
+
+    def test_concurrent_requests_run_llm_once(self):
+        """같은 입력을 동시에 요청해도 LLM은 한 번만 호출"""
+        # Given
+        store = _store(l2=InMemoryBackend())
+        calls = []
+
+        def run():
+            calls.append(1)
+            time.sleep(0.1)
+            return _Response(verdict="중립")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.get_or_run(_request(), run, _Response)))
+            for _ in range(5)
+        ]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert len(calls) == 1
+        assert results == [_Response(verdict="중립")] * 5
+
+    def test_async_concurrent_requests_run_llm_once(self):
+        """aget_or_run: 같은 입력을 동시에 기다려도 LLM은 한 번, 이후 요청은 저장된 응답"""
+        # Given
+        store = _store()
+        calls = []
+
+        async def arun():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return _Response(verdict="중립")
+
+        async def run():
+            first = await asyncio.gather(
+                *(store.aget_or_run(_request(), arun, _Response) for _ in range(5))
+            )
+            again = await store.aget_or_run(_request(), arun, _Response)
+            return first, again
+
+        # When
+        first, again = asyncio.run(run())
+
+        # Then
+        assert len(calls) == 1
+        assert first == [_Response(verdict="중립")] * 5
+        assert again == _Response(verdict="중립")
+        store.repository.save.assert_called_once()
+
+    def test_async_cache_write_runs_off_event_loop(self):
+        """aget_or_run: 응답 캐시 쓰기(Redis 포함)는 이벤트 루프 스레드에서 하지 않음"""
+        # Given
+        store = _store()
+        set_threads = []
+        original_set = store.cache.set
+
+        def recording_set(key, value):
+            set_threads.append(threading.get_ident())
+            original_set(key, value)
+
+        store.cache.set = recording_set
+
+        async def arun():
+            return _Response(verdict="중립")
+
+        async def run():
+            await store.aget_or_run(_request(), arun, _Response)
+            return threading.get_ident()
+
+        # When
+        loop_thread = asyncio.run(run())
+
+        # Then
+        assert set_threads
+        assert loop_thread not in set_threads
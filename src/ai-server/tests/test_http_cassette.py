@@ -0,0 +1,135 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from utils.http_cassette import MODE_RECORD, MODE_REPLAY, Cassette
+from utils.http_transport import HttpTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """요청 경로를 그대로 돌려주는 테스트 서버"""
+
+    protocol_version = "HTTP/1.1"
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        body = json.dumps({"path": self.path, "call": type(self).calls}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=secret")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpCassette:
+    """Cassette 녹화/재생 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 로컬 HTTP 서버 시작"""
+        _Handler.calls = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _transport(self, cassette: Cassette) -> HttpTransport:
+        transport = HttpTransport(
+            name="test", max_retries=2, backoff_base_sec=0.001, backoff_max_sec=0.002
+        )
+        transport.cassette = cassette
+        return transport
+
+    def _record(self, path):
+        transport = self._transport(Cassette(path, MODE_RECORD))
+        for nonce in ("a", "b"):
+            transport.get(
+                f"{self.base_url}/v1/orders",
+                params={"uuid": "order-1", "nonce": nonce},
+                headers={"Authorization": "Bearer secret-token"},
+            )
+        transport.close()
+
+    def test_record_scrubs_credentials(self, tmp_path):
+        """녹화 파일에 인증 헤더·nonce·쿠키가 남지 않음"""
+        # Given
+        path = tmp_path / "test.jsonl"
+
+        # When
+        self._record(path)
+
+        # Then
+        content = path.read_text(encoding="utf-8")
+        assert "secret-token" not in content
+        assert "session=secret" not in content
+        lines = [json.loads(line) for line in content.splitlines()]
+        assert "recorded_at" in lines[0]["meta"]
+        assert len(lines) == 3
+        # nonce가 달라도 같은 요청으로 묶임
+        assert lines[1]["key"] == lines[2]["key"]
+        assert "nonce" not in lines[1]["key"]
+
+    def test_replay_returns_recorded_responses_in_order(self, tmp_path):
+        """재생 시 네트워크 없이 녹화 순서대로 응답하고 마지막 응답은 재사용"""
+        # Given
+        path = tmp_path / "test.jsonl"
+        self._record(path)
+        transport = self._transport(Cassette(path, MODE_REPLAY))
+
+        # When
+        calls = [
+            transport.get(
+                f"{self.base_url}/v1/orders", params={"uuid": "order-1", "nonce": "z"}
+            ).json()["call"]
+            for _ in range(3)
+        ]
+
+        # Then
+        assert calls == [1, 2, 2]
+        assert _Handler.calls == 2
+
+    def test_replay_miss_raises_connection_error(self, tmp_path):
+        """녹화되지 않은 요청은 연결 오류"""
+        # Given
+        path = tmp_path / "test.jsonl"
+        self._record(path)
+        transport = self._transport(Cassette(path, MODE_REPLAY))
+
+        # When / Then
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get(f"{self.base_url}/v1/orders", params={"uuid": "other"})
+
+    def test_injected_429_is_deterministic_and_retried(self, tmp_path):
+        """같은 seed면 같은 위치에 429가 주입되고 전송 계층이 재시도"""
+        # Given
+        path = tmp_path / "test.jsonl"
+        self._record(path)
+
+        def run():
+            cassette = Cassette(path, MODE_REPLAY, inject_429_rate=0.5, seed=7)
+            transport = self._transport(cassette)
+            for _ in range(5):
+                transport.get(f"{self.base_url}/v1/orders", params={"uuid": "order-1"})
+            host = self.base_url.replace("http://", "")
+            return cassette.stats, transport.get_metrics()["hosts"][host]["status_counts"]
+
+        # When
+        first = run()
+        second = run()
+
+        # Then
+        assert first == second
+        stats, status_counts = first
+        assert stats["injected_429"] > 0
+        assert status_counts.get(429, 0) == stats["injected_429"]
@@ -0,0 +1,140 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from utils.http_transport import HttpTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """첫 응답은 429(Retry-After: 0), 이후 200을 반환하는 테스트 서버"""
+
+    protocol_version = "HTTP/1.1"
+    calls = 0
+    headers_seen = []
+
+    def do_GET(self):
+        type(self).calls += 1
+        type(self).headers_seen.append(self.headers.get("X-Attempt"))
+        if self.path.startswith("/limited") and type(self).calls == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/error"):
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpTransport:
+    """HttpTransport 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 로컬 HTTP 서버 시작"""
+        _Handler.calls = 0
+        _Handler.headers_seen = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.transport = HttpTransport(
+            name="test", max_retries=2, backoff_base_sec=0.01, backoff_max_sec=0.02
+        )
+
+    def teardown_method(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retry_on_429_with_fresh_headers(self):
+        """429 응답 후 재시도하며 시도마다 헤더를 새로 생성"""
+        # Given
+        attempts = iter(["1", "2", "3"])
+
+        # When
+        response = self.transport.get(
+            f"{self.base_url}/limited",
+            headers_factory=lambda: {"X-Attempt": next(attempts)},
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert _Handler.headers_seen == ["1", "2"]
+
+        host_metrics = self.transport.get_metrics()["hosts"][
+            self.base_url.replace("http://", "")
+        ]
+        assert host_metrics["requests"] == 2
+        assert host_metrics["retries"] == 1
+        assert host_metrics["status_counts"] == {429: 1, 200: 1}
+
+    def test_429_wait_delegated_to_caller(self):
+        """on_throttled를 주면 429 재시도 대기를 호출자에게 넘김"""
+        # Given
+        delays = []
+
+        # When
+        response = self.transport.get(f"{self.base_url}/limited", on_throttled=delays.append)
+
+        # Then
+        assert response.status_code == 200
+        assert len(delays) == 1 and delays[0] > 0
+
+    def test_returns_last_response_after_retries_exhausted(self):
+        """재시도 후에도 5xx면 마지막 응답 반환"""
+        # When
+        response = self.transport.get(f"{self.base_url}/error")
+
+        # Then
+        assert response.status_code == 500
+        assert _Handler.calls == 3
+        with pytest.raises(requests.exceptions.HTTPError):
+            response.raise_for_status()
+
+    def test_keep_alive_reuses_connection(self):
+        """같은 호스트 요청은 커넥션을 재사용"""
+        # When
+        for _ in range(5):
+            self.transport.get(f"{self.base_url}/ok")
+
+        # Then
+        connections = self.transport.get_metrics()["connections"]
+        assert sum(c["connections_opened"] for c in connections.values()) == 1
+
+    def test_retry_after_header_is_honored(self):
+        """Retry-After 값이 백오프보다 크면 그 값만큼 대기"""
+        assert self.transport._backoff_delay(1, "0.015") >= 0.015
+        assert self.transport._parse_retry_after("invalid") is None
+
+    def test_httpx_client_receives_per_call_timeout(self):
+        """HTTP/2(httpx) 사용 시에도 호출별 연결/읽기 타임아웃을 그대로 전달"""
+        # Given
+        httpx_client = Mock()
+        httpx_client.request.return_value = httpx.Response(
+            200, json={"ok": True}, request=httpx.Request("GET", f"{self.base_url}/ok")
+        )
+        self.transport._httpx_client = httpx_client
+
+        # When
+        response = self.transport.get(f"{self.base_url}/ok", timeout=(1.5, 7.0))
+
+        # Then
+        assert response.status_code == 200
+        timeout = httpx_client.request.call_args.kwargs["timeout"]
+        assert timeout == httpx.Timeout(7.0, connect=1.5)
@@ -0,0 +1,185 @@
+from datetime import date, timedelta
+
+from service.prompt_context import (
+    ARTICLE_ID_NOTE,
+    Candle,
+    build_article_context,
+    build_coin_price_context,
+    build_fear_greed_context,
+    count_tokens,
+    restore_aliases,
+)
+
+MODEL = "gpt-4.1"
+START = date(2023, 7, 3)
+
+
+def _candles(days: int = 180):
+    candles = []
+    price = 40_000_000.0
+    for i in range(days):
+        close = price * (1.01 if i % 3 else 0.98)
+        candles.append(
+            Candle(
+                day=START + timedelta(days=i),
+                open=price,
+                high=max(price, close) * 1.01,
+                low=min(price, close) * 0.99,
+                close=close,
+                change_rate=close / price - 1,
+            )
+        )
+        price = close
+    return candles
+
+
+def _articles(days: int = 8, per_day: int = 30):
+    return {
+        START + timedelta(days=i): [
+            (f"비트코인 헤드라인 {i}-{j}", f"https://news.example.com/articles/{i}/{j}?utm_source=rss")
+            for j in range(per_day)
+        ]
+        for i in range(days)
+    }
+
+
+class TestCoinPriceContext:
+    """코인 가격 기간 데이터 압축 테스트"""
+
+    def test_within_budget_keeps_daily_lines(self):
+        """예산 안이면 기존 일봉 형식 그대로"""
+        # Given
+        candles = _candles(10)
+
+        # When
+        context = build_coin_price_context(candles, budget=100_000, model=MODEL)
+
+        # Then
+        assert context.strategy == "daily"
+        assert context.text.splitlines()[0] == "2023-07-03: 40000000 | 40400000 | 38808000 | 39200000, -2.00%"
+        assert len(context.text.splitlines()) == 10
+
+    def test_older_candles_aggregated_weekly(self):
+        """예산을 넘으면 오래된 구간은 주간 OHLC, 최근 구간은 일봉"""
+        # Given
+        candles = _candles()
+        daily_tokens = build_coin_price_context(candles, budget=100_000, model=MODEL).tokens
+
+        # When
+        context = build_coin_price_context(candles, budget=daily_tokens * 2 // 3, model=MODEL)
+
+        # Then
+        assert context.strategy == "weekly+daily60"
+        assert context.tokens <= daily_tokens * 2 // 3
+        lines = context.text.splitlines()
+        # 2023-07-03은 월요일: 첫 주는 7일 묶음
+        first_week = candles[:7]
+        assert lines[0].startswith("2023-07-03~2023-07-09: 40000000 | ")
+        assert f"| {min(c.low for c in first_week):.0f} | {first_week[-1].close:.0f}," in lines[0]
+        assert lines[-1].startswith(candles[-1].day.isoformat() + ": ")
+        assert sum("~" not in line for line in lines) == 60
+
+    def test_truncates_oldest_when_nothing_fits(self):
+        """모든 압축으로도 넘으면 오래된 줄부터 버림"""
+        # When
+        context = build_coin_price_context(_candles(), budget=60, model=MODEL)
+
+        # Then
+        assert context.strategy.endswith("+truncated")
+        assert context.tokens <= 60
+        assert context.text.splitlines()[-1].startswith("2023-12-29: ")
+
+
+class TestFearGreedContext:
+    """공포/탐욕 기간 데이터 압축 테스트"""
+
+    def test_run_length_encodes_repeated_values(self):
+        """같은 값이 이어지는 날은 한 줄로"""
+        # Given
+        points = [(START + timedelta(days=i), 20 if i < 5 else 60) for i in range(8)]
+        daily = build_fear_greed_context(points, budget=100_000, model=MODEL)
+
+        # When
+        context = build_fear_greed_context(points, budget=daily.tokens - 1, model=MODEL)
+
+        # Then
+        assert daily.text.splitlines()[0] == "2023-07-03: 20"
+        assert context.strategy == "run_length"
+        assert context.text.splitlines() == ["2023-07-03~2023-07-07: 20", "2023-07-08~2023-07-10: 60"]
+
+    def test_older_days_grouped_by_band(self):
+        """run-length로도 넘으면 최근 N일 외에는 공포·탐욕 단계별 구간으로"""
+        # Given
+        # 60일씩 극단적 공포(10~14) → 공포(30~34) → 탐욕(60~64), 매일 값이 바뀜
+        points = [(START + timedelta(days=i), (10, 30, 60)[i // 60] + i % 5) for i in range(180)]
+        run_length = build_fear_greed_context(points, budget=100_000, model=MODEL).tokens
+
+        # When
+        context = build_fear_greed_context(points, budget=run_length // 2, model=MODEL)
+
+        # Then
+        lines = context.text.splitlines()
+        assert context.strategy == "banded+daily30"
+        assert lines[:3] == [
+            "2023-07-03~2023-08-31: 극단적 공포 (10~14)",
+            "2023-09-01~2023-10-30: 공포 (30~34)",
+            "2023-10-31~2023-11-29: 탐욕 (60~64)",
+        ]
+        assert len(lines) == 33
+        assert lines[-1] == f"{points[-1][0].isoformat()}: {points[-1][1]}"
+
+
+class TestArticleContext:
+    """기사 기간 데이터 압축 테스트"""
+
+    def test_within_budget_keeps_urls(self):
+        """예산 안이면 URL 그대로, 되돌릴 id 없음"""
+        # When
+        context = build_article_context(_articles(2, 2), budget=100_000, model=MODEL)
+
+        # Then
+        assert context.strategy == "full"
+        assert context.aliases == {}
+        assert "https://news.example.com/articles/0/0?utm_source=rss" in context.text
+
+    def test_urls_replaced_with_ids_and_restored(self):
+        """예산을 넘으면 URL을 id로, 응답의 id는 원래 URL로 되돌림"""
+        # Given
+        articles = _articles()
+        full = build_article_context(articles, budget=100_000, model=MODEL)
+
+        # When
+        context = build_article_context(articles, budget=full.tokens - 1, model=MODEL)
+        response = {
+            "verdict": "보통",
+            "notable_periods": [{"period_data": [{"summary": "헤드라인", "original_url": "[a2]"}]}],
+        }
+
+        # Then
+        assert context.strategy == "url_ids"
+        assert context.text.splitlines()[0] == ARTICLE_ID_NOTE
+        assert "https://" not in context.text
+        assert "비트코인 헤드라인 0-1 [a2]" in context.text
+        restored = restore_aliases(response, context.aliases)
+        assert restored["notable_periods"][0]["period_data"][0]["original_url"] == (
+            "https://news.example.com/articles/0/1?utm_source=rss"
+        )
+        assert restored["verdict"] == "보통"
+
+    def test_fewer_headlines_per_day_when_ids_not_enough(self):
+        """id로도 넘으면 날짜별 헤드라인 수를 줄이고, 남은 기사 id만 되돌림"""
+        # Given
+        articles = _articles()
+        ids_only = build_article_context(articles, budget=count_tokens("x", MODEL), model=MODEL)
+        budget = count_tokens(ARTICLE_ID_NOTE, MODEL) + 400
+
+        # When
+        context = build_article_context(articles, budget=budget, model=MODEL)
+
+        # Then
+        assert ids_only.strategy.endswith("+truncated")
+        assert context.strategy.startswith("url_ids+headlines")
+        assert context.tokens <= budget
+        assert len(context.text.splitlines()) == 9
+        # 안내 문구의 [a1] 제외
+        assert len(context.aliases) == context.text.count(" [a") - 1 < 240
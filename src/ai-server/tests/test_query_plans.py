@@ -0,0 +1,296 @@
+"""
+저장소 조회 쿼리 실행 계획 검사.
+
+TEST_DATABASE_URL(UTF8 Postgres)이 있을 때만 실행합니다. 임시 스키마에 테이블을 만들고
+마이그레이션을 적용한 뒤 데이터를 채워 ANALYZE 하고, 저장소 메서드가 실제로 보내는 쿼리를
+EXPLAIN 해서 대상 테이블을 순차 스캔(Seq Scan)하지 않는지 확인합니다.
+
+    TEST_DATABASE_URL=postgresql://user:pw@localhost:5432/bitriever_test pytest tests/test_query_plans.py
+"""
+
+import json
+import os
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+import model.Article  # noqa: F401
+import model.Assets  # noqa: F401
+import model.CoinHoldingsPast  # noqa: F401
+import model.CoinPricesDay  # noqa: F401
+import model.Coins  # noqa: F401
+import model.Diary  # noqa: F401
+import model.ExchangeCredentials  # noqa: F401
+import model.FearGreedIndex  # noqa: F401
+import model.TradeEvaluationResult  # noqa: F401
+import model.TradingHistories  # noqa: F401
+import model.Users  # noqa: F401
+from database.database_connection import db
+from database.migrate import run_migrations
+from database.partitions import ensure_yearly_partitions, yearly_partition_name
+from database.replica import RoutingSession
+from repository.article_repository import ArticleRepository
+from repository.assets_repository import AssetsRepository
+from repository.coin_holdings_past_repository import CoinHoldingsPastRepository
+from repository.coin_price_day_repository import CoinPriceDayRepository
+from repository.diary_repository import DiaryRepository
+from repository.trade_evaluation_result_repository import (
+    TradeEvaluationResultRepository,
+)
+from repository.trading_histories_repository import TradingHistoriesRepository
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 없으면 실행 계획 검사를 건너뜀"
+)
+
+USER_COUNT = 100
+COIN_COUNT = 100
+
+
+def _user_id(n: int) -> str:
+    return str(uuid.UUID(bytes=bytes.fromhex(f"{n:032x}")))
+
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (id, email, nickname, signup_type, is_connect_exchange)
+    SELECT lpad(to_hex(i), 32, '0')::uuid, 'user' || i || '@test', 'user' || i, 0, false
+    FROM generate_series(1, {USER_COUNT}) i
+    """,
+    f"""
+    INSERT INTO coins (id, symbol, quote_currency, market_code, exchange)
+    SELECT i, 'C' || i, 'KRW', 'KRW-C' || i, 'upbit'
+    FROM generate_series(1, {COIN_COUNT}) i
+    """,
+    f"""
+    INSERT INTO trading_histories
+        (user_id, coin_id, exchange_code, trade_uuid, trade_type, price, quantity, total_price, trade_time)
+    SELECT lpad(to_hex(i % {USER_COUNT} + 1), 32, '0')::uuid, i % {COIN_COUNT} + 1, i % 2 + 1,
+           't' || i, i % 2, 1, 1, 1, timestamp '2023-01-01' + i * interval '10 minutes'
+    FROM generate_series(1, 50000) i
+    """,
+    f"""
+    INSERT INTO coin_prices_day
+        (coin_id, market_code, candle_date_time_utc, candle_date_time_kst, opening_price, high_price,
+         low_price, trade_price, timestamp, candle_acc_trade_price, candle_acc_trade_volume,
+         prev_closing_price, change_price, change_rate)
+    SELECT c, 'KRW-C' || c, d, d, 1, 1, 1, 1, 0, 1, 1, 1, 0, 0
+    FROM generate_series(1, {COIN_COUNT}) c,
+         generate_series(timestamp '2022-01-01', timestamp '2023-12-31', interval '1 day') d
+    """,
+    """
+    INSERT INTO articles (headline, original_url, publisher_type, published_at)
+    SELECT 'h' || i, 'https://news.test/' || i, i % 5, timestamp '2022-01-01' + i * interval '30 minutes'
+    FROM generate_series(1, 50000) i
+    """,
+    f"""
+    INSERT INTO coin_holdings_past (user_id, coin_id, exchange_code, symbol, avg_buy_price, remaining_quantity)
+    SELECT lpad(to_hex(u), 32, '0')::uuid, c, 1, 'C' || c, 1, 1
+    FROM generate_series(1, {USER_COUNT}) u, generate_series(1, 50) c
+    """,
+    f"""
+    INSERT INTO assets (user_id, exchange_code, coin_id, symbol, trade_by_symbol, quantity,
+                        locked_quantity, avg_buy_price, avg_buy_price_modified)
+    SELECT lpad(to_hex(u), 32, '0')::uuid, 1, c, 'C' || c, 'KRW', 1, 0, 1, false
+    FROM generate_series(1, {USER_COUNT}) u, generate_series(1, 50) c
+    """,
+    """
+    INSERT INTO diaries (trading_history_id, content)
+    SELECT id, '{}' FROM trading_histories
+    """,
+    """
+    INSERT INTO trade_evaluation_results (user_id, trade_id, target_date, coin_id, result)
+    SELECT user_id, id, date '2024-01-01', coin_id, '{}'::jsonb
+    FROM trading_histories
+    WHERE id <= 20000
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+def plan_db():
+    """임시 스키마에 테이블 생성 → 마이그레이션 → 데이터 채움 → ANALYZE"""
+    schema = f"plan_check_{uuid.uuid4().hex[:8]}"
+    engine = create_engine(TEST_DATABASE_URL)
+
+    @event.listens_for(engine, "connect")
+    def _set_search_path(dbapi_connection, _):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"SET search_path TO {schema}")
+        dbapi_connection.commit()
+
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+
+    try:
+        db.Base.metadata.create_all(engine)
+        run_migrations(engine)
+        with engine.begin() as connection:
+            for sql in SEED_SQL:
+                connection.execute(text(sql))
+            connection.execute(text("ANALYZE"))
+        yield engine
+    finally:
+        engine.dispose()
+        with create_engine(TEST_DATABASE_URL).begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+
+def _partition_parents(engine) -> dict:
+    """파티션 테이블명 → 부모 테이블명"""
+    with engine.connect() as connection:
+        return dict(
+            connection.execute(
+                text(
+                    "SELECT c.relname, p.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent"
+                )
+            ).all()
+        )
+
+
+def _scanned_relations(plan: dict, node_type: str = None) -> set:
+    relations = set()
+    if "Relation Name" in plan and node_type in (None, plan.get("Node Type")):
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        relations |= _scanned_relations(child, node_type)
+    return relations
+
+
+def _seq_scanned_relations(plan: dict, parents: dict) -> set:
+    """순차 스캔한 테이블 (파티션은 부모 테이블명으로)"""
+    return {parents.get(name, name) for name in _scanned_relations(plan, "Seq Scan")}
+
+
+def _explain(engine, statement: str, parameters) -> dict:
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+            plan = cursor.fetchone()[0]
+    finally:
+        raw.close()
+    plan = plan if isinstance(plan, list) else json.loads(plan)
+    return plan[0]["Plan"]
+
+
+USER = _user_id(7)
+
+QUERIES = {
+    "trading_histories.find_by_user_and_exchange": lambda s: TradingHistoriesRepository().find_by_user_and_exchange(USER, 1, session=s),
+    "trading_histories.exists_by_user_and_exchange": lambda s: TradingHistoriesRepository().exists_by_user_and_exchange(USER, 1, session=s),
+    "trading_histories.find_by_user_id": lambda s: TradingHistoriesRepository().find_by_user_id(USER),
+    "trading_histories.find_by_user_id_and_trade_time_between": lambda s: TradingHistoriesRepository().find_by_user_id_and_trade_time_between(
+        s, USER, datetime(2023, 3, 1), datetime(2023, 4, 1)
+    ),
+    "trading_histories.find_page_by_user": lambda s: TradingHistoriesRepository().find_page_by_user(
+        USER, 101, cursor=(datetime(2023, 6, 1), 30000), session=s
+    ),
+    "coin_prices_day.find_by_coin_id_and_date_range": lambda s: CoinPriceDayRepository().find_by_coin_id_and_date_range(
+        s, 7, datetime(2023, 6, 1), datetime(2023, 12, 1)
+    ),
+    "coin_prices_day.find_by_market_code_and_date_range": lambda s: CoinPriceDayRepository().find_by_market_code_and_date_range(
+        s, "KRW-C7", datetime(2023, 6, 1), datetime(2023, 12, 1)
+    ),
+    "articles.find_by_published_at_between": lambda s: ArticleRepository().find_by_published_at_between(
+        s, datetime(2022, 6, 1), datetime(2022, 6, 8)
+    ),
+    "articles.find_by_published_at_between(publisher_type)": lambda s: ArticleRepository().find_by_published_at_between(
+        s, datetime(2022, 6, 1), datetime(2022, 6, 8), publisher_type=1
+    ),
+    "coin_holdings_past.find_by_user_and_exchange": lambda s: CoinHoldingsPastRepository().find_by_user_and_exchange(USER, 1, session=s),
+    "assets.find_by_user_and_exchange": lambda s: AssetsRepository().find_by_user_and_exchange(USER, 1, session=s),
+    "diaries.find_by_trading_history_id": lambda s: DiaryRepository().find_by_trading_history_id(s, 1234),
+    "trade_evaluation_results.find_by_trade_id": lambda s: TradeEvaluationResultRepository().find_by_trade_id(s, 1234),
+    "trade_evaluation_results.find_by_user_id_and_trade_id": lambda s: TradeEvaluationResultRepository().find_by_user_id_and_trade_id(
+        s, _user_id(1234 % USER_COUNT + 1), 1234
+    ),
+}
+
+
+class TestQueryPlans:
+    """저장소 조회 쿼리가 인덱스를 사용하는지 EXPLAIN으로 검사"""
+
+    @pytest.mark.parametrize("name", sorted(QUERIES))
+    def test_query_uses_index(self, plan_db, monkeypatch, name):
+        """대상 테이블을 순차 스캔하지 않음"""
+        # Given: 저장소가 여는 세션도 테스트 스키마를 쓰도록 교체하고 실행한 SQL을 수집
+        session_factory = sessionmaker(class_=RoutingSession, bind=plan_db)
+        monkeypatch.setattr(db, "SessionLocal", session_factory)
+        captured = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                captured.append((statement, parameters))
+
+        event.listen(plan_db, "before_cursor_execute", _capture)
+        try:
+            with session_factory() as session:
+                # When
+                QUERIES[name](session)
+        finally:
+            event.remove(plan_db, "before_cursor_execute", _capture)
+
+        # Then
+        assert captured, f"{name}: 실행된 SELECT가 없음"
+        table = name.split(".")[0]
+        parents = _partition_parents(plan_db)
+        for statement, parameters in captured:
+            plan = _explain(plan_db, statement, parameters)
+            assert table not in _seq_scanned_relations(plan, parents), (
+                f"{name}: {table} 순차 스캔\n{json.dumps(plan, indent=1)}"
+            )
+
+
+class TestCoinPricesDayPartitions:
+    """coin_prices_day 연 단위 파티션 테스트"""
+
+    def test_date_range_query_prunes_other_years(self, plan_db):
+        """기간 조회는 해당 연도 파티션만 스캔"""
+        # Given
+        session_factory = sessionmaker(bind=plan_db)
+        captured = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        event.listen(plan_db, "before_cursor_execute", _capture)
+        try:
+            with session_factory() as session:
+                # When
+                CoinPriceDayRepository().find_by_coin_id_and_date_range(
+                    session, 7, datetime(2023, 6, 1), datetime(2023, 12, 1)
+                )
+        finally:
+            event.remove(plan_db, "before_cursor_execute", _capture)
+
+        # Then
+        plan = _explain(plan_db, *captured[-1])
+        assert _scanned_relations(plan) == {"coin_prices_day_y2023"}
+
+    def test_ensure_yearly_partitions_creates_missing_year_once(self, plan_db):
+        """없는 연도 파티션만 만들고, 다시 호출하면 아무것도 하지 않음"""
+        # When
+        created = ensure_yearly_partitions(plan_db, "coin_prices_day", [2023, 2041, 2041])
+        created_again = ensure_yearly_partitions(plan_db, "coin_prices_day", [2041])
+
+        # Then
+        assert created == [yearly_partition_name("coin_prices_day", 2041)]
+        assert created_again == []
+        with plan_db.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO coin_prices_day (coin_id, market_code, candle_date_time_utc, "
+                    "candle_date_time_kst, opening_price, high_price, low_price, trade_price, "
+                    "timestamp, candle_acc_trade_price, candle_acc_trade_volume, "
+                    "prev_closing_price, change_price, change_rate) "
+                    "VALUES (1, 'KRW-C1', '2041-05-01', '2041-05-01', 1, 1, 1, 1, 0, 1, 1, 1, 0, 0)"
+                )
+            )
@@ -0,0 +1,113 @@
+from unittest.mock import Mock
+
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from database.replica import ReplicaRouter, RoutingSession
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class TestReplicaRouting:
+    """RoutingSession 복제본 라우팅 테스트 (primary/복제본 대신 sqlite 메모리 DB 2개)"""
+
+    def setup_method(self, method):
+        """각 테스트 메서드 실행 전 primary/복제본에 서로 다른 데이터 준비"""
+        self.primary = create_engine("sqlite://")
+        self.replica = create_engine("sqlite://")
+        for engine, name in ((self.primary, "primary"), (self.replica, "replica")):
+            Base.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(Item.__table__.insert(), {"id": 1, "name": name})
+
+        self.lag_fn = Mock(return_value=0.0)
+        self.router = ReplicaRouter(
+            {"replica-0": self.replica},
+            max_lag_sec=5,
+            check_interval_sec=60,
+            lag_fn=self.lag_fn,
+        )
+        self.Session = sessionmaker(
+            class_=RoutingSession, router=self.router, bind=self.primary
+        )
+
+    def _read_name(self, session) -> str:
+        return session.execute(select(Item.name).where(Item.id == 1)).scalar_one()
+
+    def test_read_only_session_uses_replica(self):
+        """read_only 세션은 복제본에서 조회"""
+        # When
+        with self.Session(read_only=True) as session:
+            name = self._read_name(session)
+            replica_name = session.replica_name
+
+        # Then
+        assert name == "replica"
+        assert replica_name == "replica-0"
+        assert self.router.status()["replicas"]["replica-0"]["routed_sessions"] == 1
+
+    def test_default_session_uses_primary(self):
+        """read_only가 아니면(쓰기·방금 쓴 내용 재조회) primary 사용"""
+        # When
+        with self.Session() as session:
+            name = self._read_name(session)
+
+        # Then
+        assert name == "primary"
+        self.lag_fn.assert_not_called()
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        """복제 지연이 허용치를 넘으면 primary로 조회"""
+        # Given
+        self.lag_fn.return_value = 30.0
+
+        # When
+        with self.Session(read_only=True) as session:
+            name = self._read_name(session)
+
+        # Then
+        assert name == "primary"
+        assert self.router.status()["primary_fallbacks"] == 1
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        """지연 확인에 실패한 복제본은 건너뜀"""
+        # Given
+        self.lag_fn.side_effect = ConnectionError("replica down")
+
+        # When
+        with self.Session(read_only=True) as session:
+            name = self._read_name(session)
+
+        # Then
+        assert name == "primary"
+        assert self.router.status()["replicas"]["replica-0"]["lag_sec"] is None
+
+    def test_lag_checked_once_per_interval(self):
+        """지연 확인 결과는 check_interval_sec 동안 재사용"""
+        # When
+        for _ in range(3):
+            with self.Session(read_only=True) as session:
+                self._read_name(session)
+
+        # Then
+        self.lag_fn.assert_called_once_with(self.replica)
+
+    def test_flush_goes_to_primary(self):
+        """read_only 세션이라도 flush(쓰기)는 primary로"""
+        # When
+        with self.Session(read_only=True) as session:
+            session.add(Item(id=2, name="new"))
+            session.commit()
+
+        # Then
+        with self.primary.connect() as connection:
+            assert connection.execute(select(Item.name).where(Item.id == 2)).scalar() == "new"
+        with self.replica.connect() as connection:
+            assert connection.execute(select(Item.name).where(Item.id == 2)).scalar() is None
@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+import pytest
+
+from database.database_connection import DatabaseConnection
+
+
+class TestSessionScope:
+    """DatabaseConnection.session_scope 작업 단위 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 세션 팩토리를 Mock으로 교체"""
+        self.db = DatabaseConnection()
+        self.session = Mock()
+        self.db.SessionLocal = Mock(return_value=self.session)
+
+    def test_owned_session_commits_and_closes(self):
+        """세션을 넘기지 않으면 새로 열고 commit 후 close"""
+        # When
+        with self.db.session_scope() as s:
+            s.add("row")
+
+        # Then
+        self.db.SessionLocal.assert_called_once_with(
+            expire_on_commit=False, read_only=False
+        )
+        self.session.commit.assert_called_once()
+        self.session.rollback.assert_not_called()
+        self.session.close.assert_called_once()
+
+    def test_owned_session_rolls_back_on_error(self):
+        """블록에서 예외가 나면 rollback 후 close 하고 예외를 다시 던짐"""
+        # When / Then
+        with pytest.raises(RuntimeError):
+            with self.db.session_scope():
+                raise RuntimeError("boom")
+
+        self.session.commit.assert_not_called()
+        self.session.rollback.assert_called_once()
+        self.session.close.assert_called_once()
+
+    def test_joined_session_left_to_caller(self):
+        """넘겨받은 세션은 그대로 쓰고 commit/rollback/close 하지 않음"""
+        # Given
+        outer = Mock()
+
+        # When
+        with pytest.raises(RuntimeError):
+            with self.db.session_scope(outer) as s:
+                assert s is outer
+                raise RuntimeError("boom")
+
+        # Then
+        self.db.SessionLocal.assert_not_called()
+        outer.commit.assert_not_called()
+        outer.rollback.assert_not_called()
+        outer.close.assert_not_called()
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from dto.exchange_credentials_dto import ExchangeProvider
+from service.sync_job_service import SyncJobService
+
+
+class TestSyncJobService:
+    """SyncJobService 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.service = SyncJobService(max_workers=1)
+        self.service._sync_job_repository = Mock()
+        self.service._user_sync_status_repository = Mock()
+        self.service._executor = Mock()
+
+    def test_submit_creates_and_enqueues_job(self):
+        """진행 중 작업이 없으면 새 작업을 만들고 워커 풀에 등록"""
+        # Given
+        job = SimpleNamespace(id="job-1", status="pending")
+        self.service._sync_job_repository.find_active.return_value = None
+        self.service._sync_job_repository.create_job.return_value = job
+
+        # When
+        result, created = self.service.submit(
+            "user-1", "trading_histories", ExchangeProvider.UPBIT
+        )
+
+        # Then
+        assert created is True
+        assert result is job
+        self.service._executor.submit.assert_called_once_with(
+            self.service._run, "job-1"
+        )
+
+    def test_submit_returns_active_job_without_duplicate(self):
+        """같은 작업이 진행 중이면 새로 만들지 않고 기존 작업 반환"""
+        # Given
+        active = SimpleNamespace(id="job-1", status="running")
+        self.service._sync_job_repository.find_active.return_value = active
+
+        # When
+        result, created = self.service.submit(
+            "user-1", "trading_histories", ExchangeProvider.UPBIT
+        )
+
+        # Then
+        assert created is False
+        assert result is active
+        self.service._sync_job_repository.create_job.assert_not_called()
+        self.service._executor.submit.assert_not_called()
+
+    def test_submit_assets_rejects_unsupported_exchange(self):
+        """자산 동기화는 업비트만 지원"""
+        with pytest.raises(ValueError):
+            self.service.submit("user-1", "assets", ExchangeProvider.BITHUMB)
+
+    def test_run_job_marks_failed_on_error(self):
+        """동기화 중 에러가 나면 실패 상태와 메시지 저장"""
+        # Given
+        job = SimpleNamespace(
+            id="job-1", user_id="user-1", job_type="assets", exchange_code=1
+        )
+        self.service._sync_job_repository.claim.return_value = job
+        self.service._assets_service = Mock()
+        self.service._assets_service.sync_upbit_assets.side_effect = ValueError(
+            "Upbit 자격증명을 찾을 수 없습니다"
+        )
+
+        # When
+        result = self.service.run_job("job-1")
+
+        # Then
+        assert result is None
+        self.service._sync_job_repository.mark_failed.assert_called_once_with(
+            "job-1", "Upbit 자격증명을 찾을 수 없습니다"
+        )
+
+    def test_run_job_skips_when_already_claimed(self):
+        """다른 워커가 먼저 선점한 작업은 실행하지 않음"""
+        # Given
+        self.service._sync_job_repository.claim.return_value = None
+
+        # When
+        result = self.service.run_job("job-1")
+
+        # Then
+        assert result is None
+        self.service._sync_job_repository.mark_succeeded.assert_not_called()
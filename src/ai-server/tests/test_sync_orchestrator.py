@@ -0,0 +1,228 @@
+"""
+동기화 오케스트레이터 테스트.
+
+find_due 검사는 TEST_DATABASE_URL(Postgres)이 있을 때만 실행합니다.
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+import model.Assets  # noqa: F401
+import model.CoinHoldingsPast  # noqa: F401
+import model.CoinPricesDay  # noqa: F401
+import model.Coins  # noqa: F401
+import model.ExchangeCredentials  # noqa: F401
+import model.TradingHistories  # noqa: F401
+import model.Users  # noqa: F401
+from database.database_connection import db
+from database.replica import RoutingSession
+from repository.user_sync_status_repository import UserSyncStatusRepository
+from service.sync_orchestrator import SyncOrchestrator, SyncTask
+from utils.rate_limiter import TokenBucket
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+requires_db = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 없으면 find_due 검사를 건너뜀"
+)
+
+
+def _task(user_id: str, pages: int, order: list) -> SyncTask:
+    def steps():
+        for i in range(pages):
+            order.append(user_id)
+            yield {"windows_scanned": i + 1}
+
+    return SyncTask(
+        job_id=f"job-{user_id}",
+        user_id=user_id,
+        exchange_code=1,
+        job_type="trading_histories",
+        started_at=datetime.now(timezone.utc),
+        steps=steps(),
+    )
+
+
+class TestSyncOrchestrator:
+    """SyncOrchestrator 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.orchestrator = SyncOrchestrator()
+        self.orchestrator._sync_job_repository = Mock()
+        self.orchestrator._user_sync_status_repository = Mock()
+        self.orchestrator._user_service = Mock()
+
+    def test_round_robin_between_users(self):
+        """거래가 많은 사용자도 페이지 단위로 다른 사용자와 번갈아 진행"""
+        # Given
+        order = []
+        tasks = [_task("heavy", 4, order), _task("light", 1, order)]
+
+        async def run():
+            self.orchestrator._queue = asyncio.Queue()
+            for task in tasks:
+                self.orchestrator._active_keys.add(task.key)
+                self.orchestrator._queue.put_nowait(task)
+            worker = asyncio.create_task(self.orchestrator._worker())
+            await self.orchestrator._queue.join()
+            worker.cancel()
+
+        # When
+        asyncio.run(run())
+
+        # Then
+        assert order == ["heavy", "light", "heavy", "heavy", "heavy"]
+        assert self.orchestrator._active_keys == set()
+        assert self.orchestrator._user_sync_status_repository.mark_synced.call_count == 2
+
+    def test_step_records_failure(self):
+        """단계 실행 중 에러가 나면 작업 실패와 사용자 에러를 기록하고 종료"""
+        # Given
+        def failing_steps():
+            raise ValueError("Upbit 자격증명을 찾을 수 없습니다")
+            yield
+
+        task = SyncTask(
+            job_id="job-1",
+            user_id="user-1",
+            exchange_code=1,
+            job_type="trading_histories",
+            started_at=datetime.now(timezone.utc),
+            steps=failing_steps(),
+        )
+
+        # When
+        done = self.orchestrator.step(task)
+
+        # Then
+        assert done is True
+        self.orchestrator._sync_job_repository.mark_failed.assert_called_once()
+        self.orchestrator._user_sync_status_repository.mark_error.assert_called_once()
+
+    def test_freshness_ignores_assets_for_non_upbit(self):
+        """업비트가 아닌 계정은 자산 동기화 시각이 없어도 최초 동기화 대기로 세지 않음"""
+        # Given
+        now = datetime.now(timezone.utc)
+        due_users = [
+            {
+                "user_id": "bithumb-user",
+                "exchange_code": 2,
+                "trading_synced_at": now - timedelta(minutes=5),
+                "assets_synced_at": None,
+            }
+        ]
+
+        # When
+        self.orchestrator._check_freshness(due_users, now)
+
+        # Then
+        assert 299 <= self.orchestrator._last_max_lag_sec <= 301
+        assert self.orchestrator._job_synced_times(due_users[0]) == [
+            ("trading_histories", due_users[0]["trading_synced_at"])
+        ]
+
+
+@requires_db
+class TestFindDue:
+    """UserSyncStatusRepository.find_due 테스트"""
+
+    @pytest.fixture
+    def schema_engine(self, monkeypatch):
+        """임시 스키마에 테이블 생성, 저장소 세션도 이 스키마 사용"""
+        schema = f"find_due_{uuid.uuid4().hex[:8]}"
+        engine = create_engine(TEST_DATABASE_URL)
+
+        @event.listens_for(engine, "connect")
+        def _set_search_path(dbapi_connection, _):
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"SET search_path TO {schema}")
+            dbapi_connection.commit()
+
+        with engine.begin() as connection:
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+        monkeypatch.setattr(db, "SessionLocal", sessionmaker(class_=RoutingSession, bind=engine))
+        try:
+            db.Base.metadata.create_all(engine)
+            yield engine
+        finally:
+            engine.dispose()
+            with create_engine(TEST_DATABASE_URL).begin() as connection:
+                connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+    def test_never_synced_non_upbit_assets_do_not_starve_upbit(self, schema_engine):
+        """자산 동기화가 없는 빗썸 계정이 오래된 업비트 계정보다 앞서지 않음"""
+        # Given: 빗썸 계정은 거래내역만 최근에 동기화(자산은 NULL), 업비트 계정은 둘 다 오래됨
+        now = datetime.now(timezone.utc)
+        bithumb_user, upbit_user = str(uuid.uuid4()), str(uuid.uuid4())
+        with schema_engine.begin() as connection:
+            for n, (user_id, provider) in enumerate(((bithumb_user, 2), (upbit_user, 1))):
+                connection.execute(
+                    text(
+                        "INSERT INTO users (id, email, nickname, signup_type, is_connect_exchange) "
+                        "VALUES (:id, :email, :nickname, 0, true)"
+                    ),
+                    {"id": user_id, "email": f"user{n}@test", "nickname": f"user{n}"},
+                )
+                connection.execute(
+                    text(
+                        "INSERT INTO exchange_credentials "
+                        "(user_id, exchange_provider, encrypted_access_key, encrypted_secret_key) "
+                        "VALUES (:id, :provider, 'ak', 'sk')"
+                    ),
+                    {"id": user_id, "provider": provider},
+                )
+            connection.execute(
+                text(
+                    "INSERT INTO user_sync_status (user_id, exchange_code, trading_synced_at, assets_synced_at) "
+                    "VALUES (:bithumb, 2, :recent, NULL), (:upbit, 1, :stale, :stale)"
+                ),
+                {
+                    "bithumb": bithumb_user,
+                    "upbit": upbit_user,
+                    "recent": now - timedelta(minutes=1),
+                    "stale": now - timedelta(hours=2),
+                },
+            )
+
+        # When
+        due = UserSyncStatusRepository().find_due(now - timedelta(minutes=30), limit=1)
+
+        # Then
+        assert [row["user_id"] for row in due] == [upbit_user]
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_wait_time_after_burst(self):
+        """버스트를 다 쓰면 다음 토큰까지의 대기 시간 반환"""
+        # Given
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        # When
+        first = bucket.try_acquire()
+        second = bucket.try_acquire()
+        third = bucket.try_acquire()
+
+        # Then
+        assert first == 0 and second == 0
+        assert 0 < third <= 0.1
+
+    def test_hold_delays_next_token(self):
+        """429 대기(hold) 동안은 남은 토큰이 있어도 내주지 않음"""
+        # Given
+        bucket = TokenBucket(rate=10, capacity=10)
+
+        # When
+        bucket.hold(0.5)
+        wait = bucket.try_acquire()
+
+        # Then
+        assert 0.5 < wait <= 0.6
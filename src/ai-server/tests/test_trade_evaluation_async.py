@@ -0,0 +1,141 @@
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tests._evaluation_fakes import RateLimitError, evaluation_service, meta_response
+from utils.openai_retry import with_openai_retry_async
+
+LLM_SEC = 0.2
+
+
+@pytest.fixture
+def service():
+    trade = SimpleNamespace(
+        trade_type=1,
+        trade_time=datetime(2024, 1, 2, 9, 0),
+        price=120.0,
+        quantity=1.0,
+        total_price=120.0,
+        fee=0.06,
+        profit_loss_rate=20.0,
+        avg_buy_price=100.0,
+    )
+    trading_repo = Mock()
+    trading_repo.find_by_user_id_and_id_async = AsyncMock(return_value=trade)
+    diary_repo = Mock()
+    diary_repo.find_by_trading_history_id_async = AsyncMock(return_value=None)
+    result_repo = Mock()
+    result_repo.find_by_user_id_and_trade_id_async = AsyncMock(return_value=None)
+    return evaluation_service(trading_repo, diary_repo, result_repo, delay_sec=LLM_SEC)
+
+
+def _aevaluate(service):
+    return service.aevaluate("user-1", 10, "2024-01-02", 1, session=Mock())
+
+
+@patch("service.trade_evaluation_agent_service.arun_trade_evaluation_agent", new_callable=AsyncMock)
+class TestTradeEvaluationAsync:
+    """aevaluate 테스트"""
+
+    def test_experts_run_concurrently(self, arun_meta, service):
+        """세 전문가를 동시에 기다려 전체 시간이 전문가 한 명 수준"""
+        # Given
+        arun_meta.return_value = meta_response("평가")
+
+        # When
+        started = time.perf_counter()
+        result = asyncio.run(_aevaluate(service))
+        elapsed = time.perf_counter() - started
+
+        # Then
+        assert result.trade_evaluation == meta_response("평가")
+        assert elapsed < LLM_SEC * 2
+        assert "평균매수가 100.0" in arun_meta.call_args.kwargs["trade_history_text"]
+        assert arun_meta.call_args.kwargs["diary_reason"] == "(매매 일지 없음)"
+
+    def test_many_evaluations_share_one_thread(self, arun_meta, service):
+        """동시에 평가 여러 건을 실행해도 스레드를 더 쓰지 않음"""
+        # Given
+        arun_meta.return_value = meta_response("평가")
+
+        async def run_many():
+            return await asyncio.gather(*(_aevaluate(service) for _ in range(20)))
+
+        # When
+        started = time.perf_counter()
+        results = asyncio.run(run_many())
+        elapsed = time.perf_counter() - started
+
+        # Then
+        assert len(results) == 20
+        assert elapsed < LLM_SEC * 3
+
+    def test_stored_result_reused(self, arun_meta, service):
+        """입력이 같으면 전문가·메타 에이전트를 실행하지 않음"""
+        # Given
+        arun_meta.return_value = meta_response("첫 평가")
+        first = asyncio.run(_aevaluate(service))
+        service.result_repo.find_by_user_id_and_trade_id_async.return_value = SimpleNamespace(
+            result=first.to_result_dict(), input_fingerprints=first.input_fingerprints
+        )
+        arun_meta.reset_mock()
+        service._fear_greed.arun_request.reset_mock()
+
+        # When
+        result = asyncio.run(_aevaluate(service))
+
+        # Then
+        assert result.reused is True
+        arun_meta.assert_not_called()
+        service._fear_greed.arun_request.assert_not_called()
+
+    def test_missing_trade_returns_none(self, arun_meta, service):
+        """매매 내역이 없으면 None"""
+        # Given
+        service._trading_repo.find_by_user_id_and_id_async.return_value = None
+
+        # When / Then
+        assert asyncio.run(_aevaluate(service)) is None
+        service._article.abuild_request.assert_not_called()
+
+
+class TestOpenAIRetryAsync:
+    """with_openai_retry_async 테스트"""
+
+    def test_retries_rate_limit_without_blocking_loop(self):
+        """429는 asyncio.sleep으로 기다렸다가 재시도, 그동안 다른 코루틴 실행"""
+        # Given
+        fn = AsyncMock(side_effect=[RateLimitError("429"), "ok"])
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            return await asyncio.gather(
+                with_openai_retry_async(fn, base_delay_sec=0.05)(), ticker()
+            )
+
+        # When
+        result, _ = asyncio.run(run())
+
+        # Then
+        assert result == "ok"
+        assert fn.await_count == 2
+        assert len(ticks) == 5
+
+    def test_other_errors_not_retried(self):
+        """재시도 대상이 아닌 예외는 바로 발생"""
+        # Given
+        fn = AsyncMock(side_effect=ValueError("bad"))
+
+        # When / Then
+        with pytest.raises(ValueError):
+            asyncio.run(with_openai_retry_async(fn, base_delay_sec=0)())
+        assert fn.await_count == 1
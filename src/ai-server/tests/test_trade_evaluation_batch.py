@@ -0,0 +1,225 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from dependencies import (
+    get_async_db_session,
+    get_trade_evaluation_agent_service,
+    get_trade_evaluation_result_repository,
+)
+from main import app
+from service.trade_evaluation_agent_service import TradeEvaluationAgentService
+from tests._evaluation_fakes import RateLimitError, evaluation_service, meta_response
+
+USER_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def _trade(trade_id: int):
+    return SimpleNamespace(
+        id=trade_id,
+        trade_type=0,
+        trade_time=datetime(2024, 1, 2, 9, 0),
+        price=100.0 + trade_id,
+        quantity=1.0,
+        total_price=100.0 + trade_id,
+        fee=0.05,
+        profit_loss_rate=None,
+        avg_buy_price=None,
+    )
+
+
+def _service(trade_ids) -> TradeEvaluationAgentService:
+    trading_repo = Mock()
+    trading_repo.find_all_by_user_id_and_ids_async = AsyncMock(
+        return_value=[_trade(trade_id) for trade_id in trade_ids]
+    )
+    diary_repo = Mock()
+    diary_repo.find_all_by_trading_history_ids_async = AsyncMock(return_value=[])
+    result_repo = Mock()
+    result_repo.find_all_by_user_id_and_trade_ids_async = AsyncMock(return_value=[])
+    return evaluation_service(trading_repo, diary_repo, result_repo, delay_sec=0.01)
+
+
+ITEMS = [
+    (1, "2024-01-02", 1),
+    (2, "2024-01-02", 1),
+    (3, "2024-01-02", 2),
+    (4, "2024-01-03", 1),
+]
+
+
+def _aevaluate_batch(service, items=ITEMS):
+    return asyncio.run(service.aevaluate_batch(USER_ID, items, session=Mock()))
+
+
+@patch("service.trade_evaluation_agent_service.abatch_trade_evaluation_agent", new_callable=AsyncMock)
+class TestTradeEvaluationBatch:
+    """aevaluate_batch 테스트"""
+
+    def test_distinct_experts_run_once(self, abatch_meta):
+        """(target_date, coin_id) 그룹별로 전문가 입력을 만들고 같은 입력의 전문가는 한 번만 호출"""
+        # Given
+        service = _service([1, 2, 3, 4])
+        abatch_meta.side_effect = lambda inputs, max_concurrency: [meta_response("평가") for _ in inputs]
+
+        # When
+        batch = _aevaluate_batch(service)
+
+        # Then
+        assert sorted(batch.results) == [1, 2, 3, 4]
+        # 날짜 2개 → 기사·공포탐욕 각 2회, (날짜, 코인) 3개 → 코인가격 3회
+        assert service._article.arun_request.await_count == 2
+        assert service._fear_greed.arun_request.await_count == 2
+        assert service._coin_price.arun_request.await_count == 3
+        assert service._article.abuild_request.await_count == 2
+        # 메타 에이전트는 chain.abatch 한 번으로 4건
+        abatch_meta.assert_awaited_once()
+        inputs = abatch_meta.call_args.args[0]
+        assert [kwargs["target_period"] for kwargs in inputs] == [
+            "2024-01-02",
+            "2024-01-02",
+            "2024-01-02",
+            "2024-01-03",
+        ]
+        assert abatch_meta.call_args.kwargs["max_concurrency"] == 5
+
+    def test_missing_and_failed_trades_reported(self, abatch_meta):
+        """없는 매매는 not_found, 메타 에이전트 실패 건은 failed로 분리하고 나머지는 반환"""
+        # Given
+        service = _service([1, 2])
+        abatch_meta.side_effect = lambda inputs, max_concurrency: [
+            meta_response("평가"),
+            ValueError("parse error"),
+        ]
+
+        # When
+        batch = _aevaluate_batch(service, ITEMS[:3])
+
+        # Then
+        assert list(batch.results) == [1]
+        assert batch.not_found == [3]
+        assert "parse error" in batch.failed[2]
+
+    def test_rate_limited_meta_retried_individually(self, abatch_meta):
+        """abatch에서 429로 실패한 건만 개별 재시도"""
+        # Given
+        service = _service([1, 2])
+        abatch_meta.side_effect = lambda inputs, max_concurrency: [
+            meta_response("평가"),
+            RateLimitError("429"),
+        ]
+
+        # When
+        with patch(
+            "service.trade_evaluation_agent_service.arun_trade_evaluation_agent",
+            new=AsyncMock(return_value=meta_response("재시도")),
+        ) as arun_meta:
+            batch = _aevaluate_batch(service, ITEMS[:2])
+
+        # Then
+        assert batch.results[2].trade_evaluation == meta_response("재시도")
+        arun_meta.assert_awaited_once()
+        assert batch.failed == {}
+
+    def test_stored_results_reused(self, abatch_meta):
+        """입력이 같은 저장 결과가 있는 건은 LLM 없이 reused로 반환"""
+        # Given
+        service = _service([1])
+        abatch_meta.side_effect = lambda inputs, max_concurrency: [meta_response("평가") for _ in inputs]
+        first = _aevaluate_batch(service, ITEMS[:1]).results[1]
+        service.result_repo.find_all_by_user_id_and_trade_ids_async.return_value = [
+            SimpleNamespace(
+                trade_id=1,
+                result=first.to_result_dict(),
+                input_fingerprints=first.input_fingerprints,
+            )
+        ]
+        abatch_meta.reset_mock()
+        service._article.arun_request.reset_mock()
+
+        # When
+        batch = _aevaluate_batch(service, ITEMS[:1])
+
+        # Then
+        assert batch.results[1].reused is True
+        abatch_meta.assert_not_called()
+        service._article.arun_request.assert_not_called()
+
+
+class TestTradeEvaluationBatchApi:
+    """/trade-evaluation/evaluate/batch 라우트 테스트"""
+
+    def _post(self, service, repository, session, body):
+        app.dependency_overrides[get_trade_evaluation_agent_service] = lambda: service
+        app.dependency_overrides[get_trade_evaluation_result_repository] = lambda: repository
+        app.dependency_overrides[get_async_db_session] = lambda: session
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/api/trade-evaluation/evaluate/batch", json=body)
+
+        try:
+            return asyncio.run(run())
+        finally:
+            app.dependency_overrides.clear()
+
+    @patch("service.trade_evaluation_agent_service.abatch_trade_evaluation_agent", new_callable=AsyncMock)
+    def test_saves_new_results_in_one_upsert(self, abatch_meta):
+        """새로 계산한 결과를 bulk upsert 한 번으로 저장하고 건별 결과를 반환"""
+        # Given
+        abatch_meta.side_effect = lambda inputs, max_concurrency: [meta_response("평가") for _ in inputs]
+        repository = Mock()
+        repository.bulk_upsert_async = AsyncMock(return_value=2)
+        session = Mock()
+        session.commit = AsyncMock()
+        body = {
+            "user_id": USER_ID,
+            "items": [
+                {"trade_id": 1, "target_date": "2024-01-02", "coin_id": 1},
+                {"trade_id": 2, "target_date": "2024-01-02", "coin_id": 1},
+                {"trade_id": 9, "target_date": "2024-01-02", "coin_id": 1},
+            ],
+        }
+
+        # When
+        response = self._post(_service([1, 2]), repository, session, body)
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [r["trade_id"] for r in data["results"]] == [1, 2]
+        assert data["not_found"] == [9]
+        repository.bulk_upsert_async.assert_awaited_once()
+        rows = repository.bulk_upsert_async.call_args.args[2]
+        assert [row["trade_id"] for row in rows] == [1, 2]
+        assert rows[0]["result_dict"] == data["results"][0]["data"]
+        session.commit.assert_awaited_once()
+
+    def test_duplicate_trade_ids_rejected(self):
+        """같은 trade_id가 중복되면 요청 검증 실패"""
+        # Given
+        item = {"trade_id": 1, "target_date": "2024-01-02", "coin_id": 1}
+
+        # When
+        response = self._post(Mock(), Mock(), Mock(), {"user_id": USER_ID, "items": [item, item]})
+
+        # Then
+        assert response.status_code == 422
+
+    def test_invalid_date_returns_400(self):
+        """날짜 형식이 틀리면 400"""
+        # Given
+        service = Mock()
+        service.aevaluate_batch = AsyncMock()
+        body = {"user_id": USER_ID, "items": [{"trade_id": 1, "target_date": "20240102", "coin_id": 1}]}
+
+        # When
+        response = self._post(service, Mock(), Mock(), body)
+
+        # Then
+        assert response.status_code == 400
+        service.aevaluate_batch.assert_not_called()
@@ -0,0 +1,120 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tests._evaluation_fakes import evaluation_service, meta_response
+
+
+@pytest.fixture
+def service():
+    trade = SimpleNamespace(
+        trade_type=0,
+        trade_time=datetime(2024, 1, 2, 9, 0),
+        price=100.0,
+        quantity=1.0,
+        total_price=100.0,
+        fee=0.05,
+        profit_loss_rate=None,
+        avg_buy_price=None,
+    )
+    trading_repo = Mock()
+    trading_repo.find_by_user_id_and_id_async = AsyncMock(return_value=trade)
+    diary_repo = Mock()
+    diary_repo.find_by_trading_history_id_async = AsyncMock(
+        return_value=SimpleNamespace(
+            trading_mind=1, content={"blocks": [{"type": "text", "content": "돌파 매수"}]}
+        )
+    )
+    result_repo = Mock()
+    result_repo.find_by_user_id_and_trade_id_async = AsyncMock(return_value=None)
+    return evaluation_service(trading_repo, diary_repo, result_repo)
+
+
+def _store_result(service, result):
+    """aevaluate 결과를 저장된 행처럼 조회되게 설정"""
+    service.result_repo.find_by_user_id_and_trade_id_async.return_value = SimpleNamespace(
+        result=result.to_result_dict(), input_fingerprints=result.input_fingerprints
+    )
+
+
+def _evaluate(service):
+    return asyncio.run(service.aevaluate("user-1", 10, "2024-01-02", 1, session=Mock()))
+
+
+@patch("service.trade_evaluation_agent_service.arun_trade_evaluation_agent", new_callable=AsyncMock)
+class TestTradeEvaluationReuse:
+    """매매 평가 결과 재사용 테스트"""
+
+    def test_unchanged_inputs_return_stored_result(self, run_meta, service):
+        """입력이 같으면 LLM 없이 저장된 결과 반환"""
+        # Given
+        run_meta.return_value = meta_response("첫 평가")
+        _store_result(service, _evaluate(service))
+        run_meta.reset_mock()
+        service._article.arun_request.reset_mock()
+
+        # When
+        result = _evaluate(service)
+
+        # Then
+        assert result.reused is True
+        assert result.trade_evaluation == meta_response("첫 평가")
+        run_meta.assert_not_called()
+        service._article.arun_request.assert_not_called()
+
+    def test_diary_change_reruns_onlymeta_response(self, run_meta, service):
+        """일지만 바뀌면 저장된 전문가 응답을 쓰고 메타 에이전트만 다시 실행"""
+        # Given
+        run_meta.return_value = meta_response("첫 평가")
+        first = _evaluate(service)
+        _store_result(service, first)
+        service._diary_repo.find_by_trading_history_id_async.return_value = SimpleNamespace(
+            trading_mind=12, content={"blocks": [{"type": "text", "content": "급해서 추격 매수"}]}
+        )
+        run_meta.return_value = meta_response("다시 평가")
+        for expert in (service._article, service._coin_price, service._fear_greed):
+            expert.arun_request.reset_mock()
+
+        # When
+        result = _evaluate(service)
+
+        # Then
+        assert result.reused is False
+        assert result.trade_evaluation == meta_response("다시 평가")
+        assert result.input_fingerprints["experts"] == first.input_fingerprints["experts"]
+        assert result.input_fingerprints["meta"] != first.input_fingerprints["meta"]
+        for expert in (service._article, service._coin_price, service._fear_greed):
+            expert.arun_request.assert_not_called()
+        assert run_meta.call_args.kwargs["diary_trading_mind"] == "조급함"
+
+    def test_changed_market_data_reruns_that_expert(self, run_meta, service):
+        """전문가 입력(시장 데이터)이 바뀌면 그 전문가와 메타 에이전트만 다시 실행"""
+        # Given
+        run_meta.return_value = meta_response("첫 평가")
+        _store_result(service, _evaluate(service))
+        service._fear_greed.period_data = "new data"
+        for expert in (service._article, service._coin_price, service._fear_greed):
+            expert.arun_request.reset_mock()
+        run_meta.reset_mock()
+
+        # When
+        result = _evaluate(service)
+
+        # Then
+        assert result.reused is False
+        service._fear_greed.arun_request.assert_awaited_once()
+        service._article.arun_request.assert_not_called()
+        service._coin_price.arun_request.assert_not_called()
+        run_meta.assert_awaited_once()
+
+    def test_missing_trade_returns_none(self, run_meta, service):
+        """매매 내역이 없으면 None"""
+        # Given
+        service._trading_repo.find_by_user_id_and_id_async.return_value = None
+
+        # When / Then
+        assert _evaluate(service) is None
+        run_meta.assert_not_called()
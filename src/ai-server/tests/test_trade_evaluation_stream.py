@@ -0,0 +1,155 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from dependencies import (
+    get_trade_evaluation_agent_service,
+    get_trade_evaluation_result_repository,
+)
+from main import app
+from service.trade_evaluation_agent_service import (
+    TradeEvaluationAgentService,
+    TradeEvaluationExpertResponse,
+)
+from tests._evaluation_fakes import evaluation_service
+
+REQUEST = {"user_id": "550e8400-e29b-41d4-a716-446655440000", "trade_id": 10, "target_date": "2024-01-02", "coin_id": 1}
+
+
+def _service() -> TradeEvaluationAgentService:
+    trade = SimpleNamespace(
+        trade_type=0,
+        trade_time=datetime(2024, 1, 2, 9, 0),
+        price=100.0,
+        quantity=1.0,
+        total_price=100.0,
+        fee=0.05,
+        profit_loss_rate=None,
+        avg_buy_price=None,
+    )
+    trading_repo = Mock()
+    trading_repo.find_by_user_id_and_id_async = AsyncMock(return_value=trade)
+    diary_repo = Mock()
+    diary_repo.find_by_trading_history_id_async = AsyncMock(return_value=None)
+    result_repo = Mock()
+    result_repo.find_by_user_id_and_trade_id_async = AsyncMock(return_value=None)
+    return evaluation_service(
+        trading_repo,
+        diary_repo,
+        result_repo,
+        delay_sec={"article": 0.15, "coin_price": 0.05, "fear_greed": 0.1},
+    )
+
+
+def _meta_json() -> str:
+    return json.dumps(
+        {name: "평가" for name in TradeEvaluationExpertResponse.model_fields}, ensure_ascii=False
+    )
+
+
+async def _meta_tokens(**kwargs):
+    text = _meta_json()
+    for i in range(0, len(text), 16):
+        yield text[i : i + 16]
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@patch("service.trade_evaluation_agent_service.astream_trade_evaluation_text", _meta_tokens)
+class TestTradeEvaluationStream:
+    """매매 평가 스트리밍 테스트"""
+
+    def test_service_emits_experts_in_completion_order_then_tokens(self):
+        """전문가 응답은 끝나는 순서대로, 이어서 메타 에이전트 토큰과 최종 결과"""
+        # Given
+        service = _service()
+
+        async def collect():
+            plan = await service.aprepare("user-1", 10, "2024-01-02", 1, session=Mock())
+            return [event async for event in service.astream(plan)]
+
+        # When
+        events = asyncio.run(collect())
+
+        # Then
+        names = [event[0] for event in events]
+        assert [data["name"] for event, data in events if event == "expert"] == [
+            "coin_price_expert",
+            "fear_greed_expert",
+            "article_expert",
+        ]
+        assert names[3:-1] == ["token"] * (len(names) - 4)
+        assert "".join(data["text"] for event, data in events if event == "token") == _meta_json()
+        assert events[-1][0] == "result"
+        assert events[-1][1]["data"]["trade_evaluation_expert"]["suggestions"] == "평가"
+
+    def test_route_streams_and_saves_result(self):
+        """SSE로 이벤트를 보내고 최종 결과는 저장 후 result 이벤트로 전송"""
+        # Given
+        repository = Mock()
+        repository.save_async = AsyncMock()
+        session = Mock()
+        session.commit = AsyncMock()
+
+        @asynccontextmanager
+        async def get_async_session():
+            yield session
+
+        app.dependency_overrides[get_trade_evaluation_agent_service] = _service
+        app.dependency_overrides[get_trade_evaluation_result_repository] = lambda: repository
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/api/trade-evaluation/evaluate/stream", json=REQUEST)
+
+        # When
+        try:
+            with patch("api.trade_evaluation_api.db.get_async_session", get_async_session):
+                response = asyncio.run(run())
+        finally:
+            app.dependency_overrides.clear()
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [event for event, _ in events][:3] == ["expert"] * 3
+        assert events[-1][0] == "result"
+        repository.save_async.assert_awaited_once()
+        assert repository.save_async.call_args.kwargs["result_dict"] == events[-1][1]["data"]
+        session.commit.assert_awaited_once()
+
+    def test_route_returns_404_before_streaming(self):
+        """매매 내역이 없으면 스트림 대신 404"""
+        # Given
+        service = Mock()
+        service.aprepare = AsyncMock(return_value=None)
+        app.dependency_overrides[get_trade_evaluation_agent_service] = lambda: service
+        app.dependency_overrides[get_trade_evaluation_result_repository] = lambda: Mock()
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/api/trade-evaluation/evaluate/stream", json=REQUEST)
+
+        # When
+        try:
+            response = asyncio.run(run())
+        finally:
+            app.dependency_overrides.clear()
+
+        # Then
+        assert response.status_code == 404
+        assert response.json()["detail"]["error_code"] == "TRADE_NOT_FOUND"
@@ -0,0 +1,154 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from dependencies import get_trading_histories_service
+from main import app
+from service.trading_histories_service import (
+    TradingHistoriesService,
+    decode_cursor,
+    encode_cursor,
+)
+
+USER_ID = "bd70f700-5399-46e5-837d-2fc978b3c3b7"
+
+
+def _history(history_id: int, minute: int):
+    return SimpleNamespace(
+        id=history_id,
+        coin_id=1,
+        exchange_code=1,
+        trade_uuid=f"uuid-{history_id}",
+        trade_type=0,
+        price=Decimal("50000000.5"),
+        quantity=Decimal("0.1"),
+        total_price=Decimal("5000000.05"),
+        fee=None,
+        trade_time=datetime(2024, 1, 1, 9, minute),
+        created_at=None,
+    )
+
+
+class TestTradingHistoriesPagination:
+    """거래내역 키셋 페이지네이션·NDJSON 내보내기 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.service = TradingHistoriesService()
+        self.service._trading_repository = Mock()
+
+    def test_page_returns_cursor_of_last_row(self):
+        """limit보다 한 건 더 조회되면 마지막 행 기준 next_cursor 반환"""
+        # Given
+        rows = [_history(3, 30), _history(2, 20), _history(1, 10)]
+        self.service._trading_repository.find_page_by_user.return_value = rows
+
+        # When
+        page = self.service.get_trading_histories_page(USER_ID, limit=2, coin_id=1)
+
+        # Then
+        assert [h["id"] for h in page["trading_histories"]] == [3, 2]
+        assert page["has_more"] is True
+        assert decode_cursor(page["next_cursor"]) == (datetime(2024, 1, 1, 9, 20), 2)
+        args, kwargs = self.service._trading_repository.find_page_by_user.call_args
+        assert args == (USER_ID, 3)
+        assert kwargs["cursor"] is None
+        assert kwargs["coin_id"] == 1
+
+    def test_next_page_uses_decoded_cursor(self):
+        """넘겨받은 커서를 (trade_time, id)로 풀어 저장소에 전달, 마지막 페이지는 커서 없음"""
+        # Given
+        cursor = encode_cursor(_history(2, 20))
+        self.service._trading_repository.find_page_by_user.return_value = [_history(1, 10)]
+
+        # When
+        page = self.service.get_trading_histories_page(USER_ID, limit=2, cursor=cursor)
+
+        # Then
+        assert page["has_more"] is False
+        assert page["next_cursor"] is None
+        kwargs = self.service._trading_repository.find_page_by_user.call_args.kwargs
+        assert kwargs["cursor"] == (datetime(2024, 1, 1, 9, 20), 2)
+
+    def test_decimal_converted_without_str_round_trip(self):
+        """Numeric 값은 float로, None 수수료는 0.0으로"""
+        # Given
+        self.service._trading_repository.find_page_by_user.return_value = [_history(1, 10)]
+
+        # When
+        history = self.service.get_trading_histories_page(USER_ID)["trading_histories"][0]
+
+        # Then
+        assert history["price"] == 50000000.5
+        assert history["fee"] == 0.0
+        assert history["trade_time"] == "2024-01-01T09:10:00"
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(_history(1, 1))[:-3]])
+    def test_invalid_cursor_rejected(self, cursor):
+        """형식이 잘못된 커서는 ValueError"""
+        with pytest.raises(ValueError):
+            self.service.get_trading_histories_page(USER_ID, cursor=cursor)
+
+    def test_ndjson_export_streams_one_line_per_row(self):
+        """내보내기는 거래내역 1건당 JSON 한 줄"""
+        # Given
+        self.service._trading_repository.iter_by_user.return_value = iter(
+            [_history(2, 20), _history(1, 10)]
+        )
+
+        # When
+        lines = list(self.service.iter_trading_histories_ndjson(USER_ID, exchange_code=1))
+
+        # Then
+        assert [json.loads(line)["id"] for line in lines] == [2, 1]
+        assert all(line.endswith("\n") for line in lines)
+
+
+class TestTradingHistoriesApi:
+    """거래내역 조회·내보내기 API 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 서비스 교체"""
+        self.service = Mock()
+        app.dependency_overrides[get_trading_histories_service] = lambda: self.service
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+
+    def test_invalid_cursor_returns_400(self, client):
+        """잘못된 커서는 400 INVALID_CURSOR"""
+        # Given
+        self.service.get_trading_histories_page.side_effect = ValueError("잘못된 페이지 커서입니다")
+
+        # When
+        response = client.get(
+            "/api/trading-histories", params={"user_id": USER_ID, "cursor": "x"}
+        )
+
+        # Then
+        assert response.status_code == 400
+        assert response.json()["detail"]["error_code"] == "INVALID_CURSOR"
+
+    def test_export_streams_ndjson(self, client):
+        """내보내기 응답은 application/x-ndjson 스트림, timezone 있는 기간은 KST 기준으로 변환"""
+        # Given
+        self.service.iter_trading_histories_ndjson.return_value = iter(
+            ['{"id": 2}\n', '{"id": 1}\n']
+        )
+
+        # When
+        response = client.get(
+            "/api/trading-histories/export",
+            params={"user_id": USER_ID, "start_time": "2024-01-01T00:00:00+00:00"},
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.text.splitlines() == ['{"id": 2}', '{"id": 1}']
+        kwargs = self.service.iter_trading_histories_ndjson.call_args.kwargs
+        assert kwargs["start_time"] == datetime(2024, 1, 1, 9, 0)
@@ -0,0 +1,236 @@
+"""
+trading_histories user_id HASH 파티션 전환 테스트.
+
+DB 검사는 TEST_DATABASE_URL(Postgres)이 있을 때만 실행합니다. 임시 스키마에 기존(일반) 테이블을 만들어
+데이터를 채운 뒤 partition_trading_histories_by_user()로 전환하고, 저장소 쿼리가 파티션 하나만 찾는지 확인합니다.
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+import model.Assets  # noqa: F401
+import model.CoinHoldingsPast  # noqa: F401
+import model.CoinPricesDay  # noqa: F401
+import model.Coins  # noqa: F401
+import model.ExchangeCredentials  # noqa: F401
+import model.TradeEvaluationResult  # noqa: F401
+import model.Users  # noqa: F401
+from database.database_connection import db
+from database.migrate import run_migrations
+from database.partitions import hash_partition_name, partition_trading_histories_by_user
+from database.replica import RoutingSession
+from model.TradingHistories import TradingHistories
+from repository.trading_histories_repository import TradingHistoriesRepository
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+requires_db = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 없으면 파티션 전환 검사를 건너뜀"
+)
+
+PARTITIONS = 4
+USER_COUNT = 40
+TRADES_PER_USER = 50
+
+
+def _user_id(n: int) -> uuid.UUID:
+    return uuid.UUID(bytes=bytes.fromhex(f"{n:032x}"))
+
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (id, email, nickname, signup_type, is_connect_exchange)
+    SELECT lpad(to_hex(i), 32, '0')::uuid, 'user' || i || '@test', 'user' || i, 0, false
+    FROM generate_series(1, {USER_COUNT}) i
+    """,
+    "INSERT INTO coins (id, symbol, quote_currency, market_code, exchange) VALUES (1, 'BTC', 'KRW', 'KRW-BTC', 'upbit')",
+    f"""
+    INSERT INTO trading_histories
+        (user_id, coin_id, exchange_code, trade_uuid, trade_type, price, quantity, total_price, trade_time)
+    SELECT lpad(to_hex(i % {USER_COUNT} + 1), 32, '0')::uuid, 1, 1, 't' || i, i % 2, 1, 1, 1,
+           timestamp '2024-01-01' + i * interval '1 hour'
+    FROM generate_series(1, {USER_COUNT * TRADES_PER_USER}) i
+    """,
+    """
+    INSERT INTO trade_evaluation_results (user_id, trade_id, target_date, coin_id, result)
+    SELECT user_id, id, date '2024-01-01', coin_id, '{}'::jsonb FROM trading_histories WHERE id <= 100
+    """,
+    # user_id가 없어 복합 외래 키로 옮길 수 없는 참조 (app-server 쪽 테이블 가정)
+    """
+    CREATE TABLE trade_notes (
+        id SERIAL PRIMARY KEY,
+        trading_history_id INTEGER NOT NULL REFERENCES trading_histories (id) ON DELETE CASCADE
+    )
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+def plain_db():
+    """임시 스키마에 일반 테이블 생성 → 마이그레이션 → 데이터 채움"""
+    schema = f"hash_part_{uuid.uuid4().hex[:8]}"
+    engine = create_engine(TEST_DATABASE_URL)
+
+    @event.listens_for(engine, "connect")
+    def _set_search_path(dbapi_connection, _):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"SET search_path TO {schema}")
+        dbapi_connection.commit()
+
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+
+    try:
+        db.Base.metadata.create_all(engine)
+        run_migrations(engine)
+        with engine.begin() as connection:
+            for sql in SEED_SQL:
+                connection.execute(text(sql))
+        yield engine
+    finally:
+        engine.dispose()
+        with create_engine(TEST_DATABASE_URL).begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+
+@pytest.fixture(scope="module")
+def converted_db(plain_db):
+    partition_trading_histories_by_user(
+        plain_db, partitions=PARTITIONS, drop_unsupported_foreign_keys=True
+    )
+    return plain_db
+
+
+@pytest.fixture
+def repository_session(converted_db, monkeypatch):
+    """저장소가 여는 세션도 테스트 스키마를 쓰도록 교체하고 실행한 SQL을 수집"""
+    monkeypatch.setattr(db, "SessionLocal", sessionmaker(class_=RoutingSession, bind=converted_db))
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(converted_db, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(converted_db, "before_cursor_execute", _capture)
+
+
+def _scanned_relations(plan: dict) -> set:
+    """스캔한 테이블 (UPDATE 대상 표시 노드는 제외)"""
+    scanned = "Relation Name" in plan and plan["Node Type"] != "ModifyTable"
+    relations = {plan["Relation Name"]} if scanned else set()
+    for child in plan.get("Plans", []):
+        relations |= _scanned_relations(child)
+    return relations
+
+
+def _explain(engine, statement: str, parameters) -> set:
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+            plan = cursor.fetchone()[0]
+    finally:
+        raw.rollback()
+        raw.close()
+    plan = plan if isinstance(plan, list) else json.loads(plan)
+    return _scanned_relations(plan[0]["Plan"])
+
+
+class TestTradingHistoriesIdentity:
+    """거래내역 ORM 식별자 테스트"""
+
+    def test_mapper_primary_key_includes_user_id(self):
+        """UPDATE/DELETE가 user_id로 파티션을 찾도록 ORM 식별자는 (id, user_id)"""
+        assert [c.name for c in inspect(TradingHistories).primary_key] == ["id", "user_id"]
+
+
+@requires_db
+class TestPartitionTradingHistoriesByUser:
+    """trading_histories user_id HASH 파티션 전환 테스트"""
+
+    def test_unsupported_foreign_key_aborts_without_changes(self, plain_db):
+        """user_id 없는 테이블의 외래 키가 있으면 ValueError, 테이블은 그대로"""
+        with pytest.raises(ValueError, match="trade_notes"):
+            partition_trading_histories_by_user(plain_db, partitions=PARTITIONS)
+
+        with plain_db.connect() as connection:
+            relkind = connection.execute(
+                text("SELECT relkind FROM pg_class WHERE oid = 'trading_histories'::regclass")
+            ).scalar()
+        assert relkind == "r"
+
+    def test_rows_keys_and_foreign_keys_moved(self, converted_db):
+        """행 수 유지, (id, user_id) 기본 키, 평가 결과 외래 키는 (user_id, trade_id) 복합 키로"""
+        with converted_db.connect() as connection:
+            partitions = connection.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'trading_histories'::regclass ORDER BY 1"
+                )
+            ).scalars().all()
+            count = connection.execute(text("SELECT count(*) FROM trading_histories")).scalar()
+            foreign_keys = dict(
+                connection.execute(
+                    text(
+                        "SELECT conrelid::regclass::text, pg_get_constraintdef(oid) FROM pg_constraint "
+                        "WHERE contype = 'f' AND confrelid = 'trading_histories'::regclass"
+                    )
+                ).all()
+            )
+
+        assert partitions == [hash_partition_name("trading_histories", r) for r in range(PARTITIONS)]
+        assert count == USER_COUNT * TRADES_PER_USER
+        assert foreign_keys == {
+            "trade_evaluation_results": "FOREIGN KEY (user_id, trade_id) "
+            "REFERENCES trading_histories(user_id, id) ON DELETE CASCADE"
+        }
+        assert partition_trading_histories_by_user(converted_db, partitions=PARTITIONS) is False
+
+    def test_bulk_insert_continues_id_sequence(self, repository_session):
+        """전환 후 일괄 저장은 기존 id 다음부터, 중복 체결은 유니크 키로 건너뜀"""
+        # Given
+        def history(trade_uuid):
+            return TradingHistories(
+                user_id=_user_id(3), coin_id=1, exchange_code=1, trade_uuid=trade_uuid,
+                trade_type=0, price=Decimal("1"), quantity=Decimal("1"),
+                total_price=Decimal("1"), fee=Decimal("0"), trade_time=datetime(2025, 1, 1),
+            )
+
+        # When
+        saved = TradingHistoriesRepository().bulk_insert_trading_histories(
+            [history("t2"), history("new-1")]
+        )
+
+        # Then
+        assert [h.trade_uuid for h in saved] == ["new-1"]
+        assert saved[0].id > USER_COUNT * TRADES_PER_USER
+
+    def test_per_user_queries_scan_one_partition(self, converted_db, repository_session):
+        """사용자별 조회·수익률 일괄 갱신은 파티션 하나만 스캔"""
+        # Given
+        repository = TradingHistoriesRepository()
+        user_id = str(_user_id(7))
+        histories = repository.find_by_user_and_exchange(user_id, 1)
+        for h in histories:
+            h.profit_loss_rate = Decimal("0.10")
+
+        # When
+        repository.bulk_update_profit_loss(histories[:5])
+
+        # Then
+        statements = [
+            (statement, parameters)
+            for statement, parameters in repository_session
+            if statement.lstrip().upper().startswith(("SELECT", "UPDATE"))
+        ]
+        assert len(statements) == 2
+        for statement, parameters in statements:
+            scanned = _explain(converted_db, statement, parameters)
+            assert len(scanned) == 1, f"{statement}: {scanned}"
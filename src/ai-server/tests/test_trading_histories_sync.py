@@ -0,0 +1,213 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# 관계(relationship) 매핑에 필요한 모델 등록
+import model.Assets  # noqa: F401
+import model.CoinHoldingsPast  # noqa: F401
+import model.CoinPricesDay  # noqa: F401
+import model.Coins  # noqa: F401
+import model.ExchangeCredentials  # noqa: F401
+import model.Users  # noqa: F401
+from service.trading_histories_service import TradingHistoriesService
+from service.trading_profit_service import TradingProfitService
+
+
+def _order(uuid: str, market: str = "KRW-BTC", side: str = "bid"):
+    return {
+        "uuid": uuid,
+        "market": market,
+        "side": side,
+        "paid_fee": "10",
+        "created_at": f"2024-01-0{uuid[-1]}T09:00:00+09:00",
+        "trades": [{"volume": "0.1", "funds": "5000000"}],
+    }
+
+
+class TestTradingHistoriesStreamingSync:
+    """TradingHistoriesService 스트리밍 동기화 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.service = TradingHistoriesService()
+        self.service._exchange_credentials_service = Mock()
+        self.service._exchange_credentials_service.get_credentials.return_value = (
+            SimpleNamespace(access_key="ak", secret_key="sk")
+        )
+        self.service._coin_catalog = Mock()
+        self.service._coin_catalog.market_code_map.return_value = {"KRW-BTC": 1}
+        self.service._upbit_service = Mock()
+        self.service._trading_repository = Mock()
+        self.service._trading_repository.bulk_insert_trading_histories.side_effect = (
+            lambda histories, session=None: histories
+        )
+        self.service._trading_profit_service = Mock()
+        self.service._trading_profit_service.apply_incremental_profit_loss.side_effect = (
+            lambda user_id, exchange_code, histories, session=None: {
+                "updated_count": len(histories)
+            }
+        )
+
+    def _pages(self, *order_lists):
+        return iter(
+            {
+                "window_index": i,
+                "window_count": len(order_lists),
+                "range_start": "",
+                "range_end": "",
+                "orders": orders,
+            }
+            for i, orders in enumerate(order_lists)
+        )
+
+    def test_each_page_saved_as_it_arrives(self):
+        """페이지마다 저장과 증분 수익률 계산이 바로 이루어짐"""
+        # Given
+        self.service._trading_profit_service.can_apply_incrementally.return_value = True
+        self.service._upbit_service.iter_trading_history_pages.return_value = (
+            self._pages([_order("u1"), _order("u2")], [], [_order("u3")])
+        )
+
+        # When
+        stream = self.service.iter_sync_trading_histories("user-1", "UPBIT")
+        first = next(stream)
+
+        # Then: 첫 페이지는 나머지 페이지 조회 전에 이미 저장됨
+        assert first["rows_saved"] == 2
+        self.service._trading_repository.bulk_insert_trading_histories.assert_called_once()
+
+        rest = list(stream)
+        assert rest[-1] == {
+            "windows_scanned": 3,
+            "window_count": 3,
+            "orders_fetched": 3,
+            "rows_saved": 3,
+            "profit_updated": 3,
+        }
+        # 빈 페이지는 수익률 계산을 건너뜀
+        assert (
+            self.service._trading_profit_service.apply_incremental_profit_loss.call_count
+            == 2
+        )
+        # coin 목록은 동기화당 한 번만 가져옴
+        self.service._coin_catalog.market_code_map.assert_called_once()
+
+    def test_full_recalculation_when_holdings_missing(self):
+        """평단 없이 기존 거래내역만 있으면 마지막에 전체 재계산"""
+        # Given
+        self.service._trading_profit_service.can_apply_incrementally.return_value = False
+        self.service._trading_profit_service.calculate_and_update_profit_loss.return_value = {
+            "updated_count": 5
+        }
+        self.service._upbit_service.iter_trading_history_pages.return_value = (
+            self._pages([_order("u1")])
+        )
+        on_progress = Mock()
+
+        # When
+        result = self.service.sync_trading_histories(
+            "user-1", "UPBIT", on_progress=on_progress
+        )
+
+        # Then
+        self.service._trading_profit_service.apply_incremental_profit_loss.assert_not_called()
+        self.service._trading_profit_service.calculate_and_update_profit_loss.assert_called_once_with(
+            "user-1", 1
+        )
+        assert result["profit_updated"] == 5
+        assert on_progress.call_count == 2
+
+
+def _history(history_id: int, trade_type: int, price: str, quantity: str, day: int):
+    return SimpleNamespace(
+        id=history_id,
+        user_id="user-1",
+        coin_id=1,
+        trade_type=trade_type,
+        price=Decimal(price),
+        quantity=Decimal(quantity),
+        trade_time=datetime(2024, 1, day, 9, 0, 0),
+        profit_loss_rate=None,
+        avg_buy_price=None,
+    )
+
+
+class TestIncrementalProfitLoss:
+    """TradingProfitService 증분 수익률 계산 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.service = TradingProfitService()
+        self.service._trading_histories_repository = Mock()
+        self.service._trading_histories_repository.bulk_update_profit_loss.side_effect = (
+            lambda histories, session=None: len(histories)
+        )
+        self.service._coin_holdings_past_repository = Mock()
+        self.service._coin_holdings_past_repository.delete_holdings_not_in_list.return_value = 0
+        self.service._coin_catalog = Mock()
+        self.service._coin_catalog.symbol_of.return_value = "BTC"
+        # 이미 반영된 거래: 1일 1 BTC @100 매수, 3일 0.5 BTC @120 매도 → 평단 100, 잔량 0.5
+        self.service._coin_holdings_past_repository.get_holdings_dict.return_value = {
+            1: {
+                "symbol": "BTC",
+                "avg_buy_price": Decimal("100"),
+                "remaining_quantity": Decimal("0.5"),
+            }
+        }
+        self.session = Mock()
+
+    def _saved_holdings(self):
+        args = self.service._coin_holdings_past_repository.save_or_update_holdings.call_args
+        return args[0][2]
+
+    def test_newer_trades_applied_on_stored_holdings(self):
+        """새 거래가 모두 이미 반영된 거래보다 최신이면 저장된 평단 위에 이어서 계산"""
+        # Given
+        self.service._trading_histories_repository.exists_trade_at_or_after.return_value = (
+            False
+        )
+        new_buy = _history(3, 0, "200", "1.5", 4)
+
+        # When
+        result = self.service.apply_incremental_profit_loss(
+            "user-1", 1, [new_buy], session=self.session
+        )
+
+        # Then
+        self.service._trading_histories_repository.find_by_user_and_exchange.assert_not_called()
+        assert result["updated_count"] == 1
+        assert self._saved_holdings()[1]["avg_buy_price"] == Decimal("175")
+        assert self._saved_holdings()[1]["remaining_quantity"] == Decimal("2.0")
+
+    def test_older_trade_falls_back_to_full_recalculation(self):
+        """이미 반영된 거래보다 과거의 거래가 새로 저장되면 전체 거래내역으로 재계산"""
+        # Given: 2일 매수가 3일 매도보다 늦게 동기화됨
+        old_buy = _history(1, 0, "100", "1", 1)
+        old_sell = _history(2, 1, "120", "0.5", 3)
+        new_buy = _history(3, 0, "200", "1", 2)
+        self.service._trading_histories_repository.exists_trade_at_or_after.return_value = (
+            True
+        )
+        self.service._trading_histories_repository.find_by_user_and_exchange.return_value = [
+            old_sell,
+            new_buy,
+            old_buy,
+        ]
+
+        # When
+        result = self.service.apply_incremental_profit_loss(
+            "user-1", 1, [new_buy], session=self.session
+        )
+
+        # Then
+        self.service._trading_histories_repository.exists_trade_at_or_after.assert_called_once_with(
+            "user-1", 1, new_buy.trade_time, exclude_ids=[3], session=self.session
+        )
+        self.service._trading_histories_repository.bulk_update_profit_loss.assert_not_called()
+        assert result["updated_count"] == 3
+        # 매도 시점 평단은 2일 매수를 포함한 (100 + 200) / 2 = 150
+        assert old_sell.avg_buy_price == 150.0
+        assert old_sell.profit_loss_rate == -20.0
+        assert self._saved_holdings()[1]["avg_buy_price"] == Decimal("150")
+        assert self._saved_holdings()[1]["remaining_quantity"] == Decimal("1.5")
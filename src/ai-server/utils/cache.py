@@ -0,0 +1,469 @@
+"""
+2단 캐시 (프로세스 내 LRU L1 + Redis L2).
+
+uvicorn 워커·수집기가 같은 값을 각자 계산하고 다시 가져오지 않도록, 프로세스 안의 LRU(L1)를 먼저 보고
+없으면 여러 프로세스·호스트가 함께 쓰는 Redis(L2)를 봅니다.
+
+- 키는 {CACHE_KEY_PREFIX}:{namespace}:{key}. namespace 단위로 TTL·L1 크기를 정하고 clear() 할 수 있음
+- L1은 항목 수(CACHE_L1_MAX_ENTRIES)와 직렬화 크기 합(CACHE_L1_MAX_BYTES) 중 먼저 넘는 쪽에서 오래 안 쓴 항목부터 제거
+- get_or_load()는 stampede 방지: 같은 프로세스에서는 한 스레드만 loader를 실행하고 나머지는 결과를 기다리며,
+  L2가 있으면 프로세스 간에도 SET NX 잠금으로 한 곳만 계산하고 나머지는 L2에 값이 생길 때까지 기다림
+- Redis 오류는 캐시 미스로 처리하고 CACHE_L2_RETRY_SEC 동안 L1만 사용 (Redis 장애가 요청 실패가 되지 않게)
+- namespace별 L1/L2 hit, miss, 저장, 제거, L2 오류, 잠금 대기 지표 (/api/admin/cache-metrics)
+- invalidation_name을 주면 캐시 무효화 알림(database/invalidation.py)을 받을 때 해당 키(없으면 전체)를 비움
+
+L2는 CACHE_REDIS_URL(없으면 REDIS_URL)이 있을 때만 사용하고, 없으면 L1만 씁니다.
+테스트는 InMemoryBackend를 L2로 넘깁니다.
+
+L1은 값 객체를 그대로 보관하므로 꺼낸 값은 읽기 전용으로 다뤄야 합니다.
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+CacheKey = Union[str, int, Tuple[Hashable, ...]]
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+class CacheMetrics:
+    """namespace 1개의 캐시 지표"""
+
+    COUNTERS = (
+        "l1_hits",
+        "l2_hits",
+        "misses",
+        "loads",
+        "sets",
+        "evictions",
+        "l2_errors",
+        "lock_waits",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {name: 0 for name in self.COUNTERS}
+
+    def incr(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["l1_hits"] + counts["l2_hits"] + counts["misses"]
+        counts["hit_rate"] = (
+            round((counts["l1_hits"] + counts["l2_hits"]) / lookups, 4) if lookups else None
+        )
+        return counts
+
+
+class LocalLRU:
+    """항목 수·크기 합 제한이 있는 TTL LRU (스레드 안전)"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl_sec: float) -> int:
+        """
+        저장하고 공간을 만들려고 제거한 항목 수 반환
+
+        한 항목이 max_bytes보다 크면 저장하지 않습니다.
+        """
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if size > self.max_bytes:
+                return 0
+            self._data[key] = (value, size, time.monotonic() + ttl_sec)
+            self._bytes += size
+            evicted = 0
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._data)))
+                evicted += 1
+            return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+
+class InMemoryBackend:
+    """L2 백엔드의 프로세스 내 구현 (테스트용, RedisBackend와 같은 인터페이스)"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def _alive(self, key: str, now: float) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            del self._data[key]
+            return None
+        return entry[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._alive(key, time.monotonic())
+
+    def set(self, key: str, data: bytes, ttl_sec: float) -> None:
+        with self._lock:
+            self._data[key] = (data, time.monotonic() + ttl_sec)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                del self._data[key]
+
+    def acquire_lock(self, key: str, token: str, ttl_sec: float) -> bool:
+        with self._lock:
+            if self._alive(key, time.monotonic()) is not None:
+                return False
+            self._data[key] = (token.encode(), time.monotonic() + ttl_sec)
+            return True
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            if self._alive(key, time.monotonic()) == token.encode():
+                del self._data[key]
+
+
+# 잠금을 잡은 쪽(token)만 해제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisBackend:
+    """Redis L2 백엔드"""
+
+    def __init__(self, url: str, socket_timeout_sec: float = 0.5):
+        import redis
+
+        self.client = redis.Redis.from_url(
+            url,
+            socket_timeout=socket_timeout_sec,
+            socket_connect_timeout=socket_timeout_sec,
+            health_check_interval=30,
+        )
+        self._release = self.client.register_script(_RELEASE_LOCK_SCRIPT)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, data: bytes, ttl_sec: float) -> None:
+        self.client.set(key, data, px=max(1, int(ttl_sec * 1000)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        batch = []
+        for key in self.client.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self.client.unlink(*batch)
+                batch = []
+        if batch:
+            self.client.unlink(*batch)
+
+    def acquire_lock(self, key: str, token: str, ttl_sec: float) -> bool:
+        return bool(self.client.set(key, token, nx=True, px=max(1, int(ttl_sec * 1000))))
+
+    def release_lock(self, key: str, token: str) -> None:
+        self._release(keys=[key], args=[token])
+
+
+class TieredCache:
+    """namespace 1개의 L1 + L2 캐시"""
+
+    def __init__(
+        self,
+        namespace: str,
+        l2=None,
+        ttl_sec: float = 300,
+        l1_ttl_sec: Optional[float] = None,
+        l1_max_entries: Optional[int] = None,
+        l1_max_bytes: Optional[int] = None,
+        lock_ttl_sec: float = 60,
+        lock_wait_sec: float = 30,
+        key_prefix: Optional[str] = None,
+        invalidation_name: Optional[str] = None,
+    ):
+        self.namespace = namespace
+        self.ttl_sec = ttl_sec
+        # L1은 다른 프로세스의 변경을 늦게 보므로 L2보다 길게 두지 않음
+        self.l1_ttl_sec = min(l1_ttl_sec or ttl_sec, ttl_sec)
+        self.lock_ttl_sec = lock_ttl_sec
+        self.lock_wait_sec = lock_wait_sec
+        self.prefix = f"{key_prefix or os.getenv('CACHE_KEY_PREFIX', 'bitriever')}:{namespace}:"
+        self.l1 = LocalLRU(
+            l1_max_entries or _env_int("CACHE_L1_MAX_ENTRIES", 1000),
+            l1_max_bytes or _env_int("CACHE_L1_MAX_BYTES", 32 * 1024 * 1024),
+        )
+        self.l2 = l2
+        self.l2_retry_sec = _env_float("CACHE_L2_RETRY_SEC", 30)
+        self._l2_down_until = 0.0
+        self.metrics = CacheMetrics()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+        if invalidation_name:
+            from database.invalidation import subscribe
+
+            subscribe(invalidation_name, self._on_invalidation)
+
+    def _full_key(self, key: CacheKey) -> str:
+        if isinstance(key, tuple):
+            key = ":".join(str(part) for part in key)
+        return f"{self.prefix}{key}"
+
+    # L2 호출 (오류는 미스로 처리하고 잠시 L2를 건너뜀)
+    def _l2_available(self) -> bool:
+        return self.l2 is not None and time.monotonic() >= self._l2_down_until
+
+    def _l2_call(self, method: str, *args, default=None):
+        if not self._l2_available():
+            return default
+        try:
+            return getattr(self.l2, method)(*args)
+        except Exception as e:
+            self.metrics.incr("l2_errors")
+            self._l2_down_until = time.monotonic() + self.l2_retry_sec
+            logger.warning(
+                f"L2 캐시 오류, {self.l2_retry_sec:.0f}초 동안 L1만 사용: namespace={self.namespace}, error={e}"
+            )
+            return default
+
+    def _get_l2(self, full_key: str) -> Any:
+        """L2에서 꺼내 L1에도 저장 (없거나 읽을 수 없으면 MISSING)"""
+        data = self._l2_call("get", full_key)
+        if data is None:
+            return MISSING
+        try:
+            value = pickle.loads(data)
+        except Exception as e:
+            logger.warning(f"L2 캐시 값 역직렬화 실패, 미스로 처리: key={full_key}, error={e}")
+            return MISSING
+        self.metrics.incr("l2_hits")
+        self.metrics.incr("evictions", self.l1.set(full_key, value, len(data), self.l1_ttl_sec))
+        return value
+
+    def _get(self, full_key: str) -> Any:
+        value = self.l1.get(full_key)
+        if value is not MISSING:
+            self.metrics.incr("l1_hits")
+            return value
+
+        value = self._get_l2(full_key)
+        if value is MISSING:
+            self.metrics.incr("misses")
+        return value
+
+    def _set(self, full_key: str, value: Any, ttl_sec: Optional[float]) -> None:
+        ttl_sec = ttl_sec or self.ttl_sec
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.metrics.incr("sets")
+        self.metrics.incr(
+            "evictions", self.l1.set(full_key, value, len(data), min(ttl_sec, self.l1_ttl_sec))
+        )
+        self._l2_call("set", full_key, data, ttl_sec)
+
+    def get(self, key: CacheKey, default: Any = None) -> Any:
+        value = self._get(self._full_key(key))
+        return default if value is MISSING else value
+
+    def set(self, key: CacheKey, value: Any, ttl_sec: Optional[float] = None) -> None:
+        self._set(self._full_key(key), value, ttl_sec)
+
+    def delete(self, key: CacheKey) -> None:
+        full_key = self._full_key(key)
+        self.l1.delete(full_key)
+        self._l2_call("delete", full_key)
+
+    def clear(self) -> None:
+        """namespace 전체 삭제 (L1과 L2 모두)"""
+        self.l1.delete_prefix(self.prefix)
+        self._l2_call("delete_prefix", self.prefix)
+
+    def get_or_load(
+        self, key: CacheKey, loader: Callable[[], Any], ttl_sec: Optional[float] = None
+    ) -> Any:
+        """
+        캐시에 있으면 반환, 없으면 loader() 결과를 저장 후 반환
+
+        같은 키를 동시에 요청하면 loader는 한 번만 실행됩니다(프로세스 내, L2가 있으면 프로세스 간에도).
+        loader가 실패하면 저장하지 않고 예외를 그대로 발생시키며, 기다리던 호출은 각자 다시 시도합니다.
+        """
+        full_key = self._full_key(key)
+        value = self._get(full_key)
+        if value is not MISSING:
+            return value
+
+        with self._inflight_lock:
+            event = self._inflight.get(full_key)
+            leader = event is None
+            if leader:
+                event = self._inflight[full_key] = threading.Event()
+
+        if not leader:
+            self.metrics.incr("lock_waits")
+            event.wait(self.lock_wait_sec)
+            value = self._get(full_key)
+            if value is not MISSING:
+                return value
+            return self._load(full_key, loader, ttl_sec)
+
+        try:
+            return self._load_with_l2_lock(full_key, loader, ttl_sec)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(full_key, None)
+            event.set()
+
+    def _load(self, full_key: str, loader: Callable[[], Any], ttl_sec: Optional[float]) -> Any:
+        value = loader()
+        self.metrics.incr("loads")
+        self._set(full_key, value, ttl_sec)
+        return value
+
+    def _load_with_l2_lock(
+        self, full_key: str, loader: Callable[[], Any], ttl_sec: Optional[float]
+    ) -> Any:
+        lock_key = f"{full_key}:lock"
+        token = uuid.uuid4().hex
+        if not self._l2_available() or self._l2_call(
+            "acquire_lock", lock_key, token, self.lock_ttl_sec, default=True
+        ):
+            try:
+                return self._load(full_key, loader, ttl_sec)
+            finally:
+                self._l2_call("release_lock", lock_key, token)
+
+        # 다른 프로세스가 계산 중: L2에 값이 생길 때까지 기다리고, 시간 안에 안 생기면 직접 계산
+        self.metrics.incr("lock_waits")
+        deadline = time.monotonic() + self.lock_wait_sec
+        delay = 0.02
+        while time.monotonic() < deadline and self._l2_available():
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            value = self._get_l2(full_key)
+            if value is not MISSING:
+                return value
+        return self._load(full_key, loader, ttl_sec)
+
+    def _on_invalidation(self, key: Optional[str]) -> None:
+        if key is None:
+            self.clear()
+        else:
+            self.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.metrics.snapshot(),
+            "l1_entries": len(self.l1),
+            "l1_bytes": self.l1.size_bytes,
+            "l2": type(self.l2).__name__ if self.l2 is not None else None,
+            "l2_available": self._l2_available(),
+        }
+
+
+_backend = MISSING
+_caches: Dict[str, TieredCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_l2_backend():
+    """환경변수로 정한 공용 L2 백엔드 (없으면 None)"""
+    global _backend
+    with _caches_lock:
+        if _backend is MISSING:
+            url = os.getenv("CACHE_REDIS_URL") or os.getenv("REDIS_URL")
+            _backend = RedisBackend(url) if url else None
+            logger.info(f"캐시 L2: {'Redis' if url else '없음 (L1만 사용)'}")
+        return _backend
+
+
+def configure_l2_backend(backend) -> None:
+    """L2 백엔드 교체 (테스트에서 InMemoryBackend 사용). 이미 만든 캐시에는 적용되지 않음"""
+    global _backend
+    with _caches_lock:
+        _backend = backend
+
+
+def get_cache(namespace: str, **options) -> TieredCache:
+    """namespace 캐시 (프로세스 안에서 하나, 처음 만들 때의 options 사용)"""
+    cache = _caches.get(namespace)
+    if cache is not None:
+        return cache
+    l2 = options.pop("l2", MISSING)
+    if l2 is MISSING:
+        l2 = get_l2_backend()
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = TieredCache(namespace, l2=l2, **options)
+        return _caches[namespace]
+
+
+def get_all_cache_metrics() -> Dict[str, Any]:
+    with _caches_lock:
+        caches = dict(_caches)
+    return {namespace: cache.stats() for namespace, cache in caches.items()}
@@ -0,0 +1,61 @@
+"""
+async 라우트에서 블로킹 작업(동기 SQLAlchemy 쿼리, LLM chain.invoke 등) 실행.
+
+async def 라우트 안에서 블로킹 호출을 직접 하면 이벤트 루프가 멈춰 헬스 체크를 포함한
+모든 요청이 함께 대기합니다. run_blocking()은 크기가 정해진 전용 스레드 풀에서 실행하고
+결과를 await로 돌려주므로 다른 요청은 그동안 계속 처리됩니다.
+
+풀 크기는 BLOCKING_EXECUTOR_WORKERS (기본 16)로 조정하며, 풀이 가득 차면 이후 작업은
+이벤트 루프를 막지 않고 스레드가 빌 때까지 대기합니다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """블로킹 작업 전용 스레드 풀 (프로세스 전역에서 하나)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            max_workers = int(os.getenv("BLOCKING_EXECUTOR_WORKERS", "16"))
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="blocking"
+            )
+            logger.info(f"블로킹 작업 스레드 풀 생성 (workers={max_workers})")
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    블로킹 함수를 전용 스레드 풀에서 실행하고 결과 반환
+
+    호출한 쪽의 contextvars(로깅 컨텍스트 등)를 그대로 넘기고, 함수에서 발생한 예외는
+    그대로 다시 발생합니다.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_blocking_executor(), call)
+
+
+def shutdown_blocking_executor() -> None:
+    """애플리케이션 종료 시 스레드 풀 정리 (진행 중인 작업은 끝까지 실행)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
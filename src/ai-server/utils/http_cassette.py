@@ -0,0 +1,251 @@
+"""
+HTTP 응답 녹화/재생 (cassette).
+
+HTTP_RECORD_MODE 환경변수로 공용 전송 계층(utils.http_transport)의 동작을 바꿉니다.
+
+- off (기본): 실제 요청만 보냄
+- record: 실제 응답을 HTTP_CASSETTE_DIR/<전송 이름>.jsonl 에 저장
+- replay: 네트워크 없이 저장된 응답만 반환. 없는 요청은 ConnectionError
+
+녹화 시 요청 헤더(Authorization 등)는 저장하지 않고, nonce·키 같은 파라미터는 제거합니다.
+재생은 HTTP_REPLAY_SEED로 고정한 난수로 지연(HTTP_REPLAY_LATENCY_MS, HTTP_REPLAY_JITTER_MS)과
+429 응답(HTTP_REPLAY_429_RATE)을 주입하므로 같은 설정이면 같은 결과가 나옵니다.
+"""
+
+import base64
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# 녹화 파일에 남기지 않는 파라미터 (매 요청 달라지거나 자격증명인 값)
+SCRUBBED_PARAMS = frozenset({"nonce", "access_key", "secret_key"})
+
+# 녹화 파일에 남기는 응답 헤더
+KEPT_RESPONSE_HEADERS = ("content-type", "retry-after", "remaining-req")
+
+
+def _normalize_params(params: Optional[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+    if not params:
+        return []
+    normalized = []
+    for key in sorted(params):
+        if key in SCRUBBED_PARAMS:
+            continue
+        value = params[key]
+        if isinstance(value, (list, tuple)):
+            value = [str(v) for v in value]
+        else:
+            value = str(value)
+        normalized.append((key, value))
+    return normalized
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]]) -> str:
+    """요청 식별 키: 메서드 + 쿼리를 뺀 URL + 정리한 파라미터"""
+    parts = urlsplit(url)
+    return json.dumps(
+        [method.upper(), f"{parts.scheme}://{parts.netloc}{parts.path}", _normalize_params(params)],
+        ensure_ascii=False,
+    )
+
+
+def build_response(
+    status: int, body: bytes, headers: Optional[Dict[str, str]] = None, url: str = ""
+) -> requests.Response:
+    """저장된 값으로 requests.Response 생성"""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    response.encoding = "utf-8"
+    return response
+
+
+class Cassette:
+    """전송 객체 1개의 녹화/재생 파일"""
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str,
+        latency_ms: Optional[float] = None,
+        jitter_ms: float = 0.0,
+        inject_429_rate: float = 0.0,
+        retry_after_sec: str = "0",
+        seed: int = 0,
+    ):
+        self.path = path
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.inject_429_rate = inject_429_rate
+        self.retry_after_sec = retry_after_sec
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.meta: Dict[str, Any] = {}
+        self._entries: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.stats = {"played": 0, "missed": 0, "injected_429": 0, "recorded": 0}
+
+        if mode == MODE_REPLAY:
+            self._load()
+        elif mode == MODE_RECORD:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if not self.path.exists():
+                self._append(
+                    {"meta": {"recorded_at": datetime.now(timezone.utc).isoformat()}}
+                )
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            logger.warning(f"재생할 녹화 파일이 없습니다: {self.path}")
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if "meta" in entry:
+                    self.meta.update(entry["meta"])
+                    continue
+                self._entries.setdefault(entry["key"], deque()).append(entry)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        response,
+        latency_sec: float,
+    ) -> None:
+        """실제 응답 저장 (요청 헤더는 저장하지 않음)"""
+        content = response.content or b""
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+
+        headers = {
+            name: response.headers[name]
+            for name in KEPT_RESPONSE_HEADERS
+            if name in response.headers
+        }
+        entry = {
+            "key": request_key(method, url, params),
+            "status": response.status_code,
+            "headers": headers,
+            "body": body,
+            "encoding": encoding,
+            "latency_ms": round(latency_sec * 1000, 2),
+        }
+        with self._lock:
+            self._append(entry)
+            self.stats["recorded"] += 1
+
+    def play(self, method: str, url: str, params: Optional[Dict[str, Any]]):
+        """
+        저장된 응답 반환
+
+        같은 키로 여러 번 녹화된 경우 녹화 순서대로 돌려주고, 마지막 응답은 계속 재사용합니다.
+        """
+        key = request_key(method, url, params)
+        with self._lock:
+            queue = self._entries.get(key)
+            if not queue:
+                self.stats["missed"] += 1
+                raise requests.exceptions.ConnectionError(
+                    f"녹화된 응답이 없습니다 (replay): {key}"
+                )
+
+            delay_ms = self._next_latency_ms(queue[0])
+            if self.inject_429_rate and self._rng.random() < self.inject_429_rate:
+                self.stats["injected_429"] += 1
+                entry = None
+            else:
+                entry = queue.popleft() if len(queue) > 1 else queue[0]
+                self.stats["played"] += 1
+
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if entry is None:
+            return build_response(
+                429,
+                b'{"error":{"name":"too_many_requests","message":"injected"}}',
+                {"Content-Type": "application/json", "Retry-After": self.retry_after_sec},
+                url,
+            )
+
+        body = (
+            base64.b64decode(entry["body"])
+            if entry.get("encoding") == "base64"
+            else entry["body"].encode("utf-8")
+        )
+        return build_response(entry["status"], body, entry.get("headers"), url)
+
+    def _next_latency_ms(self, entry: Dict[str, Any]) -> float:
+        base = self.latency_ms if self.latency_ms is not None else entry.get("latency_ms", 0)
+        if self.jitter_ms:
+            base += self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, base)
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_record_mode() -> str:
+    return os.getenv("HTTP_RECORD_MODE", MODE_OFF).lower()
+
+
+def get_cassette(name: str) -> Optional[Cassette]:
+    """
+    전송 객체 이름별 녹화/재생 파일 (HTTP_RECORD_MODE=off면 None)
+    """
+    mode = get_record_mode()
+    if mode not in (MODE_RECORD, MODE_REPLAY):
+        return None
+
+    with _cassettes_lock:
+        cassette = _cassettes.get(name)
+        if cassette is None:
+            latency = os.getenv("HTTP_REPLAY_LATENCY_MS")
+            cassette = Cassette(
+                path=Path(os.getenv("HTTP_CASSETTE_DIR", "cassettes")) / f"{name}.jsonl",
+                mode=mode,
+                latency_ms=float(latency) if latency else None,
+                jitter_ms=float(os.getenv("HTTP_REPLAY_JITTER_MS", "0")),
+                inject_429_rate=float(os.getenv("HTTP_REPLAY_429_RATE", "0")),
+                retry_after_sec=os.getenv("HTTP_REPLAY_RETRY_AFTER_SEC", "0"),
+                seed=int(os.getenv("HTTP_REPLAY_SEED", "0")),
+            )
+            _cassettes[name] = cassette
+        return cassette
+
+
+def reset_cassettes() -> None:
+    """캐시된 녹화/재생 파일 정보 초기화 (환경변수를 바꾼 뒤 다시 읽을 때)"""
+    with _cassettes_lock:
+        _cassettes.clear()
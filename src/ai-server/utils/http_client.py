@@ -3,6 +3,7 @@ import time
 import os
 from typing import Optional, Dict, Any
 import logging
+from utils.http_transport import get_transport
 
 
 class Http_client:
@@ -23,11 +24,13 @@ class Http_client:
             }
         )
         self.logger = logging.getLogger(__name__)
+        # 프로세스 공용 커넥션 풀 (keep-alive, 타임아웃, 429/5xx 재시도)
+        self.transport = get_transport()
 
     def get(self, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         try:
-            response = requests.get(
-                self.base_url, headers=self.headers, params=params, timeout=30
+            response = self.transport.get(
+                self.base_url, headers=self.headers, params=params
             )
 
             response.raise_for_status()
@@ -64,7 +67,7 @@ class Http_client:
     def download_image(self, url: str, save_path: str) -> bool:
         try:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.transport.get(url, headers=self.headers)
             response.raise_for_status()
             with open(save_path, "wb") as f:
                 f.write(response.content)
@@ -0,0 +1,383 @@
+"""
+프로젝트 공용 HTTP 전송 계층.
+
+- 프로세스 전역에서 공유하는 keep-alive 세션과 크기가 정해진 커넥션 풀
+- 연결/읽기 타임아웃 기본 적용 (무한 대기 방지)
+- 429/5xx 및 연결 오류 시 지터가 섞인 지수 백오프 재시도, Retry-After 헤더 우선
+- 호스트별 요청 수·지연 시간·재시도·커넥션 지표
+- HTTP_ENABLE_HTTP2=true 이고 h2 패키지가 있으면 httpx 기반 HTTP/2 사용
+- HTTP_RECORD_MODE=record/replay 로 응답 녹화·재생 (utils.http_cassette)
+
+Http_client, UpbitHttpClient, data-collector의 UpbitClient가 모두 이 모듈을 사용합니다.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.http_cassette import MODE_REPLAY, get_cassette
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+class HostMetrics:
+    """호스트 1개의 요청 지표"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_counts: Dict[int, int] = {}
+        self.total_latency_sec = 0.0
+        self.max_latency_sec = 0.0
+
+    def record(self, latency_sec: float, status: Optional[int]) -> None:
+        self.requests += 1
+        self.total_latency_sec += latency_sec
+        self.max_latency_sec = max(self.max_latency_sec, latency_sec)
+        if status is None:
+            self.errors += 1
+        else:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "status_counts": dict(self.status_counts),
+            "avg_latency_ms": (
+                round(self.total_latency_sec / self.requests * 1000, 2)
+                if self.requests
+                else 0.0
+            ),
+            "max_latency_ms": round(self.max_latency_sec * 1000, 2),
+        }
+
+
+class _HttpxResponse:
+    """httpx 응답을 requests.Response와 같은 방식으로 쓰기 위한 래퍼"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.content
+        self.url = str(response.url)
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    def json(self) -> Any:
+        return self._response.json()
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+class HttpTransport:
+    """
+    재시도·타임아웃·지표가 적용된 공용 HTTP 전송 객체
+
+    스레드 간에 공유해도 안전하며, 같은 이름의 전송 객체는 get_transport()로 한 번만 만들어집니다.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base_sec: Optional[float] = None,
+        backoff_max_sec: Optional[float] = None,
+        enable_http2: Optional[bool] = None,
+    ):
+        self.name = name
+        self.pool_connections = pool_connections or _env_int("HTTP_POOL_CONNECTIONS", 10)
+        self.pool_maxsize = pool_maxsize or _env_int("HTTP_POOL_MAXSIZE", 20)
+        self.timeout: Tuple[float, float] = (
+            connect_timeout or _env_float("HTTP_CONNECT_TIMEOUT_SEC", 5.0),
+            read_timeout or _env_float("HTTP_READ_TIMEOUT_SEC", 30.0),
+        )
+        self.max_retries = (
+            max_retries if max_retries is not None else _env_int("HTTP_MAX_RETRIES", 3)
+        )
+        self.backoff_base_sec = backoff_base_sec or _env_float(
+            "HTTP_RETRY_BACKOFF_SEC", 0.5
+        )
+        self.backoff_max_sec = backoff_max_sec or _env_float(
+            "HTTP_RETRY_BACKOFF_MAX_SEC", 10.0
+        )
+        if enable_http2 is None:
+            enable_http2 = os.getenv("HTTP_ENABLE_HTTP2", "false").lower() == "true"
+
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+        self._httpx_client = None
+        if enable_http2:
+            self._httpx_client = self._create_http2_client()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._adapter = adapter
+
+        self.cassette = get_cassette(name)
+        if self.cassette is not None:
+            logger.info(f"HTTP {self.cassette.mode} 모드: {name} -> {self.cassette.path}")
+
+    def _create_http2_client(self):
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 동작합니다 (pip install 'httpx[http2]')")
+            return None
+
+        connect_timeout, read_timeout = self.timeout
+        return httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+            ),
+        )
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self._httpx_client is not None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        headers_factory: Optional[Callable[[], Dict[str, str]]] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+        retry: bool = True,
+        on_throttled: Optional[Callable[[float], None]] = None,
+        **kwargs,
+    ):
+        """
+        HTTP 요청 (재시도 포함)
+
+        Args:
+            headers_factory: 시도마다 새 헤더를 만드는 함수 (JWT nonce처럼 재사용하면 안 되는 값)
+            retry: False면 재시도하지 않음. 멱등이 아닌 메서드는 항상 재시도하지 않음
+            on_throttled: 429 응답 후 재시도 대기 시간(초)을 넘겨받는 함수. 주면 transport는 기다리지 않고
+                호출자의 요청 한도(headers_factory의 acquire 등)가 다음 시도를 늦춤
+
+        Returns:
+            requests.Response (HTTP/2 사용 시 같은 인터페이스의 래퍼).
+            재시도 후에도 429/5xx면 마지막 응답을 그대로 반환하므로 raise_for_status()로 확인합니다.
+
+        Raises:
+            requests.exceptions.RequestException: 연결 실패·타임아웃이 재시도 후에도 계속될 때
+        """
+        method = method.upper()
+        host = urlsplit(url).netloc
+        max_attempts = (
+            self.max_retries + 1 if retry and method in IDEMPOTENT_METHODS else 1
+        )
+
+        attempt = 0
+        while True:
+            attempt += 1
+            request_headers = dict(headers or {})
+            if headers_factory is not None:
+                request_headers.update(headers_factory())
+
+            started = time.perf_counter()
+            try:
+                response = self._send(
+                    method, url, params, request_headers, timeout or self.timeout, **kwargs
+                )
+            except requests.exceptions.RequestException as e:
+                self._record(host, time.perf_counter() - started, None)
+                if attempt >= max_attempts:
+                    raise
+                delay = self._backoff_delay(attempt, None)
+                logger.warning(
+                    f"HTTP 요청 실패, {delay:.2f}초 후 재시도 ({attempt}/{max_attempts - 1}): {host} {e}"
+                )
+                self._record_retry(host)
+                time.sleep(delay)
+                continue
+
+            self._record(host, time.perf_counter() - started, response.status_code)
+            if response.status_code not in RETRY_STATUSES or attempt >= max_attempts:
+                return response
+
+            delay = self._backoff_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                f"HTTP {response.status_code}, {delay:.2f}초 후 재시도 ({attempt}/{max_attempts - 1}): {host}"
+            )
+            self._record_retry(host)
+            if response.status_code == 429 and on_throttled is not None:
+                on_throttled(delay)
+            else:
+                time.sleep(delay)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def _send(self, method, url, params, headers, timeout, **kwargs):
+        if self.cassette is not None and self.cassette.mode == MODE_REPLAY:
+            return self.cassette.play(method, url, params)
+
+        started = time.perf_counter()
+        response = self._send_network(method, url, params, headers, timeout, **kwargs)
+        if self.cassette is not None:
+            self.cassette.record(
+                method, url, params, response, time.perf_counter() - started
+            )
+        return response
+
+    def _send_network(self, method, url, params, headers, timeout, **kwargs):
+        if self._httpx_client is None:
+            return self.session.request(
+                method, url, params=params, headers=headers, timeout=timeout, **kwargs
+            )
+
+        import httpx
+
+        connect_timeout, read_timeout = timeout
+        try:
+            response = self._httpx_client.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                **kwargs,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        return _HttpxResponse(response)
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """지수 백오프 + 지터. Retry-After가 있으면 그 값 이상 대기"""
+        backoff = min(self.backoff_max_sec, self.backoff_base_sec * (2 ** (attempt - 1)))
+        delay = random.uniform(backoff / 2, backoff)
+        server_delay = self._parse_retry_after(retry_after)
+        if server_delay is not None:
+            delay = max(delay, min(server_delay, self.backoff_max_sec * 6))
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _host_metrics(self, host: str) -> HostMetrics:
+        metrics = self._metrics.get(host)
+        if metrics is None:
+            metrics = HostMetrics()
+            self._metrics[host] = metrics
+        return metrics
+
+    def _record(self, host: str, latency_sec: float, status: Optional[int]) -> None:
+        with self._metrics_lock:
+            self._host_metrics(host).record(latency_sec, status)
+
+    def _record_retry(self, host: str) -> None:
+        with self._metrics_lock:
+            self._host_metrics(host).retries += 1
+
+    def _connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """urllib3 커넥션 풀 상태 (호스트별 생성된 커넥션 수, 유휴 커넥션 수)"""
+        stats = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.host}:{pool.port}" if pool.port else pool.host
+            stats[host] = {
+                "connections_opened": pool.num_connections,
+                "pooled_requests": pool.num_requests,
+                "idle_connections": pool.pool.qsize() if pool.pool is not None else 0,
+            }
+        return stats
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            hosts = {host: m.to_dict() for host, m in self._metrics.items()}
+        return {
+            "http2": self.http2_enabled,
+            "record_mode": self.cassette.mode if self.cassette is not None else "off",
+            "pool_maxsize": self.pool_maxsize,
+            "timeout": {"connect": self.timeout[0], "read": self.timeout[1]},
+            "hosts": hosts,
+            "connections": self._connection_stats(),
+        }
+
+    def close(self) -> None:
+        self.session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+
+
+_transports: Dict[str, HttpTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(name: str = "default") -> HttpTransport:
+    """이름별 공용 전송 객체 (프로세스 전역에서 하나)"""
+    with _transports_lock:
+        transport = _transports.get(name)
+        if transport is None:
+            transport = HttpTransport(name=name)
+            _transports[name] = transport
+        return transport
+
+
+def get_all_metrics() -> Dict[str, Any]:
+    """모든 전송 객체의 호스트별 지표"""
+    with _transports_lock:
+        transports = list(_transports.values())
+    return {transport.name: transport.get_metrics() for transport in transports}
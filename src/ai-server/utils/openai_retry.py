@@ -1,15 +1,15 @@
 """OpenAI API 호출 시 429 Rate Limit / 타임아웃에 대한 재시도 유틸."""
 
+import asyncio
 import logging
-import time
-from typing import Callable, TypeVar
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
-def _is_retryable(exc: BaseException) -> bool:
+def is_retryable(exc: BaseException) -> bool:
     """재시도 가능한 OpenAI 예외인지 판단."""
     exc_type = type(exc).__name__
     if exc_type == "RateLimitError":
@@ -25,26 +25,25 @@ def _is_retryable(exc: BaseException) -> bool:
     return False
 
 
-def with_openai_retry(
-    fn: Callable[..., T],
+def with_openai_retry_async(
+    fn: Callable[..., Awaitable[T]],
     max_retries: int = 3,
     base_delay_sec: float = 5.0,
-) -> Callable[..., T]:
+) -> Callable[..., Awaitable[T]]:
     """
-    OpenAI 호출(chain.invoke 등)에 429/타임아웃 시 지수 백오프 재시도를 적용한 래퍼.
+    OpenAI 비동기 호출(chain.ainvoke 등)에 429/타임아웃 시 지수 백오프 재시도를 적용한 래퍼.
 
     - RateLimitError(429), APITimeoutError 시 base_delay * 2^attempt 초 대기 후 재시도.
     - max_retries 회까지 시도 (총 1 + max_retries - 1 번 재시도).
+    - 대기는 asyncio.sleep이라 백오프 중에도 스레드·이벤트 루프를 점유하지 않습니다.
     """
 
-    def wrapper(*args, **kwargs) -> T:
-        last_err: BaseException | None = None
+    async def wrapper(*args, **kwargs) -> T:
         for attempt in range(max_retries):
             try:
-                return fn(*args, **kwargs)
-            except BaseException as e:
-                last_err = e
-                if _is_retryable(e) and attempt < max_retries - 1:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                if is_retryable(e) and attempt < max_retries - 1:
                     delay = base_delay_sec * (2 ** attempt)
                     logger.warning(
                         "OpenAI rate limit/timeout (attempt %s/%s), retrying in %.1fs: %s",
@@ -53,11 +52,42 @@ def with_openai_retry(
                         delay,
                         e,
                     )
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                     continue
                 raise
-        if last_err is not None:
-            raise last_err
         raise RuntimeError("unreachable")
 
     return wrapper
+
+
+async def astream_with_openai_retry(
+    fn: Callable[..., AsyncIterator[T]],
+    *args,
+    max_retries: int = 3,
+    base_delay_sec: float = 5.0,
+    **kwargs,
+) -> AsyncIterator[T]:
+    """
+    스트리밍 호출(astream)에 429/타임아웃 재시도를 적용해 조각을 그대로 전달.
+
+    이미 조각을 내보낸 뒤의 오류는 중복 출력이 되므로 재시도하지 않고 그대로 발생합니다.
+    """
+    for attempt in range(max_retries):
+        started = False
+        try:
+            async for chunk in fn(*args, **kwargs):
+                started = True
+                yield chunk
+            return
+        except Exception as e:
+            if started or not is_retryable(e) or attempt == max_retries - 1:
+                raise
+            delay = base_delay_sec * (2 ** attempt)
+            logger.warning(
+                "OpenAI rate limit/timeout (attempt %s/%s), retrying in %.1fs: %s",
+                attempt + 1,
+                max_retries,
+                delay,
+                e,
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,121 @@
+"""API 키별 요청 속도 제한 (토큰 버킷)."""
+
+import os
+import threading
+import time
+from typing import Dict
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷
+
+    acquire()는 토큰이 생길 때까지 호출한 스레드를 대기시킵니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 가져오거나, 부족하면 다시 시도할 때까지의 대기 시간(초)을 반환
+
+        Returns:
+            0이면 획득 성공, 양수면 그만큼 기다린 뒤 재시도
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """토큰을 얻을 때까지 대기"""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def hold(self, seconds: float) -> None:
+        """
+        앞으로 seconds초 동안 토큰을 내주지 않음 (429 응답의 Retry-After/백오프 반영)
+
+        이 버킷을 쓰는 모든 스레드의 다음 acquire()가 함께 늦춰집니다.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiterRegistry:
+    """키(API access key 등)별 토큰 버킷 보관소"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, key: str, tokens: float = 1.0) -> None:
+        self.get(key).acquire(tokens)
+
+    def hold(self, key: str, seconds: float) -> None:
+        self.get(key).hold(seconds)
+
+
+_upbit_rate_limiter = None
+_upbit_rate_limiter_lock = threading.Lock()
+
+
+def get_upbit_rate_limiter() -> RateLimiterRegistry:
+    """
+    업비트 access key별 요청 한도
+
+    업비트 Exchange API(주문 외 요청)는 키당 초당 30회로 제한되므로 기본값은 여유를 둔 초당 25회입니다.
+    """
+    global _upbit_rate_limiter
+    with _upbit_rate_limiter_lock:
+        if _upbit_rate_limiter is None:
+            rate = float(os.getenv("UPBIT_RATE_LIMIT_PER_SEC", "25"))
+            burst = float(os.getenv("UPBIT_RATE_LIMIT_BURST", str(rate)))
+            _upbit_rate_limiter = RateLimiterRegistry(rate, burst)
+        return _upbit_rate_limiter
+
+
+_upbit_static_rate_limiter = None
+_upbit_static_rate_limiter_lock = threading.Lock()
+
+
+def get_upbit_static_rate_limiter() -> TokenBucket:
+    """
+    업비트 정적 파일 서버(static.upbit.com) 요청 한도
+
+    Exchange API와 다른 호스트이므로 따로 제한하며, 기본값은 기존과 같은 초당 5회입니다.
+    """
+    global _upbit_static_rate_limiter
+    with _upbit_static_rate_limiter_lock:
+        if _upbit_static_rate_limiter is None:
+            rate = float(os.getenv("UPBIT_STATIC_RATE_LIMIT_PER_SEC", "5"))
+            burst = float(os.getenv("UPBIT_STATIC_RATE_LIMIT_BURST", str(rate)))
+            _upbit_static_rate_limiter = TokenBucket(rate, burst)
+        return _upbit_static_rate_limiter
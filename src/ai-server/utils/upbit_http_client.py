@@ -4,6 +4,8 @@ import jwt
 import uuid
 from urllib.parse import urlencode, unquote
 from typing import Dict, Any, Optional, List
+from utils.rate_limiter import get_upbit_rate_limiter
+from utils.http_transport import get_transport
 
 
 class UpbitHttpClientError(Exception):
@@ -18,7 +20,8 @@ class UpbitHttpClient:
         base_url: str = "https://api.upbit.com",
     ):
         self.base_url = base_url
-        self.session = requests.Session()
+        # 프로세스 공용 커넥션 풀 (keep-alive, 타임아웃, 429/5xx 재시도)
+        self.transport = get_transport("upbit")
 
     def _create_jwt_token(
         self, access_key: str, secret_key: str, params: Optional[Dict[str, Any]] = None
@@ -65,14 +68,24 @@ class UpbitHttpClient:
         try:
             url = f"{self.base_url}{endpoint}"
 
-            # 인증 헤더가 필요할때만 생성
-            headers = (
-                self._get_headers(access_key, secret_key, params)
-                if require_auth
-                else None
-            )
+            # 인증 요청은 시도(재시도 포함)마다 access key별 요청 한도를 지키고
+            # nonce가 새로 담긴 JWT 헤더를 만듦. 429 응답 후 대기도 요청 한도가 맡아
+            # 같은 key를 쓰는 다른 요청도 함께 늦춰짐
+            def headers_factory():
+                if not require_auth:
+                    return {}
+                get_upbit_rate_limiter().acquire(access_key)
+                return self._get_headers(access_key, secret_key, params)
+
+            def on_throttled(delay: float):
+                get_upbit_rate_limiter().hold(access_key, delay)
 
-            response = self.session.get(url, params=params, headers=headers)
+            response = self.transport.get(
+                url,
+                params=params,
+                headers_factory=headers_factory,
+                on_throttled=on_throttled if require_auth else None,
+            )
             response.raise_for_status()
 
             return response.json()
@@ -8,8 +8,8 @@ import sys
 from pathlib import Path
 import pytz
 
-# app-server 모듈 경로 추가
-app_server_path = Path(__file__).parent.parent / "app-server"
+# ai-server 모듈 경로 추가
+app_server_path = Path(__file__).parent.parent / "ai-server"
 sys.path.insert(0, str(app_server_path))
 
 # 프로젝트 루트 경로 추가 (data-collector 모듈 import용)
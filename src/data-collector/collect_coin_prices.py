@@ -26,8 +26,8 @@ import pytz
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# app-server 모듈 경로 추가
-app_server_path = project_root / "app-server"
+# ai-server 모듈 경로 추가
+app_server_path = project_root / "ai-server"
 sys.path.insert(0, str(app_server_path))
 
 # data-collector 디렉토리 경로 추가
@@ -2,16 +2,27 @@ import logging
 from typing import List, Optional
 from datetime import datetime
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert
 import sys
 from pathlib import Path
 
-# app-server 모듈 경로 추가
-app_server_path = Path(__file__).parent.parent.parent / "app-server"
+# ai-server 모듈 경로 추가
+app_server_path = Path(__file__).parent.parent.parent / "ai-server"
 sys.path.insert(0, str(app_server_path))
 
 from database.database_connection import db
+from database.invalidation import publish_invalidation
+from database.partitions import ensure_yearly_partitions
+from model.CacheVersion import CACHE_COIN_PRICES_DAY
 from model.CoinPricesDay import CoinPricesDay
 
+# INSERT에 넣는 칼럼 (id, created_at, updated_at은 DB/모델 기본값)
+_CANDLE_COLUMNS = [
+    column.key
+    for column in CoinPricesDay.__table__.columns
+    if column.key not in ("id", "created_at", "updated_at")
+]
+
 
 class CoinPricesDayRepository:
     def __init__(self):
@@ -21,30 +32,49 @@ class CoinPricesDayRepository:
         """
         캔들 데이터 리스트를 배치로 저장
         
+        (market_code, candle_date_time_utc)가 이미 있는 캔들은 건너뜁니다 (ON CONFLICT DO NOTHING).
+        저장 전에 캔들 연도의 파티션이 없으면 만듭니다.
+        
         Args:
             candle_list: 저장할 캔들 데이터 리스트
             
         Returns:
             저장된 행 수
         """
+        if not candle_list:
+            return 0
+
+        ensure_yearly_partitions(
+            db.engine,
+            CoinPricesDay.__tablename__,
+            {candle.candle_date_time_utc.year for candle in candle_list},
+        )
+
+        rows = [
+            {key: getattr(candle, key) for key in _CANDLE_COLUMNS}
+            for candle in candle_list
+        ]
         session = None
         try:
             session = db.get_session()
             
-            saved_count = 0
-            for candle in candle_list:
-                # 중복 체크 (market_code + candle_date_time_utc)
-                existing = session.query(CoinPricesDay).filter(
-                    and_(
-                        CoinPricesDay.market_code == candle.market_code,
-                        CoinPricesDay.candle_date_time_utc == candle.candle_date_time_utc
-                    )
-                ).first()
-                
-                if not existing:
-                    session.add(candle)
-                    saved_count += 1
-            
+            # 한 번의 INSERT로 저장, 중복은 유니크 키(uq_coin_prices_day_market_date)로 DB에서 거름
+            result = session.execute(
+                insert(CoinPricesDay)
+                .values(rows)
+                .on_conflict_do_nothing(
+                    index_elements=["market_code", "candle_date_time_utc"]
+                )
+            )
+            saved_count = result.rowcount
+            if saved_count:
+                # 새 캔들이 저장된 코인의 캐시(가격 분석 컨텍스트 등)를 각 워커에서 비움
+                publish_invalidation(
+                    CACHE_COIN_PRICES_DAY,
+                    {candle.coin_id for candle in candle_list},
+                    session=session,
+                )
+
             session.commit()
             self.logger.info(f"Saved {saved_count} candles out of {len(candle_list)}")
             return saved_count
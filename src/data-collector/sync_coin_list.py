@@ -22,8 +22,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# app-server 모듈 경로 추가
-app_server_path = project_root / "app-server"
+# ai-server 모듈 경로 추가
+app_server_path = project_root / "ai-server"
 sys.path.insert(0, str(app_server_path))
 
 # SQLAlchemy 관계를 위해 모든 모델을 명시적으로 import
@@ -2,6 +2,7 @@ import requests
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from utils.http_transport import get_transport
 
 
 class UpbitClientError(Exception):
@@ -14,7 +15,8 @@ class UpbitClient:
     
     def __init__(self, base_url: str = "https://api.upbit.com"):
         self.base_url = base_url
-        self.session = requests.Session()
+        # ai-server와 같은 공용 전송 계층 (커넥션 풀, 타임아웃, 429/5xx 재시도)
+        self.transport = get_transport("upbit")
         self.logger = logging.getLogger(__name__)
 
     def fetch_daily_candles(
@@ -46,7 +48,7 @@ class UpbitClient:
             if to:
                 params["to"] = to
             
-            response = self.session.get(url, params=params)
+            response = self.transport.get(url, params=params)
             response.raise_for_status()
             
             data = response.json()